@@ -0,0 +1,69 @@
+import ctypes
+import sys
+import time
+sys.path.append("../")
+
+from front_end.parser.parser_99 import C99Parser
+from transformer.ctypes_generator import CTypesGenerator
+
+# Directory entry like record (32 bytes)
+RECORD = '''
+typedef struct directory_entry {
+    unsigned char name[11];
+    unsigned char attributes;
+    unsigned char reserved[8];
+    unsigned short cluster_high;
+    unsigned short modification_time;
+    unsigned short modification_date;
+    unsigned short cluster_low;
+    unsigned int size;
+} directory_entry_t;
+'''
+
+def generate_record_class():
+    """
+    Generate the ctypes class of the record and load it.
+    """
+    namespace = {}
+    exec(CTypesGenerator().generate(C99Parser().parse(RECORD)), namespace)
+
+    return namespace['DirectoryEntryT']
+
+def best_time(function, repeat = 3):
+    measure_list = []
+
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = function()
+        measure_list.append(time.perf_counter() - start)
+
+    return min(measure_list), result
+
+def decode_each(record_class, buffer):
+    # One copy and one offset computation per record
+    size = ctypes.sizeof(record_class)
+
+    return sum(record_class.from_buffer_copy(buffer, offset).size for offset in range(0, len(buffer) - size + 1, size))
+
+def decode_bulk(record_class, buffer):
+    return sum(record.size for record in record_class.iter_from_buffer(buffer))
+
+if __name__ == "__main__":
+    record_class = generate_record_class()
+    record_size  = ctypes.sizeof(record_class)
+
+    print(f'''{'Records':>10}{'Map array (ms)':>16}{'Per record (ms)':>17}{'Bulk (ms)':>11}{'Speedup':>10}''')
+
+    for record_count in [10 ** 4, 10 ** 5, 10 ** 6]:
+        buffer = bytearray(record_size * record_count)
+
+        for index in range(0, record_count, 97):
+            record_class.from_buffer(buffer, index * record_size).size = index
+
+        mapped, _         = best_time(lambda: record_class.from_buffer_array(buffer, record_count))
+        each, each_total  = best_time(lambda: decode_each(record_class, buffer))
+        bulk, bulk_total  = best_time(lambda: decode_bulk(record_class, buffer))
+
+        assert each_total == bulk_total
+
+        print(f'''{record_count:>10}{mapped * 1000:>16.3f}{each * 1000:>17.1f}{bulk * 1000:>11.1f}{each / bulk:>9.2f}x''')
@@ -0,0 +1,72 @@
+import os
+import shutil
+import sys
+import tempfile
+import time
+sys.path.append("../")
+
+from copy_compiler import CoPy99Compiler
+
+ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir))
+
+def create_header_tree(tree_dir, count, depth = 3):
+    """
+    Create a tree of independent translation units.
+
+    :param      tree_dir:  The tree directory
+    :type       tree_dir:  str
+    :param      count:     The number of translation units
+    :type       count:     int
+    :param      depth:     The number of sub directories
+    :type       depth:     int
+    """
+    source_path = os.path.join(ROOT_DIR, 'examples', 'unprocessed.h')
+
+    for index in range(count):
+        header_dir = os.path.join(tree_dir, *[f'dir_{index % (level + 2)}' for level in range(index % depth)])
+        os.makedirs(header_dir, exist_ok = True)
+        shutil.copyfile(source_path, os.path.join(header_dir, f'header_{index}.h'))
+
+def compile_tree(tree_dir, output_dir, max_workers):
+    """
+    Measure the wall-clock time to compile a whole tree.
+
+    :param      tree_dir:     The tree directory
+    :type       tree_dir:     str
+    :param      output_dir:   The output directory
+    :type       output_dir:   str
+    :param      max_workers:  The number of processes
+    :type       max_workers:  int
+    """
+    shutil.rmtree(output_dir, ignore_errors = True)
+    compiler = CoPy99Compiler(output_dir)
+
+    start = time.perf_counter()
+    compiler.compile_directory(tree_dir, max_workers = max_workers)
+
+    return time.perf_counter() - start
+
+if __name__ == "__main__":
+    count     = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    cpu_count = os.cpu_count() or 1
+
+    # Always measure at least two workers so overhead of the pool is visible on a single core.
+    worker_list = sorted({1, 2, *[2 ** power for power in range(cpu_count.bit_length())], cpu_count})
+
+    with tempfile.TemporaryDirectory() as work_dir:
+        tree_dir   = os.path.join(work_dir, 'include')
+        output_dir = os.path.join(work_dir, 'output')
+
+        create_header_tree(tree_dir, count)
+
+        print(f'{count} translation units, {cpu_count} cores')
+        print(f'''{'Workers':<10}{'Wall-clock (s)':>16}{'Speedup':>10}{'Efficiency':>12}''')
+
+        reference = None
+
+        for max_workers in worker_list:
+            elapsed   = compile_tree(tree_dir, output_dir, max_workers)
+            reference = reference or elapsed
+            speedup   = reference / elapsed
+
+            print(f'''{max_workers:<10}{elapsed:>16.2f}{speedup:>9.2f}x{speedup / min(max_workers, cpu_count):>11.0%}''')
@@ -0,0 +1,64 @@
+import sys
+import time
+sys.path.append("../")
+
+from preprocessor.c99_preprocessor import C99PreProcessor
+
+# Portability header shape: most of the text is inside groups selected for other targets.
+DEAD_GROUP = '''
+#if defined(_MSC_VER)
+#define EXPORT_{index} __declspec(dllexport)
+typedef struct msvc_{index} {{ unsigned long a; unsigned long b[4]; }} msvc_{index}_t;
+#ifdef _WIN64
+typedef unsigned long long ptr_{index}_t;
+#else
+typedef unsigned long ptr_{index}_t;
+#endif
+#elif defined(__APPLE__)
+#define EXPORT_{index} __attribute__((visibility("default")))
+typedef struct apple_{index} {{ unsigned int a; unsigned int b[4]; }} apple_{index}_t;
+#else
+typedef struct generic_{index} {{ unsigned int a; unsigned int b[4]; }} generic_{index}_t;
+#endif
+'''
+
+def generate_header(group_count):
+    """
+    Generate a header made of if sections where a single small group is live.
+
+    :param      group_count:  The number of if sections
+    :type       group_count:  int
+    """
+    return ''.join(DEAD_GROUP.format(index = index) for index in range(group_count))
+
+def best_time(function, data, repeat = 3):
+    measure_list = []
+
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function(data)
+        measure_list.append(time.perf_counter() - start)
+
+    return min(measure_list)
+
+def preprocess(data, skip_dead_groups):
+    pre_processor = C99PreProcessor()
+
+    # Without callback, dead groups are lexed and reduced by the grammar like live ones.
+    if not skip_dead_groups:
+        pre_processor._lexer.conditional_callback = None
+
+    return pre_processor.parse(data)
+
+if __name__ == "__main__":
+    print(f'''{'Sections':>10}{'Lexed (ms)':>13}{'Skipped (ms)':>15}{'Speedup':>10}''')
+
+    for group_count in [100, 400, 1600]:
+        data = generate_header(group_count)
+
+        assert preprocess(data, True) == preprocess(data, False)
+
+        lexed   = best_time(lambda data: preprocess(data, False), data)
+        skipped = best_time(lambda data: preprocess(data, True), data)
+
+        print(f'''{group_count:>10}{lexed * 1000:>13.1f}{skipped * 1000:>15.1f}{lexed / skipped:>9.2f}x''')
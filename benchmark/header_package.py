@@ -0,0 +1,166 @@
+import compileall
+import ctypes
+import importlib
+import os
+import subprocess
+import sys
+import tempfile
+sys.path.append("../")
+
+from copy_compiler import CoPy99Compiler, CoPyGNU99Compiler
+
+# Translation units of an SDK like tree, all of them include a shared header.
+TYPES_HEADER_COUNT = 300
+UNIT_COUNT         = 20
+
+def write_sources(source_dir):
+    """
+    Write a shared types header (common/types.h) and translation units using
+    its types.
+
+    :param      source_dir:  The source directory
+    :type       source_dir:  str
+    """
+    os.makedirs(os.path.join(source_dir, 'common'))
+
+    with open(os.path.join(source_dir, 'common', 'types.h'), 'wt') as header:
+        header.write('#ifndef TYPES_H\n#define TYPES_H\n')
+
+        for index in range(TYPES_HEADER_COUNT):
+            header.write(f'''
+typedef enum
+{{
+    OFF_{index} = 0,
+    ON_{index} = 1,
+}} state_{index}_e;
+
+typedef struct vector_{index}
+{{
+    float x;
+    float y;
+    float z;
+    state_{index}_e state;
+}} vector_{index}_t;
+''')
+
+        header.write('#endif\n')
+
+    for unit in range(UNIT_COUNT):
+        with open(os.path.join(source_dir, f'unit_{unit}.h'), 'wt') as source:
+            source.write('#include "common/types.h"\n')
+
+            for index in range(5):
+                source.write(f'''
+typedef struct record_{unit}_{index}
+{{
+    unsigned int identifier;
+    vector_{unit * 5 + index}_t position;
+    state_{unit}_e state;
+    double values[2];
+}} record_{unit}_{index}_t;
+''')
+
+def ctype_description(ctype):
+    """
+    Describe a ctypes type by its layout and codec.
+
+    :param      ctype:  The ctypes type
+    :type       ctype:  type
+    """
+    if issubclass(ctype, ctypes.Array):
+        return [ctype._length_, ctype_description(ctype._type_)]
+    elif issubclass(ctype, ctypes.Structure):
+        field_list = [(name, getattr(ctype, name).offset, ctype_description(field_type)) for name, field_type in ctype._fields_]
+        codec      = ctype._struct_.format if hasattr(ctype, '_struct_') else None
+
+        return [ctype.__name__, ctypes.sizeof(ctype), codec, field_list]
+
+    return ctype.__name__
+
+def check(single_dir, package_dir):
+    """
+    Check classes of every single file module are defined the same way by the
+    package, once.
+
+    :param      single_dir:   The directory of single file modules
+    :type       single_dir:   str
+    :param      package_dir:  The package directory
+    :type       package_dir:  str
+    """
+    sys.path.insert(0, single_dir)
+    sys.path.insert(0, os.path.dirname(package_dir))
+
+    types_module = importlib.import_module(f'{os.path.basename(package_dir)}.common.types')
+
+    for unit in range(UNIT_COUNT):
+        single_module  = importlib.import_module(f'unit_{unit}')
+        package_module = importlib.import_module(f'{os.path.basename(package_dir)}.unit_{unit}')
+
+        for name, value in vars(single_module).items():
+            if not isinstance(value, type) or name.startswith('_'):
+                continue
+
+            package_class = getattr(package_module, name, None) or getattr(types_module, name)
+
+            assert ctype_description(value) == ctype_description(package_class), f'unit_{unit}.{name} differs'
+
+            # Shared classes are defined once, by the header module.
+            if hasattr(types_module, name):
+                assert package_class is getattr(types_module, name)
+
+def output_size(output_dir):
+    return sum([os.path.getsize(os.path.join(directory, name)) for directory, _, name_list in os.walk(output_dir) for name in name_list if name.endswith('.py')])
+
+def import_time(path, module_list, repeat = 5):
+    """
+    Measure the time to import modules in a fresh interpreter (best of repeat),
+    bytecode is already cached.
+
+    :param      path:         The path added to sys.path
+    :type       path:         str
+    :param      module_list:  The module list
+    :type       module_list:  list
+    :param      repeat:       The number of measures
+    :type       repeat:       int
+    """
+    import_list = '\n'.join([f'import {module}' for module in module_list])
+    script      = f'''
+import sys, time
+sys.path.insert(0, {path!r})
+start = time.perf_counter()
+{import_list}
+print(time.perf_counter() - start)
+'''
+    return min([float(subprocess.run([sys.executable, '-c', script], capture_output = True, text = True, check = True).stdout) for _ in range(repeat)])
+
+if __name__ == "__main__":
+    with tempfile.TemporaryDirectory() as work_dir:
+        source_dir  = os.path.join(work_dir, 'source')
+        single_dir  = os.path.join(work_dir, 'single')
+        package_dir = os.path.join(work_dir, 'sdk')
+
+        write_sources(source_dir)
+
+        CoPy99Compiler(single_dir).compile_directory(source_dir, 'unit_*.h', max_workers = 1)
+        CoPyGNU99Compiler(package_dir).compile_directory(source_dir, 'unit_*.h', max_workers = 1)
+
+        check(single_dir, package_dir)
+
+        print('Package modules define the classes of single file modules, shared ones once.')
+
+        # Import time of bytecode, even when it's not written on import (PYTHONDONTWRITEBYTECODE).
+        compileall.compile_dir(single_dir, quiet = 1)
+        compileall.compile_dir(package_dir, quiet = 1)
+
+        unit_list = [f'unit_{unit}' for unit in range(UNIT_COUNT)]
+
+        print(f'''{'':<22}{'Single files':>14}{'Package':>10}''')
+        print(f'''{'Output (KB)':<22}{output_size(single_dir) / 1024:>14.0f}{output_size(package_dir) / 1024:>10.0f}''')
+
+        for label, module_list in [('Import 1 unit (ms)', unit_list[:1]), (f'Import {UNIT_COUNT} units (ms)', unit_list)]:
+            single_time  = import_time(single_dir, module_list)
+            package_time = import_time(work_dir, [f'sdk.{module}' for module in module_list])
+
+            print(f'''{label:<22}{single_time * 1000:>14.1f}{package_time * 1000:>10.1f}''')
+
+        print(f'{UNIT_COUNT} translation units including a header of {TYPES_HEADER_COUNT * 2} enumerations and structures')
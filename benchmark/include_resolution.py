@@ -0,0 +1,77 @@
+import os
+import sys
+import tempfile
+import time
+sys.path.append("../")
+
+from pathlib import Path
+from preprocessor.include_resolver import IncludeResolver
+
+def legacy_resolve(header_name, including_dir, include_dir_list):
+    """
+    Resolve a header like the preprocessor did before using a resolver,
+    every include checks each directory on the filesystem.
+    """
+    header_path = header_name[1:-1]
+
+    if header_name[0] == '"':
+        include_path = Path(including_dir).joinpath(header_path)
+
+        if include_path.is_file():
+            return include_path
+
+    for include_dir in include_dir_list:
+        include_path = Path(include_dir).joinpath(header_path)
+
+        if include_path.is_file():
+            return include_path
+
+    return None
+
+def create_include_tree(directory, dir_count, header_count):
+    """
+    Create include directories where every header is found in the last one.
+
+    :param      directory:     The directory
+    :type       directory:     str
+    :param      dir_count:     The number of include directories
+    :type       dir_count:     int
+    :param      header_count:  The number of headers
+    :type       header_count:  int
+    """
+    include_dir_list = []
+
+    for index in range(dir_count):
+        include_dir = os.path.join(directory, f'include_{index}')
+        os.makedirs(include_dir)
+        include_dir_list.append(include_dir)
+
+    for index in range(header_count):
+        Path(include_dir_list[-1]).joinpath(f'header_{index}.h').write_text('int a;\n')
+
+    return include_dir_list
+
+def time_resolution(resolve, header_name_list, including_dir, repeat = 10):
+    start = time.perf_counter()
+
+    for _ in range(repeat):
+        for header_name in header_name_list:
+            resolve(header_name, including_dir)
+
+    return (time.perf_counter() - start) / (repeat * len(header_name_list))
+
+if __name__ == "__main__":
+    header_count = 200
+
+    print(f'''{'Include dirs':>13}{'Legacy (us)':>14}{'Cached (us)':>14}{'Pre-scan (us)':>16}''')
+
+    for dir_count in [5, 20, 50, 100]:
+        with tempfile.TemporaryDirectory() as directory:
+            include_dir_list = create_include_tree(directory, dir_count, header_count)
+            header_name_list = [f'"header_{index}.h"' for index in range(header_count)]
+
+            legacy   = time_resolution(lambda name, including_dir: legacy_resolve(name, including_dir, include_dir_list), header_name_list, directory)
+            cached   = time_resolution(IncludeResolver(include_dir_list).resolve, header_name_list, directory)
+            prescan  = time_resolution(IncludeResolver(include_dir_list, prescan = True).resolve, header_name_list, directory)
+
+            print(f'''{dir_count:>13}{legacy * 1e6:>14.1f}{cached * 1e6:>14.2f}{prescan * 1e6:>16.2f}''')
@@ -0,0 +1,114 @@
+import ctypes
+import os
+import sys
+import time
+sys.path.append("../")
+
+from core.layout import LayoutEngine, LP64, ILP32, MSVC
+from front_end.parser.parser_99 import C99Parser
+from front_end.parser.parser_gnu99 import GNU99Parser
+from preprocessor.c99_preprocessor import C99PreProcessor
+from transformer.ctypes_generator import CTypesGenerator
+
+import core.intermediate_representation as ir
+
+ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir))
+
+def typedef_list(ast):
+    return [translation_unit.specifier_list[-1] for translation_unit in ast.translation_unit_list if isinstance(translation_unit, ir.Declaration) and translation_unit.is_typedef]
+
+def class_name(node):
+    return ''.join([name.capitalize() for name in node.identifier.split('_')])
+
+def ctypes_layout(ast):
+    """
+    Answer layout questions the way generated code does: generate and load
+    ctypes classes, then ask ctypes.
+
+    :param      ast:  The ast
+    :type       ast:  { type_description }
+    """
+    namespace = {}
+    exec(CTypesGenerator().generate(ast), namespace)
+
+    return {node.identifier: ctypes.sizeof(namespace[class_name(node)]) for node in typedef_list(ast)}
+
+def engine_layout(ast, abi = LP64):
+    engine = LayoutEngine(ast, abi)
+
+    return {node.identifier: engine.layout(node).size for node in typedef_list(ast)}
+
+def clear_layout(ast):
+    # Layouts are cached on IR nodes, nested structures included.
+    node_list = typedef_list(ast)
+
+    while node_list:
+        node = node_list.pop()
+        node.layout_table.clear()
+        node_list += [specifier for declaration in getattr(node, 'declaration_list', []) for specifier in declaration.specifier_qualifier_list if not isinstance(specifier, str)]
+
+def check(ast):
+    """
+    Check LP64 layouts match ctypes classes generated on this host, field by field.
+
+    :param      ast:  The ast
+    :type       ast:  { type_description }
+    """
+    namespace = {}
+    exec(CTypesGenerator().generate(ast), namespace)
+    engine    = LayoutEngine(ast, LP64)
+
+    for node in typedef_list(ast):
+        ctypes_class = namespace[class_name(node)]
+        layout       = engine.layout(node)
+
+        assert (layout.size, layout.alignment) == (ctypes.sizeof(ctypes_class), ctypes.alignment(ctypes_class)), f'{node.identifier} size differs'
+
+        for field in layout.field_list:
+            descriptor = getattr(ctypes_class, field.name)
+
+            # Bit field size and offset are packed in ctypes field size.
+            if field.is_bitfield():
+                assert (descriptor.offset, descriptor.size & 0xFFFF, descriptor.size >> 16) == (field.offset, field.bit_offset, field.bit_size), f'{node.identifier}.{field.name} differs'
+            else:
+                assert (descriptor.offset, descriptor.size) == (field.offset, field.size), f'{node.identifier}.{field.name} differs'
+
+def best_time(function, repeat = 5):
+    measure_list = []
+
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        measure_list.append(time.perf_counter() - start)
+
+    return min(measure_list)
+
+if __name__ == "__main__":
+    elf_ast         = GNU99Parser().parse_file(os.path.join(ROOT_DIR, 'examples', 'elf.i'))
+    unprocessed_ast = C99Parser().parse(C99PreProcessor().process(os.path.join(ROOT_DIR, 'examples', 'unprocessed.h')))
+
+    check(elf_ast)
+    check(unprocessed_ast)
+
+    print('LP64 layouts match generated ctypes classes.')
+
+    print(f'''{'Type':<18}{'LP64':>6}{'ILP32':>7}{'MSVC':>6}''')
+
+    for ast in [elf_ast, unprocessed_ast]:
+        size_list = [engine_layout(ast, abi) for abi in [LP64, ILP32, MSVC]]
+
+        for node in typedef_list(ast):
+            print(f'''{node.identifier:<18}{size_list[0][node.identifier]:>6}{size_list[1][node.identifier]:>7}{size_list[2][node.identifier]:>6}''')
+
+    assert ctypes_layout(elf_ast) == engine_layout(elf_ast)
+
+    def engine_cold():
+        clear_layout(elf_ast)
+        engine_layout(elf_ast)
+
+    ctypes_time = best_time(lambda: ctypes_layout(elf_ast))
+    cold_time   = best_time(engine_cold)
+    cached_time = best_time(lambda: engine_layout(elf_ast))
+
+    print(f'''{'Sizes of elf.i':<18}{'ctypes (ms)':>12}{'Engine (ms)':>13}{'Cached (ms)':>13}''')
+    print(f'''{'':<18}{ctypes_time * 1000:>12.2f}{cold_time * 1000:>13.3f}{cached_time * 1000:>13.3f}''')
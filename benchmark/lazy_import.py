@@ -0,0 +1,174 @@
+import ctypes
+import importlib
+import os
+import py_compile
+import subprocess
+import sys
+import tempfile
+sys.path.append("../")
+
+from front_end.parser.parser_99 import C99Parser
+from front_end.parser.parser_gnu99 import GNU99Parser
+from preprocessor.c99_preprocessor import C99PreProcessor
+from transformer.ctypes_generator import CTypesGenerator
+
+ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir))
+
+def sdk_header(count):
+    """
+    Build an SDK like header: enumerations and structures nesting the ones
+    declared before them.
+
+    :param      count:  The number of structures
+    :type       count:  int
+    """
+    source = ''
+
+    for index in range(count):
+        source += f'''
+typedef enum
+{{
+    IDLE_{index} = 0,
+    BUSY_{index} = 1,
+}} state_{index}_e;
+
+typedef struct record_{index}
+{{
+    unsigned int identifier;
+    state_{index}_e state;
+    unsigned short flags : 4;
+    double values[4];
+    struct
+    {{
+        short x;
+        short y;
+    }} position;
+    {f'record_{index - 1}_t previous;' if index else 'unsigned char previous;'}
+}} record_{index}_t;
+'''
+
+    return source
+
+def ctype_description(ctype):
+    """
+    Describe a ctypes type by its layout, codec and names so classes of eager
+    and lazy modules can be compared.
+
+    :param      ctype:  The ctypes type
+    :type       ctype:  type
+    """
+    if issubclass(ctype, ctypes.Array):
+        return [ctype._length_, ctype_description(ctype._type_)]
+    elif issubclass(ctype, (ctypes.Structure, ctypes.Union)):
+        field_list = [(field[0], getattr(ctype, field[0]).offset, getattr(ctype, field[0]).size, ctype_description(field[1])) for field in ctype._fields_]
+        codec      = ctype._struct_.format if hasattr(ctype, '_struct_') else None
+
+        return [ctype.__qualname__, ctypes.sizeof(ctype), ctypes.alignment(ctype), codec, field_list]
+
+    return ctype.__name__
+
+def check(ast, module_dir, name):
+    """
+    Check a lazy module defines the same classes as an eager one, and only
+    the classes needed when one is accessed.
+
+    :param      ast:         The ast
+    :type       ast:         { type_description }
+    :param      module_dir:  The module directory
+    :type       module_dir:  str
+    :param      name:        The module name
+    :type       name:        str
+    """
+    eager_module = load(CTypesGenerator().generate(ast), module_dir, f'{name}_eager')
+    lazy_module  = load(CTypesGenerator(lazy = True).generate(ast), module_dir, f'{name}_lazy')
+    class_list   = [name for name, value in vars(eager_module).items() if isinstance(value, type) and not name.startswith('_')]
+
+    # Last class pulls the classes it depends on, nothing else.
+    dependency_list = [name for name in class_list if name in str(ctype_description(getattr(eager_module, class_list[-1])))]
+    getattr(lazy_module, class_list[-1])
+
+    assert [name for name in class_list if name in vars(lazy_module)] == dependency_list, f'{name} materialized unused classes'
+    assert sorted(lazy_module.__all__) == sorted(class_list) and set(class_list) <= set(dir(lazy_module))
+
+    namespace = {}
+    exec(f'from {name}_lazy import *', namespace)
+
+    for class_name in class_list:
+        assert ctype_description(getattr(eager_module, class_name)) == ctype_description(namespace[class_name]), f'{name}.{class_name} differs'
+
+    try:
+        lazy_module.Unknown
+    except AttributeError:
+        pass
+    else:
+        raise Exception('Unknown classes must raise AttributeError.')
+
+def load(output, module_dir, name):
+    with open(os.path.join(module_dir, f'{name}.py'), 'wt') as module_file:
+        module_file.write(output)
+
+    return importlib.import_module(name)
+
+def import_time(module_dir, name, statement, repeat = 5):
+    """
+    Measure the time to import a module and run a statement using it in a
+    fresh interpreter (best of repeat), bytecode is already cached.
+
+    :param      module_dir:  The module directory
+    :type       module_dir:  str
+    :param      name:        The module name
+    :type       name:        str
+    :param      statement:   The statement, the module is named module
+    :type       statement:   str
+    :param      repeat:      The number of measures
+    :type       repeat:      int
+    """
+    script = f'''
+import sys, time
+sys.path.insert(0, {module_dir!r})
+start = time.perf_counter()
+import {name} as module
+{statement}
+print(time.perf_counter() - start)
+'''
+    return min([float(subprocess.run([sys.executable, '-c', script], capture_output = True, text = True, check = True).stdout) for _ in range(repeat)])
+
+if __name__ == "__main__":
+    record_count = 2000
+    sdk_ast      = C99Parser().parse(sdk_header(record_count))
+
+    with tempfile.TemporaryDirectory() as module_dir:
+        sys.path.insert(0, module_dir)
+
+        check(GNU99Parser().parse_file(os.path.join(ROOT_DIR, 'examples', 'elf.i')), module_dir, 'elf')
+        check(C99Parser().parse(C99PreProcessor().process(os.path.join(ROOT_DIR, 'examples', 'unprocessed.h'))), module_dir, 'unprocessed')
+        check(C99Parser().parse(sdk_header(50)), module_dir, 'sdk')
+
+        print('Lazy modules define the same classes as eager modules, on demand.')
+
+        with open(os.path.join(module_dir, 'big_eager.py'), 'wt') as module_file:
+            module_file.write(CTypesGenerator().generate(sdk_ast))
+
+        with open(os.path.join(module_dir, 'big_lazy.py'), 'wt') as module_file:
+            module_file.write(CTypesGenerator(lazy = True).generate(sdk_ast))
+
+        # Import time of bytecode, even when it's not written on import (PYTHONDONTWRITEBYTECODE).
+        py_compile.compile(os.path.join(module_dir, 'big_eager.py'))
+        py_compile.compile(os.path.join(module_dir, 'big_lazy.py'))
+
+        print(f'''{'Import':<26}{'Eager (ms)':>12}{'Lazy (ms)':>11}{'Speedup':>10}''')
+
+        statement_list =    [
+                                ('Module only',             ''),
+                                ('3 classes',               'module.Record0T, module.State1E, module.Record2T'),
+                                ('1 class, 9 dependencies', 'module.Record4T'),
+                                ('Every class',             "[getattr(module, name) for name in getattr(module, '__all__', [])]"),
+                            ]
+
+        for label, statement in statement_list:
+            eager_time = import_time(module_dir, 'big_eager', statement)
+            lazy_time  = import_time(module_dir, 'big_lazy', statement)
+
+            print(f'''{label:<26}{eager_time * 1000:>12.1f}{lazy_time * 1000:>11.1f}{eager_time / lazy_time:>9.1f}x''')
+
+        print(f'{record_count * 2} enumerations and structures')
@@ -0,0 +1,43 @@
+import os
+import sys
+import time
+sys.path.append("../")
+
+from front_end.lexer.lexer_99 import C99Lexer
+from front_end.lexer.lexer_gnu99 import GNU99Lexer
+
+ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir))
+
+def create_lexer(lexer_class, scanner):
+    lexer = lexer_class(scanner = scanner)
+    lexer.add_symbol('typedef_name', None, True)
+
+    return lexer
+
+def best_time(function, repeat = 5):
+    measure_list = []
+
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        measure_list.append(time.perf_counter() - start)
+
+    return min(measure_list)
+
+if __name__ == "__main__":
+    with open(os.path.join(ROOT_DIR, 'examples', 'elf.i'), 'rt') as source_file:
+        part = source_file.read()
+
+    data = part * (4 * 2 ** 20 // len(part) + 1)
+    size = len(data.encode()) / 2 ** 20
+
+    print(f'''{'Lexer':<14}{'PLY (MB/s)':>12}{'Scanner (MB/s)':>16}{'Speedup':>10}''')
+
+    for lexer_class in [C99Lexer, GNU99Lexer]:
+        ply_lexer = create_lexer(lexer_class, False)
+        scanner   = create_lexer(lexer_class, True)
+
+        ply_time     = best_time(lambda: ply_lexer.tokenize(data))
+        scanner_time = best_time(lambda: scanner.tokenize(data))
+
+        print(f'''{lexer_class.__name__:<14}{size / ply_time:>12.2f}{size / scanner_time:>16.2f}{ply_time / scanner_time:>9.2f}x''')
@@ -0,0 +1,64 @@
+import os
+import sys
+import tempfile
+import time
+sys.path.append("../")
+
+from preprocessor.c99_preprocessor import C99PreProcessor
+
+def generate_macro_heavy_source(use_count, depth):
+    """
+    Generate a source where every line uses a chain of nested function-like macros.
+    
+    :param      use_count:  The number of lines using the macro chain
+    :type       use_count:  int
+    :param      depth:      The depth of the macro chain
+    :type       depth:      int
+    """
+    line_list = ['#define M0(a, b) ((a) + (b))']
+
+    for level in range(1, depth + 1):
+        line_list.append(f'#define M{level}(a, b) M{level - 1}(a, b) * M{level - 1}(b, a)')
+
+    line_list.append('#define VALUE 1')
+    line_list.extend([f'int value_{index} = M{depth}(VALUE, {index});' for index in range(use_count)])
+
+    return '\n'.join(line_list) + '\n'
+
+def time_preprocessing(use_count, depth, repeat = 3):
+    """
+    Measure the best time to preprocess a macro heavy source.
+    
+    :param      use_count:  The number of lines using the macro chain
+    :type       use_count:  int
+    :param      depth:      The depth of the macro chain
+    :type       depth:      int
+    :param      repeat:     The number of measures
+    :type       repeat:     int
+    """
+    with tempfile.TemporaryDirectory() as directory:
+        source_path = os.path.join(directory, 'macro.c')
+
+        with open(source_path, 'wt') as source_file:
+            source_file.write(generate_macro_heavy_source(use_count, depth))
+
+        measure_list = []
+
+        for _ in range(repeat):
+            pre_processor = C99PreProcessor()
+
+            start = time.perf_counter()
+            pre_processor.process(source_path)
+            measure_list.append(time.perf_counter() - start)
+
+    return min(measure_list)
+
+if __name__ == "__main__":
+    print(f'''{'Uses':>8}{'Depth':>8}{'Expanded tokens':>18}{'Time (ms)':>12}{'us/token':>10}''')
+
+    for use_count, depth in [(100, 2), (1000, 2), (100, 5), (1000, 5), (100, 8)]:
+        # Each level doubles the number of tokens produced by the chain.
+        token_count = use_count * (2 ** depth) * 7
+        elapsed     = time_preprocessing(use_count, depth)
+
+        print(f'''{use_count:>8}{depth:>8}{token_count:>18}{elapsed * 1000:>12.1f}{elapsed * 1e6 / token_count:>10.2f}''')
@@ -0,0 +1,86 @@
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+sys.path.append("../")
+
+from core.source_file import read_source
+from front_end.lexer.lexer_gnu99 import GNU99Lexer
+
+ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir))
+
+def generate_source(file_path, size):
+    """
+    Write an amalgamation like source of about size bytes by repeating an example.
+
+    :param      file_path:  The file path
+    :type       file_path:  str
+    :param      size:       The size in bytes
+    :type       size:       int
+    """
+    with open(os.path.join(ROOT_DIR, 'examples', 'elf.i'), 'rt') as source_file:
+        part = source_file.read()
+
+    with open(file_path, 'wt') as source_file:
+        source_file.write(part * (size // len(part) + 1))
+
+def measure(function):
+    """
+    Measure duration and peak of Python allocations of a function.
+
+    Pages of a memory mapped file aren't Python allocations, they're read by the
+    OS on demand and can be dropped under memory pressure.
+
+    :param      function:  The function
+    :type       function:  function
+    """
+    start = time.perf_counter()
+    function()
+    duration = time.perf_counter() - start
+
+    tracemalloc.start()
+    function()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return duration, peak
+
+def count_tokens(lexer, data):
+    # Tokens are dropped as soon as they're produced, like a streaming consumer would.
+    lexer._lexer.input(data)
+
+    return sum(1 for _ in iter(lexer._lexer.token, None))
+
+def scan_text(file_path):
+    lexer = GNU99Lexer(scanner = True)
+
+    return count_tokens(lexer, Path(file_path).read_text())
+
+def scan_mapped(file_path):
+    lexer = GNU99Lexer(scanner = True)
+
+    with lexer.open_source(file_path) as data:
+        return count_tokens(lexer, data)
+
+def report(name, size, text, mapped):
+    print(f'''{name:<16}{size / 2 ** 20:>10.0f}{text[0]:>10.2f}{text[1] / 2 ** 20:>11.1f}{mapped[0]:>12.2f}{mapped[1] / 2 ** 20:>13.1f}''')
+
+if __name__ == "__main__":
+    print(f'''{'Stage':<16}{'Size (MB)':>10}{'Text (s)':>10}{'Text (MB)':>11}{'Mapped (s)':>12}{'Mapped (MB)':>13}''')
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        file_path = os.path.join(tmp_dir, 'amalgamation.i')
+
+        # Preprocessor reads whole sources, mapping saves the intermediate bytes copy.
+        generate_source(file_path, 64 * 2 ** 20)
+        report('Read', os.path.getsize(file_path), measure(lambda: Path(file_path).read_text()), measure(lambda: read_source(file_path)))
+
+        # Scanner lexes a large mapped source in place, small sources are read (MAP_THRESHOLD).
+        for size in [2 ** 20, 32 * 2 ** 20]:
+            generate_source(file_path, size)
+            assert scan_text(file_path) == scan_mapped(file_path)
+            report('Scan', os.path.getsize(file_path), measure(lambda: scan_text(file_path)), measure(lambda: scan_mapped(file_path)))
+
+    print('Peak of Python allocations, pages of a mapped file are managed by the OS.')
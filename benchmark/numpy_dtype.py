@@ -0,0 +1,121 @@
+import ctypes
+import os
+import random
+import sys
+import time
+sys.path.append("../")
+
+from front_end.parser.parser_gnu99 import GNU99Parser
+from transformer.common import Endianness
+from transformer.ctypes_generator import CTypesGenerator
+from transformer.numpy_generator import NumpyDtypeGenerator
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir))
+
+def load(generator, ast):
+    namespace = {}
+    exec(generator.generate(ast), namespace)
+
+    return namespace
+
+def ctypes_value(value):
+    """
+    Convert a ctypes field value to comparable Python values.
+
+    :param      value:  The value
+    :type       value:  object
+    """
+    if isinstance(value, ctypes.Array):
+        return [ctypes_value(item) for item in value]
+    elif isinstance(value, (ctypes.Structure, ctypes.Union)):
+        return {field[0]: ctypes_value(getattr(value, field[0])) for field in value._fields_ if len(field) == 2}
+    elif isinstance(value, ctypes._Pointer):
+        return ctypes.cast(value, ctypes.c_void_p).value or 0
+
+    return value
+
+def numpy_value(value, dtype):
+    """
+    Convert a numpy record value to comparable Python values.
+
+    :param      value:  The value
+    :type       value:  numpy.void|numpy.ndarray|numpy.generic
+    :param      dtype:  The value dtype
+    :type       dtype:  numpy.dtype
+    """
+    if dtype.subdtype is not None:
+        dtype = dtype.subdtype[0]
+
+    # Multi dimensional sub arrays are iterated one dimension at a time.
+    if isinstance(value, numpy.ndarray) and value.ndim > 0:
+        return [numpy_value(item, dtype) for item in value]
+    elif dtype.names is not None:
+        return {name: numpy_value(value[name], dtype.fields[name][0]) for name in dtype.names}
+
+    return value.item()
+
+def flatten_enumeration(value):
+    """
+    Replace enumerations ({'_value': x}) decoded by ctypes by their integer value.
+
+    :param      value:  The value
+    :type       value:  object
+    """
+    if isinstance(value, dict):
+        if list(value) == ['_value']:
+            return value['_value']
+
+        return {name: flatten_enumeration(item) for name, item in value.items()}
+    elif isinstance(value, list):
+        return [flatten_enumeration(item) for item in value]
+
+    return value
+
+if __name__ == "__main__":
+    if numpy is None:
+        print('NumPy is required to decode records with generated dtypes.')
+        sys.exit(1)
+
+    ast = GNU99Parser().parse_file(os.path.join(ROOT_DIR, 'examples', 'elf.i'))
+
+    for endianness in Endianness:
+        ctypes_module = load(CTypesGenerator(endianness = endianness), ast)
+        dtype_module  = load(NumpyDtypeGenerator(endianness = endianness), ast)
+
+        for name, dtype in dtype_module.items():
+            if not isinstance(dtype, numpy.dtype) or dtype.names is None:
+                continue
+
+            ctypes_class = ctypes_module[name]
+            data         = random.Random(0).getrandbits(8 * ctypes.sizeof(ctypes_class) * 1000).to_bytes(ctypes.sizeof(ctypes_class) * 1000, 'little')
+
+            # Every record is compared field by field, enumerations on their integer value.
+            for record, row in zip(ctypes_class.iter_from_buffer(data, copy = True), numpy.frombuffer(data, dtype = dtype)):
+                assert flatten_enumeration(ctypes_value(record)) == numpy_value(row, dtype), f'{name} ({endianness.name}) decoded differently'
+
+    print('ctypes classes and dtypes decode the same bytes identically.')
+
+    header_class = ctypes_module['Elf32HdrT']
+    header_dtype = dtype_module['Elf32HdrT']
+
+    print(f'''{'Records':>10}{'ctypes (ms)':>13}{'NumPy (ms)':>12}{'Speedup':>10}''')
+
+    for record_count in [10 ** 4, 10 ** 5, 10 ** 6]:
+        data = bytes(ctypes.sizeof(header_class) * record_count)
+
+        start       = time.perf_counter()
+        total       = sum(record.entryPoint_u32 for record in header_class.iter_from_buffer(data, copy = True))
+        ctypes_time = time.perf_counter() - start
+
+        start       = time.perf_counter()
+        result      = int(numpy.frombuffer(data, dtype = header_dtype)['entryPoint_u32'].sum())
+        numpy_time  = time.perf_counter() - start
+
+        assert total == result
+
+        print(f'''{record_count:>10}{ctypes_time * 1000:>13.1f}{numpy_time * 1000:>12.2f}{ctypes_time / numpy_time:>9.0f}x''')
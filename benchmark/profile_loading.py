@@ -0,0 +1,28 @@
+import sys
+import time
+sys.path.append("../")
+
+from preprocessor.c99_preprocessor import C99PreProcessor
+from preprocessor.profile import compile_profile, load_profile, profile_list
+
+def best_time(function, repeat = 10):
+    measure_list = []
+
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        measure_list.append(time.perf_counter() - start)
+
+    return min(measure_list)
+
+if __name__ == "__main__":
+    print(f'''{'Profile':<16}{'Macros':>8}{'Parsed (ms)':>13}{'Precompiled (ms)':>18}{'Speedup':>10}''')
+
+    for name in profile_list():
+        macro_count = len(load_profile(name))
+
+        # Definitions are fed through the preprocessor grammar like a prelude would be.
+        parsed      = best_time(lambda: compile_profile(name, C99PreProcessor()))
+        precompiled = best_time(lambda: load_profile(name))
+
+        print(f'''{name:<16}{macro_count:>8}{parsed * 1000:>13.2f}{precompiled * 1000:>18.2f}{parsed / precompiled:>9.1f}x''')
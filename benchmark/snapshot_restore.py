@@ -0,0 +1,75 @@
+import os
+import sys
+import tempfile
+import time
+sys.path.append("../")
+
+from pathlib import Path
+from preprocessor.c99_preprocessor import C99PreProcessor
+from preprocessor.snapshot import PreProcessorSnapshot
+
+def create_sources(directory, macro_count, source_count):
+    """
+    Create a prelude header defining many macros and sources including it.
+
+    :param      directory:     The directory
+    :type       directory:     str
+    :param      macro_count:   The number of macros defined by the prelude
+    :type       macro_count:   int
+    :param      source_count:  The number of sources
+    :type       source_count:  int
+    """
+    line_list = ['#ifndef PRELUDE_H', '#define PRELUDE_H']
+
+    for index in range(macro_count):
+        line_list.append(f'#define CONFIG_{index} ({index} + 1)')
+        line_list.append(f'#define CALL_{index}(a, b) ((a) * CONFIG_{index} + (b))')
+
+    line_list.append('typedef unsigned int config_t;')
+    line_list.append('#endif')
+
+    prelude_path = Path(directory).joinpath('prelude.h')
+    prelude_path.write_text('\n'.join(line_list) + '\n')
+
+    source_list = []
+
+    for index in range(source_count):
+        source_path = Path(directory).joinpath(f'source_{index}.c')
+        source_path.write_text(f'#include "prelude.h"\nconfig_t value_{index} = CALL_{index % macro_count}(2, 3);\n')
+        source_list.append(str(source_path))
+
+    return str(prelude_path), source_list
+
+def cold(prelude_path, source_list):
+    # Every source preprocesses the prelude again.
+    for source_path in source_list:
+        C99PreProcessor().process(source_path)
+
+def warm(snapshot_path, source_list):
+    pre_processor = C99PreProcessor()
+    snapshot      = PreProcessorSnapshot.load(snapshot_path)
+
+    for source_path in source_list:
+        pre_processor.restore(snapshot)
+        output = snapshot.output + pre_processor.process(source_path)
+
+if __name__ == "__main__":
+    print(f'''{'Macros':>8}{'Sources':>9}{'Cold (ms)':>12}{'Warm (ms)':>12}{'Speedup':>10}''')
+
+    for macro_count in [500, 2000]:
+        with tempfile.TemporaryDirectory() as directory:
+            prelude_path, source_list = create_sources(directory, macro_count, 20)
+            snapshot_path             = os.path.join(directory, 'prelude.snapshot')
+
+            pre_processor = C99PreProcessor()
+            pre_processor.snapshot(pre_processor.process(prelude_path)).save(snapshot_path)
+
+            start = time.perf_counter()
+            cold(prelude_path, source_list)
+            cold_time = time.perf_counter() - start
+
+            start = time.perf_counter()
+            warm(snapshot_path, source_list)
+            warm_time = time.perf_counter() - start
+
+            print(f'''{macro_count:>8}{len(source_list):>9}{cold_time * 1000:>12.1f}{warm_time * 1000:>12.1f}{cold_time / warm_time:>9.2f}x''')
@@ -0,0 +1,67 @@
+import os
+import re
+import sys
+import time
+sys.path.append("../")
+
+from preprocessor.source_scanner import SourceScanner
+
+ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir))
+
+# Phases 1 to 3 as they were done before the single pass scanner: one pass per
+# di/trigraph, one for line splicing and one for comments.
+LEGACY_REPLACE_TABLE = {
+                            '<:' : '[', '>:' : ']', '<%' : '{', '>%' : '}', '%:' : '#',
+                            '??=' : '#', '??/' : '\\', '??\'' : '^', '??(' : '[',
+                            '??)' : ']', '??!' : '|', '??<' : '{', '??>' : '}',
+                            '??-' : '~',
+                       }
+LEGACY_COMMENT_RE    = r'\/\*[\s\S]*?\*\/+|//.*'
+
+def legacy_scan(file_content):
+    for di_trigraph, replacing_char in LEGACY_REPLACE_TABLE.items():
+        file_content = file_content.replace(di_trigraph, replacing_char)
+
+    file_content = file_content.replace('\\\n', '')
+
+    return re.sub(LEGACY_COMMENT_RE, ' ', file_content)
+
+def generate_header(size):
+    """
+    Generate a header of about size bytes by repeating the example headers.
+
+    :param      size:  The size in bytes
+    :type       size:  int
+    """
+    part_list = []
+
+    for name in ['unprocessed.h', 'fat32.h', 'fat32_constant.h']:
+        with open(os.path.join(ROOT_DIR, 'examples', name), 'rt') as header_file:
+            part_list.append(header_file.read())
+
+    part = '\n'.join(part_list)
+
+    return part * (size // len(part) + 1)
+
+def best_time(function, data, repeat = 5):
+    measure_list = []
+
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function(data)
+        measure_list.append(time.perf_counter() - start)
+
+    return min(measure_list)
+
+if __name__ == "__main__":
+    scanner = SourceScanner()
+
+    print(f'''{'Size (MB)':>10}{'Legacy (ms)':>14}{'Scanner (ms)':>15}{'Speedup':>10}''')
+
+    for size in [1, 4, 16]:
+        data = generate_header(size * 1024 * 1024)
+
+        legacy  = best_time(legacy_scan, data)
+        current = best_time(scanner.scan, data)
+
+        print(f'''{size:>10}{legacy * 1000:>14.1f}{current * 1000:>15.1f}{legacy / current:>9.2f}x''')
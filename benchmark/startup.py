@@ -0,0 +1,61 @@
+import os
+import subprocess
+import sys
+sys.path.append("../")
+
+ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir))
+
+# Each measure is done in a fresh interpreter, otherwise PLY tables would
+# already be loaded by a previous measure.
+MEASURE_TEMPLATE = '''
+import sys
+import time
+sys.path.insert(0, {root_dir!r})
+
+start = time.perf_counter()
+
+from {module} import {grammar}
+grammar = {grammar}({options})
+grammar.{parse}({input!r})
+
+print(time.perf_counter() - start)
+'''
+
+GRAMMAR_LIST = [
+                    ('preprocessor.c99_preprocessor', 'C99PreProcessor', 'parse', '#define A 1\nint a = A;\n'),
+                    ('front_end.parser.parser_ansi', 'CANSIParser', 'parse', 'int a;'),
+                    ('front_end.parser.parser_99', 'C99Parser', 'parse', 'typedef struct { int a; } a_t;'),
+                    ('front_end.parser.parser_gnu99', 'GNU99Parser', 'parse', 'typedef struct { int a; } a_t;'),
+               ]
+
+def time_to_first_parse(module, grammar, parse, data, options = '', repeat = 5):
+    """
+    Measure the best time to import, build and run a grammar on a small input.
+    
+    :param      module:   The grammar module
+    :type       module:   str
+    :param      grammar:  The grammar class name
+    :type       grammar:  str
+    :param      options:  The constructor keyword arguments
+    :type       options:  str
+    :param      repeat:   The number of measures
+    :type       repeat:   int
+    """
+    code = MEASURE_TEMPLATE.format(root_dir = ROOT_DIR, module = module, grammar = grammar, options = options, parse = parse, input = data)
+    measure_list = []
+
+    for _ in range(repeat):
+        output = subprocess.run([sys.executable, '-c', code], stdout = subprocess.PIPE, stderr = subprocess.DEVNULL, universal_newlines = True, check = True, cwd = ROOT_DIR)
+        measure_list.append(float(output.stdout.split()[-1]))
+
+    return min(measure_list)
+
+if __name__ == "__main__":
+    print(f'''{'Grammar':<20}{'Generated (ms)':>16}{'Precomputed (ms)':>18}{'Speedup':>10}''')
+
+    for module, grammar, parse, data in GRAMMAR_LIST:
+        # Pointing to a missing table module forces PLY to compute tables like before.
+        generated   = time_to_first_parse(module, grammar, parse, data, "tabmodule = 'missing_parsetab'")
+        precomputed = time_to_first_parse(module, grammar, parse, data)
+
+        print(f'''{grammar:<20}{generated * 1000:>16.1f}{precomputed * 1000:>18.1f}{generated / precomputed:>9.1f}x''')
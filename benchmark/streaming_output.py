@@ -0,0 +1,70 @@
+import os
+import sys
+import tempfile
+import tracemalloc
+sys.path.append("../")
+
+from preprocessor.c99_preprocessor import C99PreProcessor
+
+def generate_amalgamation(directory, include_count, line_count = 200):
+    """
+    Generate a source including the same unguarded header many times, so
+    output grows with include count while input size stays the same.
+
+    :param      directory:      The directory
+    :type       directory:      str
+    :param      include_count:  The number of includes
+    :type       include_count:  int
+    :param      line_count:     The number of lines of the header
+    :type       line_count:     int
+    """
+    with open(os.path.join(directory, 'part.h'), 'wt') as header_file:
+        header_file.write('#define FIELD(name) int name;\n')
+        header_file.writelines([f'FIELD(field_{index})\n' for index in range(line_count)])
+
+    source_path = os.path.join(directory, 'amalgamation.c')
+
+    with open(source_path, 'wt') as source_file:
+        source_file.writelines(['#include "part.h"\n'] * include_count)
+
+    return source_path
+
+def measure_peak(function, *args):
+    """
+    Measure peak memory allocated by a function.
+
+    :param      function:  The function
+    :type       function:  function
+    :param      args:      The arguments
+    :type       args:      list
+    """
+    tracemalloc.start()
+    function(*args)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    return peak
+
+def write_joined(source_path, output_path):
+    with open(output_path, 'wt') as output_file:
+        output_file.write(C99PreProcessor().process(source_path))
+
+def write_streamed(source_path, output_path):
+    with open(output_path, 'wt') as output_file:
+        C99PreProcessor().process_to(source_path, output_file)
+
+if __name__ == "__main__":
+    # Parse tables are loaded once, so don't account them in the first measure.
+    C99PreProcessor()
+
+    print(f'''{'Includes':>10}{'Output (kB)':>14}{'Joined peak (kB)':>19}{'Streamed peak (kB)':>21}''')
+
+    for include_count in [10, 50, 250]:
+        with tempfile.TemporaryDirectory() as directory:
+            source_path = generate_amalgamation(directory, include_count)
+            output_path = os.path.join(directory, 'amalgamation.i')
+
+            joined   = measure_peak(write_joined, source_path, output_path)
+            streamed = measure_peak(write_streamed, source_path, output_path)
+
+            print(f'''{include_count:>10}{os.path.getsize(output_path) / 1024:>14.0f}{joined / 1024:>19.0f}{streamed / 1024:>21.0f}''')
@@ -0,0 +1,171 @@
+import ctypes
+import os
+import random
+import sys
+import time
+sys.path.append("../")
+
+from front_end.parser.parser_99 import C99Parser
+from front_end.parser.parser_gnu99 import GNU99Parser
+from transformer.common import Endianness
+from transformer.ctypes_generator import CTypesGenerator
+
+ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir))
+
+# Telemetry frame like record with nested structures, arrays of structures and padding
+RECORD = '''
+typedef enum
+{
+    NOMINAL = 0,
+    DEGRADED = 1,
+    SAFE = 2,
+} mode_e;
+
+typedef struct vector
+{
+    float x;
+    float y;
+    float z;
+} vector_t;
+
+typedef struct frame
+{
+    unsigned int sequence;
+    mode_e mode;
+    unsigned char flags;
+    double timestamp;
+    vector_t attitude[4];
+    short temperature[2][3];
+    struct
+    {
+        unsigned short voltage;
+        long long energy;
+    } battery;
+} frame_t;
+'''
+
+def load(ast, endianness = Endianness.LITTLE_ENDIAN):
+    namespace = {}
+    exec(CTypesGenerator(endianness = endianness).generate(ast), namespace)
+
+    return namespace
+
+def field_dict(value, ctype):
+    """
+    Build the dictionary of a ctypes value touching each field separately,
+    enumerations are their integer value.
+
+    :param      value:  The value
+    :type       value:  object
+    :param      ctype:  The ctypes type of the value
+    :type       ctype:  type
+    """
+    if issubclass(ctype, ctypes.Array):
+        return [field_dict(item, ctype._type_) for item in value]
+    elif issubclass(ctype, ctypes.Structure):
+        if hasattr(ctype, 'Value'):
+            return value._value
+
+        return {name: field_dict(getattr(value, name), field_type) for name, field_type in ctype._fields_}
+
+    return value
+
+def check(ast, endianness):
+    """
+    Check codecs of every structure against ctypes classes on random records.
+
+    :param      ast:         The ast
+    :type       ast:         { type_description }
+    :param      endianness:  The endianness
+    :type       endianness:  Endianness
+    """
+    for name, ctypes_class in load(ast, endianness).items():
+        if not hasattr(ctypes_class, '_struct_'):
+            continue
+
+        size = ctypes.sizeof(ctypes_class)
+        data = random.Random(0).getrandbits(8 * size * 100).to_bytes(size * 100, 'little')
+
+        assert ctypes_class._struct_.size == size, f'{name} ({endianness.name}) format size differs'
+
+        for index, values in enumerate(ctypes_class.iter_unpack(data)):
+            record = ctypes_class.from_buffer_copy(data, index * size)
+            packed = ctypes_class.from_buffer_copy(ctypes_class.pack_tuple(values))
+
+            # Compared on representation for NaN floats.
+            assert repr(record.to_dict()) == repr(field_dict(record, ctypes_class)), f'{name} ({endianness.name}) decoded differently'
+            assert repr(packed.to_dict()) == repr(record.to_dict()), f'{name} ({endianness.name}) packed differently'
+
+def unpack_frame(record):
+    # Flat tuple of every field value, in struct codec order
+    values = [record.sequence, record.mode._value, record.flags, record.timestamp]
+
+    for vector in record.attitude:
+        values += [vector.x, vector.y, vector.z]
+
+    for row in record.temperature:
+        values += row[:]
+
+    return tuple(values + [record.battery.voltage, record.battery.energy])
+
+def pack_frame(frame_class, values):
+    record = frame_class()
+    record.sequence, record.mode._value, record.flags, record.timestamp = values[:4]
+
+    for index, vector in enumerate(record.attitude):
+        vector.x, vector.y, vector.z = values[4 + 3 * index:7 + 3 * index]
+
+    for index, row in enumerate(record.temperature):
+        row[:] = values[16 + 3 * index:19 + 3 * index]
+
+    record.battery.voltage, record.battery.energy = values[22:]
+
+    return bytes(record)
+
+def best_time(function, repeat = 3):
+    measure_list = []
+
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        measure_list.append(time.perf_counter() - start)
+
+    return min(measure_list)
+
+if __name__ == "__main__":
+    record_ast = C99Parser().parse(RECORD)
+
+    for endianness in Endianness:
+        check(GNU99Parser().parse_file(os.path.join(ROOT_DIR, 'examples', 'elf.i')), endianness)
+        check(record_ast, endianness)
+
+    print('Codecs decode and encode like ctypes classes.')
+
+    frame_class  = load(record_ast)['FrameT']
+    frame_size   = ctypes.sizeof(frame_class)
+    record_count = 20000
+    data         = random.Random(0).getrandbits(8 * frame_size * record_count).to_bytes(frame_size * record_count, 'little')
+    record_list  = frame_class.from_buffer_array(bytearray(data), record_count)
+    values_list  = list(frame_class.iter_unpack(data))
+
+    assert repr([unpack_frame(record) for record in record_list]) == repr(values_list)
+    assert [pack_frame(frame_class, values) for values in values_list] == [frame_class.pack_tuple(values) for values in values_list]
+
+    benchmark_list =    [
+                            ('Unpack',  lambda: [unpack_frame(record) for record in frame_class.iter_from_buffer(data, copy = True)],
+                                        lambda: list(frame_class.iter_unpack(data))),
+                            ('Pack',    lambda: [pack_frame(frame_class, values) for values in values_list],
+                                        lambda: [frame_class.pack_tuple(values) for values in values_list]),
+                            ('To dict', lambda: [field_dict(record, frame_class) for record in record_list],
+                                        lambda: [record.to_dict() for record in record_list]),
+                        ]
+
+    print(f'''{'Frames':<10}{'Per field (ms)':>16}{'Struct (ms)':>13}{'Speedup':>10}''')
+
+    for name, per_field, codec in benchmark_list:
+        per_field_time = best_time(per_field)
+        codec_time     = best_time(codec)
+
+        print(f'''{name:<10}{per_field_time * 1000:>16.1f}{codec_time * 1000:>13.1f}{per_field_time / codec_time:>9.1f}x''')
+
+    print(f'{record_count} frames of {frame_size} bytes')
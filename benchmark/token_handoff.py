@@ -0,0 +1,80 @@
+import gc
+import os
+import sys
+import tempfile
+import time
+sys.path.append("../")
+
+from preprocessor.c99_preprocessor import C99PreProcessor
+from front_end.parser.parser_99 import C99Parser
+
+# Header shape: every field type comes from a macro so text lines go through the expander.
+STRUCTURE = '''
+#define FIELD_{index}(name) unsigned int name : 4
+typedef struct header_{index} {{
+    FIELD_{index}(kind);
+    unsigned char data[SIZE];
+    struct {{ unsigned short a, b; }} pair[2];
+}} header_{index}_t;
+'''
+
+def generate_header(structure_count):
+    """
+    Generate a header made of macro heavy structure declarations.
+
+    :param      structure_count:  The number of structures
+    :type       structure_count:  int
+    """
+    return '#define SIZE 16\n' + ''.join(STRUCTURE.format(index = index) for index in range(structure_count))
+
+def best_time(function_table, repeat = 9):
+    """
+    Measure the best duration of each function, measures are interleaved so
+    every function sees the same machine load.
+
+    :param      function_table:  The functions by name
+    :type       function_table:  dict
+    :param      repeat:          The number of measures
+    :type       repeat:          int
+    """
+    measure_table = {name: [] for name in function_table}
+
+    for _ in range(repeat):
+        for name, function in function_table.items():
+            gc.collect()
+            start = time.perf_counter()
+            function()
+            measure_table[name].append(time.perf_counter() - start)
+
+    return {name: min(measure_list) for name, measure_list in measure_table.items()}
+
+if __name__ == "__main__":
+    # Preprocessor is built first so PLY parser picks the C lexer up as its default lexer.
+    C99PreProcessor()
+
+    print(f'''{'Structures':>12}{'Preprocess (ms)':>18}{'Parse (ms)':>16}{'Total (ms)':>16}{'Speedup':>10}''')
+    print(f'''{'':>12}{'text/tokens':>18}{'text/tokens':>16}{'text/tokens':>16}''')
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for structure_count in [100, 400, 1600]:
+            file_path = os.path.join(tmp_dir, f'header_{structure_count}.h')
+
+            with open(file_path, 'wt') as header_file:
+                header_file.write(generate_header(structure_count))
+
+            text       = C99PreProcessor().process(file_path)
+            token_list = C99PreProcessor().process_tokens(file_path)
+
+            assert repr(C99Parser().parse(text)) == repr(C99Parser().parse_tokens(token_list))
+
+            measure = best_time({
+                                    'process':          lambda: C99PreProcessor().process(file_path),
+                                    'process_tokens':   lambda: C99PreProcessor().process_tokens(file_path),
+                                    'parse':            lambda: C99Parser().parse(text),
+                                    'parse_tokens':     lambda: C99Parser().parse_tokens(token_list),
+                                })
+
+            text_total  = measure['process'] + measure['parse']
+            token_total = measure['process_tokens'] + measure['parse_tokens']
+
+            print(f'''{structure_count:>12}{measure['process'] * 1000:>10.0f}/{measure['process_tokens'] * 1000:<7.0f}{measure['parse'] * 1000:>8.0f}/{measure['parse_tokens'] * 1000:<7.0f}{text_total * 1000:>8.0f}/{token_total * 1000:<7.0f}{text_total / token_total:>9.2f}x''')
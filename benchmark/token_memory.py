@@ -0,0 +1,68 @@
+import os
+import sys
+import time
+import tracemalloc
+sys.path.append("../")
+
+from front_end.lexer.lexer_99 import C99Lexer
+from front_end.lexer.lexer_ansi import CANSILexer
+from preprocessor.c99_preprocessor import C99PreProcessorLexer
+import ply.lex as lex
+
+ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir))
+
+def generate_source(size):
+    """
+    Generate a preprocessed source of about size bytes by repeating an example.
+
+    :param      size:  The size in bytes
+    :type       size:  int
+    """
+    with open(os.path.join(ROOT_DIR, 'examples', 'elf.i'), 'rt') as source_file:
+        # Line markers aren't C tokens.
+        part = ''.join(line for line in source_file if not line.startswith('#'))
+
+    return part * (size // len(part) + 1)
+
+def measure(lexer, data, token):
+    """
+    Measure memory used by the token list of data once every token is alive.
+
+    :param      lexer:  The PLY lexer
+    :type       lexer:  ply.lex.Lexer
+    :param      data:   The source
+    :type       data:   str
+    :param      token:  The function producing next token
+    :type       token:  function
+    """
+    lexer.input(data)
+    start = time.perf_counter()
+    list(iter(lambda: token(lexer), None))
+    duration = time.perf_counter() - start
+
+    # Tracing slows allocations down so time is measured on its own.
+    lexer.input(data)
+    tracemalloc.start()
+
+    token_list = list(iter(lambda: token(lexer), None))
+    memory, _  = tracemalloc.get_traced_memory()
+
+    tracemalloc.stop()
+
+    return len(token_list), memory, duration
+
+if __name__ == "__main__":
+    data = generate_source(1024 * 1024)
+
+    print(f'''{'Lexer':<22}{'Tokens':>9}{'LexToken (MB)':>15}{'Token (MB)':>12}{'LexToken (s)':>14}{'Token (s)':>11}''')
+
+    for lexer_class in [C99PreProcessorLexer, C99Lexer, CANSILexer]:
+        lexer = lexer_class()._lexer
+
+        # PLY tokens are produced by calling the base lexer method directly.
+        count, legacy_memory, legacy_duration = measure(lexer, data, lex.Lexer.token)
+        _, memory, duration                   = measure(lexer, data, type(lexer).token)
+
+        print(f'''{lexer_class.__name__:<22}{count:>9}{legacy_memory / 2 ** 20:>15.1f}{memory / 2 ** 20:>12.1f}{legacy_duration:>14.2f}{duration:>11.2f}''')
+
+    print('Memory of every token alive per 1 MB of source.')
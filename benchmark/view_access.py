@@ -0,0 +1,168 @@
+import ctypes
+import os
+import random
+import sys
+import time
+sys.path.append("../")
+
+from front_end.parser.parser_99 import C99Parser
+from front_end.parser.parser_gnu99 import GNU99Parser
+from transformer.common import Endianness
+from transformer.ctypes_generator import CTypesGenerator
+from transformer.view_generator import ViewGenerator
+
+ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir))
+
+# Record with an enumeration, a nested structure, bit fields and arrays
+RECORD = '''
+typedef enum
+{
+    IDLE = 0,
+    RUNNING = 1,
+    STOPPED = 2,
+} state_e;
+
+typedef struct sample
+{
+    unsigned int timestamp;
+    state_e state;
+    unsigned short flags : 4;
+    short delta : 7;
+    struct
+    {
+        short x;
+        short y;
+    } position;
+    unsigned char data[2][3];
+} sample_t;
+'''
+
+def load(generator, ast):
+    namespace = {}
+    exec(generator.generate(ast), namespace)
+
+    return namespace
+
+def decode(value, ctype):
+    """
+    Decode a field value of a ctypes class or of a view class to comparable
+    Python values, walking the fields of the ctypes class.
+
+    :param      value:  The value
+    :type       value:  object
+    :param      ctype:  The ctypes type of the value
+    :type       ctype:  type
+    """
+    if issubclass(ctype, ctypes.Array):
+        return [decode(item, ctype._type_) for item in value]
+    elif issubclass(ctype, (ctypes.Structure, ctypes.Union)):
+        decoded = {field[0]: decode(getattr(value, field[0]), field[1]) for field in ctype._fields_ if field[0]}
+
+        # Enumerations are also compared on their member.
+        if hasattr(ctype, 'Value'):
+            try:
+                decoded['value'] = value.value
+            except ValueError:
+                decoded['value'] = None
+
+        return decoded
+    elif isinstance(value, ctypes._Pointer):
+        return ctypes.cast(value, ctypes.c_void_p).value or 0
+
+    return value
+
+def check(ast, endianness):
+    """
+    Check views decode random records like ctypes classes, for every structure.
+
+    :param      ast:         The ast
+    :type       ast:         { type_description }
+    :param      endianness:  The endianness
+    :type       endianness:  Endianness
+    """
+    ctypes_module = load(CTypesGenerator(endianness = endianness), ast)
+    view_module   = load(ViewGenerator(endianness = endianness), ast)
+
+    for name, view_class in view_module.items():
+        if not isinstance(view_class, type) or name.startswith('_'):
+            continue
+
+        ctypes_class = ctypes_module[name]
+        size         = ctypes.sizeof(ctypes_class) * 1000
+        data         = random.Random(0).getrandbits(8 * size).to_bytes(size, 'little')
+
+        # Enumerations are compared too, as arrays of records.
+        for record, view in zip((ctypes_class * 1000).from_buffer_copy(data), view_class.iter_from_buffer(data)):
+            assert decode(record, ctypes_class) == decode(view, ctypes_class), f'{name} ({endianness.name}) decoded differently'
+
+def reads_per_second(record, read, count = 200000):
+    """
+    Measure reads per second on a record or a record class (best of 3).
+
+    :param      record:  The record
+    :type       record:  object|type
+    :param      read:    The read function
+    :type       read:    function
+    :param      count:   The number of reads per measure
+    :type       count:   int
+    """
+    measure_list = []
+
+    for _ in range(3):
+        start = time.perf_counter()
+        for _ in range(count):
+            read(record)
+        measure_list.append(time.perf_counter() - start)
+
+    return count / min(measure_list)
+
+if __name__ == "__main__":
+    record_ast = C99Parser().parse(RECORD)
+
+    for endianness in Endianness:
+        check(GNU99Parser().parse_file(os.path.join(ROOT_DIR, 'examples', 'elf.i')), endianness)
+        check(record_ast, endianness)
+
+    print('ctypes and view classes decode the same bytes identically.')
+
+    ctypes_class = load(CTypesGenerator(), record_ast)['SampleT']
+    view_class   = load(ViewGenerator(), record_ast)['SampleT']
+    record       = ctypes_class(timestamp = 1000, delta = -5)
+
+    record.state._value = 2
+    record.position.x   = 3
+    record.data[1][2]   = 7
+
+    view = view_class.from_buffer(bytes(record))
+
+    read_map =  {
+                    'timestamp'     : lambda record: record.timestamp,
+                    'state.value'   : lambda record: record.state.value,
+                    'delta'         : lambda record: record.delta,
+                    'position.x'    : lambda record: record.position.x,
+                    'data[1][2]'    : lambda record: record.data[1][2],
+                }
+
+    print(f'''{'Field':<14}{'ctypes (reads/s)':>18}{'View (reads/s)':>16}{'Speedup':>10}''')
+
+    for field, read in read_map.items():
+        ctypes_reads = reads_per_second(record, read)
+        view_reads   = reads_per_second(view, read)
+
+        print(f'''{field:<14}{ctypes_reads:>18,.0f}{view_reads:>16,.0f}{view_reads / ctypes_reads:>9.2f}x''')
+
+    # Records are decoded in a stream, reading a few fields of each.
+    record_count    = 100000
+    data            = bytearray(bytes(record) * record_count)
+    stream_read_map =   {
+                            'Stream'        : lambda record_class: sum(record.timestamp + record.state.value for record in record_class.iter_from_buffer(data)),
+                            'Stream scalars': lambda record_class: sum(record.timestamp + record.delta for record in record_class.iter_from_buffer(data)),
+                        }
+
+    for label, stream_read in stream_read_map.items():
+        ctypes_records = reads_per_second(ctypes_class, stream_read, 1) * record_count
+        view_records   = reads_per_second(view_class, stream_read, 1) * record_count
+
+        assert stream_read(ctypes_class) == stream_read(view_class)
+
+        print(f'''{label:<14}{ctypes_records:>18,.0f}{view_records:>16,.0f}{view_records / ctypes_records:>9.2f}x  (records/s)''')
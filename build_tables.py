@@ -0,0 +1,97 @@
+from front_end.parser.parser_ansi import CANSIParser
+from front_end.parser.parser_99 import C99Parser
+from front_end.parser.parser_gnu99 import GNU99Parser
+from preprocessor.c99_preprocessor import C99PreProcessor
+from preprocessor.profile import compile_profile, load_profile, profile_list, save_profile
+
+import argparse
+import importlib
+import ply.yacc as yacc
+import sys
+
+# Every grammar shipping a precomputed parse table
+GRAMMAR_LIST = [C99PreProcessor, CANSIParser, C99Parser, GNU99Parser]
+
+def grammar_signature(grammar):
+    """
+    Compute the signature of a grammar as done by PLY to check table validity.
+
+    :param      grammar:  The parser or preprocessor instance
+    :type       grammar:  object
+    """
+    pdict = {name: getattr(grammar, name) for name in dir(grammar)}
+
+    # Start symbol of the preprocessor is only given to yacc at construction.
+    if isinstance(grammar, C99PreProcessor):
+        pdict['start'] = 'preprocessing_file'
+
+    pinfo = yacc.ParserReflect(pdict, log = yacc.NullLogger())
+    pinfo.get_all()
+
+    return pinfo.signature()
+
+def is_up_to_date(grammar):
+    """
+    Determine whether shipped parse table matches the grammar.
+
+    :param      grammar:  The parser or preprocessor instance
+    :type       grammar:  object
+    """
+    try:
+        table_module = importlib.import_module(grammar.TABLE_MODULE)
+    except ImportError:
+        return False
+
+    return table_module._lr_signature == grammar_signature(grammar)
+
+def build_tables(check = False):
+    """
+    Generate (or check) parse tables of every grammar.
+
+    Tables are only written when grammar signature changed.
+
+    :param      check:  Only check tables without writing them
+    :type       check:  bool
+    """
+    is_outdated = False
+
+    for grammar_class in GRAMMAR_LIST:
+        if check:
+            if not is_up_to_date(grammar_class()):
+                is_outdated = True
+                print(f'{grammar_class.TABLE_MODULE} is outdated, run build_tables.py.')
+        else:
+            # Without optimization, PLY checks table signature and regenerates a stale table.
+            grammar_class(optimize = False, write_tables = True)
+
+    return build_profiles(check) and not is_outdated
+
+def build_profiles(check = False):
+    """
+    Precompile (or check) predefined macros of every target profile.
+
+    Profiles are only written when their definitions changed.
+
+    :param      check:  Only check profiles without writing them
+    :type       check:  bool
+    """
+    is_outdated = False
+
+    for name in profile_list():
+        if load_profile(name) is not None:
+            continue
+
+        if check:
+            is_outdated = True
+            print(f'Profile {name} is outdated, run build_tables.py.')
+        else:
+            save_profile(name, compile_profile(name, C99PreProcessor()))
+
+    return not is_outdated
+
+if __name__ == "__main__":
+    argument_parser = argparse.ArgumentParser(description = 'Generate precomputed PLY parse tables and predefined macros profiles.')
+    argument_parser.add_argument('--check', action = 'store_true', help = 'only check that shipped tables and profiles are up to date')
+    arguments = argument_parser.parse_args()
+
+    sys.exit(0 if build_tables(arguments.check) else 1)
@@ -1,10 +1,50 @@
+from core.dependency_graph import DependencyGraph
 from front_end.parser.parser_ansi import CANSIParser
 from front_end.parser.parser_99 import C99Parser
+from front_end.parser.parser_gnu99 import GNU99Parser
 from preprocessor.c99_preprocessor import C99PreProcessor
+from preprocessor.gnu99_preprocessor import GNU99PreProcessor
 from transformer.ctypes_generator import CTypesGenerator
 
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+
 import os
 
+# Dependency graph manifest written at the root of the output tree
+MANIFEST_NAME = '.copy_dependencies.json'
+
+# Touched at the root of the output tree when compile_many starts, modules older
+# than it are left over by a previous build.
+BUILD_STAMP_NAME = '.copy_build'
+
+def _compile_translation_unit(compiler_class, output_path, cache_dir, profile, lazy, input_path, output_filepath):
+    """
+    Compile a single translation unit inside a worker process.
+
+    Preprocessor and parser keep macro, symbol and tag tables between calls
+    so every translation unit is compiled by its own compiler instance.
+
+    :param      compiler_class:   The compiler class
+    :type       compiler_class:   type
+    :param      output_path:      The output path
+    :type       output_path:      str
+    :param      cache_dir:        The header cache directory
+    :type       cache_dir:        str|None
+    :param      profile:          The predefined macros profile
+    :type       profile:          str|None
+    :param      lazy:             Generate lazy modules
+    :type       lazy:             bool
+    :param      input_path:       The input path
+    :type       input_path:       str
+    :param      output_filepath:  The output filepath
+    :type       output_filepath:  str
+    """
+    compiler = compiler_class(output_path, cache_dir = cache_dir, profile = profile, lazy = lazy)
+    compiler.compile(input_path, output_filepath)
+
+    return output_filepath, compiler.get_dependency_list(input_path)
+
 class CoPYCompiler(object):
     '''
     This class represent a compiler that translates C struct
@@ -12,13 +52,111 @@ class CoPYCompiler(object):
 
     Comments found inside structures will be kept intact.
     '''
-    def __init__(self, output_path):
+    def __init__(self, output_path, cache_dir = None, profile = None, lazy = False):
         self._output_path   = output_path
-        self._pre_processor = C99PreProcessor()
+        self._cache_dir     = cache_dir
+        self._profile       = profile
+        self._lazy          = lazy
+        self._pre_processor = C99PreProcessor(cache_dir = cache_dir, profile = profile)
+
+    def _get_output_filepath(self, input_path, input_root = None):
+        """
+        Gets the output filepath of an input file.
 
-    def compile(self, input_path):
+        Output tree mirrors the input tree relatively to input root.
+
+        :param      input_path:  The input path
+        :type       input_path:  str
+        :param      input_root:  The input root
+        :type       input_root:  str|None
+        """
+        if input_root is not None:
+            input_path = os.path.relpath(input_path, input_root)
+
+        return os.path.join(self._output_path, f'{os.path.splitext(input_path)[0]}.py')
+
+    def compile(self, input_path, output_filepath = None):
         self._pre_processor.process(input_path)
 
+    def get_dependency_list(self, input_path):
+        """
+        Gets files a compiled translation unit depends on, itself included.
+
+        :param      input_path:  The input path
+        :type       input_path:  str
+        """
+        return [str(input_path)] + [str(path) for path in self._pre_processor.dependencies]
+
+    def compile_many(self, input_path_list, input_root = None, max_workers = None, incremental = False):
+        """
+        Compile independent translation units in parallel.
+
+        Translation units are dispatched to a pool of processes, each one
+        compiling with its own preprocessor and parser instances.
+
+        Headers pulled in by each translation unit are recorded inside a dependency
+        graph manifest at the root of the output tree. In incremental mode, only
+        outputs whose source or transitive headers changed are generated again.
+
+        :param      input_path_list:  The input paths
+        :type       input_path_list:  list
+        :param      input_root:       The root of the mirrored input tree
+        :type       input_root:       str|None
+        :param      max_workers:      The number of processes (default to core count)
+        :type       max_workers:      int|None
+        :param      incremental:      Only compile outdated outputs
+        :type       incremental:      bool
+        """
+        output_filepath_list = []
+        dependency_graph     = DependencyGraph(os.path.join(self._output_path, MANIFEST_NAME), type(self).__name__)
+
+        os.makedirs(self._output_path, exist_ok=True)
+        Path(self._output_path, BUILD_STAMP_NAME).touch()
+
+        try:
+            with ProcessPoolExecutor(max_workers = max_workers) as executor:
+                future_list = {}
+
+                for input_path in input_path_list:
+                    output_filepath = self._get_output_filepath(input_path, input_root)
+
+                    if incremental and not dependency_graph.is_outdated(output_filepath, input_path):
+                        continue
+
+                    future = executor.submit(_compile_translation_unit, type(self), self._output_path, self._cache_dir, self._profile, self._lazy, str(input_path), output_filepath)
+                    future_list[future] = input_path
+
+                for future in as_completed(future_list):
+                    try:
+                        output_filepath, dependency_list = future.result()
+                    except Exception as error:
+                        raise Exception(f'Failed to compile {future_list[future]}: {error}') from error
+
+                    dependency_graph.add(output_filepath, future_list[future], dependency_list)
+                    output_filepath_list.append(output_filepath)
+        finally:
+            # Saved even on failure so successfully compiled units aren't compiled again.
+            dependency_graph.save()
+
+        return output_filepath_list
+
+    def compile_directory(self, input_dir, pattern = '*.h', max_workers = None, incremental = False):
+        """
+        Compile every file matching pattern inside a directory tree.
+
+        :param      input_dir:    The input directory
+        :type       input_dir:    str
+        :param      pattern:      The file pattern
+        :type       pattern:      str
+        :param      max_workers:  The number of processes (default to core count)
+        :type       max_workers:  int|None
+        :param      incremental:  Only compile outdated outputs
+        :type       incremental:  bool
+        """
+        input_path_list = sorted(Path(input_dir).rglob(pattern))
+
+        return self.compile_many(input_path_list, input_root = input_dir, max_workers = max_workers, incremental = incremental)
+
 class CoPyANSICompiler(CoPYCompiler):
     '''
     This class represent the C89/C90 compatible compiler that translates C struct
@@ -27,12 +165,12 @@ class CoPyANSICompiler(CoPYCompiler):
     Comments found inside structures will be kept intact.
     '''
 
-    def __init__(self, output_path):
-        super(CoPyANSICompiler, self).__init__(output_path)
+    def __init__(self, output_path, cache_dir = None, profile = None, lazy = False):
+        super(CoPyANSICompiler, self).__init__(output_path, cache_dir, profile, lazy)
         self._parser = CANSIParser()
 
-    def compile(self, input_path):
-        super(CoPyANSICompiler, self).compile(input_path)
+    def compile(self, input_path, output_filepath = None):
+        super(CoPyANSICompiler, self).compile(input_path, output_filepath)
 
 class CoPy99Compiler(CoPYCompiler):
     '''
@@ -42,25 +180,175 @@ class CoPy99Compiler(CoPYCompiler):
     Comments found inside structures will be kept intact.
     '''
 
-    def __init__(self, output_path):
-        super(CoPy99Compiler, self).__init__(output_path)
+    def __init__(self, output_path, cache_dir = None, profile = None, lazy = False):
+        super(CoPy99Compiler, self).__init__(output_path, cache_dir, profile, lazy)
         self._parser    = C99Parser()
-        self._generator = CTypesGenerator()
+        self._generator = CTypesGenerator(lazy = lazy)
 
-    def compile(self, input_path):
-        super(CoPy99Compiler, self).compile(input_path)
-        
-        preprocessed_output = self._pre_processor.process(input_path)
-        ast                 = self._parser.parse(preprocessed_output)
-        generated_code      = self._generator.generate(ast)
+    def _parse(self, input_path, preprocessed_filepath = None):
+        """
+        Preprocess and parse a translation unit.
+
+        Preprocessed tokens are handed to the parser directly, preprocessed text
+        is only written when a preprocessed filepath is given.
+
+        :param      input_path:             The input path
+        :type       input_path:             str
+        :param      preprocessed_filepath:  The preprocessed text (.i) filepath
+        :type       preprocessed_filepath:  str|None
+        """
+        if preprocessed_filepath is None:
+            token_list = self._pre_processor.process_tokens(input_path)
+        else:
+            os.makedirs(os.path.dirname(os.path.abspath(preprocessed_filepath)), exist_ok=True)
+
+            with open(preprocessed_filepath, 'wt') as preprocessed_file:
+                token_list = self._pre_processor.process_tokens(input_path, preprocessed_file)
+
+        return self._parser.parse_tokens(token_list)
+
+    def compile(self, input_path, output_filepath = None, preprocessed_filepath = None):
+        """
+        Compile a translation unit to Python code.
+
+        :param      input_path:             The input path
+        :type       input_path:             str
+        :param      output_filepath:        The output filepath
+        :type       output_filepath:        str|None
+        :param      preprocessed_filepath:  The preprocessed text (.i) filepath
+        :type       preprocessed_filepath:  str|None
+        """
+        ast            = self._parse(input_path, preprocessed_filepath)
+        generated_code = self._generator.generate(ast)
         
-        output_filepath = os.path.join(self._output_path, f'{os.path.splitext(input_path)[0]}.py')
+        if output_filepath is None:
+            output_filepath = self._get_output_filepath(input_path)
 
         os.makedirs(os.path.dirname(output_filepath), exist_ok=True)
 
         with open(output_filepath, 'wt') as output_file:
             output_file.write(generated_code)
 
+class CoPyGNU99Compiler(CoPy99Compiler):
+    '''
+    This class represent the GNU99 compatible compiler that translates C struct
+    to a Python package of ctypes structures.
+
+    Line markers tell the header each declaration comes from, every header gets
+    its own module inside the output tree, imported by modules using its classes.
+    '''
+
+    def __init__(self, output_path, cache_dir = None, profile = None, lazy = False):
+        super(CoPyGNU99Compiler, self).__init__(output_path, cache_dir, profile, lazy)
+        self._pre_processor = GNU99PreProcessor(cache_dir = cache_dir, profile = profile)
+        self._parser        = GNU99Parser()
+
+    def _is_built(self, filepath, package_path):
+        """
+        Determine whether a module has been written by the current build
+        (compile_many), rather than left over by a previous one.
+
+        :param      filepath:      The filepath
+        :type       filepath:      str
+        :param      package_path:  The package root
+        :type       package_path:  str
+        """
+        try:
+            return os.stat(filepath).st_mtime_ns >= os.stat(os.path.join(package_path, BUILD_STAMP_NAME)).st_mtime_ns
+        except FileNotFoundError:
+            return False
+
+    def _write_module(self, filepath, code, package_path, shared = False):
+        """
+        Write a module of the package, directories up to the package root get an
+        __init__.py.
+
+        Modules are written to a temporary file first, so concurrent workers never
+        read a partial module. A shared module (header) is created exclusively,
+        it isn't written again when it already holds the same code, and another
+        translation unit of the build generating it differently is an error.
+
+        :param      filepath:      The filepath
+        :type       filepath:      str
+        :param      code:          The code
+        :type       code:          str
+        :param      package_path:  The package root
+        :type       package_path:  str
+        :param      shared:        Whether the module is shared by translation units
+        :type       shared:        bool
+        """
+        os.makedirs(os.path.dirname(filepath), exist_ok=True)
+
+        tmp_path = f'{filepath}.{os.getpid()}.tmp'
+
+        with open(tmp_path, 'wt') as module_file:
+            module_file.write(code)
+
+        try:
+            if not shared:
+                os.replace(tmp_path, filepath)
+            else:
+                try:
+                    os.link(tmp_path, filepath)
+                except FileExistsError:
+                    with open(filepath, 'rt') as module_file:
+                        if module_file.read() != code:
+                            if self._is_built(filepath, package_path):
+                                raise Exception(f'{filepath} is generated differently by another translation unit, the header is included with other macros.')
+
+                            os.replace(tmp_path, filepath)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+        directory_list = [package_path]
+
+        for part in Path(os.path.relpath(os.path.dirname(os.path.abspath(filepath)), package_path)).parts:
+            directory_list.append(os.path.join(directory_list[-1], part))
+
+        for directory in directory_list:
+            open(os.path.join(directory, '__init__.py'), 'at').close()
+
+    def compile(self, input_path, output_filepath = None, preprocessed_filepath = None):
+        """
+        Compile a translation unit to a module of the output package, headers it
+        includes are compiled to their own modules.
+
+        Headers included with quotes are placed relatively to their includer, the
+        other ones at the root of the output tree (or of the output filepath
+        directory when it's outside the output tree).
+
+        :param      input_path:             The input path
+        :type       input_path:             str
+        :param      output_filepath:        The output filepath
+        :type       output_filepath:        str|None
+        :param      preprocessed_filepath:  The preprocessed text (.i) filepath
+        :type       preprocessed_filepath:  str|None
+        """
+        ast = self._parse(input_path, preprocessed_filepath)
+
+        if output_filepath is None:
+            output_filepath = self._get_output_filepath(input_path)
+
+        package_path = os.path.abspath(self._output_path)
+        source_path  = os.path.relpath(os.path.abspath(output_filepath), package_path)
+
+        if source_path.startswith(os.pardir):
+            package_path = os.path.dirname(os.path.abspath(output_filepath))
+            source_path  = os.path.basename(output_filepath)
+
+        source_path  = Path(os.path.splitext(source_path)[0] + os.path.splitext(input_path)[1]).as_posix()
+        module_table = self._generator.generate_package(ast, source_path)
+        module_name  = self._generator.get_module_name(source_path)
+
+        os.makedirs(package_path, exist_ok=True)
+
+        for name, code in module_table.items():
+            if name == module_name:
+                self._write_module(output_filepath, code, package_path)
+            else:
+                self._write_module(os.path.join(package_path, *name.split('.')) + '.py', code, package_path, shared = True)
+
 if __name__ == "__main__":
     compiler = CoPy99Compiler("output/")
-    compiler.compile("examples/unprocessed.h")
\ No newline at end of file
+    compiler.compile("examples/unprocessed.h")
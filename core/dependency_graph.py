@@ -0,0 +1,111 @@
+import hashlib
+import json
+import os
+from pathlib import Path
+
+# Bump this value whenever the manifest layout changes.
+MANIFEST_VERSION = 1
+
+def file_state(path):
+    """
+    Compute the state of a file used to detect changes.
+
+    :param      path:  The file path
+    :type       path:  str
+    """
+    path = Path(path)
+    stat = path.stat()
+
+    return [stat.st_mtime_ns, stat.st_size, hashlib.sha256(path.read_bytes()).hexdigest()]
+
+class DependencyGraph(object):
+    """
+    Record headers every translation unit pulled in and tell which outputs
+    are outdated.
+
+    Graph is stored as a JSON manifest next to generated files. For each output,
+    the manifest holds its source and the state (mtime, size, digest) of every
+    file it transitively depends on. Mtime and size are checked first so only
+    touched files are hashed again.
+    """
+
+    def __init__(self, manifest_path, compiler_name = ''):
+        self._manifest_path = Path(manifest_path)
+        self._compiler_name = compiler_name
+        self.output_table   = {}
+
+        self.load()
+
+    def load(self):
+        """
+        Load the manifest, an unreadable or outdated manifest is ignored.
+        """
+        try:
+            manifest = json.loads(self._manifest_path.read_text())
+        except (OSError, ValueError):
+            return
+
+        if manifest.get('version') == MANIFEST_VERSION and manifest.get('compiler') == self._compiler_name:
+            self.output_table = manifest['outputs']
+
+    def save(self):
+        """
+        Save the manifest.
+        """
+        manifest = {
+                        'version'  : MANIFEST_VERSION,
+                        'compiler' : self._compiler_name,
+                        'outputs'  : self.output_table,
+                   }
+        tmp_path = self._manifest_path.with_suffix(f'.{os.getpid()}.tmp')
+
+        self._manifest_path.parent.mkdir(parents = True, exist_ok = True)
+        tmp_path.write_text(json.dumps(manifest, indent = 4, sort_keys = True))
+        os.replace(tmp_path, self._manifest_path)
+
+    def add(self, output_filepath, input_path, dependency_list):
+        """
+        Record dependencies of an output.
+
+        :param      output_filepath:  The output filepath
+        :type       output_filepath:  str
+        :param      input_path:       The translation unit path
+        :type       input_path:       str
+        :param      dependency_list:  The files translation unit depends on (itself included)
+        :type       dependency_list:  list
+        """
+        self.output_table[str(output_filepath)] = {
+                                                        'source'       : str(Path(input_path).resolve()),
+                                                        'dependencies' : {str(Path(path).resolve()): file_state(path) for path in dependency_list},
+                                                  }
+
+    def is_outdated(self, output_filepath, input_path):
+        """
+        Determine whether an output has to be generated again.
+
+        :param      output_filepath:  The output filepath
+        :type       output_filepath:  str
+        :param      input_path:       The translation unit path
+        :type       input_path:       str
+        """
+        output = self.output_table.get(str(output_filepath))
+
+        if not output or output['source'] != str(Path(input_path).resolve()) or not os.path.isfile(output_filepath):
+            return True
+
+        for path, state in output['dependencies'].items():
+            try:
+                stat = os.stat(path)
+            except OSError:
+                return True
+
+            if [stat.st_mtime_ns, stat.st_size] == state[:2]:
+                continue
+
+            # File has been touched, only a content change requires a rebuild.
+            if file_state(path)[2] != state[2]:
+                return True
+
+            state[:2] = [stat.st_mtime_ns, stat.st_size]
+
+        return False
@@ -1,3 +1,6 @@
+import copy
+import enum
+
 class SourceFile(object):
 
     def __init__(self, filename = ''):
@@ -16,10 +19,13 @@ class Struct(object):
     """
     """
 
-    def __init__(self, identifier = '', declaration_list = [], packing = 4):
+    def __init__(self, identifier = '', declaration_list = [], packing = 4, is_packed = False):
         self.identifier       = identifier
         self.declaration_list = declaration_list
         self.packing          = packing
+        # Packing is explicit (packed attribute), not the default one.
+        self.is_packed        = is_packed
+        self.layout_table     = {}
 
     def is_incomplete(self):
         return not len(self.declaration_list)
@@ -35,10 +41,12 @@ class Union(object):
     """
     """
 
-    def __init__(self, identifier = '', declaration_list = [], packing = 4):
+    def __init__(self, identifier = '', declaration_list = [], packing = 4, is_packed = False):
         self.identifier       = identifier
         self.declaration_list = declaration_list
         self.packing          = packing
+        self.is_packed        = is_packed
+        self.layout_table     = {}
 
     def is_incomplete(self):
         return not len(self.declaration_list)
@@ -77,10 +85,12 @@ class StructDeclarator(object):
 
 class Enumeration(object):
 
-    def __init__(self, identifier = '', enumerator_list = [], packing = 4):
+    def __init__(self, identifier = '', enumerator_list = [], packing = 4, is_packed = False):
         self.identifier      = identifier
         self.enumerator_list = enumerator_list
         self.packing         = packing
+        self.is_packed       = is_packed
+        self.layout_table    = {}
 
     def is_incomplete(self):
         return not len(self.enumerator_list)
@@ -101,54 +111,199 @@ class FunctionDeclarator(object):
     def __init__(self):
         pass
 
+class MacroTemplate(enum.IntEnum):
+    """
+    Kind of the items of a compiled macro replacement list.
+    """
+    TOKEN        = 0
+    ARGUMENT     = 1
+    RAW_ARGUMENT = 2
+    STRINGIFY    = 3
+    PASTE        = 4
+
 class Macro(object):
 
-    def __init__(self, name, replacement = '', arg_list = [], variadic = False, callback = None):
+    def __init__(self, name, replacement = '', arg_list = [], variadic = False, callback = None, function_like = False, token_list = []):
         self.name              = name
         self.replacement       = replacement
         self.arg_list          = arg_list
         self.variadic          = variadic
         self.callback          = callback
-        self.has_been_expanded = False
+        self.function_like     = function_like
+        self.template          = self._compile_template(token_list)
 
-    def expand(self, arg_list = []):
+    def _compile_template(self, token_list):
         """
-        Expand a macro. 
+        Compile the replacement token list into a template indexed by parameter
+        position so expansion is done in a single pass.
 
-        :param      arg_list:  The argument list
-        :type       arg_list:  { type_description }
+        Parameters operand of ## are substituted with their unexpanded argument
+        and parameters following # are stringified (C99 6.10.3.1 to 6.10.3.3).
+        
+        :param      token_list:  The replacement token list
+        :type       token_list:  list
         """
-        replacement = self.replacement
+        parameter_index_table = {}
 
-        if arg_list:
-            if not self.variadic and len(arg_list) != len(self.arg_list):
-                raise Exception("Number of arguments not matching with expected list length.")
+        if self.function_like:
+            parameter_index_table = {parameter.strip() : index for index, parameter in enumerate(self.arg_list)}
 
-            if self.callback:
-                raise Exception("Callback macro can't be called with user provided argument list.")
+            if self.variadic:
+                parameter_index_table['__VA_ARGS__'] = len(self.arg_list)
+
+        template = []
+        index    = 0
+
+        while index < len(token_list):
+            token      = token_list[index]
+            next_token = token_list[index + 1] if index + 1 < len(token_list) else None
+
+            if token.type == '#' and next_token and next_token.value in parameter_index_table:
+                template.append((MacroTemplate.STRINGIFY, parameter_index_table[next_token.value]))
+                index += 1
+            elif token.type == 'HASH_HASH':
+                template.append((MacroTemplate.PASTE, None))
+            elif token.type == 'IDENTIFIER' and token.value in parameter_index_table:
+                is_paste_operand = (template and template[-1][0] == MacroTemplate.PASTE) or (next_token and next_token.type == 'HASH_HASH')
+                kind             = MacroTemplate.RAW_ARGUMENT if is_paste_operand else MacroTemplate.ARGUMENT
+
+                template.append((kind, parameter_index_table[token.value]))
+            else:
+                template.append((MacroTemplate.TOKEN, token))
 
-            for label, arg in zip(self.arg_list, arg_list): 
-                replacement = replacement.replace(label, arg)
+            index += 1
+
+        return template
+
+    def _bind_arg_list(self, arg_list, tokenize):
+        """
+        Bind the argument token lists to the macro parameters.
+        
+        :param      arg_list:  The argument token lists
+        :type       arg_list:  list
+        :param      tokenize:  The function converting text into a token list
+        :type       tokenize:  function
+        """
+        # Invocation without argument for a macro without parameter, like RECURSIVE().
+        if arg_list == [[]] and not self.arg_list:
+            arg_list = []
+
+        parameter_count = len(self.arg_list)
+
+        if len(arg_list) != parameter_count and not (self.variadic and len(arg_list) >= parameter_count):
+            raise Exception(f"Number of arguments not matching with expected list length for macro {self.name}.")
+
+        if self.variadic:
+            # Variable arguments are merged back into a single __VA_ARGS__ argument.
+            variadic_arg = []
+
+            for index, arg in enumerate(arg_list[parameter_count:]):
+                if index:
+                    variadic_arg.extend(tokenize(','))
+                variadic_arg.extend(arg)
+
+            arg_list = arg_list[:parameter_count] + [variadic_arg]
+
+        return arg_list
+
+    def _stringify(self, arg, tokenize):
+        """
+        Convert an argument to a string literal token.
+
+        White space between tokens of the argument becomes a single space, none
+        is added where the argument has none (C99 6.10.3.2).
+        
+        :param      arg:       The argument token list
+        :type       arg:       list
+        :param      tokenize:  The function converting text into a token list
+        :type       tokenize:  function
+        """
+        spelling_list = []
+
+        for index, token in enumerate(arg):
+            spelling = str(token.value)
+
+            # A string literal followed by white space is lexed as a header name, the white space isn't part of it.
+            if token.type == 'STRING_LITERAL' or (token.type == 'HEADER_NAME' and spelling[0] == '"'):
+                spelling = spelling.rstrip(' \t').replace('\\', '\\\\').replace('"', '\\"')
+
+            if index and getattr(token, 'space', False):
+                spelling_list.append(' ')
+
+            spelling_list.append(spelling)
+
+        return tokenize(f'''"{''.join(spelling_list)}"''')
+
+    def expand(self, arg_list = None, expand_arg = None, tokenize = None):
+        """
+        Expand a macro. 
+
+        Each argument is expanded at most once through expand_arg, whatever the
+        number of times its parameter is used by the replacement list. Returned
+        tokens are copies so they can be updated by the caller.
+
+        :param      arg_list:    The argument token lists, None for object-like macro
+        :type       arg_list:    list
+        :param      expand_arg:  The function expanding macros of an argument
+        :type       expand_arg:  function
+        :param      tokenize:    The function converting text into a token list
+        :type       tokenize:    function
+        """
+        if self.callback:
+            if arg_list:
+                raise Exception("Callback macro can't be called with user provided argument list.")
 
-        elif self.callback:
             callback_return = self.callback(*self.arg_list)
             if type(callback_return) == str:
                 replacement = f'"{callback_return}"'
             else:
                 replacement = str(callback_return)
-        elif self.arg_list and not arg_list:
-            raise Exception("Function like macro needs argument list.")
 
-        self.has_been_expanded = True
+            return tokenize(replacement)
+
+        if self.function_like:
+            if arg_list is None:
+                raise Exception("Function like macro needs argument list.")
+
+            arg_list = self._bind_arg_list(arg_list, tokenize)
+
+        expanded_arg_list = {}
+        output            = []
+        paste             = False
+
+        for kind, value in self.template:
+            if kind == MacroTemplate.PASTE:
+                paste = True
+                continue
+            elif kind == MacroTemplate.TOKEN:
+                token_list = [value]
+            elif kind == MacroTemplate.ARGUMENT:
+                if value not in expanded_arg_list:
+                    expanded_arg_list[value] = expand_arg(arg_list[value])
+                token_list = expanded_arg_list[value]
+            elif kind == MacroTemplate.RAW_ARGUMENT:
+                token_list = arg_list[value]
+            elif kind == MacroTemplate.STRINGIFY:
+                token_list = self._stringify(arg_list[value], tokenize)
+
+            token_list = [copy.copy(token) for token in token_list]
+
+            # An empty operand of ## is a placemarker so there is nothing to concatenate.
+            if paste and output and token_list:
+                token_list = tokenize(f'{output.pop().value}{token_list[0].value}') + token_list[1:]
+
+            paste = False
+            output.extend(token_list)
 
-        return replacement
+        return output
 
     def __repr__(self):
         s = f'''
                 Macro name: {self.name}
                 Replacement text: {self.replacement}
                 Argument list : {self.arg_list}
-                Variadic : {self.variadic}'''
+                Variadic : {self.variadic}
+                Function like : {self.function_like}'''
         return s
 
 class Declaration(object):
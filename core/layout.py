@@ -0,0 +1,395 @@
+import core.intermediate_representation as ir
+
+class TargetAbi(object):
+    """
+    Size and alignment of scalar types on a target, and the rule used to
+    allocate bit fields.
+    """
+
+    def __init__(self, name, type_table, ms_bitfields = False):
+        """
+        :param      name:          The name, key of layouts cached on IR nodes
+        :type       name:          str
+        :param      type_table:    The (size, alignment) of each scalar type
+        :type       type_table:    dict
+        :param      ms_bitfields:  True for Microsoft bit fields, System V otherwise
+        :type       ms_bitfields:  bool
+        """
+        self.name         = name
+        self.type_table   = type_table
+        self.ms_bitfields = ms_bitfields
+
+    def __repr__(self):
+        return f'''TargetAbi({self.name})'''
+
+# Linux, macOS... 64 bits (x86-64 System V)
+LP64 = TargetAbi('LP64', {
+                            '_Bool'       : (1, 1),
+                            'char'        : (1, 1),
+                            'short'       : (2, 2),
+                            'int'         : (4, 4),
+                            'long'        : (8, 8),
+                            'long long'   : (8, 8),
+                            'float'       : (4, 4),
+                            'double'      : (8, 8),
+                            'long double' : (16, 16),
+                            'size_t'      : (8, 8),
+                            'ssize_t'     : (8, 8),
+                            'pointer'     : (8, 8),
+                         })
+
+# Linux 32 bits (i386 System V), 8 bytes types are only aligned on 4 bytes.
+ILP32 = TargetAbi('ILP32', {
+                            '_Bool'       : (1, 1),
+                            'char'        : (1, 1),
+                            'short'       : (2, 2),
+                            'int'         : (4, 4),
+                            'long'        : (4, 4),
+                            'long long'   : (8, 4),
+                            'float'       : (4, 4),
+                            'double'      : (8, 4),
+                            'long double' : (12, 4),
+                            'size_t'      : (4, 4),
+                            'ssize_t'     : (4, 4),
+                            'pointer'     : (4, 4),
+                           })
+
+# Windows 64 bits (LLP64)
+MSVC = TargetAbi('MSVC', {
+                            '_Bool'       : (1, 1),
+                            'char'        : (1, 1),
+                            'short'       : (2, 2),
+                            'int'         : (4, 4),
+                            'long'        : (4, 4),
+                            'long long'   : (8, 8),
+                            'float'       : (4, 4),
+                            'double'      : (8, 8),
+                            'long double' : (8, 8),
+                            'size_t'      : (8, 8),
+                            'ssize_t'     : (8, 8),
+                            'pointer'     : (8, 8),
+                         }, ms_bitfields = True)
+
+class FieldLayout(object):
+    """
+    Placement of a field. A bit field is placed in the storage unit starting at
+    offset, from bit_offset (least significant bit first). The unit may be
+    larger than its declared type when the bit field continues the unit of a
+    larger one, ctypes then describes it from the end of the unit and can't
+    read it.
+    """
+
+    def __init__(self, name, offset, size, alignment, bit_offset = None, bit_size = None, layout = None):
+        self.name       = name
+        self.offset     = offset
+        self.size       = size
+        self.alignment  = alignment
+        self.bit_offset = bit_offset
+        self.bit_size   = bit_size
+        self.layout     = layout
+
+    def is_bitfield(self):
+        return self.bit_size is not None
+
+    def __repr__(self):
+        bitfield = f''', bits {self.bit_offset}:{self.bit_offset + self.bit_size}''' if self.is_bitfield() else ''
+
+        return f'''{self.name} (offset {self.offset}, size {self.size}, alignment {self.alignment}{bitfield})'''
+
+class Layout(object):
+    """
+    Layout of a structure, union or enumeration.
+    """
+
+    def __init__(self, size, alignment, field_list = []):
+        self.size        = size
+        self.alignment   = alignment
+        self.field_list  = field_list
+        self.field_table = {field.name: field for field in field_list}
+
+    def __repr__(self):
+        return f'''Layout(size {self.size}, alignment {self.alignment}, {self.field_list})'''
+
+def align(value, alignment):
+    return (value + alignment - 1) // alignment * alignment
+
+class LayoutEngine(object):
+    """
+    Compute offset, size, alignment and bit field placement of structures,
+    unions and enumerations from the IR, for a target ABI, without ctypes.
+
+    Packing of IR nodes caps the alignment of their fields like #pragma pack
+    (ctypes _pack_), an enumeration takes its packing as size. With the default
+    packing, System V bit fields are allocated in storage units of their type
+    like the ctypes classes generated from the IR. With an explicit packing
+    (packed attribute) they follow each other over storage units, like GCC
+    does. Layouts are cached on IR nodes (layout_table) by ABI name.
+    """
+    TYPE_QUALIFIER_LIST = ['const', 'volatile', 'restrict', 'signed', 'unsigned']
+
+    def __init__(self, ast = None, abi = LP64):
+        self.abi            = abi
+        self._typedef_table = {}
+        self._tag_table     = {}
+
+        if ast:
+            self.add_source(ast)
+
+    def add_source(self, ast):
+        """
+        Register typedefs and tagged types of an AST so declarations using them
+        can be resolved.
+
+        :param      ast:  The ast
+        :type       ast:  SourceFile
+        """
+        for translation_unit in ast.translation_unit_list:
+            if not isinstance(translation_unit, ir.Declaration) or not translation_unit.specifier_list:
+                continue
+
+            node = translation_unit.specifier_list[-1]
+
+            if not isinstance(node, (ir.Struct, ir.Union, ir.Enumeration)):
+                continue
+
+            if translation_unit.is_typedef:
+                for init_declarator in translation_unit.init_declarator_list:
+                    self._typedef_table[init_declarator.name] = node
+
+            if node.identifier and not node.is_incomplete():
+                self._tag_table[node.identifier] = node
+
+    def _type_name(self, specifier_qualifier_list):
+        """
+        Get the name of the type named by the words of a specifier list.
+
+        :param      specifier_qualifier_list:  The specifier qualifier list
+        :type       specifier_qualifier_list:  list
+        """
+        word_list = [specifier for specifier in specifier_qualifier_list if specifier not in LayoutEngine.TYPE_QUALIFIER_LIST]
+
+        # short int, long int, long long int...
+        if len(word_list) > 1 and 'int' in word_list:
+            word_list.remove('int')
+
+        return ' '.join(word_list) or 'int'
+
+    def type_node(self, specifier_qualifier_list):
+        """
+        Get the structure, union or enumeration named by a specifier list, None
+        for a scalar type.
+
+        :param      specifier_qualifier_list:  The specifier qualifier list
+        :type       specifier_qualifier_list:  list
+        """
+        node_list = [specifier for specifier in specifier_qualifier_list if not isinstance(specifier, str)]
+
+        if node_list:
+            return self._resolve(node_list[-1])
+
+        type_name = self._type_name(specifier_qualifier_list)
+
+        if type_name in self.abi.type_table:
+            return None
+        elif type_name in self._typedef_table:
+            return self._resolve(self._typedef_table[type_name])
+
+        raise Exception(f'Unknown type {type_name}.')
+
+    def type_layout(self, specifier_qualifier_list):
+        """
+        Get size, alignment and layout (None for scalars) of the type named by
+        a specifier list.
+
+        :param      specifier_qualifier_list:  The specifier qualifier list
+        :type       specifier_qualifier_list:  list
+        """
+        node = self.type_node(specifier_qualifier_list)
+
+        if node:
+            layout = self.layout(node)
+
+            return layout.size, layout.alignment, layout
+
+        return self.abi.type_table[self._type_name(specifier_qualifier_list)] + (None,)
+
+    def _declarator_layout(self, declarator, specifier_qualifier_list):
+        """
+        Get name, size, alignment and layout of a declared field.
+
+        :param      declarator:                The declarator
+        :type       declarator:                str|ir.ArrayDeclarator|ir.Pointer
+        :param      specifier_qualifier_list:  The specifier qualifier list
+        :type       specifier_qualifier_list:  list
+        """
+        length     = 1
+        is_pointer = False
+
+        while not isinstance(declarator, str):
+            if isinstance(declarator, ir.ArrayDeclarator):
+                if not isinstance(declarator.length, int):
+                    raise Exception(f'Array length {declarator.length} is not a constant.')
+
+                # Flexible array member
+                length *= max(declarator.length, 0)
+            else:
+                is_pointer = True
+
+            declarator = declarator.direct_declarator
+
+        if is_pointer:
+            size, alignment, layout = self.abi.type_table['pointer'] + (None,)
+        else:
+            size, alignment, layout = self.type_layout(specifier_qualifier_list)
+
+        return declarator, size * length, alignment, layout
+
+    def _resolve(self, node):
+        """
+        Get the definition of an incomplete structure, union or enumeration.
+
+        :param      node:  The node
+        :type       node:  ir.Struct|ir.Union|ir.Enumeration
+        """
+        if node.is_incomplete():
+            node = self._tag_table.get(node.identifier, self._typedef_table.get(node.identifier, node))
+
+            if node.is_incomplete():
+                raise Exception(f'Incomplete type {node.identifier}.')
+
+        return node
+
+    def _layout_record(self, node):
+        """
+        Lay out fields of a structure (one after the other) or of a union (all
+        at offset 0).
+
+        :param      node:  The node
+        :type       node:  ir.Struct|ir.Union
+        """
+        is_union   = isinstance(node, ir.Union)
+        field_list = []
+        bit_offset = 0
+        alignment  = 1
+
+        # Storage unit of the bit field being filled (Microsoft or default packing): (offset, size, alignment)
+        unit       = None
+
+        for declaration in node.declaration_list:
+            for struct_declarator in declaration.struct_declarator_list:
+                name, size, type_alignment, layout = self._declarator_layout(struct_declarator.declarator, declaration.specifier_qualifier_list)
+                field_alignment = min(type_alignment, node.packing)
+
+                if struct_declarator.bitfield is None:
+                    if unit:
+                        bit_offset = (unit[0] + unit[1]) * 8
+                        unit       = None
+
+                    offset     = 0 if is_union else align(bit_offset, field_alignment * 8) // 8
+                    bit_offset = max(bit_offset, (offset + size) * 8)
+                    alignment  = max(alignment, field_alignment)
+
+                    field_list.append(FieldLayout(name, offset, size, field_alignment, layout = layout))
+                    continue
+
+                bit_size = struct_declarator.bitfield
+
+                if is_union:
+                    if bit_size == 0:
+                        continue
+
+                    offset, field_bit_offset = 0, 0
+                    bit_offset               = max(bit_offset, bit_size)
+                elif self.abi.ms_bitfields:
+                    # Zero width bit field only counts after a bit field, it closes its storage unit and aligns the next field.
+                    if bit_size == 0:
+                        if unit:
+                            bit_offset = align((unit[0] + unit[1]) * 8, field_alignment * 8)
+                            alignment  = max(alignment, field_alignment)
+                            unit       = None
+
+                        continue
+
+                    # A new storage unit is started when declared type size changes or when it's full.
+                    if unit and (unit[1] != size or bit_offset + bit_size > (unit[0] + unit[1]) * 8):
+                        bit_offset = (unit[0] + unit[1]) * 8
+                        unit       = None
+
+                    if not unit:
+                        unit       = (align(bit_offset, field_alignment * 8) // 8, size, field_alignment)
+                        bit_offset = unit[0] * 8
+
+                    offset, field_bit_offset = unit[0], bit_offset - unit[0] * 8
+                    bit_offset              += bit_size
+                elif not node.is_packed:
+                    # Zero width bit field closes the storage unit and aligns on its type (ctypes rejects it).
+                    if bit_size == 0:
+                        if unit:
+                            bit_offset = (unit[0] + unit[1]) * 8
+                            unit       = None
+
+                        bit_offset = align(bit_offset, type_alignment * 8)
+                        continue
+
+                    # Bit fields are allocated like ctypes classes generated from the IR: a bit field continues the storage
+                    # unit of a type at least as large, expands the unit to its larger type or starts a new unit if it doesn't fit.
+                    # Units are never shared with other fields and an expanded unit keeps its alignment.
+                    if unit and size <= unit[1] and bit_offset + bit_size <= (unit[0] + unit[1]) * 8:
+                        field_alignment = unit[2]
+                    elif unit and size > unit[1] and bit_offset + bit_size <= unit[0] * 8 + size * 8:
+                        unit            = (unit[0], size, unit[2])
+                        field_alignment = unit[2]
+                    else:
+                        if unit:
+                            bit_offset = (unit[0] + unit[1]) * 8
+
+                        unit       = (align(bit_offset, field_alignment * 8) // 8, size, field_alignment)
+                        bit_offset = unit[0] * 8
+
+                    offset, field_bit_offset = unit[0], bit_offset - unit[0] * 8
+                    bit_offset              += bit_size
+                else:
+                    # Zero width bit field aligns on its type, whatever the packing.
+                    if bit_size == 0:
+                        bit_offset = align(bit_offset, type_alignment * 8)
+                        continue
+
+                    # Packing is explicit so bit fields follow each other, even over storage units (GCC).
+                    # Offset is the storage unit of the declared type holding the field, or its first byte if split.
+                    offset = bit_offset // (size * 8) * size
+
+                    if bit_offset + bit_size > (offset + size) * 8:
+                        offset = bit_offset // 8
+
+                    field_bit_offset  = bit_offset - offset * 8
+                    bit_offset       += bit_size
+
+                # Unnamed bit fields are padding, they don't align the structure (System V).
+                if name:
+                    alignment = max(alignment, field_alignment)
+                    field_list.append(FieldLayout(name, offset, size, field_alignment, field_bit_offset, bit_size))
+                elif self.abi.ms_bitfields:
+                    alignment = max(alignment, field_alignment)
+
+        if unit:
+            bit_offset = (unit[0] + unit[1]) * 8
+
+        return Layout(align((bit_offset + 7) // 8, alignment), alignment, field_list)
+
+    def layout(self, node):
+        """
+        Get the layout of a structure, union or enumeration, computed on first
+        request for an ABI.
+
+        :param      node:  The node
+        :type       node:  ir.Struct|ir.Union|ir.Enumeration
+        """
+        node = self._resolve(node)
+
+        if self.abi.name not in node.layout_table:
+            if isinstance(node, ir.Enumeration):
+                node.layout_table[self.abi.name] = Layout(node.packing, node.packing)
+            else:
+                node.layout_table[self.abi.name] = self._layout_record(node)
+
+        return node.layout_table[self.abi.name]
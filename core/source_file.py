@@ -0,0 +1,62 @@
+import mmap
+import os
+
+from contextlib import contextmanager
+
+SOURCE_ENCODING = 'utf-8'
+
+# Smaller sources are read, mapping them is slower and scanning bytes in place is
+# slower than scanning decoded text (benchmark/mapped_input.py). Only large
+# sources (amalgamations) are worth the memory a mapping saves.
+MAP_THRESHOLD = 16 * 2 ** 20
+
+@contextmanager
+def map_source(file_path):
+    """
+    Map a source file in memory (read only).
+
+    Pages are read by the OS when they're scanned and can be dropped under memory
+    pressure, so a large source (amalgamation) doesn't need a full size buffer.
+    Sources smaller than MAP_THRESHOLD (empty files can't be mapped) are read
+    into a bytes buffer instead.
+
+    Nothing should still export the mapping (regex iterator, memoryview) when the
+    context exits.
+
+    :param      file_path:  The file path
+    :type       file_path:  str|Path
+    """
+    with open(file_path, 'rb') as source_file:
+        if os.fstat(source_file.fileno()).st_size < MAP_THRESHOLD:
+            yield source_file.read()
+            return
+
+        with mmap.mmap(source_file.fileno(), 0, access = mmap.ACCESS_READ) as mapping:
+            yield mapping
+
+def decode_source(buffer):
+    """
+    Decode a source buffer to text, directly from the buffer without an
+    intermediate bytes copy.
+
+    Line endings are translated like a file opened in text mode.
+
+    :param      buffer:  The source buffer
+    :type       buffer:  bytes|mmap.mmap|memoryview
+    """
+    text = str(buffer, SOURCE_ENCODING)
+
+    if '\r' in text:
+        text = text.replace('\r\n', '\n').replace('\r', '\n')
+
+    return text
+
+def read_source(file_path):
+    """
+    Read a source file as text, through a memory mapping if it's large.
+
+    :param      file_path:  The file path
+    :type       file_path:  str|Path
+    """
+    with map_source(file_path) as buffer:
+        return decode_source(buffer)
@@ -1,5 +1,9 @@
+import os
+
 from functools import wraps
 
+ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir))
+
 def debug_production(func):
     """
     Debug print for production rules
@@ -16,4 +20,24 @@ def debug_production(func):
             print("-" * 80)
 
     inner.co_firstlineno = func.__code__.co_firstlineno
-    return inner
\ No newline at end of file
+    return inner
+
+def table_options(table_module, **kwargs):
+    """
+    Build yacc keyword arguments so precomputed parse tables are loaded
+    from table_module without checking grammar signature.
+
+    Tables are never written at runtime, they are generated by build_tables.py.
+    If table module is missing then tables are computed in memory.
+
+    :param      table_module:  The table module
+    :type       table_module:  str
+    :param      kwargs:        The yacc keyword arguments
+    :type       kwargs:        dict
+    """
+    kwargs.setdefault('tabmodule', table_module)
+    kwargs.setdefault('optimize', True)
+    kwargs.setdefault('write_tables', False)
+    kwargs.setdefault('outputdir', os.path.join(ROOT_DIR, *table_module.split('.')[:-1]))
+
+    return kwargs
\ No newline at end of file
@@ -5,6 +5,7 @@ HEX_DIGIT    = r"[a-fA-F-0-9]"
 OCT_DIGIT    = r"[0-7]"
 E            = f"""[Ee][+-]?{DIGIT}+"""
 FLOAT_SUFFIX = r"[fFlL]"
-INT_SUFFIX   = r"[uUlL]"
+# Unsigned and long (long) suffixes can be combined in any order (C99 6.4.4.1)
+INT_SUFFIX   = r"(?:[uU](?:ll|LL|[lL])?|(?:ll|LL|[lL])[uU]?)"
 
 COMMENT_RE = r'\/\*[\s\S]*?\*\/+|//.*'
\ No newline at end of file
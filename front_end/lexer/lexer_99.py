@@ -4,7 +4,11 @@ import sys
 sys.path.append('../../')
 
 from collections import namedtuple
+from contextlib import contextmanager
+from core.source_file import decode_source, map_source
 from front_end.lexer.cregex import *
+from front_end.lexer.scanner import C99Scanner
+from front_end.lexer.token import Token, compact_lexer
 
 class C99Lexer(object):
     """
@@ -72,13 +76,17 @@ class C99Lexer(object):
     t_EQ_OP = r'=='
     t_NE_OP = r'!='
 
-    def __init__(self, **kwargs):
-        self._lexer           = lex.lex(module = self, **kwargs)
+    def __init__(self, scanner = False, **kwargs):
+        self._lexer           = compact_lexer(lex.lex(module = self, **kwargs))
         
         self._symbol_table    = {}
         self._tag_table       = {}
         self._label_table     = {}
 
+        # Single regex scanner producing the same tokens faster, see C99Scanner.
+        if scanner:
+            self._lexer = C99Scanner(self, self._lexer)
+
     def add_label(self, label, obj):
         """
         Adds a label.
@@ -115,6 +123,22 @@ class C99Lexer(object):
     def get_tag(self, tag):
         return self._tag_table[tag]
 
+    def identifier_type(self, identifier):
+        """
+        Gets the token type of an identifier, either a keyword, a typedef name
+        or an identifier.
+        
+        :param      identifier:  The identifier
+        :type       identifier:  str
+        """
+        # Check first if identifier is a reserved word
+        if identifier in self.reserved:
+            return self.reserved[identifier]
+        elif identifier in self._symbol_table and self._symbol_table[identifier].typedef:
+            return "TYPEDEF_NAME"
+
+        return "IDENTIFIER"
+
     def add_symbol(self, symbol, value, typedef = False):
         """
         Adds a symbol to the internal symbol table
@@ -136,12 +160,7 @@ class C99Lexer(object):
     def t_IDENTIFIER(self, t):
         r'[a-zA-Z_][a-zA-Z_0-9]*'
 
-        # Check first if identifier is a reserved word
-        if t.value in self.reserved:
-            t.type = self.reserved[t.value] 
-        else:
-            if t.value in self._symbol_table:
-                t.type = "TYPEDEF_NAME" if self._symbol_table[t.value].typedef else "IDENTIFIER"
+        t.type = self.identifier_type(t.value)
 
         return t
 
@@ -237,6 +256,92 @@ class C99Lexer(object):
         print("Illegal character '%s'" % t.value[0])
         t.lexer.skip(1)
 
+    def token_function(self, token_list):
+        """
+        Build a function feeding the parser with tokens produced by the preprocessor,
+        so preprocessed text doesn't have to be lexed again.
+
+        Identifiers are typed when the parser consumes them since typedef names
+        are only known once their declaration is parsed.
+        
+        :param      token_list:  The preprocessed token list
+        :type       token_list:  list
+        """
+        token_iterator = iter(token_list)
+        pending_list   = []
+        # Every type shared with the preprocessor lexer is kept as is.
+        type_set       = set(self.tokens) | set(self.literals)
+
+        def token():
+            if pending_list:
+                return pending_list.pop()
+
+            for source_token in token_iterator:
+                token_type = source_token.type
+                value      = source_token.value
+
+                if token_type == 'IDENTIFIER' or token_type == 'DEFINED' or token_type == '_PRAGMA':
+                    token_type = self.identifier_type(value)
+                elif token_type == 'HEADER_NAME' and value[0] == '"':
+                    token_type = 'STRING_LITERAL'
+                elif token_type in type_set:
+                    # Parser only reads tokens so they're shared with the preprocessor.
+                    return source_token
+                else:
+                    # Preprocessing tokens which aren't C tokens (a < b > c lexed as a header name).
+                    relexed_list = self.tokenize(str(value))
+
+                    for relexed_token in relexed_list:
+                        relexed_token.lineno = source_token.lineno
+
+                    pending_list.extend(reversed(relexed_list))
+
+                    if not pending_list:
+                        continue
+
+                    return pending_list.pop()
+
+                if token_type == source_token.type:
+                    return source_token
+
+                return Token(token_type, value, source_token.lineno, source_token.lexpos)
+
+            return None
+
+        return token
+
+    @contextmanager
+    def open_source(self, file_path):
+        """
+        Open a source file as lexer input.
+
+        The scanner backend scans a memory mapped (large) file in place, only token
+        values are decoded. PLY lexer and small files get the decoded file content.
+        
+        :param      file_path:  The file path
+        :type       file_path:  str
+        """
+        with map_source(file_path) as buffer:
+            # Line endings other than LF are translated by decoding.
+            if not isinstance(self._lexer, C99Scanner) or isinstance(buffer, bytes) or buffer.find(b'\r') != -1:
+                yield decode_source(buffer)
+                return
+
+            try:
+                yield buffer
+            finally:
+                self._lexer.release()
+
+    def tokenize_file(self, file_path):
+        """
+        Tokenize a source file, see open_source.
+        
+        :param      file_path:  The file path
+        :type       file_path:  str
+        """
+        with self.open_source(file_path) as data:
+            return self.tokenize(data)
+
     def tokenize(self, data):
         """
         Parse data and returns a token list.
@@ -258,8 +363,5 @@ class C99Lexer(object):
 if __name__ == "__main__":
     lexer = C99Lexer()
 
-    with open("../../output/directive.i", "rt") as file:
-        data = file.read()
-
-    token_list = lexer.tokenize(data)
+    token_list = lexer.tokenize_file("../../output/directive.i")
     print(token_list)
\ No newline at end of file
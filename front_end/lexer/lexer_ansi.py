@@ -1,3 +1,4 @@
+from front_end.lexer.token import compact_lexer
 import ply.lex as lex
 
 LETTER = r"[a-zA-Z]"
@@ -120,7 +121,7 @@ class CANSILexer(object):
     t_NE_OP = r'!='
 
     def __init__(self, **kwargs):
-        self._lexer        = lex.lex(module = self, **kwargs)
+        self._lexer        = compact_lexer(lex.lex(module = self, **kwargs))
         self._symbol_table = {}
 
     PREPROC_DIRECTIVE = r"|".join([r'\#' + directive for directive in [
@@ -24,13 +24,10 @@ class GNU99Lexer(C99Lexer):
 
     # Extends tokens and reserved values
     reserved = {**C99Lexer.reserved, **reserved_subset}
-    C99Lexer.tokens += list(reserved_subset.values())
+    tokens   = C99Lexer.tokens + list(reserved_subset.values())
 
 if __name__ == "__main__":
     lexer = GNU99Lexer()
 
-    with open("../../examples/elf.i", "rt") as include_file:
-        data = include_file.read()
-
-    token_list = lexer.tokenize(data)
+    token_list = lexer.tokenize_file("../../examples/elf.i")
     print(token_list)
\ No newline at end of file
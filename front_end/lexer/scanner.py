@@ -0,0 +1,177 @@
+import ply.lex as lex
+import re
+
+from sys import intern
+from core.source_file import SOURCE_ENCODING
+from front_end.lexer.token import Token, UNINTERNED_TYPE_SET
+
+class DecodedMatch(object):
+    """
+    Match over a source buffer giving decoded groups to rule functions.
+    """
+
+    __slots__ = ('_match',)
+
+    def __init__(self, match):
+        self._match = match
+
+    def group(self, *args):
+        group = self._match.group(*args)
+
+        if isinstance(group, tuple):
+            return tuple(value if value is None else value.decode(SOURCE_ENCODING) for value in group)
+
+        return group if group is None else group.decode(SOURCE_ENCODING)
+
+class C99Scanner(object):
+    """
+    Lexer backend scanning a whole source with a single regex.
+
+    PLY lexer creates a LexToken per match, tries each rule group in order at
+    every position and goes through a rule function for identifiers. This
+    scanner adds ignored characters, newlines, literals and illegal characters
+    to PLY master regex so a single finditer walks the source without gaps,
+    then builds compact tokens directly.
+
+    Rules are taken from the PLY lexer of a C99Lexer (rule order, regex flags,
+    token types) so both produce identical tokens. Identifier, operator,
+    literal and newline rules are inlined, every other rule function (constants,
+    string literals, comments) is called like PLY does.
+
+    Input can be a source buffer (bytes, mmap, memoryview) instead of text, it's
+    scanned in place by the same regex compiled for bytes and only token values are
+    decoded. Token positions are byte offsets then.
+
+    It has the interface of a PLY lexer used by PLY parser (input, token, lineno, lexpos).
+    """
+
+    # Punctuators which are tokens on their own, no rule starts with one of them.
+    SEPARATORS = ';{},:()[]~?#'
+
+    def __init__(self, lexer, ply_lexer):
+        """
+        :param      lexer:      The lexer module (C99Lexer or a subclass)
+        :type       lexer:      C99Lexer
+        :param      ply_lexer:  The PLY lexer built from its rules
+        :type       ply_lexer:  ply.lex.Lexer
+        """
+        pattern_list      = []
+        self._rule_table  = {}
+
+        for regex, index_function_list in ply_lexer.lexre:
+            pattern_list.append(regex.pattern)
+
+            for name, index in regex.groupindex.items():
+                if index_function_list[index] is not None:
+                    self._rule_table[name] = index_function_list[index]
+
+        ignore            = re.escape(ply_lexer.lexignore)
+        literals          = ''.join(re.escape(literal) for literal in ply_lexer.lexliterals)
+        separators        = ''.join(re.escape(literal) for literal in ply_lexer.lexliterals if literal in self.SEPARATORS)
+
+        # Ignored characters are consumed before any rule like PLY does, none of the
+        # rules match them so backtracking never starts a token on one of them.
+        # Separators and newlines are frequent and no other rule matches on them, so
+        # they're tried first without changing which rule wins.
+        pattern           = (f"[{ignore}]*(?:(?P<separator>[{separators}])|(?P<newline>\\n+)|"
+                             f"{'|'.join(pattern_list)}|(?P<literal>[{literals}])|(?P<error>[^{ignore}]))")
+
+        self._regex        = re.compile(pattern, ply_lexer.lexreflags)
+        # C rules are ASCII so they apply to encoded sources as is.
+        self._buffer_regex = re.compile(pattern.encode('ascii'), ply_lexer.lexreflags)
+
+        self._reserved     = lexer.reserved
+        self._symbol_table = lexer._symbol_table
+        self._iterator     = iter(())
+
+        self.lexdata       = None
+        self.lexpos        = 0
+        self.lineno        = 1
+        self.lexmatch      = None
+
+    def input(self, data):
+        self.lexdata   = data
+        self.lexpos    = 0
+        self._iterator = self._scan(data)
+
+    def token(self):
+        return next(self._iterator, None)
+
+    def release(self):
+        """
+        Drop current input so a mapped source buffer can be closed.
+        """
+        self.input('')
+
+    def _scan(self, data):
+        """
+        Generate tokens of data.
+
+        :param      data:  The source
+        :type       data:  str
+        """
+        reserved_get     = self._reserved.get
+        symbol_get       = self._symbol_table.get
+        rule_table       = self._rule_table
+        lineno           = self.lineno
+        is_buffer        = not isinstance(data, str)
+        regex            = self._buffer_regex if is_buffer else self._regex
+
+        for match in regex.finditer(data):
+            name   = match.lastgroup
+            value  = match.group(name)
+            lexpos = match.end() - len(value)
+
+            if is_buffer:
+                value = value.decode(SOURCE_ENCODING, 'replace')
+
+            if name == 't_IDENTIFIER':
+                token_type = reserved_get(value)
+
+                if token_type is None:
+                    symbol     = symbol_get(value)
+                    token_type = "TYPEDEF_NAME" if symbol is not None and symbol.typedef else "IDENTIFIER"
+
+                yield Token(token_type, intern(value), lineno, lexpos)
+            elif name == 'separator' or name == 'literal':
+                yield Token(value, value, lineno, lexpos)
+            elif name == 'newline':
+                lineno += len(value)
+            elif name == 'error':
+                print("Illegal character '%s'" % value)
+            else:
+                function, token_type = rule_table[name]
+
+                # String rules (operators)
+                if function is None:
+                    yield Token(token_type, intern(value), lineno, lexpos)
+                    continue
+
+                lex_token        = lex.LexToken()
+                lex_token.type   = token_type
+                lex_token.value  = value
+                lex_token.lineno = lineno
+                lex_token.lexpos = lexpos
+                lex_token.lexer  = self
+
+                self.lineno      = lineno
+                self.lexpos      = match.end()
+                self.lexmatch    = DecodedMatch(match) if is_buffer else match
+
+                lex_token        = function(lex_token)
+                lineno           = self.lineno
+
+                # Rules returning nothing are skipped (comments)
+                if not lex_token:
+                    continue
+
+                value = lex_token.value
+
+                if value.__class__ is str and lex_token.type not in UNINTERNED_TYPE_SET:
+                    value = intern(value)
+
+                yield Token(lex_token.type, value, lex_token.lineno, lex_token.lexpos)
+
+        self.lineno   = lineno
+        self.lexpos   = len(data)
+        self.lexmatch = None
@@ -0,0 +1,93 @@
+import ply.lex as lex
+
+from sys import intern
+
+# Values of these tokens are rarely repeated so they aren't interned.
+UNINTERNED_TYPE_SET = frozenset(['CONSTANT', 'STRING_LITERAL'])
+
+class Token(object):
+    """
+    Compact token produced by every lexer (preprocessor and C front end).
+
+    Unlike PLY LexToken, it has no instance dictionary and its identifier,
+    keyword and punctuator values are interned, so a token list costs a fixed
+    size per token and equal values are stored once.
+    """
+
+    # Hide set is only set on tokens produced by a macro expansion, space is
+    # only set on preprocessor tokens preceded by white space and lexer is
+    # only set by PLY parser on the token reported to p_error.
+    __slots__ = ('type', 'value', 'lineno', 'lexpos', 'hide_set', 'space', 'lexer')
+
+    def __init__(self, type, value, lineno, lexpos):
+        self.type   = type
+        self.value  = value
+        self.lineno = lineno
+        self.lexpos = lexpos
+
+    def __str__(self):
+        return f'LexToken({self.type},{self.value!r},{self.lineno},{self.lexpos})'
+
+    def __repr__(self):
+        return str(self)
+
+class TokenLexer(lex.Lexer):
+    """
+    PLY lexer producing compact tokens.
+
+    Token rules still get a PLY LexToken (with its lexer attribute) which is
+    released as soon as it's converted.
+    """
+
+    _intern = staticmethod(intern)
+
+    def token(self):
+        lex_token = lex.Lexer.token(self)
+
+        if lex_token is None:
+            return None
+
+        value = lex_token.value
+
+        if value.__class__ is str and lex_token.type not in UNINTERNED_TYPE_SET:
+            value = self._intern(value)
+
+        return Token(lex_token.type, value, lex_token.lineno, lex_token.lexpos)
+
+class SpaceTokenLexer(TokenLexer):
+    """
+    PLY lexer producing compact tokens flagged when they're preceded by white
+    space, which # operator keeps when it stringifies an argument (C99 6.10.3.2).
+
+    Preprocessor tokens are dropped as soon as their line is written, so values
+    interned by the interpreter would be freed and interned again by each header,
+    making the interpreter table grow with output. They're interned in a table of
+    the lexer instead, shared with its clones.
+    """
+
+    def _intern(self, value):
+        return self.value_table.setdefault(value, value)
+
+    def token(self):
+        token = TokenLexer.token(self)
+
+        if token is not None and token.lexpos and self.lexdata[token.lexpos - 1].isspace():
+            token.space = True
+
+        return token
+
+def compact_lexer(lexer, space = False):
+    """
+    Make a PLY lexer produce compact tokens, clones of the lexer produce them as well.
+
+    :param      lexer:  The lexer built by lex.lex
+    :type       lexer:  ply.lex.Lexer
+    :param      space:  Whether tokens preceded by white space are flagged
+    :type       space:  bool
+    """
+    lexer.__class__ = SpaceTokenLexer if space else TokenLexer
+
+    if space:
+        lexer.value_table = {}
+
+    return lexer
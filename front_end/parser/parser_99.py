@@ -4,7 +4,7 @@ sys.path.append('../../')
 
 from collections import namedtuple
 from front_end.lexer.lexer_99 import C99Lexer
-from core.utils import debug_production
+from core.utils import debug_production, table_options
 
 import core.intermediate_representation as ir
 import ply.yacc as yacc
@@ -19,6 +19,9 @@ class C99Parser(object):
     Enumerator     = namedtuple('Enumerator', ['name', 'value'])
     InitDeclarator = namedtuple('InitDeclarator', ['name', 'value'])
 
+    # Precomputed parse tables generated by build_tables.py
+    TABLE_MODULE   = 'front_end.parser.parsetab_99'
+
     def __init__(self, lexer = None, debug = False, **kwargs):
         if not lexer:
             self._lexer = C99Lexer()
@@ -26,7 +29,7 @@ class C99Parser(object):
             self._lexer = lexer
 
         self.tokens        = self._lexer.tokens
-        self._parser       = yacc.yacc(module = self, debug = debug, **kwargs)
+        self._parser       = yacc.yacc(module = self, debug = debug, **table_options(self.TABLE_MODULE, **kwargs))
         self._debug        = debug
 
         self._current_enumerator_value = 0
@@ -859,12 +862,30 @@ class C99Parser(object):
             print("Reach EOF")
 
     def parse(self, data):
-        return self._parser.parse(data)
+        return self._parser.parse(data, lexer = self._lexer._lexer)
+
+    def parse_tokens(self, token_list):
+        """
+        Parse tokens produced by the preprocessor (C99PreProcessor.process_tokens)
+        without lexing preprocessed text again.
+        
+        :param      token_list:  The preprocessed token list
+        :type       token_list:  list
+        """
+        return self._parser.parse(lexer = self._lexer._lexer, tokenfunc = self._lexer.token_function(token_list))
+
+    def parse_file(self, file_path):
+        """
+        Parse a preprocessed source file, memory mapped with the scanner lexer
+        backend (see C99Lexer.open_source).
+        
+        :param      file_path:  The file path
+        :type       file_path:  str
+        """
+        with self._lexer.open_source(file_path) as data:
+            return self.parse(data)
 
 if __name__ == "__main__":
     parser = C99Parser(debug = False)
 
-    with open("../../output/directive.i", "rt") as include_file:
-        data = include_file.read()
-
-    print(parser.parse(data))
\ No newline at end of file
+    print(parser.parse_file("../../output/directive.i"))
\ No newline at end of file
@@ -1,6 +1,7 @@
 import sys
 sys.path.append("../../")
 
+from core.utils import table_options
 from front_end.lexer.lexer_ansi import CANSILexer
 
 import core.intermediate_representation as ir
@@ -12,6 +13,9 @@ class CANSIParser(object):
     and will provide a compatible interface to Python ctypes library.
     """
 
+    # Precomputed parse tables generated by build_tables.py
+    TABLE_MODULE = 'front_end.parser.parsetab_ansi'
+
     def __init__(self, lexer = None, debug = False, **kwargs):
         if not lexer:
             self._lexer = CANSILexer()
@@ -22,7 +26,7 @@ class CANSIParser(object):
         self.ast           = {}
 
         self.tokens        = self._lexer.tokens
-        self._parser       = yacc.yacc(module = self, debug = debug, **kwargs)
+        self._parser       = yacc.yacc(module = self, debug = debug, **table_options(self.TABLE_MODULE, **kwargs))
         self._debug        = debug
 
     def _print_ast(self):
@@ -39,8 +39,11 @@ class GNU99Parser(C99Parser):
     # Because we are inheriting a parser we need to explicitly set starting symbol
     start = 'translation_unit'
 
+    # Precomputed parse tables generated by build_tables.py
+    TABLE_MODULE = 'front_end.parser.parsetab_gnu99'
+
     def __init__(self, lexer = None, debug = None, **kwargs):
-        super(GNU99Parser, self).__init__(GNU99Lexer(), debug, **kwargs)
+        super(GNU99Parser, self).__init__(lexer or GNU99Lexer(), debug, **kwargs)
 
     def _apply_attribute_list(self, ir_object, attribute_list):
         '''
@@ -51,7 +54,8 @@ class GNU99Parser(C99Parser):
         # TODO: Callback function and map might be preferable instead of if/else statements.
         for attribute in attribute_list:
             if attribute.name == "packed":
-                ir_object.packing = 1
+                ir_object.packing   = 1
+                ir_object.is_packed = True
             elif attribute.name == "aligned":
                 ir_object.packing = attribute.arg_list[0]
 
@@ -326,7 +330,4 @@ class GNU99Parser(C99Parser):
 if __name__ == "__main__":
     parser = GNU99Parser(debug = False)
 
-    with open("../../examples/elf.i", "rt") as include_file:
-        data = include_file.read()
-
-    print(parser.parse(data))
\ No newline at end of file
+    print(parser.parse_file("../../examples/elf.i"))
\ No newline at end of file
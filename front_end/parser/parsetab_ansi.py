@@ -0,0 +1,241 @@
+
+# parsetab_ansi.py
+# This file is automatically generated. Do not edit.
+# pylint: disable=W,C,R
+_tabversion = '3.10'
+
+_lr_method = 'LALR'
+
+_lr_signature = "ADD_ASSIGN AND_ASSIGN AND_OP AUTO BREAK CASE CHAR COMMENT CONST CONSTANT CONTINUE DEC_OP DEFAULT DIV_ASSIGN DO DOUBLE ELLIPSIS ELSE ENUM EQ_OP EXTERN FLOAT FOR GE_OP GOTO IDENTIFIER IF INC_OP INT LEFT_ASSIGN LEFT_OP LE_OP LONG MOD_ASSIGN MUL_ASSIGN NE_OP OR_ASSIGN OR_OP PREPROC_DIRECTIVE PTR_OP REGISTER RETURN RIGHT_ASSIGN RIGHT_OP SHORT SIGNED SIZEOF STATIC STRING_LITERAL STRUCT SUB_ASSIGN SWITCH TYPEDEF TYPE_NAME UNION UNSIGNED VOID VOLATILE WHILE XOR_ASSIGNtranslation_unit : external_declaration \n                            | translation_unit external_declarationprimary_expression : IDENTIFIER\n                              | CONSTANT\n                              | STRING_LITERAL\n                              | '(' expression ')' postfix_expression : primary_expression\n                              | postfix_expression '[' expression ']'\n                              | postfix_expression '(' ')'\n                              | postfix_expression '(' argument_expression_list ')'\n                              | postfix_expression '.' IDENTIFIER\n                              | postfix_expression PTR_OP IDENTIFIER\n                              | postfix_expression INC_OP\n                              | postfix_expression DEC_OP argument_expression_list : assignment_expression\n                                    | argument_expression_list ',' assignment_expression unary_expression : postfix_expression\n                            | INC_OP unary_expression\n                            | DEC_OP unary_expression\n                            | unary_operator cast_expression\n                            | SIZEOF unary_expression\n                            | SIZEOF '(' type_name ')' unary_operator : '&'\n                          | '*'  \n                          | '+'  \n                          | '-'  \n                          | '~'  \n                          | '!' cast_expression : unary_expression\n                           | '(' type_name ')' cast_expression multiplicative_expression : cast_expression\n                                     | multiplicative_expression '*' cast_expression\n                                     | multiplicative_expression '/' cast_expression\n                                     | multiplicative_expression '%' cast_expression additive_expression : multiplicative_expression\n                               | additive_expression '+' multiplicative_expression\n                               | additive_expression '-' multiplicative_expression shift_expression : additive_expression\n                            | shift_expression LEFT_OP additive_expression\n                            | shift_expression RIGHT_OP additive_expression relational_expression : shift_expression\n                                 | relational_expression '<' shift_expression\n                                 | relational_expression '>' shift_expression\n                                 | relational_expression LE_OP shift_expression\n                                 | relational_expression GE_OP shift_expression equality_expression : relational_expression\n                               | equality_expression EQ_OP relational_expression\n                               | equality_expression NE_OP relational_expression and_expression : equality_expression\n                          | and_expression '&' equality_expression exclusive_or_expression : and_expression\n                                   | exclusive_or_expression '^' and_expression inclusive_or_expression : exclusive_or_expression\n                                   | inclusive_or_expression '|' exclusive_or_expression logical_and_expression : inclusive_or_expression\n                                  | logical_and_expression AND_OP inclusive_or_expression logical_or_expression : logical_and_expression\n                                 | logical_or_expression OR_OP logical_and_expression conditional_expression : logical_or_expression\n                                  | logical_or_expression '?' expression ':' conditional_expression assignment_expression : conditional_expression\n                                 | unary_expression assignment_operator assignment_expressionassignment_operator : '='\n                               | MUL_ASSIGN \n                               | DIV_ASSIGN \n                               | MOD_ASSIGN \n                               | ADD_ASSIGN \n                               | SUB_ASSIGN \n                               | LEFT_ASSIGN \n                               | RIGHT_ASSIGN \n                               | AND_ASSIGN \n                               | XOR_ASSIGN \n                               | OR_ASSIGN expression : assignment_expression\n                      | expression ',' assignment_expression constant_expression : conditional_expression declaration : declaration_specifiers ';' \n                       | declaration_specifiers init_declarator_list ';' declaration_specifiers : storage_class_specifier\n                                  | storage_class_specifier declaration_specifiers\n                                  | type_specifier\n                                  | type_specifier declaration_specifiers\n                                  | type_qualifier\n                                  | type_qualifier declaration_specifiers init_declarator_list : init_declarator\n                                | init_declarator_list ',' init_declarator init_declarator : declarator\n                           | declarator '=' initializer storage_class_specifier : TYPEDEF\n                                   | EXTERN\n                                   | STATIC\n                                   | AUTO\n                                   | REGISTER type_specifier : VOID\n                          | CHAR\n                          | SHORT\n                          | INT\n                          | LONG\n                          | FLOAT\n                          | DOUBLE\n                          | SIGNED\n                          | UNSIGNED\n                          | struct_or_union_specifier\n                          | enum_specifier\n                          | TYPE_NAME struct_or_union_specifier : struct_or_union IDENTIFIER '{' struct_declaration_list '}'\n                                     | struct_or_union '{' struct_declaration_list '}'\n                                     | struct_or_union IDENTIFIER struct_or_union : STRUCT\n                           | UNION struct_declaration_list : struct_declaration\n                                   | struct_declaration_list struct_declaration struct_declaration : specifier_qualifier_list struct_declarator_list ';' specifier_qualifier_list : type_specifier specifier_qualifier_list\n                                    | type_specifier\n                                    | type_qualifier specifier_qualifier_list\n                                    | type_qualifier struct_declarator_list : struct_declarator\n                                  | struct_declarator_list ',' struct_declaratorstruct_declarator : declarator\n                             | ':' constant_expression\n                             | declarator ':' constant_expressionenum_specifier : ENUM '{' enumerator_list '}'\n                          | ENUM IDENTIFIER '{' enumerator_list '}'\n                          | ENUM IDENTIFIERenumerator_list : enumerator\n                           | enumerator_list ',' enumeratorenumerator : IDENTIFIER\n                      | IDENTIFIER '=' constant_expression type_qualifier : CONST\n                          | VOLATILE declarator : pointer direct_declarator\n                      | direct_declarator direct_declarator : IDENTIFIER\n                             | '(' declarator ')'\n                             | direct_declarator '[' constant_expression ']'\n                             | direct_declarator '[' ']'\n                             | direct_declarator '(' parameter_type_list ')'\n                             | direct_declarator '(' identifier_list ')'\n                             | direct_declarator '(' ')' pointer : '*'\n                   | '*' type_qualifier_list\n                   | '*' pointer\n                   | '*' type_qualifier_list pointer type_qualifier_list : type_qualifier\n                               | type_qualifier_list type_qualifier parameter_type_list : parameter_list\n                               | parameter_list ',' ELLIPSISparameter_list : parameter_declaration\n                          | parameter_list ',' parameter_declaration parameter_declaration : declaration_specifiers declarator\n                                 | declaration_specifiers abstract_declarator\n                                 | declaration_specifiers identifier_list : IDENTIFIER\n                           | identifier_list ',' IDENTIFIER type_name : specifier_qualifier_list\n                     | specifier_qualifier_list abstract_declarator abstract_declarator : pointer\n                               | direct_abstract_declarator\n                               | pointer direct_abstract_declarator direct_abstract_declarator : '(' abstract_declarator ')'\n                                      | '[' ']'\n                                      | '[' constant_expression ']'\n                                      | direct_abstract_declarator '[' ']'\n                                      | direct_abstract_declarator '[' constant_expression ']'\n                                      | '(' ')'\n                                      | '(' parameter_type_list ')'\n                                      | direct_abstract_declarator '(' ')'\n                                      | direct_abstract_declarator '(' parameter_type_list ')' initializer : assignment_expression\n                       | '{' initializer_list '}'\n                       | '{' initializer_list ',' '}' initializer_list : initializer\n                            | initializer_list ',' initializer statement : labeled_statement\n                     | compound_statement\n                     | expression_statement\n                     | selection_statement\n                     | iteration_statement\n                     | jump_statement labeled_statement : IDENTIFIER ':' statement\n                             | CASE constant_expression ':' statement\n                             | DEFAULT ':' statement compound_statement : '{' '}'\n                              | '{' statement_list '}'\n                              | '{' declaration_list '}'\n                              | '{' declaration_list statement_list '}' declaration_list : declaration\n                            | declaration_list declaration statement_list : statement\n                          | statement_list statement expression_statement : ';'\n                                | expression ';' selection_statement : IF '(' expression ')' statement\n                               | IF '(' expression ')' statement ELSE statement\n                               | SWITCH '(' expression ')' statement iteration_statement : WHILE '(' expression ')' statement\n                               | DO statement WHILE '(' expression ')' ';'\n                               | FOR '(' expression_statement expression_statement ')' statement\n                               | FOR '(' expression_statement expression_statement expression ')' statement jump_statement : GOTO IDENTIFIER ';'\n                          | CONTINUE ';'\n                          | BREAK ';'\n                          | RETURN ';'\n                          | RETURN expression ';' external_declaration : function_definition\n                                | declaration function_definition : declaration_specifiers declarator declaration_list compound_statement\n                                | declaration_specifiers declarator compound_statement\n                                | declarator declaration_list compound_statement\n                                | declarator compound_statement "
+    
+_lr_action_items = {'TYPEDEF':([0,1,2,3,4,6,7,8,9,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,32,38,39,40,43,44,45,46,51,53,58,61,62,63,65,67,68,69,71,124,130,138,149,154,156,219,220,221,223,228,231,239,245,255,294,300,307,],[12,12,-1,-206,-207,12,12,12,12,-133,-89,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,-101,-102,-103,-104,-105,-130,-131,-134,-2,12,-77,12,-211,-188,12,-132,12,-108,-125,12,-209,-78,-210,-189,-184,12,-137,-140,-135,-208,-185,-186,-136,-138,-139,12,12,-107,-123,-187,12,12,-106,-124,]),'EXTERN':([0,1,2,3,4,6,7,8,9,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,32,38,39,40,43,44,45,46,51,53,58,61,62,63,65,67,68,69,71,124,130,138,149,154,156,219,220,221,223,228,231,239,245,255,294,300,307,],[13,13,-1,-206,-207,13,13,13,13,-133,-89,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,-101,-102,-103,-104,-105,-130,-131,-134,-2,13,-77,13,-211,-188,13,-132,13,-108,-125,13,-209,-78,-210,-189,-184,13,-137,-140,-135,-208,-185,-186,-136,-138,-139,13,13,-107,-123,-187,13,13,-106,-124,]),'STATIC':([0,1,2,3,4,6,7,8,9,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,32,38,39,40,43,44,45,46,51,53,58,61,62,63,65,67,68,69,71,124,130,138,149,154,156,219,220,221,223,228,231,239,245,255,294,300,307,],[14,14,-1,-206,-207,14,14,14,14,-133,-89,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,-101,-102,-103,-104,-105,-130,-131,-134,-2,14,-77,14,-211,-188,14,-132,14,-108,-125,14,-209,-78,-210,-189,-184,14,-137,-140,-135,-208,-185,-186,-136,-138,-139,14,14,-107,-123,-187,14,14,-106,-124,]),'AUTO':([0,1,2,3,4,6,7,8,9,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,32,38,39,40,43,44,45,46,51,53,58,61,62,63,65,67,68,69,71,124,130,138,149,154,156,219,220,221,223,228,231,239,245,255,294,300,307,],[15,15,-1,-206,-207,15,15,15,15,-133,-89,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,-101,-102,-103,-104,-105,-130,-131,-134,-2,15,-77,15,-211,-188,15,-132,15,-108,-125,15,-209,-78,-210,-189,-184,15,-137,-140,-135,-208,-185,-186,-136,-138,-139,15,15,-107,-123,-187,15,15,-106,-124,]),'REGISTER':([0,1,2,3,4,6,7,8,9,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,32,38,39,40,43,44,45,46,51,53,58,61,62,63,65,67,68,69,71,124,130,138,149,154,156,219,220,221,223,228,231,239,245,255,294,300,307,],[16,16,-1,-206,-207,16,16,16,16,-133,-89,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,-101,-102,-103,-104,-105,-130,-131,-134,-2,16,-77,16,-211,-188,16,-132,16,-108,-125,16,-209,-78,-210,-189,-184,16,-137,-140,-135,-208,-185,-186,-136,-138,-139,16,16,-107,-123,-187,16,16,-106,-124,]),'VOID':([0,1,2,3,4,6,7,8,9,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,32,38,39,40,43,44,45,46,51,53,58,59,61,62,63,65,67,68,69,71,85,124,127,130,138,139,140,141,143,144,149,154,156,201,219,220,221,223,228,230,231,232,239,245,255,294,300,301,307,],[17,17,-1,-206,-207,17,17,17,17,-133,-89,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,-101,-102,-103,-104,-105,-130,-131,-134,-2,17,-77,17,-211,-188,17,-132,17,-108,17,-125,17,-209,-78,-210,-189,-184,17,17,-137,17,-140,-135,17,17,-111,17,17,-208,-185,-186,17,-136,-138,-139,17,17,17,-107,-112,-123,-187,17,17,-106,-113,-124,]),'CHAR':([0,1,2,3,4,6,7,8,9,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,32,38,39,40,43,44,45,46,51,53,58,59,61,62,63,65,67,68,69,71,85,124,127,130,138,139,140,141,143,144,149,154,156,201,219,220,221,223,228,230,231,232,239,245,255,294,300,301,307,],[18,18,-1,-206,-207,18,18,18,18,-133,-89,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,-101,-102,-103,-104,-105,-130,-131,-134,-2,18,-77,18,-211,-188,18,-132,18,-108,18,-125,18,-209,-78,-210,-189,-184,18,18,-137,18,-140,-135,18,18,-111,18,18,-208,-185,-186,18,-136,-138,-139,18,18,18,-107,-112,-123,-187,18,18,-106,-113,-124,]),'SHORT':([0,1,2,3,4,6,7,8,9,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,32,38,39,40,43,44,45,46,51,53,58,59,61,62,63,65,67,68,69,71,85,124,127,130,138,139,140,141,143,144,149,154,156,201,219,220,221,223,228,230,231,232,239,245,255,294,300,301,307,],[19,19,-1,-206,-207,19,19,19,19,-133,-89,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,-101,-102,-103,-104,-105,-130,-131,-134,-2,19,-77,19,-211,-188,19,-132,19,-108,19,-125,19,-209,-78,-210,-189,-184,19,19,-137,19,-140,-135,19,19,-111,19,19,-208,-185,-186,19,-136,-138,-139,19,19,19,-107,-112,-123,-187,19,19,-106,-113,-124,]),'INT':([0,1,2,3,4,6,7,8,9,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,32,38,39,40,43,44,45,46,51,53,58,59,61,62,63,65,67,68,69,71,85,124,127,130,138,139,140,141,143,144,149,154,156,201,219,220,221,223,228,230,231,232,239,245,255,294,300,301,307,],[20,20,-1,-206,-207,20,20,20,20,-133,-89,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,-101,-102,-103,-104,-105,-130,-131,-134,-2,20,-77,20,-211,-188,20,-132,20,-108,20,-125,20,-209,-78,-210,-189,-184,20,20,-137,20,-140,-135,20,20,-111,20,20,-208,-185,-186,20,-136,-138,-139,20,20,20,-107,-112,-123,-187,20,20,-106,-113,-124,]),'LONG':([0,1,2,3,4,6,7,8,9,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,32,38,39,40,43,44,45,46,51,53,58,59,61,62,63,65,67,68,69,71,85,124,127,130,138,139,140,141,143,144,149,154,156,201,219,220,221,223,228,230,231,232,239,245,255,294,300,301,307,],[21,21,-1,-206,-207,21,21,21,21,-133,-89,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,-101,-102,-103,-104,-105,-130,-131,-134,-2,21,-77,21,-211,-188,21,-132,21,-108,21,-125,21,-209,-78,-210,-189,-184,21,21,-137,21,-140,-135,21,21,-111,21,21,-208,-185,-186,21,-136,-138,-139,21,21,21,-107,-112,-123,-187,21,21,-106,-113,-124,]),'FLOAT':([0,1,2,3,4,6,7,8,9,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,32,38,39,40,43,44,45,46,51,53,58,59,61,62,63,65,67,68,69,71,85,124,127,130,138,139,140,141,143,144,149,154,156,201,219,220,221,223,228,230,231,232,239,245,255,294,300,301,307,],[22,22,-1,-206,-207,22,22,22,22,-133,-89,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,-101,-102,-103,-104,-105,-130,-131,-134,-2,22,-77,22,-211,-188,22,-132,22,-108,22,-125,22,-209,-78,-210,-189,-184,22,22,-137,22,-140,-135,22,22,-111,22,22,-208,-185,-186,22,-136,-138,-139,22,22,22,-107,-112,-123,-187,22,22,-106,-113,-124,]),'DOUBLE':([0,1,2,3,4,6,7,8,9,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,32,38,39,40,43,44,45,46,51,53,58,59,61,62,63,65,67,68,69,71,85,124,127,130,138,139,140,141,143,144,149,154,156,201,219,220,221,223,228,230,231,232,239,245,255,294,300,301,307,],[23,23,-1,-206,-207,23,23,23,23,-133,-89,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,-101,-102,-103,-104,-105,-130,-131,-134,-2,23,-77,23,-211,-188,23,-132,23,-108,23,-125,23,-209,-78,-210,-189,-184,23,23,-137,23,-140,-135,23,23,-111,23,23,-208,-185,-186,23,-136,-138,-139,23,23,23,-107,-112,-123,-187,23,23,-106,-113,-124,]),'SIGNED':([0,1,2,3,4,6,7,8,9,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,32,38,39,40,43,44,45,46,51,53,58,59,61,62,63,65,67,68,69,71,85,124,127,130,138,139,140,141,143,144,149,154,156,201,219,220,221,223,228,230,231,232,239,245,255,294,300,301,307,],[24,24,-1,-206,-207,24,24,24,24,-133,-89,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,-101,-102,-103,-104,-105,-130,-131,-134,-2,24,-77,24,-211,-188,24,-132,24,-108,24,-125,24,-209,-78,-210,-189,-184,24,24,-137,24,-140,-135,24,24,-111,24,24,-208,-185,-186,24,-136,-138,-139,24,24,24,-107,-112,-123,-187,24,24,-106,-113,-124,]),'UNSIGNED':([0,1,2,3,4,6,7,8,9,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,32,38,39,40,43,44,45,46,51,53,58,59,61,62,63,65,67,68,69,71,85,124,127,130,138,139,140,141,143,144,149,154,156,201,219,220,221,223,228,230,231,232,239,245,255,294,300,301,307,],[25,25,-1,-206,-207,25,25,25,25,-133,-89,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,-101,-102,-103,-104,-105,-130,-131,-134,-2,25,-77,25,-211,-188,25,-132,25,-108,25,-125,25,-209,-78,-210,-189,-184,25,25,-137,25,-140,-135,25,25,-111,25,25,-208,-185,-186,25,-136,-138,-139,25,25,25,-107,-112,-123,-187,25,25,-106,-113,-124,]),'TYPE_NAME':([0,1,2,3,4,6,7,8,9,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,32,38,39,40,43,44,45,46,51,53,58,59,61,62,63,65,67,68,69,71,85,124,127,130,138,139,140,141,143,144,149,154,156,201,219,220,221,223,228,230,231,232,239,245,255,294,300,301,307,],[28,28,-1,-206,-207,28,28,28,28,-133,-89,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,-101,-102,-103,-104,-105,-130,-131,-134,-2,28,-77,28,-211,-188,28,-132,28,-108,28,-125,28,-209,-78,-210,-189,-184,28,28,-137,28,-140,-135,28,28,-111,28,28,-208,-185,-186,28,-136,-138,-139,28,28,28,-107,-112,-123,-187,28,28,-106,-113,-124,]),'CONST':([0,1,2,3,4,6,7,8,9,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,38,39,40,43,44,45,46,51,53,54,56,58,59,61,62,63,65,67,68,69,71,85,124,127,130,137,138,139,140,141,143,144,149,154,156,201,219,220,221,223,228,230,231,232,239,245,255,294,300,301,307,],[29,29,-1,-206,-207,29,29,29,29,-133,-89,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,-101,-102,-103,-104,-105,-130,-131,29,-134,-2,29,-77,29,-211,-188,29,-132,29,29,-145,-108,29,-125,29,-209,-78,-210,-189,-184,29,29,-137,29,-140,-146,-135,29,29,-111,29,29,-208,-185,-186,29,-136,-138,-139,29,29,29,-107,-112,-123,-187,29,29,-106,-113,-124,]),'VOLATILE':([0,1,2,3,4,6,7,8,9,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,38,39,40,43,44,45,46,51,53,54,56,58,59,61,62,63,65,67,68,69,71,85,124,127,130,137,138,139,140,141,143,144,149,154,156,201,219,220,221,223,228,230,231,232,239,245,255,294,300,301,307,],[30,30,-1,-206,-207,30,30,30,30,-133,-89,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,-101,-102,-103,-104,-105,-130,-131,30,-134,-2,30,-77,30,-211,-188,30,-132,30,30,-145,-108,30,-125,30,-209,-78,-210,-189,-184,30,30,-137,30,-140,-146,-135,30,30,-111,30,30,-208,-185,-186,30,-136,-138,-139,30,30,30,-107,-112,-123,-187,30,30,-106,-113,-124,]),'*':([0,1,2,3,4,5,7,8,9,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,33,38,40,44,45,46,47,48,49,50,52,54,56,58,61,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,85,88,93,96,98,99,100,101,102,103,105,106,107,108,109,110,111,113,114,121,126,127,128,135,137,142,143,144,149,152,154,155,156,157,158,160,161,162,163,166,167,168,170,172,173,174,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,218,228,229,231,236,237,238,239,241,245,246,247,248,251,252,255,259,260,261,266,269,270,284,285,286,287,288,293,300,302,303,307,309,310,311,312,313,314,315,316,317,318,319,320,321,333,334,335,337,343,345,346,347,348,349,],[31,31,-1,-206,-207,31,-79,-81,-83,-89,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,-101,-102,-103,-104,-105,-130,-131,31,31,-2,-77,-211,-188,107,31,-80,-82,-84,107,31,-145,-108,-125,-209,107,-78,31,-210,-189,-184,107,107,-190,-175,-176,-177,-178,-179,-180,-192,-3,107,107,107,107,-29,-17,107,107,107,-31,107,-7,-23,-24,-25,-26,-27,-28,-4,-5,216,-29,107,-3,31,-146,31,-115,-117,-208,107,-185,-191,-186,107,107,107,-193,107,107,31,107,107,107,-202,-203,-204,107,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,107,107,107,107,-13,-14,-18,107,-19,-20,-21,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,31,107,-107,107,-114,-116,-123,107,-187,-181,107,-183,-6,107,31,107,-201,-205,-9,-11,-12,216,216,-32,-33,-34,107,-106,31,107,-124,107,-182,107,-30,107,107,107,107,107,-8,-10,107,-22,-194,-196,-197,107,107,-199,107,-195,-198,-200,]),'IDENTIFIER':([0,1,2,3,4,5,7,8,9,10,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,33,34,35,36,37,38,40,44,45,46,47,48,49,50,52,53,54,55,56,58,60,61,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,81,85,88,90,93,99,100,101,103,106,107,108,109,110,111,127,135,136,137,142,143,144,148,149,152,154,155,156,157,158,160,161,162,163,167,168,170,172,173,174,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,197,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,218,222,226,228,229,231,236,237,238,239,240,241,245,246,247,248,252,259,260,261,293,300,302,303,307,309,310,311,313,314,315,316,317,320,333,334,335,337,343,345,346,347,348,349,],[32,32,-1,-206,-207,32,-79,-81,-83,32,-89,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,-101,-102,-103,-104,-105,-130,-131,-141,32,58,61,-109,-110,-2,-77,-211,-188,80,32,-80,-82,-84,128,133,-142,-143,-145,-108,147,-125,-209,128,-78,32,-210,-189,-184,80,80,-190,-175,-176,-177,-178,-179,-180,-192,128,128,80,171,128,128,128,128,128,-23,-24,-25,-26,-27,-28,128,32,-144,-146,32,-115,-117,147,-208,128,-185,-191,-186,80,80,80,-193,128,128,128,128,128,-202,-203,-204,128,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,128,128,128,128,269,270,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,289,32,32,128,-107,128,-114,-116,-123,147,128,-187,-181,80,-183,128,128,-201,-205,128,-106,32,128,-124,128,-182,80,80,80,128,128,128,128,-194,-196,-197,80,80,-199,80,-195,-198,-200,]),'(':([0,1,2,3,4,5,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,38,40,44,45,46,47,48,49,50,51,52,54,55,56,58,61,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,84,85,86,87,88,89,93,98,99,100,101,103,105,106,107,108,109,110,111,113,114,124,127,128,130,135,136,137,138,142,143,144,149,152,154,155,156,157,158,160,161,162,163,166,167,168,170,172,173,174,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,194,195,197,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,226,227,228,229,231,236,237,238,239,241,245,246,247,248,251,252,254,255,258,259,260,261,266,269,270,292,293,295,298,300,302,303,307,309,310,311,313,314,315,316,317,318,319,320,322,324,326,327,328,333,334,335,337,341,342,343,345,346,347,348,349,],[33,33,-1,-206,-207,33,-79,-81,-83,33,53,-89,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,-101,-102,-103,-104,-105,-130,-131,-141,-134,33,-2,-77,-211,-188,85,33,-80,-82,-84,53,127,-142,-143,-145,-108,-125,-209,85,-78,33,-210,-189,-184,85,85,-190,-175,-176,-177,-178,-179,-180,-192,-3,127,163,85,167,168,85,170,85,191,197,197,127,201,-7,-23,-24,-25,-26,-27,-28,-4,-5,-137,85,-3,-140,228,-144,-146,-135,33,-115,-117,-208,85,-185,-191,-186,85,85,85,-193,85,85,255,85,85,85,-202,-203,-204,85,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,85,127,85,85,-13,-14,85,85,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,-136,-138,-139,228,294,228,127,-107,127,-114,-116,-123,127,-187,-181,85,-183,-6,127,255,255,315,85,-201,-205,-9,-11,-12,294,127,-166,-162,-106,33,127,-124,85,-182,85,85,85,85,85,127,-8,-10,85,-164,-168,-161,-167,-163,-194,-196,-197,85,-165,-169,85,-199,85,-195,-198,-200,]),'ENUM':([0,1,2,3,4,6,7,8,9,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,32,38,39,40,43,44,45,46,51,53,58,59,61,62,63,65,67,68,69,71,85,124,127,130,138,139,140,141,143,144,149,154,156,201,219,220,221,223,228,230,231,232,239,245,255,294,300,301,307,],[35,35,-1,-206,-207,35,35,35,35,-133,-89,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,-101,-102,-103,-104,-105,-130,-131,-134,-2,35,-77,35,-211,-188,35,-132,35,-108,35,-125,35,-209,-78,-210,-189,-184,35,35,-137,35,-140,-135,35,35,-111,35,35,-208,-185,-186,35,-136,-138,-139,35,35,35,-107,-112,-123,-187,35,35,-106,-113,-124,]),'STRUCT':([0,1,2,3,4,6,7,8,9,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,32,38,39,40,43,44,45,46,51,53,58,59,61,62,63,65,67,68,69,71,85,124,127,130,138,139,140,141,143,144,149,154,156,201,219,220,221,223,228,230,231,232,239,245,255,294,300,301,307,],[36,36,-1,-206,-207,36,36,36,36,-133,-89,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,-101,-102,-103,-104,-105,-130,-131,-134,-2,36,-77,36,-211,-188,36,-132,36,-108,36,-125,36,-209,-78,-210,-189,-184,36,36,-137,36,-140,-135,36,36,-111,36,36,-208,-185,-186,36,-136,-138,-139,36,36,36,-107,-112,-123,-187,36,36,-106,-113,-124,]),'UNION':([0,1,2,3,4,6,7,8,9,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,32,38,39,40,43,44,45,46,51,53,58,59,61,62,63,65,67,68,69,71,85,124,127,130,138,139,140,141,143,144,149,154,156,201,219,220,221,223,228,230,231,232,239,245,255,294,300,301,307,],[37,37,-1,-206,-207,37,37,37,37,-133,-89,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,-101,-102,-103,-104,-105,-130,-131,-134,-2,37,-77,37,-211,-188,37,-132,37,-108,37,-125,37,-209,-78,-210,-189,-184,37,37,-137,37,-140,-135,37,37,-111,37,37,-208,-185,-186,37,-136,-138,-139,37,37,37,-107,-112,-123,-187,37,37,-106,-113,-124,]),'$end':([1,2,3,4,38,40,44,63,65,67,69,149,154,156,245,],[0,-1,-206,-207,-2,-77,-211,-209,-78,-210,-184,-208,-185,-186,-187,]),';':([5,7,8,9,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,32,39,40,41,42,45,46,47,48,49,50,51,58,61,65,68,69,70,71,72,73,74,75,76,77,78,79,80,83,88,91,92,93,94,95,96,97,98,102,104,105,112,113,114,115,116,117,118,119,120,121,122,124,125,126,128,130,138,150,151,153,154,155,156,157,158,160,161,170,171,172,173,174,175,194,195,196,198,199,200,219,220,221,231,233,234,235,239,245,246,247,248,249,251,259,260,261,262,264,266,269,270,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,300,304,307,308,310,311,312,313,314,318,319,321,329,330,331,333,334,335,337,339,343,344,345,346,347,348,349,],[40,-79,-81,-83,-133,-89,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,-101,-102,-103,-104,-105,-130,-131,-134,-87,-77,65,-85,-188,79,40,-80,-82,-84,-132,-108,-125,-78,-189,-184,79,79,-190,-175,-176,-177,-178,-179,-180,-192,-3,161,79,172,173,174,-74,-61,-29,-59,-17,-31,-57,-7,-55,-4,-5,-53,-51,-49,-46,-41,-38,-35,-87,-137,-76,-29,-3,-140,-135,-88,-170,-86,-185,-191,-186,79,79,79,-193,79,260,-202,-203,-204,261,-13,-14,-18,-19,-20,-21,-136,-138,-139,-107,301,-118,-120,-123,-187,-181,79,-183,-75,-6,79,-201,-205,-62,-58,-9,-11,-12,-56,-54,-52,-50,-47,-48,-42,-43,-44,-45,-39,-40,-36,-37,-32,-33,-34,-106,-121,-124,-171,-182,79,-30,79,79,-8,-10,-22,-119,-122,-172,-194,-196,-197,79,-60,79,348,-199,79,-195,-198,-200,]),'{':([6,11,32,34,35,36,37,39,40,43,45,46,51,58,61,62,64,65,68,69,70,71,72,73,74,75,76,77,78,79,88,124,130,138,152,154,155,156,157,158,160,161,172,173,174,219,220,221,245,246,247,248,260,261,309,310,311,313,314,333,334,335,337,343,345,346,347,348,349,],[46,-133,-134,59,60,-109,-110,46,-77,46,-188,46,-132,139,148,46,152,-78,-189,-184,46,46,-190,-175,-176,-177,-178,-179,-180,-192,46,-137,-140,-135,152,-185,-191,-186,46,46,46,-193,-202,-203,-204,-136,-138,-139,-187,-181,46,-183,-201,-205,152,-182,46,46,46,-194,-196,-197,46,46,-199,46,-195,-198,-200,]),'[':([7,8,9,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,48,49,50,51,54,55,56,58,61,80,98,105,113,114,124,128,130,135,136,137,138,143,144,166,194,195,219,220,221,226,227,228,231,237,238,239,251,254,255,266,269,270,292,295,298,300,307,318,319,322,324,326,327,328,341,342,],[-79,-81,-83,52,-89,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,-101,-102,-103,-104,-105,-130,-131,-141,-134,-80,-82,-84,52,-142,-143,-145,-108,-125,-3,190,-7,-4,-5,-137,-3,-140,229,-144,-146,-135,-115,-117,229,-13,-14,-136,-138,-139,229,293,229,-107,-114,-116,-123,-6,229,229,-9,-11,-12,293,-166,-162,-106,-124,-8,-10,-164,-168,-161,-167,-163,-165,-169,]),',':([7,8,9,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,39,41,42,48,49,50,51,54,55,56,58,61,80,83,94,95,96,97,98,102,104,105,112,113,114,115,116,117,118,119,120,121,122,124,125,126,128,130,131,132,133,134,135,136,137,138,145,146,147,150,151,153,164,175,194,195,196,198,199,200,219,220,221,224,225,226,227,231,233,234,235,239,242,243,244,249,250,251,256,257,262,263,264,265,266,267,268,269,270,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,291,292,295,298,300,304,305,306,307,308,312,318,319,321,322,324,326,327,328,329,330,331,332,336,338,339,340,341,342,],[-79,-81,-83,-133,-89,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,-101,-102,-103,-104,-105,-130,-131,-141,-134,-87,66,-85,-80,-82,-84,-132,-142,-143,-145,-108,-125,-3,162,-74,-61,-29,-59,-17,-31,-57,-7,-55,-4,-5,-53,-51,-49,-46,-41,-38,-35,-87,-137,-76,-29,-3,-140,222,223,-154,-149,-153,-144,-146,-135,240,-126,-128,-88,-170,-86,162,162,-13,-14,-18,-19,-20,-21,-136,-138,-139,-151,-152,-158,-159,-107,302,-118,-120,-123,240,309,-173,-75,162,-6,162,162,-62,162,-58,162,-9,320,-15,-11,-12,-56,-54,-52,-50,-47,-48,-42,-43,-44,-45,-39,-40,-36,-37,-32,-33,-34,-155,-150,-160,-166,-162,-106,-121,-127,-129,-124,-171,-30,-8,-10,-22,-164,-168,-161,-167,-163,-119,-122,-172,-174,162,162,-60,-16,-165,-169,]),')':([7,8,9,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,48,49,50,51,53,54,55,56,57,58,61,79,94,95,96,97,98,102,104,105,112,113,114,115,116,117,118,119,120,121,124,126,128,129,130,131,132,133,134,135,136,137,138,143,144,161,164,165,166,191,194,195,196,198,199,200,219,220,221,224,225,226,227,228,231,237,238,239,249,250,251,253,254,255,256,257,262,264,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,294,295,296,297,298,300,307,312,316,318,319,321,322,324,325,326,327,328,336,338,339,340,341,342,],[-79,-81,-83,-133,-89,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,-101,-102,-103,-104,-105,-130,-131,-141,-134,-80,-82,-84,-132,130,-142,-143,-145,138,-108,-125,-192,-74,-61,-29,-59,-17,-31,-57,-7,-55,-4,-5,-53,-51,-49,-46,-41,-38,-35,-137,-29,-3,220,-140,221,-147,-154,-149,-153,-144,-146,-135,-115,-117,-193,251,252,-156,266,-13,-14,-18,-19,-20,-21,-136,-138,-139,-151,-152,-158,-159,295,-107,-114,-116,-123,-75,311,-6,-157,-158,295,313,314,-62,-58,-9,319,-15,-11,-12,321,-56,-54,-52,-50,-47,-48,-42,-43,-44,-45,-39,-40,-36,-37,-32,-33,-34,-155,-148,-150,-160,324,-166,326,327,-162,-106,-124,-30,337,-8,-10,-22,-164,-168,342,-161,-167,-163,344,346,-60,-16,-165,-169,]),'=':([11,32,39,51,80,96,98,105,113,114,122,124,126,128,130,138,147,194,195,196,198,199,200,219,220,221,251,266,269,270,312,318,319,321,],[-133,-134,64,-132,-3,177,-17,-7,-4,-5,64,-137,-29,-3,-140,-135,241,-13,-14,-18,-19,-20,-21,-136,-138,-139,-6,-9,-11,-12,-30,-8,-10,-22,]),':':([11,17,18,19,20,21,22,23,24,25,26,27,28,29,30,32,51,58,61,80,82,94,95,96,97,98,102,104,105,112,113,114,115,116,117,118,119,120,121,124,125,126,128,130,138,142,143,144,159,194,195,196,198,199,200,219,220,221,231,235,237,238,239,249,251,262,263,264,266,269,270,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,300,302,307,312,318,319,321,339,],[-133,-94,-95,-96,-97,-98,-99,-100,-101,-102,-103,-104,-105,-130,-131,-134,-132,-108,-125,158,160,-74,-61,-29,-59,-17,-31,-57,-7,-55,-4,-5,-53,-51,-49,-46,-41,-38,-35,-137,-76,-29,-3,-140,-135,236,-115,-117,247,-13,-14,-18,-19,-20,-21,-136,-138,-139,-107,303,-114,-116,-123,-75,-6,-62,317,-58,-9,-11,-12,-56,-54,-52,-50,-47,-48,-42,-43,-44,-45,-39,-40,-36,-37,-32,-33,-34,-106,236,-124,-30,-8,-10,-22,-60,]),'}':([40,45,46,65,68,69,70,71,72,73,74,75,76,77,78,79,95,96,97,98,102,104,105,112,113,114,115,116,117,118,119,120,121,125,126,128,140,141,145,146,147,151,154,155,156,157,161,172,173,174,194,195,196,198,199,200,230,232,242,243,244,245,246,248,251,260,261,262,264,266,269,270,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,301,305,306,308,309,310,312,318,319,321,331,332,333,334,335,339,345,347,348,349,],[-77,-188,69,-78,-189,-184,154,156,-190,-175,-176,-177,-178,-179,-180,-192,-61,-29,-59,-17,-31,-57,-7,-55,-4,-5,-53,-51,-49,-46,-41,-38,-35,-76,-29,-3,231,-111,239,-126,-128,-170,-185,-191,-186,245,-193,-202,-203,-204,-13,-14,-18,-19,-20,-21,300,-112,307,308,-173,-187,-181,-183,-6,-201,-205,-62,-58,-9,-11,-12,-56,-54,-52,-50,-47,-48,-42,-43,-44,-45,-39,-40,-36,-37,-32,-33,-34,-113,-127,-129,-171,331,-182,-30,-8,-10,-22,-172,-174,-194,-196,-197,-60,-199,-195,-198,-200,]),'CASE':([40,45,46,65,68,69,70,71,72,73,74,75,76,77,78,79,88,154,155,156,157,158,160,161,172,173,174,245,246,247,248,260,261,310,311,313,314,333,334,335,337,343,345,346,347,348,349,],[-77,-188,81,-78,-189,-184,81,81,-190,-175,-176,-177,-178,-179,-180,-192,81,-185,-191,-186,81,81,81,-193,-202,-203,-204,-187,-181,81,-183,-201,-205,-182,81,81,81,-194,-196,-197,81,81,-199,81,-195,-198,-200,]),'DEFAULT':([40,45,46,65,68,69,70,71,72,73,74,75,76,77,78,79,88,154,155,156,157,158,160,161,172,173,174,245,246,247,248,260,261,310,311,313,314,333,334,335,337,343,345,346,347,348,349,],[-77,-188,82,-78,-189,-184,82,82,-190,-175,-176,-177,-178,-179,-180,-192,82,-185,-191,-186,82,82,82,-193,-202,-203,-204,-187,-181,82,-183,-201,-205,-182,82,82,82,-194,-196,-197,82,82,-199,82,-195,-198,-200,]),'IF':([40,45,46,65,68,69,70,71,72,73,74,75,76,77,78,79,88,154,155,156,157,158,160,161,172,173,174,245,246,247,248,260,261,310,311,313,314,333,334,335,337,343,345,346,347,348,349,],[-77,-188,84,-78,-189,-184,84,84,-190,-175,-176,-177,-178,-179,-180,-192,84,-185,-191,-186,84,84,84,-193,-202,-203,-204,-187,-181,84,-183,-201,-205,-182,84,84,84,-194,-196,-197,84,84,-199,84,-195,-198,-200,]),'SWITCH':([40,45,46,65,68,69,70,71,72,73,74,75,76,77,78,79,88,154,155,156,157,158,160,161,172,173,174,245,246,247,248,260,261,310,311,313,314,333,334,335,337,343,345,346,347,348,349,],[-77,-188,86,-78,-189,-184,86,86,-190,-175,-176,-177,-178,-179,-180,-192,86,-185,-191,-186,86,86,86,-193,-202,-203,-204,-187,-181,86,-183,-201,-205,-182,86,86,86,-194,-196,-197,86,86,-199,86,-195,-198,-200,]),'WHILE':([40,45,46,65,68,69,70,71,72,73,74,75,76,77,78,79,88,154,155,156,157,158,160,161,169,172,173,174,245,246,247,248,260,261,310,311,313,314,333,334,335,337,343,345,346,347,348,349,],[-77,-188,87,-78,-189,-184,87,87,-190,-175,-176,-177,-178,-179,-180,-192,87,-185,-191,-186,87,87,87,-193,258,-202,-203,-204,-187,-181,87,-183,-201,-205,-182,87,87,87,-194,-196,-197,87,87,-199,87,-195,-198,-200,]),'DO':([40,45,46,65,68,69,70,71,72,73,74,75,76,77,78,79,88,154,155,156,157,158,160,161,172,173,174,245,246,247,248,260,261,310,311,313,314,333,334,335,337,343,345,346,347,348,349,],[-77,-188,88,-78,-189,-184,88,88,-190,-175,-176,-177,-178,-179,-180,-192,88,-185,-191,-186,88,88,88,-193,-202,-203,-204,-187,-181,88,-183,-201,-205,-182,88,88,88,-194,-196,-197,88,88,-199,88,-195,-198,-200,]),'FOR':([40,45,46,65,68,69,70,71,72,73,74,75,76,77,78,79,88,154,155,156,157,158,160,161,172,173,174,245,246,247,248,260,261,310,311,313,314,333,334,335,337,343,345,346,347,348,349,],[-77,-188,89,-78,-189,-184,89,89,-190,-175,-176,-177,-178,-179,-180,-192,89,-185,-191,-186,89,89,89,-193,-202,-203,-204,-187,-181,89,-183,-201,-205,-182,89,89,89,-194,-196,-197,89,89,-199,89,-195,-198,-200,]),'GOTO':([40,45,46,65,68,69,70,71,72,73,74,75,76,77,78,79,88,154,155,156,157,158,160,161,172,173,174,245,246,247,248,260,261,310,311,313,314,333,334,335,337,343,345,346,347,348,349,],[-77,-188,90,-78,-189,-184,90,90,-190,-175,-176,-177,-178,-179,-180,-192,90,-185,-191,-186,90,90,90,-193,-202,-203,-204,-187,-181,90,-183,-201,-205,-182,90,90,90,-194,-196,-197,90,90,-199,90,-195,-198,-200,]),'CONTINUE':([40,45,46,65,68,69,70,71,72,73,74,75,76,77,78,79,88,154,155,156,157,158,160,161,172,173,174,245,246,247,248,260,261,310,311,313,314,333,334,335,337,343,345,346,347,348,349,],[-77,-188,91,-78,-189,-184,91,91,-190,-175,-176,-177,-178,-179,-180,-192,91,-185,-191,-186,91,91,91,-193,-202,-203,-204,-187,-181,91,-183,-201,-205,-182,91,91,91,-194,-196,-197,91,91,-199,91,-195,-198,-200,]),'BREAK':([40,45,46,65,68,69,70,71,72,73,74,75,76,77,78,79,88,154,155,156,157,158,160,161,172,173,174,245,246,247,248,260,261,310,311,313,314,333,334,335,337,343,345,346,347,348,349,],[-77,-188,92,-78,-189,-184,92,92,-190,-175,-176,-177,-178,-179,-180,-192,92,-185,-191,-186,92,92,92,-193,-202,-203,-204,-187,-181,92,-183,-201,-205,-182,92,92,92,-194,-196,-197,92,92,-199,92,-195,-198,-200,]),'RETURN':([40,45,46,65,68,69,70,71,72,73,74,75,76,77,78,79,88,154,155,156,157,158,160,161,172,173,174,245,246,247,248,260,261,310,311,313,314,333,334,335,337,343,345,346,347,348,349,],[-77,-188,93,-78,-189,-184,93,93,-190,-175,-176,-177,-178,-179,-180,-192,93,-185,-191,-186,93,93,93,-193,-202,-203,-204,-187,-181,93,-183,-201,-205,-182,93,93,93,-194,-196,-197,93,93,-199,93,-195,-198,-200,]),'INC_OP':([40,45,46,52,64,65,68,69,70,71,72,73,74,75,76,77,78,79,80,81,85,88,93,98,99,100,101,103,105,106,107,108,109,110,111,113,114,127,128,152,154,155,156,157,158,160,161,162,163,167,168,170,172,173,174,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,194,195,197,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,218,229,236,241,245,246,247,248,251,252,259,260,261,266,269,270,293,303,309,310,311,313,314,315,316,317,318,319,320,333,334,335,337,343,345,346,347,348,349,],[-77,-188,99,99,99,-78,-189,-184,99,99,-190,-175,-176,-177,-178,-179,-180,-192,-3,99,99,99,99,194,99,99,99,99,-7,-23,-24,-25,-26,-27,-28,-4,-5,99,-3,99,-185,-191,-186,99,99,99,-193,99,99,99,99,99,-202,-203,-204,99,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,99,99,99,99,-13,-14,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,-187,-181,99,-183,-6,99,99,-201,-205,-9,-11,-12,99,99,99,-182,99,99,99,99,99,99,-8,-10,99,-194,-196,-197,99,99,-199,99,-195,-198,-200,]),'DEC_OP':([40,45,46,52,64,65,68,69,70,71,72,73,74,75,76,77,78,79,80,81,85,88,93,98,99,100,101,103,105,106,107,108,109,110,111,113,114,127,128,152,154,155,156,157,158,160,161,162,163,167,168,170,172,173,174,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,194,195,197,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,218,229,236,241,245,246,247,248,251,252,259,260,261,266,269,270,293,303,309,310,311,313,314,315,316,317,318,319,320,333,334,335,337,343,345,346,347,348,349,],[-77,-188,100,100,100,-78,-189,-184,100,100,-190,-175,-176,-177,-178,-179,-180,-192,-3,100,100,100,100,195,100,100,100,100,-7,-23,-24,-25,-26,-27,-28,-4,-5,100,-3,100,-185,-191,-186,100,100,100,-193,100,100,100,100,100,-202,-203,-204,100,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,100,100,100,100,-13,-14,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,-187,-181,100,-183,-6,100,100,-201,-205,-9,-11,-12,100,100,100,-182,100,100,100,100,100,100,-8,-10,100,-194,-196,-197,100,100,-199,100,-195,-198,-200,]),'SIZEOF':([40,45,46,52,64,65,68,69,70,71,72,73,74,75,76,77,78,79,81,85,88,93,99,100,101,103,106,107,108,109,110,111,127,152,154,155,156,157,158,160,161,162,163,167,168,170,172,173,174,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,197,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,218,229,236,241,245,246,247,248,252,259,260,261,293,303,309,310,311,313,314,315,316,317,320,333,334,335,337,343,345,346,347,348,349,],[-77,-188,103,103,103,-78,-189,-184,103,103,-190,-175,-176,-177,-178,-179,-180,-192,103,103,103,103,103,103,103,103,-23,-24,-25,-26,-27,-28,103,103,-185,-191,-186,103,103,103,-193,103,103,103,103,103,-202,-203,-204,103,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,-187,-181,103,-183,103,103,-201,-205,103,103,103,-182,103,103,103,103,103,103,103,-194,-196,-197,103,103,-199,103,-195,-198,-200,]),'&':([40,45,46,52,64,65,68,69,70,71,72,73,74,75,76,77,78,79,80,81,85,88,93,96,98,99,100,101,102,103,105,106,107,108,109,110,111,113,114,116,117,118,119,120,121,126,127,128,152,154,155,156,157,158,160,161,162,163,167,168,170,172,173,174,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,218,229,236,241,245,246,247,248,251,252,259,260,261,266,269,270,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,293,303,309,310,311,312,313,314,315,316,317,318,319,320,321,333,334,335,337,343,345,346,347,348,349,],[-77,-188,106,106,106,-78,-189,-184,106,106,-190,-175,-176,-177,-178,-179,-180,-192,-3,106,106,106,106,-29,-17,106,106,106,-31,106,-7,-23,-24,-25,-26,-27,-28,-4,-5,205,-49,-46,-41,-38,-35,-29,106,-3,106,-185,-191,-186,106,106,106,-193,106,106,106,106,106,-202,-203,-204,106,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,106,106,106,106,-13,-14,-18,106,-19,-20,-21,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,-187,-181,106,-183,-6,106,106,-201,-205,-9,-11,-12,205,-50,-47,-48,-42,-43,-44,-45,-39,-40,-36,-37,-32,-33,-34,106,106,106,-182,106,-30,106,106,106,106,106,-8,-10,106,-22,-194,-196,-197,106,106,-199,106,-195,-198,-200,]),'+':([40,45,46,52,64,65,68,69,70,71,72,73,74,75,76,77,78,79,80,81,85,88,93,96,98,99,100,101,102,103,105,106,107,108,109,110,111,113,114,120,121,126,127,128,152,154,155,156,157,158,160,161,162,163,167,168,170,172,173,174,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,218,229,236,241,245,246,247,248,251,252,259,260,261,266,269,270,282,283,284,285,286,287,288,293,303,309,310,311,312,313,314,315,316,317,318,319,320,321,333,334,335,337,343,345,346,347,348,349,],[-77,-188,108,108,108,-78,-189,-184,108,108,-190,-175,-176,-177,-178,-179,-180,-192,-3,108,108,108,108,-29,-17,108,108,108,-31,108,-7,-23,-24,-25,-26,-27,-28,-4,-5,214,-35,-29,108,-3,108,-185,-191,-186,108,108,108,-193,108,108,108,108,108,-202,-203,-204,108,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,108,108,108,108,-13,-14,-18,108,-19,-20,-21,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,-187,-181,108,-183,-6,108,108,-201,-205,-9,-11,-12,214,214,-36,-37,-32,-33,-34,108,108,108,-182,108,-30,108,108,108,108,108,-8,-10,108,-22,-194,-196,-197,108,108,-199,108,-195,-198,-200,]),'-':([40,45,46,52,64,65,68,69,70,71,72,73,74,75,76,77,78,79,80,81,85,88,93,96,98,99,100,101,102,103,105,106,107,108,109,110,111,113,114,120,121,126,127,128,152,154,155,156,157,158,160,161,162,163,167,168,170,172,173,174,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,218,229,236,241,245,246,247,248,251,252,259,260,261,266,269,270,282,283,284,285,286,287,288,293,303,309,310,311,312,313,314,315,316,317,318,319,320,321,333,334,335,337,343,345,346,347,348,349,],[-77,-188,109,109,109,-78,-189,-184,109,109,-190,-175,-176,-177,-178,-179,-180,-192,-3,109,109,109,109,-29,-17,109,109,109,-31,109,-7,-23,-24,-25,-26,-27,-28,-4,-5,215,-35,-29,109,-3,109,-185,-191,-186,109,109,109,-193,109,109,109,109,109,-202,-203,-204,109,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,109,109,109,109,-13,-14,-18,109,-19,-20,-21,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,-187,-181,109,-183,-6,109,109,-201,-205,-9,-11,-12,215,215,-36,-37,-32,-33,-34,109,109,109,-182,109,-30,109,109,109,109,109,-8,-10,109,-22,-194,-196,-197,109,109,-199,109,-195,-198,-200,]),'~':([40,45,46,52,64,65,68,69,70,71,72,73,74,75,76,77,78,79,81,85,88,93,99,100,101,103,106,107,108,109,110,111,127,152,154,155,156,157,158,160,161,162,163,167,168,170,172,173,174,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,197,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,218,229,236,241,245,246,247,248,252,259,260,261,293,303,309,310,311,313,314,315,316,317,320,333,334,335,337,343,345,346,347,348,349,],[-77,-188,110,110,110,-78,-189,-184,110,110,-190,-175,-176,-177,-178,-179,-180,-192,110,110,110,110,110,110,110,110,-23,-24,-25,-26,-27,-28,110,110,-185,-191,-186,110,110,110,-193,110,110,110,110,110,-202,-203,-204,110,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,-187,-181,110,-183,110,110,-201,-205,110,110,110,-182,110,110,110,110,110,110,110,-194,-196,-197,110,110,-199,110,-195,-198,-200,]),'!':([40,45,46,52,64,65,68,69,70,71,72,73,74,75,76,77,78,79,81,85,88,93,99,100,101,103,106,107,108,109,110,111,127,152,154,155,156,157,158,160,161,162,163,167,168,170,172,173,174,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,197,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,218,229,236,241,245,246,247,248,252,259,260,261,293,303,309,310,311,313,314,315,316,317,320,333,334,335,337,343,345,346,347,348,349,],[-77,-188,111,111,111,-78,-189,-184,111,111,-190,-175,-176,-177,-178,-179,-180,-192,111,111,111,111,111,111,111,111,-23,-24,-25,-26,-27,-28,111,111,-185,-191,-186,111,111,111,-193,111,111,111,111,111,-202,-203,-204,111,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,-187,-181,111,-183,111,111,-201,-205,111,111,111,-182,111,111,111,111,111,111,111,-194,-196,-197,111,111,-199,111,-195,-198,-200,]),'CONSTANT':([40,45,46,52,64,65,68,69,70,71,72,73,74,75,76,77,78,79,81,85,88,93,99,100,101,103,106,107,108,109,110,111,127,152,154,155,156,157,158,160,161,162,163,167,168,170,172,173,174,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,197,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,218,229,236,241,245,246,247,248,252,259,260,261,293,303,309,310,311,313,314,315,316,317,320,333,334,335,337,343,345,346,347,348,349,],[-77,-188,113,113,113,-78,-189,-184,113,113,-190,-175,-176,-177,-178,-179,-180,-192,113,113,113,113,113,113,113,113,-23,-24,-25,-26,-27,-28,113,113,-185,-191,-186,113,113,113,-193,113,113,113,113,113,-202,-203,-204,113,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,-187,-181,113,-183,113,113,-201,-205,113,113,113,-182,113,113,113,113,113,113,113,-194,-196,-197,113,113,-199,113,-195,-198,-200,]),'STRING_LITERAL':([40,45,46,52,64,65,68,69,70,71,72,73,74,75,76,77,78,79,81,85,88,93,99,100,101,103,106,107,108,109,110,111,127,152,154,155,156,157,158,160,161,162,163,167,168,170,172,173,174,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,197,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,218,229,236,241,245,246,247,248,252,259,260,261,293,303,309,310,311,313,314,315,316,317,320,333,334,335,337,343,345,346,347,348,349,],[-77,-188,114,114,114,-78,-189,-184,114,114,-190,-175,-176,-177,-178,-179,-180,-192,114,114,114,114,114,114,114,114,-23,-24,-25,-26,-27,-28,114,114,-185,-191,-186,114,114,114,-193,114,114,114,114,114,-202,-203,-204,114,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,-187,-181,114,-183,114,114,-201,-205,114,114,114,-182,114,114,114,114,114,114,114,-194,-196,-197,114,114,-199,114,-195,-198,-200,]),']':([52,94,95,96,97,98,102,104,105,112,113,114,115,116,117,118,119,120,121,123,125,126,128,194,195,196,198,199,200,229,249,251,262,264,265,266,269,270,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,293,299,312,318,319,321,323,339,],[124,-74,-61,-29,-59,-17,-31,-57,-7,-55,-4,-5,-53,-51,-49,-46,-41,-38,-35,219,-76,-29,-3,-13,-14,-18,-19,-20,-21,298,-75,-6,-62,-58,318,-9,-11,-12,-56,-54,-52,-50,-47,-48,-42,-43,-44,-45,-39,-40,-36,-37,-32,-33,-34,322,328,-30,-8,-10,-22,341,-60,]),'ELSE':([69,73,74,75,76,77,78,79,154,156,161,172,173,174,245,246,248,260,261,310,333,334,335,345,347,348,349,],[-184,-175,-176,-177,-178,-179,-180,-192,-185,-186,-193,-202,-203,-204,-187,-181,-183,-201,-205,-182,343,-196,-197,-199,-195,-198,-200,]),'.':([80,98,105,113,114,128,194,195,251,266,269,270,318,319,],[-3,192,-7,-4,-5,-3,-13,-14,-6,-9,-11,-12,-8,-10,]),'PTR_OP':([80,98,105,113,114,128,194,195,251,266,269,270,318,319,],[-3,193,-7,-4,-5,-3,-13,-14,-6,-9,-11,-12,-8,-10,]),'MUL_ASSIGN':([80,96,98,105,113,114,126,128,194,195,196,198,199,200,251,266,269,270,312,318,319,321,],[-3,178,-17,-7,-4,-5,-29,-3,-13,-14,-18,-19,-20,-21,-6,-9,-11,-12,-30,-8,-10,-22,]),'DIV_ASSIGN':([80,96,98,105,113,114,126,128,194,195,196,198,199,200,251,266,269,270,312,318,319,321,],[-3,179,-17,-7,-4,-5,-29,-3,-13,-14,-18,-19,-20,-21,-6,-9,-11,-12,-30,-8,-10,-22,]),'MOD_ASSIGN':([80,96,98,105,113,114,126,128,194,195,196,198,199,200,251,266,269,270,312,318,319,321,],[-3,180,-17,-7,-4,-5,-29,-3,-13,-14,-18,-19,-20,-21,-6,-9,-11,-12,-30,-8,-10,-22,]),'ADD_ASSIGN':([80,96,98,105,113,114,126,128,194,195,196,198,199,200,251,266,269,270,312,318,319,321,],[-3,181,-17,-7,-4,-5,-29,-3,-13,-14,-18,-19,-20,-21,-6,-9,-11,-12,-30,-8,-10,-22,]),'SUB_ASSIGN':([80,96,98,105,113,114,126,128,194,195,196,198,199,200,251,266,269,270,312,318,319,321,],[-3,182,-17,-7,-4,-5,-29,-3,-13,-14,-18,-19,-20,-21,-6,-9,-11,-12,-30,-8,-10,-22,]),'LEFT_ASSIGN':([80,96,98,105,113,114,126,128,194,195,196,198,199,200,251,266,269,270,312,318,319,321,],[-3,183,-17,-7,-4,-5,-29,-3,-13,-14,-18,-19,-20,-21,-6,-9,-11,-12,-30,-8,-10,-22,]),'RIGHT_ASSIGN':([80,96,98,105,113,114,126,128,194,195,196,198,199,200,251,266,269,270,312,318,319,321,],[-3,184,-17,-7,-4,-5,-29,-3,-13,-14,-18,-19,-20,-21,-6,-9,-11,-12,-30,-8,-10,-22,]),'AND_ASSIGN':([80,96,98,105,113,114,126,128,194,195,196,198,199,200,251,266,269,270,312,318,319,321,],[-3,185,-17,-7,-4,-5,-29,-3,-13,-14,-18,-19,-20,-21,-6,-9,-11,-12,-30,-8,-10,-22,]),'XOR_ASSIGN':([80,96,98,105,113,114,126,128,194,195,196,198,199,200,251,266,269,270,312,318,319,321,],[-3,186,-17,-7,-4,-5,-29,-3,-13,-14,-18,-19,-20,-21,-6,-9,-11,-12,-30,-8,-10,-22,]),'OR_ASSIGN':([80,96,98,105,113,114,126,128,194,195,196,198,199,200,251,266,269,270,312,318,319,321,],[-3,187,-17,-7,-4,-5,-29,-3,-13,-14,-18,-19,-20,-21,-6,-9,-11,-12,-30,-8,-10,-22,]),'/':([80,96,98,102,105,113,114,121,126,128,194,195,196,198,199,200,251,266,269,270,284,285,286,287,288,312,318,319,321,],[-3,-29,-17,-31,-7,-4,-5,217,-29,-3,-13,-14,-18,-19,-20,-21,-6,-9,-11,-12,217,217,-32,-33,-34,-30,-8,-10,-22,]),'%':([80,96,98,102,105,113,114,121,126,128,194,195,196,198,199,200,251,266,269,270,284,285,286,287,288,312,318,319,321,],[-3,-29,-17,-31,-7,-4,-5,218,-29,-3,-13,-14,-18,-19,-20,-21,-6,-9,-11,-12,218,218,-32,-33,-34,-30,-8,-10,-22,]),'LEFT_OP':([80,96,98,102,105,113,114,119,120,121,126,128,194,195,196,198,199,200,251,266,269,270,278,279,280,281,282,283,284,285,286,287,288,312,318,319,321,],[-3,-29,-17,-31,-7,-4,-5,212,-38,-35,-29,-3,-13,-14,-18,-19,-20,-21,-6,-9,-11,-12,212,212,212,212,-39,-40,-36,-37,-32,-33,-34,-30,-8,-10,-22,]),'RIGHT_OP':([80,96,98,102,105,113,114,119,120,121,126,128,194,195,196,198,199,200,251,266,269,270,278,279,280,281,282,283,284,285,286,287,288,312,318,319,321,],[-3,-29,-17,-31,-7,-4,-5,213,-38,-35,-29,-3,-13,-14,-18,-19,-20,-21,-6,-9,-11,-12,213,213,213,213,-39,-40,-36,-37,-32,-33,-34,-30,-8,-10,-22,]),'<':([80,96,98,102,105,113,114,118,119,120,121,126,128,194,195,196,198,199,200,251,266,269,270,276,277,278,279,280,281,282,283,284,285,286,287,288,312,318,319,321,],[-3,-29,-17,-31,-7,-4,-5,208,-41,-38,-35,-29,-3,-13,-14,-18,-19,-20,-21,-6,-9,-11,-12,208,208,-42,-43,-44,-45,-39,-40,-36,-37,-32,-33,-34,-30,-8,-10,-22,]),'>':([80,96,98,102,105,113,114,118,119,120,121,126,128,194,195,196,198,199,200,251,266,269,270,276,277,278,279,280,281,282,283,284,285,286,287,288,312,318,319,321,],[-3,-29,-17,-31,-7,-4,-5,209,-41,-38,-35,-29,-3,-13,-14,-18,-19,-20,-21,-6,-9,-11,-12,209,209,-42,-43,-44,-45,-39,-40,-36,-37,-32,-33,-34,-30,-8,-10,-22,]),'LE_OP':([80,96,98,102,105,113,114,118,119,120,121,126,128,194,195,196,198,199,200,251,266,269,270,276,277,278,279,280,281,282,283,284,285,286,287,288,312,318,319,321,],[-3,-29,-17,-31,-7,-4,-5,210,-41,-38,-35,-29,-3,-13,-14,-18,-19,-20,-21,-6,-9,-11,-12,210,210,-42,-43,-44,-45,-39,-40,-36,-37,-32,-33,-34,-30,-8,-10,-22,]),'GE_OP':([80,96,98,102,105,113,114,118,119,120,121,126,128,194,195,196,198,199,200,251,266,269,270,276,277,278,279,280,281,282,283,284,285,286,287,288,312,318,319,321,],[-3,-29,-17,-31,-7,-4,-5,211,-41,-38,-35,-29,-3,-13,-14,-18,-19,-20,-21,-6,-9,-11,-12,211,211,-42,-43,-44,-45,-39,-40,-36,-37,-32,-33,-34,-30,-8,-10,-22,]),'EQ_OP':([80,96,98,102,105,113,114,117,118,119,120,121,126,128,194,195,196,198,199,200,251,266,269,270,275,276,277,278,279,280,281,282,283,284,285,286,287,288,312,318,319,321,],[-3,-29,-17,-31,-7,-4,-5,206,-46,-41,-38,-35,-29,-3,-13,-14,-18,-19,-20,-21,-6,-9,-11,-12,206,-47,-48,-42,-43,-44,-45,-39,-40,-36,-37,-32,-33,-34,-30,-8,-10,-22,]),'NE_OP':([80,96,98,102,105,113,114,117,118,119,120,121,126,128,194,195,196,198,199,200,251,266,269,270,275,276,277,278,279,280,281,282,283,284,285,286,287,288,312,318,319,321,],[-3,-29,-17,-31,-7,-4,-5,207,-46,-41,-38,-35,-29,-3,-13,-14,-18,-19,-20,-21,-6,-9,-11,-12,207,-47,-48,-42,-43,-44,-45,-39,-40,-36,-37,-32,-33,-34,-30,-8,-10,-22,]),'^':([80,96,98,102,105,113,114,115,116,117,118,119,120,121,126,128,194,195,196,198,199,200,251,266,269,270,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,312,318,319,321,],[-3,-29,-17,-31,-7,-4,-5,204,-51,-49,-46,-41,-38,-35,-29,-3,-13,-14,-18,-19,-20,-21,-6,-9,-11,-12,204,-52,-50,-47,-48,-42,-43,-44,-45,-39,-40,-36,-37,-32,-33,-34,-30,-8,-10,-22,]),'|':([80,96,98,102,105,112,113,114,115,116,117,118,119,120,121,126,128,194,195,196,198,199,200,251,266,269,270,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,312,318,319,321,],[-3,-29,-17,-31,-7,203,-4,-5,-53,-51,-49,-46,-41,-38,-35,-29,-3,-13,-14,-18,-19,-20,-21,-6,-9,-11,-12,203,-54,-52,-50,-47,-48,-42,-43,-44,-45,-39,-40,-36,-37,-32,-33,-34,-30,-8,-10,-22,]),'AND_OP':([80,96,98,102,104,105,112,113,114,115,116,117,118,119,120,121,126,128,194,195,196,198,199,200,251,264,266,269,270,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,312,318,319,321,],[-3,-29,-17,-31,202,-7,-55,-4,-5,-53,-51,-49,-46,-41,-38,-35,-29,-3,-13,-14,-18,-19,-20,-21,-6,202,-9,-11,-12,-56,-54,-52,-50,-47,-48,-42,-43,-44,-45,-39,-40,-36,-37,-32,-33,-34,-30,-8,-10,-22,]),'?':([80,96,97,98,102,104,105,112,113,114,115,116,117,118,119,120,121,126,128,194,195,196,198,199,200,251,264,266,269,270,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,312,318,319,321,],[-3,-29,188,-17,-31,-57,-7,-55,-4,-5,-53,-51,-49,-46,-41,-38,-35,-29,-3,-13,-14,-18,-19,-20,-21,-6,-58,-9,-11,-12,-56,-54,-52,-50,-47,-48,-42,-43,-44,-45,-39,-40,-36,-37,-32,-33,-34,-30,-8,-10,-22,]),'OR_OP':([80,96,97,98,102,104,105,112,113,114,115,116,117,118,119,120,121,126,128,194,195,196,198,199,200,251,264,266,269,270,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,312,318,319,321,],[-3,-29,189,-17,-31,-57,-7,-55,-4,-5,-53,-51,-49,-46,-41,-38,-35,-29,-3,-13,-14,-18,-19,-20,-21,-6,-58,-9,-11,-12,-56,-54,-52,-50,-47,-48,-42,-43,-44,-45,-39,-40,-36,-37,-32,-33,-34,-30,-8,-10,-22,]),'ELLIPSIS':([223,],[290,]),}
+
+_lr_action = {}
+for _k, _v in _lr_action_items.items():
+   for _x,_y in zip(_v[0],_v[1]):
+      if not _x in _lr_action:  _lr_action[_x] = {}
+      _lr_action[_x][_k] = _y
+del _lr_action_items
+
+_lr_goto_items = {'translation_unit':([0,],[1,]),'external_declaration':([0,1,],[2,38,]),'function_definition':([0,1,],[3,3,]),'declaration':([0,1,6,39,43,46,62,71,],[4,4,45,45,68,45,68,68,]),'declaration_specifiers':([0,1,6,7,8,9,39,43,46,53,62,71,223,228,255,294,],[5,5,47,48,49,50,47,47,47,135,47,47,135,135,135,135,]),'declarator':([0,1,5,33,47,66,135,142,228,302,],[6,6,39,57,122,122,224,235,57,235,]),'storage_class_specifier':([0,1,6,7,8,9,39,43,46,53,62,71,223,228,255,294,],[7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,]),'type_specifier':([0,1,6,7,8,9,39,43,46,53,59,62,71,85,127,139,140,143,144,201,223,228,230,255,294,],[8,8,8,8,8,8,8,8,8,8,143,8,8,143,143,143,143,143,143,143,8,8,143,8,8,]),'type_qualifier':([0,1,6,7,8,9,31,39,43,46,53,54,59,62,71,85,127,139,140,143,144,201,223,228,230,255,294,],[9,9,9,9,9,9,56,9,9,9,9,137,144,9,9,144,144,144,144,144,144,144,9,9,144,9,9,]),'pointer':([0,1,5,31,33,47,54,66,135,142,166,228,255,302,],[10,10,10,55,10,10,136,10,226,10,254,226,254,10,]),'direct_declarator':([0,1,5,10,33,47,66,135,142,226,228,302,],[11,11,11,51,11,11,11,11,11,51,11,11,]),'struct_or_union_specifier':([0,1,6,7,8,9,39,43,46,53,59,62,71,85,127,139,140,143,144,201,223,228,230,255,294,],[26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,]),'enum_specifier':([0,1,6,7,8,9,39,43,46,53,59,62,71,85,127,139,140,143,144,201,223,228,230,255,294,],[27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,]),'struct_or_union':([0,1,6,7,8,9,39,43,46,53,59,62,71,85,127,139,140,143,144,201,223,228,230,255,294,],[34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,]),'init_declarator_list':([5,47,],[41,41,]),'init_declarator':([5,47,66,],[42,42,153,]),'declaration_list':([6,39,46,],[43,62,71,]),'compound_statement':([6,39,43,46,62,70,71,88,157,158,160,247,311,313,314,337,343,346,],[44,63,67,74,149,74,74,74,74,74,74,74,74,74,74,74,74,74,]),'type_qualifier_list':([31,],[54,]),'statement_list':([46,71,],[70,157,]),'statement':([46,70,71,88,157,158,160,247,311,313,314,337,343,346,],[72,155,72,169,155,246,248,310,333,334,335,345,347,349,]),'labeled_statement':([46,70,71,88,157,158,160,247,311,313,314,337,343,346,],[73,73,73,73,73,73,73,73,73,73,73,73,73,73,]),'expression_statement':([46,70,71,88,157,158,160,170,247,259,311,313,314,337,343,346,],[75,75,75,75,75,75,75,259,75,316,75,75,75,75,75,75,]),'selection_statement':([46,70,71,88,157,158,160,247,311,313,314,337,343,346,],[76,76,76,76,76,76,76,76,76,76,76,76,76,76,]),'iteration_statement':([46,70,71,88,157,158,160,247,311,313,314,337,343,346,],[77,77,77,77,77,77,77,77,77,77,77,77,77,77,]),'jump_statement':([46,70,71,88,157,158,160,247,311,313,314,337,343,346,],[78,78,78,78,78,78,78,78,78,78,78,78,78,78,]),'expression':([46,70,71,85,88,93,127,157,158,160,163,167,168,170,188,190,197,201,247,259,311,313,314,315,316,337,343,346,],[83,83,83,164,83,175,164,83,83,83,250,256,257,83,263,265,164,164,83,83,83,83,83,336,338,83,83,83,]),'assignment_expression':([46,64,70,71,85,88,93,127,152,157,158,160,162,163,167,168,170,176,188,190,191,197,201,247,259,309,311,313,314,315,316,320,337,343,346,],[94,151,94,94,94,94,94,94,151,94,94,94,249,94,94,94,94,262,94,94,268,94,94,94,94,151,94,94,94,94,94,340,94,94,94,]),'conditional_expression':([46,52,64,70,71,81,85,88,93,127,152,157,158,160,162,163,167,168,170,176,188,190,191,197,201,229,236,241,247,259,293,303,309,311,313,314,315,316,317,320,337,343,346,],[95,125,95,95,95,125,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,125,125,125,95,95,125,125,95,95,95,95,95,95,339,95,95,95,95,]),'unary_expression':([46,52,64,70,71,81,85,88,93,99,100,101,103,127,152,157,158,160,162,163,167,168,170,176,188,189,190,191,197,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,218,229,236,241,247,252,259,293,303,309,311,313,314,315,316,317,320,337,343,346,],[96,126,96,96,96,126,96,96,96,196,198,126,200,96,96,96,96,96,96,96,96,96,96,96,96,126,96,96,96,96,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,96,126,96,126,126,96,96,96,96,96,96,126,96,96,96,96,]),'logical_or_expression':([46,52,64,70,71,81,85,88,93,127,152,157,158,160,162,163,167,168,170,176,188,190,191,197,201,229,236,241,247,259,293,303,309,311,313,314,315,316,317,320,337,343,346,],[97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,]),'postfix_expression':([46,52,64,70,71,81,85,88,93,99,100,101,103,127,152,157,158,160,162,163,167,168,170,176,188,189,190,191,197,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,218,229,236,241,247,252,259,293,303,309,311,313,314,315,316,317,320,337,343,346,],[98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,]),'unary_operator':([46,52,64,70,71,81,85,88,93,99,100,101,103,127,152,157,158,160,162,163,167,168,170,176,188,189,190,191,197,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,218,229,236,241,247,252,259,293,303,309,311,313,314,315,316,317,320,337,343,346,],[101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,]),'cast_expression':([46,52,64,70,71,81,85,88,93,101,127,152,157,158,160,162,163,167,168,170,176,188,189,190,191,197,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,218,229,236,241,247,252,259,293,303,309,311,313,314,315,316,317,320,337,343,346,],[102,102,102,102,102,102,102,102,102,199,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,286,287,288,102,102,102,102,312,102,102,102,102,102,102,102,102,102,102,102,102,102,102,]),'logical_and_expression':([46,52,64,70,71,81,85,88,93,127,152,157,158,160,162,163,167,168,170,176,188,189,190,191,197,201,229,236,241,247,259,293,303,309,311,313,314,315,316,317,320,337,343,346,],[104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,264,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,]),'primary_expression':([46,52,64,70,71,81,85,88,93,99,100,101,103,127,152,157,158,160,162,163,167,168,170,176,188,189,190,191,197,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,218,229,236,241,247,252,259,293,303,309,311,313,314,315,316,317,320,337,343,346,],[105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,]),'inclusive_or_expression':([46,52,64,70,71,81,85,88,93,127,152,157,158,160,162,163,167,168,170,176,188,189,190,191,197,201,202,229,236,241,247,259,293,303,309,311,313,314,315,316,317,320,337,343,346,],[112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,272,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,]),'exclusive_or_expression':([46,52,64,70,71,81,85,88,93,127,152,157,158,160,162,163,167,168,170,176,188,189,190,191,197,201,202,203,229,236,241,247,259,293,303,309,311,313,314,315,316,317,320,337,343,346,],[115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,273,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,]),'and_expression':([46,52,64,70,71,81,85,88,93,127,152,157,158,160,162,163,167,168,170,176,188,189,190,191,197,201,202,203,204,229,236,241,247,259,293,303,309,311,313,314,315,316,317,320,337,343,346,],[116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,274,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,]),'equality_expression':([46,52,64,70,71,81,85,88,93,127,152,157,158,160,162,163,167,168,170,176,188,189,190,191,197,201,202,203,204,205,229,236,241,247,259,293,303,309,311,313,314,315,316,317,320,337,343,346,],[117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,275,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,]),'relational_expression':([46,52,64,70,71,81,85,88,93,127,152,157,158,160,162,163,167,168,170,176,188,189,190,191,197,201,202,203,204,205,206,207,229,236,241,247,259,293,303,309,311,313,314,315,316,317,320,337,343,346,],[118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,276,277,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,]),'shift_expression':([46,52,64,70,71,81,85,88,93,127,152,157,158,160,162,163,167,168,170,176,188,189,190,191,197,201,202,203,204,205,206,207,208,209,210,211,229,236,241,247,259,293,303,309,311,313,314,315,316,317,320,337,343,346,],[119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,278,279,280,281,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,]),'additive_expression':([46,52,64,70,71,81,85,88,93,127,152,157,158,160,162,163,167,168,170,176,188,189,190,191,197,201,202,203,204,205,206,207,208,209,210,211,212,213,229,236,241,247,259,293,303,309,311,313,314,315,316,317,320,337,343,346,],[120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,282,283,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,]),'multiplicative_expression':([46,52,64,70,71,81,85,88,93,127,152,157,158,160,162,163,167,168,170,176,188,189,190,191,197,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,229,236,241,247,259,293,303,309,311,313,314,315,316,317,320,337,343,346,],[121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,284,285,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,]),'constant_expression':([52,81,229,236,241,293,303,],[123,159,299,304,306,323,330,]),'parameter_type_list':([53,228,255,294,],[129,297,297,325,]),'identifier_list':([53,],[131,]),'parameter_list':([53,228,255,294,],[132,132,132,132,]),'parameter_declaration':([53,223,228,255,294,],[134,291,134,134,134,]),'struct_declaration_list':([59,139,],[140,230,]),'struct_declaration':([59,139,140,230,],[141,141,232,232,]),'specifier_qualifier_list':([59,85,127,139,140,143,144,201,230,],[142,166,166,142,142,237,238,166,142,]),'enumerator_list':([60,148,],[145,242,]),'enumerator':([60,148,240,],[146,146,305,]),'initializer':([64,152,309,],[150,244,332,]),'type_name':([85,127,201,],[165,165,271,]),'assignment_operator':([96,],[176,]),'abstract_declarator':([135,166,228,255,],[225,253,296,296,]),'direct_abstract_declarator':([135,166,226,228,254,255,],[227,227,292,227,292,227,]),'struct_declarator_list':([142,],[233,]),'struct_declarator':([142,302,],[234,329,]),'initializer_list':([152,],[243,]),'argument_expression_list':([191,],[267,]),}
+
+_lr_goto = {}
+for _k, _v in _lr_goto_items.items():
+   for _x, _y in zip(_v[0], _v[1]):
+       if not _x in _lr_goto: _lr_goto[_x] = {}
+       _lr_goto[_x][_k] = _y
+del _lr_goto_items
+_lr_productions = [
+  ("S' -> translation_unit","S'",1,None,None,None),
+  ('translation_unit -> external_declaration','translation_unit',1,'p_translation_unit','parser_ansi.py',37),
+  ('translation_unit -> translation_unit external_declaration','translation_unit',2,'p_translation_unit','parser_ansi.py',38),
+  ('primary_expression -> IDENTIFIER','primary_expression',1,'p_primary_expression','parser_ansi.py',44),
+  ('primary_expression -> CONSTANT','primary_expression',1,'p_primary_expression','parser_ansi.py',45),
+  ('primary_expression -> STRING_LITERAL','primary_expression',1,'p_primary_expression','parser_ansi.py',46),
+  ('primary_expression -> ( expression )','primary_expression',3,'p_primary_expression','parser_ansi.py',47),
+  ('postfix_expression -> primary_expression','postfix_expression',1,'p_postfix_expression','parser_ansi.py',54),
+  ('postfix_expression -> postfix_expression [ expression ]','postfix_expression',4,'p_postfix_expression','parser_ansi.py',55),
+  ('postfix_expression -> postfix_expression ( )','postfix_expression',3,'p_postfix_expression','parser_ansi.py',56),
+  ('postfix_expression -> postfix_expression ( argument_expression_list )','postfix_expression',4,'p_postfix_expression','parser_ansi.py',57),
+  ('postfix_expression -> postfix_expression . IDENTIFIER','postfix_expression',3,'p_postfix_expression','parser_ansi.py',58),
+  ('postfix_expression -> postfix_expression PTR_OP IDENTIFIER','postfix_expression',3,'p_postfix_expression','parser_ansi.py',59),
+  ('postfix_expression -> postfix_expression INC_OP','postfix_expression',2,'p_postfix_expression','parser_ansi.py',60),
+  ('postfix_expression -> postfix_expression DEC_OP','postfix_expression',2,'p_postfix_expression','parser_ansi.py',61),
+  ('argument_expression_list -> assignment_expression','argument_expression_list',1,'p_argument_expression_list','parser_ansi.py',68),
+  ('argument_expression_list -> argument_expression_list , assignment_expression','argument_expression_list',3,'p_argument_expression_list','parser_ansi.py',69),
+  ('unary_expression -> postfix_expression','unary_expression',1,'p_unary_expression','parser_ansi.py',77),
+  ('unary_expression -> INC_OP unary_expression','unary_expression',2,'p_unary_expression','parser_ansi.py',78),
+  ('unary_expression -> DEC_OP unary_expression','unary_expression',2,'p_unary_expression','parser_ansi.py',79),
+  ('unary_expression -> unary_operator cast_expression','unary_expression',2,'p_unary_expression','parser_ansi.py',80),
+  ('unary_expression -> SIZEOF unary_expression','unary_expression',2,'p_unary_expression','parser_ansi.py',81),
+  ('unary_expression -> SIZEOF ( type_name )','unary_expression',4,'p_unary_expression','parser_ansi.py',82),
+  ('unary_operator -> &','unary_operator',1,'p_unary_operator','parser_ansi.py',90),
+  ('unary_operator -> *','unary_operator',1,'p_unary_operator','parser_ansi.py',91),
+  ('unary_operator -> +','unary_operator',1,'p_unary_operator','parser_ansi.py',92),
+  ('unary_operator -> -','unary_operator',1,'p_unary_operator','parser_ansi.py',93),
+  ('unary_operator -> ~','unary_operator',1,'p_unary_operator','parser_ansi.py',94),
+  ('unary_operator -> !','unary_operator',1,'p_unary_operator','parser_ansi.py',95),
+  ('cast_expression -> unary_expression','cast_expression',1,'p_cast_expression','parser_ansi.py',99),
+  ('cast_expression -> ( type_name ) cast_expression','cast_expression',4,'p_cast_expression','parser_ansi.py',100),
+  ('multiplicative_expression -> cast_expression','multiplicative_expression',1,'p_multiplicative_expression','parser_ansi.py',108),
+  ('multiplicative_expression -> multiplicative_expression * cast_expression','multiplicative_expression',3,'p_multiplicative_expression','parser_ansi.py',109),
+  ('multiplicative_expression -> multiplicative_expression / cast_expression','multiplicative_expression',3,'p_multiplicative_expression','parser_ansi.py',110),
+  ('multiplicative_expression -> multiplicative_expression % cast_expression','multiplicative_expression',3,'p_multiplicative_expression','parser_ansi.py',111),
+  ('additive_expression -> multiplicative_expression','additive_expression',1,'p_additive_expression','parser_ansi.py',123),
+  ('additive_expression -> additive_expression + multiplicative_expression','additive_expression',3,'p_additive_expression','parser_ansi.py',124),
+  ('additive_expression -> additive_expression - multiplicative_expression','additive_expression',3,'p_additive_expression','parser_ansi.py',125),
+  ('shift_expression -> additive_expression','shift_expression',1,'p_shift_expression','parser_ansi.py',135),
+  ('shift_expression -> shift_expression LEFT_OP additive_expression','shift_expression',3,'p_shift_expression','parser_ansi.py',136),
+  ('shift_expression -> shift_expression RIGHT_OP additive_expression','shift_expression',3,'p_shift_expression','parser_ansi.py',137),
+  ('relational_expression -> shift_expression','relational_expression',1,'p_relational_expression','parser_ansi.py',147),
+  ('relational_expression -> relational_expression < shift_expression','relational_expression',3,'p_relational_expression','parser_ansi.py',148),
+  ('relational_expression -> relational_expression > shift_expression','relational_expression',3,'p_relational_expression','parser_ansi.py',149),
+  ('relational_expression -> relational_expression LE_OP shift_expression','relational_expression',3,'p_relational_expression','parser_ansi.py',150),
+  ('relational_expression -> relational_expression GE_OP shift_expression','relational_expression',3,'p_relational_expression','parser_ansi.py',151),
+  ('equality_expression -> relational_expression','equality_expression',1,'p_equality_expression','parser_ansi.py',165),
+  ('equality_expression -> equality_expression EQ_OP relational_expression','equality_expression',3,'p_equality_expression','parser_ansi.py',166),
+  ('equality_expression -> equality_expression NE_OP relational_expression','equality_expression',3,'p_equality_expression','parser_ansi.py',167),
+  ('and_expression -> equality_expression','and_expression',1,'p_and_expression','parser_ansi.py',177),
+  ('and_expression -> and_expression & equality_expression','and_expression',3,'p_and_expression','parser_ansi.py',178),
+  ('exclusive_or_expression -> and_expression','exclusive_or_expression',1,'p_exclusive_or_expression','parser_ansi.py',185),
+  ('exclusive_or_expression -> exclusive_or_expression ^ and_expression','exclusive_or_expression',3,'p_exclusive_or_expression','parser_ansi.py',186),
+  ('inclusive_or_expression -> exclusive_or_expression','inclusive_or_expression',1,'p_inclusive_or_expression','parser_ansi.py',193),
+  ('inclusive_or_expression -> inclusive_or_expression | exclusive_or_expression','inclusive_or_expression',3,'p_inclusive_or_expression','parser_ansi.py',194),
+  ('logical_and_expression -> inclusive_or_expression','logical_and_expression',1,'p_logical_and_expression','parser_ansi.py',201),
+  ('logical_and_expression -> logical_and_expression AND_OP inclusive_or_expression','logical_and_expression',3,'p_logical_and_expression','parser_ansi.py',202),
+  ('logical_or_expression -> logical_and_expression','logical_or_expression',1,'p_logical_or_expression','parser_ansi.py',209),
+  ('logical_or_expression -> logical_or_expression OR_OP logical_and_expression','logical_or_expression',3,'p_logical_or_expression','parser_ansi.py',210),
+  ('conditional_expression -> logical_or_expression','conditional_expression',1,'p_conditional_expression','parser_ansi.py',217),
+  ('conditional_expression -> logical_or_expression ? expression : conditional_expression','conditional_expression',5,'p_conditional_expression','parser_ansi.py',218),
+  ('assignment_expression -> conditional_expression','assignment_expression',1,'p_assignment_expression','parser_ansi.py',225),
+  ('assignment_expression -> unary_expression assignment_operator assignment_expression','assignment_expression',3,'p_assignment_expression','parser_ansi.py',226),
+  ('assignment_operator -> =','assignment_operator',1,'p_assignment_operator','parser_ansi.py',234),
+  ('assignment_operator -> MUL_ASSIGN','assignment_operator',1,'p_assignment_operator','parser_ansi.py',235),
+  ('assignment_operator -> DIV_ASSIGN','assignment_operator',1,'p_assignment_operator','parser_ansi.py',236),
+  ('assignment_operator -> MOD_ASSIGN','assignment_operator',1,'p_assignment_operator','parser_ansi.py',237),
+  ('assignment_operator -> ADD_ASSIGN','assignment_operator',1,'p_assignment_operator','parser_ansi.py',238),
+  ('assignment_operator -> SUB_ASSIGN','assignment_operator',1,'p_assignment_operator','parser_ansi.py',239),
+  ('assignment_operator -> LEFT_ASSIGN','assignment_operator',1,'p_assignment_operator','parser_ansi.py',240),
+  ('assignment_operator -> RIGHT_ASSIGN','assignment_operator',1,'p_assignment_operator','parser_ansi.py',241),
+  ('assignment_operator -> AND_ASSIGN','assignment_operator',1,'p_assignment_operator','parser_ansi.py',242),
+  ('assignment_operator -> XOR_ASSIGN','assignment_operator',1,'p_assignment_operator','parser_ansi.py',243),
+  ('assignment_operator -> OR_ASSIGN','assignment_operator',1,'p_assignment_operator','parser_ansi.py',244),
+  ('expression -> assignment_expression','expression',1,'p_expression','parser_ansi.py',248),
+  ('expression -> expression , assignment_expression','expression',3,'p_expression','parser_ansi.py',249),
+  ('constant_expression -> conditional_expression','constant_expression',1,'p_constant_expression','parser_ansi.py',257),
+  ('declaration -> declaration_specifiers ;','declaration',2,'p_declaration','parser_ansi.py',261),
+  ('declaration -> declaration_specifiers init_declarator_list ;','declaration',3,'p_declaration','parser_ansi.py',262),
+  ('declaration_specifiers -> storage_class_specifier','declaration_specifiers',1,'p_declaration_specifiers','parser_ansi.py',268),
+  ('declaration_specifiers -> storage_class_specifier declaration_specifiers','declaration_specifiers',2,'p_declaration_specifiers','parser_ansi.py',269),
+  ('declaration_specifiers -> type_specifier','declaration_specifiers',1,'p_declaration_specifiers','parser_ansi.py',270),
+  ('declaration_specifiers -> type_specifier declaration_specifiers','declaration_specifiers',2,'p_declaration_specifiers','parser_ansi.py',271),
+  ('declaration_specifiers -> type_qualifier','declaration_specifiers',1,'p_declaration_specifiers','parser_ansi.py',272),
+  ('declaration_specifiers -> type_qualifier declaration_specifiers','declaration_specifiers',2,'p_declaration_specifiers','parser_ansi.py',273),
+  ('init_declarator_list -> init_declarator','init_declarator_list',1,'p_init_declarator_list','parser_ansi.py',281),
+  ('init_declarator_list -> init_declarator_list , init_declarator','init_declarator_list',3,'p_init_declarator_list','parser_ansi.py',282),
+  ('init_declarator -> declarator','init_declarator',1,'p_init_declarator','parser_ansi.py',290),
+  ('init_declarator -> declarator = initializer','init_declarator',3,'p_init_declarator','parser_ansi.py',291),
+  ('storage_class_specifier -> TYPEDEF','storage_class_specifier',1,'p_storage_class_specifier','parser_ansi.py',298),
+  ('storage_class_specifier -> EXTERN','storage_class_specifier',1,'p_storage_class_specifier','parser_ansi.py',299),
+  ('storage_class_specifier -> STATIC','storage_class_specifier',1,'p_storage_class_specifier','parser_ansi.py',300),
+  ('storage_class_specifier -> AUTO','storage_class_specifier',1,'p_storage_class_specifier','parser_ansi.py',301),
+  ('storage_class_specifier -> REGISTER','storage_class_specifier',1,'p_storage_class_specifier','parser_ansi.py',302),
+  ('type_specifier -> VOID','type_specifier',1,'p_type_specifier','parser_ansi.py',306),
+  ('type_specifier -> CHAR','type_specifier',1,'p_type_specifier','parser_ansi.py',307),
+  ('type_specifier -> SHORT','type_specifier',1,'p_type_specifier','parser_ansi.py',308),
+  ('type_specifier -> INT','type_specifier',1,'p_type_specifier','parser_ansi.py',309),
+  ('type_specifier -> LONG','type_specifier',1,'p_type_specifier','parser_ansi.py',310),
+  ('type_specifier -> FLOAT','type_specifier',1,'p_type_specifier','parser_ansi.py',311),
+  ('type_specifier -> DOUBLE','type_specifier',1,'p_type_specifier','parser_ansi.py',312),
+  ('type_specifier -> SIGNED','type_specifier',1,'p_type_specifier','parser_ansi.py',313),
+  ('type_specifier -> UNSIGNED','type_specifier',1,'p_type_specifier','parser_ansi.py',314),
+  ('type_specifier -> struct_or_union_specifier','type_specifier',1,'p_type_specifier','parser_ansi.py',315),
+  ('type_specifier -> enum_specifier','type_specifier',1,'p_type_specifier','parser_ansi.py',316),
+  ('type_specifier -> TYPE_NAME','type_specifier',1,'p_type_specifier','parser_ansi.py',317),
+  ('struct_or_union_specifier -> struct_or_union IDENTIFIER { struct_declaration_list }','struct_or_union_specifier',5,'p_struct_or_union_specifier','parser_ansi.py',321),
+  ('struct_or_union_specifier -> struct_or_union { struct_declaration_list }','struct_or_union_specifier',4,'p_struct_or_union_specifier','parser_ansi.py',322),
+  ('struct_or_union_specifier -> struct_or_union IDENTIFIER','struct_or_union_specifier',2,'p_struct_or_union_specifier','parser_ansi.py',323),
+  ('struct_or_union -> STRUCT','struct_or_union',1,'p_struct_or_union','parser_ansi.py',331),
+  ('struct_or_union -> UNION','struct_or_union',1,'p_struct_or_union','parser_ansi.py',332),
+  ('struct_declaration_list -> struct_declaration','struct_declaration_list',1,'p_struct_declaration_list','parser_ansi.py',336),
+  ('struct_declaration_list -> struct_declaration_list struct_declaration','struct_declaration_list',2,'p_struct_declaration_list','parser_ansi.py',337),
+  ('struct_declaration -> specifier_qualifier_list struct_declarator_list ;','struct_declaration',3,'p_struct_declaration','parser_ansi.py',345),
+  ('specifier_qualifier_list -> type_specifier specifier_qualifier_list','specifier_qualifier_list',2,'p_specifier_qualifier_list','parser_ansi.py',353),
+  ('specifier_qualifier_list -> type_specifier','specifier_qualifier_list',1,'p_specifier_qualifier_list','parser_ansi.py',354),
+  ('specifier_qualifier_list -> type_qualifier specifier_qualifier_list','specifier_qualifier_list',2,'p_specifier_qualifier_list','parser_ansi.py',355),
+  ('specifier_qualifier_list -> type_qualifier','specifier_qualifier_list',1,'p_specifier_qualifier_list','parser_ansi.py',356),
+  ('struct_declarator_list -> struct_declarator','struct_declarator_list',1,'p_struct_declarator_list','parser_ansi.py',363),
+  ('struct_declarator_list -> struct_declarator_list , struct_declarator','struct_declarator_list',3,'p_struct_declarator_list','parser_ansi.py',364),
+  ('struct_declarator -> declarator','struct_declarator',1,'p_struct_declarator','parser_ansi.py',372),
+  ('struct_declarator -> : constant_expression','struct_declarator',2,'p_struct_declarator','parser_ansi.py',373),
+  ('struct_declarator -> declarator : constant_expression','struct_declarator',3,'p_struct_declarator','parser_ansi.py',374),
+  ('enum_specifier -> ENUM { enumerator_list }','enum_specifier',4,'p_enum_specifier','parser_ansi.py',385),
+  ('enum_specifier -> ENUM IDENTIFIER { enumerator_list }','enum_specifier',5,'p_enum_specifier','parser_ansi.py',386),
+  ('enum_specifier -> ENUM IDENTIFIER','enum_specifier',2,'p_enum_specifier','parser_ansi.py',387),
+  ('enumerator_list -> enumerator','enumerator_list',1,'p_enumerator_list','parser_ansi.py',393),
+  ('enumerator_list -> enumerator_list , enumerator','enumerator_list',3,'p_enumerator_list','parser_ansi.py',394),
+  ('enumerator -> IDENTIFIER','enumerator',1,'p_enumerator','parser_ansi.py',402),
+  ('enumerator -> IDENTIFIER = constant_expression','enumerator',3,'p_enumerator','parser_ansi.py',403),
+  ('type_qualifier -> CONST','type_qualifier',1,'p_type_qualifier','parser_ansi.py',410),
+  ('type_qualifier -> VOLATILE','type_qualifier',1,'p_type_qualifier','parser_ansi.py',411),
+  ('declarator -> pointer direct_declarator','declarator',2,'p_declarator','parser_ansi.py',415),
+  ('declarator -> direct_declarator','declarator',1,'p_declarator','parser_ansi.py',416),
+  ('direct_declarator -> IDENTIFIER','direct_declarator',1,'p_direct_declarator','parser_ansi.py',425),
+  ('direct_declarator -> ( declarator )','direct_declarator',3,'p_direct_declarator','parser_ansi.py',426),
+  ('direct_declarator -> direct_declarator [ constant_expression ]','direct_declarator',4,'p_direct_declarator','parser_ansi.py',427),
+  ('direct_declarator -> direct_declarator [ ]','direct_declarator',3,'p_direct_declarator','parser_ansi.py',428),
+  ('direct_declarator -> direct_declarator ( parameter_type_list )','direct_declarator',4,'p_direct_declarator','parser_ansi.py',429),
+  ('direct_declarator -> direct_declarator ( identifier_list )','direct_declarator',4,'p_direct_declarator','parser_ansi.py',430),
+  ('direct_declarator -> direct_declarator ( )','direct_declarator',3,'p_direct_declarator','parser_ansi.py',431),
+  ('pointer -> *','pointer',1,'p_pointer','parser_ansi.py',447),
+  ('pointer -> * type_qualifier_list','pointer',2,'p_pointer','parser_ansi.py',448),
+  ('pointer -> * pointer','pointer',2,'p_pointer','parser_ansi.py',449),
+  ('pointer -> * type_qualifier_list pointer','pointer',3,'p_pointer','parser_ansi.py',450),
+  ('type_qualifier_list -> type_qualifier','type_qualifier_list',1,'p_type_qualifier_list','parser_ansi.py',454),
+  ('type_qualifier_list -> type_qualifier_list type_qualifier','type_qualifier_list',2,'p_type_qualifier_list','parser_ansi.py',455),
+  ('parameter_type_list -> parameter_list','parameter_type_list',1,'p_parameter_type_list','parser_ansi.py',463),
+  ('parameter_type_list -> parameter_list , ELLIPSIS','parameter_type_list',3,'p_parameter_type_list','parser_ansi.py',464),
+  ('parameter_list -> parameter_declaration','parameter_list',1,'p_parameter_list','parser_ansi.py',468),
+  ('parameter_list -> parameter_list , parameter_declaration','parameter_list',3,'p_parameter_list','parser_ansi.py',469),
+  ('parameter_declaration -> declaration_specifiers declarator','parameter_declaration',2,'p_parameter_declaration','parser_ansi.py',477),
+  ('parameter_declaration -> declaration_specifiers abstract_declarator','parameter_declaration',2,'p_parameter_declaration','parser_ansi.py',478),
+  ('parameter_declaration -> declaration_specifiers','parameter_declaration',1,'p_parameter_declaration','parser_ansi.py',479),
+  ('identifier_list -> IDENTIFIER','identifier_list',1,'p_identifier_list','parser_ansi.py',483),
+  ('identifier_list -> identifier_list , IDENTIFIER','identifier_list',3,'p_identifier_list','parser_ansi.py',484),
+  ('type_name -> specifier_qualifier_list','type_name',1,'p_type_name','parser_ansi.py',492),
+  ('type_name -> specifier_qualifier_list abstract_declarator','type_name',2,'p_type_name','parser_ansi.py',493),
+  ('abstract_declarator -> pointer','abstract_declarator',1,'p_abstract_declarator','parser_ansi.py',497),
+  ('abstract_declarator -> direct_abstract_declarator','abstract_declarator',1,'p_abstract_declarator','parser_ansi.py',498),
+  ('abstract_declarator -> pointer direct_abstract_declarator','abstract_declarator',2,'p_abstract_declarator','parser_ansi.py',499),
+  ('direct_abstract_declarator -> ( abstract_declarator )','direct_abstract_declarator',3,'p_direct_abstract_declarator','parser_ansi.py',503),
+  ('direct_abstract_declarator -> [ ]','direct_abstract_declarator',2,'p_direct_abstract_declarator','parser_ansi.py',504),
+  ('direct_abstract_declarator -> [ constant_expression ]','direct_abstract_declarator',3,'p_direct_abstract_declarator','parser_ansi.py',505),
+  ('direct_abstract_declarator -> direct_abstract_declarator [ ]','direct_abstract_declarator',3,'p_direct_abstract_declarator','parser_ansi.py',506),
+  ('direct_abstract_declarator -> direct_abstract_declarator [ constant_expression ]','direct_abstract_declarator',4,'p_direct_abstract_declarator','parser_ansi.py',507),
+  ('direct_abstract_declarator -> ( )','direct_abstract_declarator',2,'p_direct_abstract_declarator','parser_ansi.py',508),
+  ('direct_abstract_declarator -> ( parameter_type_list )','direct_abstract_declarator',3,'p_direct_abstract_declarator','parser_ansi.py',509),
+  ('direct_abstract_declarator -> direct_abstract_declarator ( )','direct_abstract_declarator',3,'p_direct_abstract_declarator','parser_ansi.py',510),
+  ('direct_abstract_declarator -> direct_abstract_declarator ( parameter_type_list )','direct_abstract_declarator',4,'p_direct_abstract_declarator','parser_ansi.py',511),
+  ('initializer -> assignment_expression','initializer',1,'p_initializer','parser_ansi.py',515),
+  ('initializer -> { initializer_list }','initializer',3,'p_initializer','parser_ansi.py',516),
+  ('initializer -> { initializer_list , }','initializer',4,'p_initializer','parser_ansi.py',517),
+  ('initializer_list -> initializer','initializer_list',1,'p_initializer_list','parser_ansi.py',521),
+  ('initializer_list -> initializer_list , initializer','initializer_list',3,'p_initializer_list','parser_ansi.py',522),
+  ('statement -> labeled_statement','statement',1,'p_statement','parser_ansi.py',530),
+  ('statement -> compound_statement','statement',1,'p_statement','parser_ansi.py',531),
+  ('statement -> expression_statement','statement',1,'p_statement','parser_ansi.py',532),
+  ('statement -> selection_statement','statement',1,'p_statement','parser_ansi.py',533),
+  ('statement -> iteration_statement','statement',1,'p_statement','parser_ansi.py',534),
+  ('statement -> jump_statement','statement',1,'p_statement','parser_ansi.py',535),
+  ('labeled_statement -> IDENTIFIER : statement','labeled_statement',3,'p_labeled_statement','parser_ansi.py',539),
+  ('labeled_statement -> CASE constant_expression : statement','labeled_statement',4,'p_labeled_statement','parser_ansi.py',540),
+  ('labeled_statement -> DEFAULT : statement','labeled_statement',3,'p_labeled_statement','parser_ansi.py',541),
+  ('compound_statement -> { }','compound_statement',2,'p_compound_statement','parser_ansi.py',545),
+  ('compound_statement -> { statement_list }','compound_statement',3,'p_compound_statement','parser_ansi.py',546),
+  ('compound_statement -> { declaration_list }','compound_statement',3,'p_compound_statement','parser_ansi.py',547),
+  ('compound_statement -> { declaration_list statement_list }','compound_statement',4,'p_compound_statement','parser_ansi.py',548),
+  ('declaration_list -> declaration','declaration_list',1,'p_declaration_list','parser_ansi.py',557),
+  ('declaration_list -> declaration_list declaration','declaration_list',2,'p_declaration_list','parser_ansi.py',558),
+  ('statement_list -> statement','statement_list',1,'p_statement_list','parser_ansi.py',566),
+  ('statement_list -> statement_list statement','statement_list',2,'p_statement_list','parser_ansi.py',567),
+  ('expression_statement -> ;','expression_statement',1,'p_expression_statement','parser_ansi.py',575),
+  ('expression_statement -> expression ;','expression_statement',2,'p_expression_statement','parser_ansi.py',576),
+  ('selection_statement -> IF ( expression ) statement','selection_statement',5,'p_selection_statement','parser_ansi.py',580),
+  ('selection_statement -> IF ( expression ) statement ELSE statement','selection_statement',7,'p_selection_statement','parser_ansi.py',581),
+  ('selection_statement -> SWITCH ( expression ) statement','selection_statement',5,'p_selection_statement','parser_ansi.py',582),
+  ('iteration_statement -> WHILE ( expression ) statement','iteration_statement',5,'p_iteration_statement','parser_ansi.py',586),
+  ('iteration_statement -> DO statement WHILE ( expression ) ;','iteration_statement',7,'p_iteration_statement','parser_ansi.py',587),
+  ('iteration_statement -> FOR ( expression_statement expression_statement ) statement','iteration_statement',6,'p_iteration_statement','parser_ansi.py',588),
+  ('iteration_statement -> FOR ( expression_statement expression_statement expression ) statement','iteration_statement',7,'p_iteration_statement','parser_ansi.py',589),
+  ('jump_statement -> GOTO IDENTIFIER ;','jump_statement',3,'p_jump_statement','parser_ansi.py',593),
+  ('jump_statement -> CONTINUE ;','jump_statement',2,'p_jump_statement','parser_ansi.py',594),
+  ('jump_statement -> BREAK ;','jump_statement',2,'p_jump_statement','parser_ansi.py',595),
+  ('jump_statement -> RETURN ;','jump_statement',2,'p_jump_statement','parser_ansi.py',596),
+  ('jump_statement -> RETURN expression ;','jump_statement',3,'p_jump_statement','parser_ansi.py',597),
+  ('external_declaration -> function_definition','external_declaration',1,'p_external_declaration','parser_ansi.py',601),
+  ('external_declaration -> declaration','external_declaration',1,'p_external_declaration','parser_ansi.py',602),
+  ('function_definition -> declaration_specifiers declarator declaration_list compound_statement','function_definition',4,'p_function_definition','parser_ansi.py',606),
+  ('function_definition -> declaration_specifiers declarator compound_statement','function_definition',3,'p_function_definition','parser_ansi.py',607),
+  ('function_definition -> declarator declaration_list compound_statement','function_definition',3,'p_function_definition','parser_ansi.py',608),
+  ('function_definition -> declarator compound_statement','function_definition',2,'p_function_definition','parser_ansi.py',609),
+]
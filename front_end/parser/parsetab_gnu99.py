@@ -0,0 +1,352 @@
+
+# parsetab_gnu99.py
+# This file is automatically generated. Do not edit.
+# pylint: disable=W,C,R
+_tabversion = '3.10'
+
+_lr_method = 'LALR'
+
+_lr_signature = "translation_unitACCESS ADD_ASSIGN ALIGNED ALLOC_SIZE AND_ASSIGN AND_OP AUTO BOOLEAN BREAK CASE CHAR COLD COMPLEX CONST CONSTANT CONTINUE COPY DEC_OP DEFAULT DEPRECATED DESIGNATED_INIT DIV_ASSIGN DO DOUBLE ELLIPSIS ELSE ENUM EQ_OP EXTERN FALLTHROUGH FLOAT FOR GE_OP GOTO HOT IDENTIFIER IF IMAGINARY INC_OP INLINE INT LEFT_ASSIGN LEFT_OP LE_OP LONG MAY_ALIAS MODE MOD_ASSIGN MUL_ASSIGN NE_OP OBJC_ROOT_CLASS OR_ASSIGN OR_OP PACKED PTR_OP REGISTER RESTRICT RETURN RIGHT_ASSIGN RIGHT_OP SCALAR_STORAGE_ORDER SHORT SIGNED SIZEOF STATIC STRING_LITERAL STRUCT SUB_ASSIGN SWITCH TRANSPARENT_UNION TYPEDEF TYPEDEF_NAME UNAVAILABLE UNION UNSIGNED UNUSED VECTOR_SIZE VISIBILITY VOID VOLATILE WARN_IF_NOT_ALIGNED WHILE XOR_ASSIGN __ACCESS__ __ALIGNED__ __ALLOC_SIZE__ __ATTRIBUTE__ __COLD__ __COPY__ __DEPRECATED__ __DESIGNATED_INIT__ __FALLTHROUGH__ __HOT__ __MAY_ALIAS__ __MODE__ __OBJC_ROOT_CLASS__ __PACKED__ __SCALAR_STORAGE_ORDER__ __TRANSPARENT_UNION__ __UNAVAILABLE__ __UNUSED__ __VECTOR_SIZE__ __VISIBILITY__ __WARN_IF_NOT_ALIGNED__translation_unit : external_declaration \n                            | translation_unit external_declarationexternal_declaration : function_definition\n                                | declaration function_definition : declaration_specifiers declarator declaration_list compound_statement\n                                | declaration_specifiers declarator compound_statementprimary_expression : IDENTIFIER\n                              | CONSTANT\n                              | STRING_LITERAL\n                              | '(' expression ')' external_declaration : linemarker\n        linemarker : '#' CONSTANT STRING_LITERAL flag_list\n        postfix_expression : primary_expression\n                              | postfix_expression '[' expression ']'\n                              | postfix_expression '(' ')'\n                              | postfix_expression '(' argument_expression_list ')'\n                              | postfix_expression '.' IDENTIFIER\n                              | postfix_expression PTR_OP IDENTIFIER\n                              | postfix_expression INC_OP\n                              | postfix_expression DEC_OP\n                              | '(' type_name ')' '{' initializer_list '}' \n                              | '(' type_name ')' '{' initializer_list  ',' '}' \n                              flag_list : \n                     | CONSTANT\n                     | flag_list CONSTANT\n        argument_expression_list : assignment_expression\n                                    | argument_expression_list ',' assignment_expression enum_specifier : ENUM attribute_specifier_list '{' enumerator_list '}'\n                          | ENUM attribute_specifier_list '{' enumerator_list  ',' '}' unary_expression : postfix_expression\n                            | INC_OP unary_expression\n                            | DEC_OP unary_expression\n                            | unary_operator cast_expression\n                            | SIZEOF unary_expression\n                            | SIZEOF '(' type_name ')' enum_specifier : ENUM attribute_specifier_list IDENTIFIER '{' enumerator_list '}'\n                          | ENUM attribute_specifier_list IDENTIFIER '{' enumerator_list  ',' '}' enum_specifier : ENUM attribute_specifier_list IDENTIFIER unary_operator : '&'\n                          | '*'  \n                          | '+'  \n                          | '-'  \n                          | '~'  \n                          | '!' enum_specifier : ENUM '{' enumerator_list '}' attribute_specifier_listcast_expression : unary_expression\n                           | '(' type_name ')' cast_expression enum_specifier : ENUM '{' enumerator_list  ',' '}' attribute_specifier_listmultiplicative_expression : cast_expression\n                                     | multiplicative_expression '*' cast_expression\n                                     | multiplicative_expression '/' cast_expression\n                                     | multiplicative_expression '%' cast_expression enum_specifier : ENUM IDENTIFIER '{' enumerator_list '}' attribute_specifier_listenum_specifier : ENUM IDENTIFIER '{' enumerator_list  ',' '}' attribute_specifier_listadditive_expression : multiplicative_expression\n                               | additive_expression '+' multiplicative_expression\n                               | additive_expression '-' multiplicative_expression struct_or_union_specifier : struct_or_union attribute_specifier_list '{' struct_declaration_list '}'\n                                     | struct_or_union attribute_specifier_list IDENTIFIER \n                                     | struct_or_union attribute_specifier_list IDENTIFIER '{' struct_declaration_list '}'\n                                     shift_expression : additive_expression\n                            | shift_expression LEFT_OP additive_expression\n                            | shift_expression RIGHT_OP additive_expression struct_or_union_specifier : struct_or_union '{' struct_declaration_list '}' attribute_specifier_list\n                                     struct_or_union_specifier : struct_or_union IDENTIFIER '{' struct_declaration_list '}' attribute_specifier_list \n                                     relational_expression : shift_expression\n                                 | relational_expression '<' shift_expression\n                                 | relational_expression '>' shift_expression\n                                 | relational_expression LE_OP shift_expression\n                                 | relational_expression GE_OP shift_expression \n        attribute_specifier_list : attribute_specifier\n                                 | attribute_specifier_list attribute_specifier\n        equality_expression : relational_expression\n                               | equality_expression EQ_OP relational_expression\n                               | equality_expression NE_OP relational_expression \n        attribute_specifier : __ATTRIBUTE__ '(' '(' attribute_list ')' ')'\n        \n        attribute_list : \n                       | attribute\n                       | attribute_list ',' \n                       | attribute_list ',' attribute \n        and_expression : equality_expression\n                          | and_expression '&' equality_expression exclusive_or_expression : and_expression\n                                   | exclusive_or_expression '^' and_expression \n        attribute : attribute_token\n                  | attribute_token '(' attribute_argument_list ')'\n        inclusive_or_expression : exclusive_or_expression\n                                   | inclusive_or_expression '|' exclusive_or_expression \n        attribute_argument_list : attribute_argument\n                                | attribute_argument_list ',' attribute_argument\n        logical_and_expression : inclusive_or_expression\n                                  | logical_and_expression AND_OP inclusive_or_expression \n        attribute_argument : assignment_expression\n        logical_or_expression : logical_and_expression\n                                 | logical_or_expression OR_OP logical_and_expression \n        attribute_token : enumerator_attribute\n                        | function_attribute\n                        | label_attribute\n                        | type_attribute\n                        | statement_attribute\n        conditional_expression : logical_or_expression\n                                  | logical_or_expression '?' expression ':' conditional_expression \n        enumerator_attribute : DEPRECATED\n                             | __DEPRECATED__\n                             | UNAVAILABLE\n                             | __UNAVAILABLE__\n        assignment_expression : conditional_expression\n                                 | unary_expression assignment_operator assignment_expression\n        function_attribute : ACCESS\n                           | __ACCESS__\n                           | UNAVAILABLE\n                           | __UNAVAILABLE__\n        assignment_operator : '='\n                               | MUL_ASSIGN \n                               | DIV_ASSIGN \n                               | MOD_ASSIGN \n                               | ADD_ASSIGN \n                               | SUB_ASSIGN \n                               | LEFT_ASSIGN \n                               | RIGHT_ASSIGN \n                               | AND_ASSIGN \n                               | XOR_ASSIGN \n                               | OR_ASSIGN \n        label_attribute : COLD\n                        | __COLD__\n                        | HOT\n                        | __HOT__\n                        | UNUSED\n                        | __UNUSED__\n        expression : assignment_expression\n                      | expression ',' assignment_expression \n        statement_attribute : FALLTHROUGH\n                            | __FALLTHROUGH__\n        \n        type_attribute : ALIGNED\n                       | __ALIGNED__\n                       | ALLOC_SIZE\n                       | __ALLOC_SIZE__\n                       | COPY\n                       | __COPY__\n                       | DEPRECATED\n                       | __DEPRECATED__\n                       | DESIGNATED_INIT\n                       | __DESIGNATED_INIT__\n                       | MAY_ALIAS\n                       | __MAY_ALIAS__\n                       | MODE\n                       | __MODE__\n                       | OBJC_ROOT_CLASS\n                       | __OBJC_ROOT_CLASS__\n                       | PACKED\n                       | __PACKED__\n                       | SCALAR_STORAGE_ORDER\n                       | __SCALAR_STORAGE_ORDER__\n                       | TRANSPARENT_UNION\n                       | __TRANSPARENT_UNION__\n                       | UNAVAILABLE\n                       | __UNAVAILABLE__\n                       | UNUSED\n                       | __UNUSED__\n                       | VECTOR_SIZE\n                       | __VECTOR_SIZE__\n                       | VISIBILITY\n                       | __VISIBILITY__\n                       | WARN_IF_NOT_ALIGNED\n                       | __WARN_IF_NOT_ALIGNED__\n        constant_expression : conditional_expression declaration : declaration_specifiers ';' \n                       | declaration_specifiers init_declarator_list ';' declaration_specifiers : storage_class_specifier\n                                  | storage_class_specifier declaration_specifiers\n                                  | type_specifier\n                                  | type_specifier declaration_specifiers\n                                  | type_qualifier\n                                  | type_qualifier declaration_specifiers\n                                  | function_specifier\n                                  | function_specifier declaration_specifiersinit_declarator_list : init_declarator\n                                | init_declarator_list ',' init_declarator init_declarator : declarator\n                           | declarator '=' initializer storage_class_specifier : TYPEDEF\n                                   | EXTERN\n                                   | STATIC\n                                   | AUTO\n                                   | REGISTER type_specifier : VOID\n                          | CHAR\n                          | SHORT\n                          | INT\n                          | LONG\n                          | FLOAT\n                          | DOUBLE\n                          | SIGNED\n                          | UNSIGNED\n                          | BOOLEAN\n                          | COMPLEX\n                          | IMAGINARY\n                          | struct_or_union_specifier\n                          | enum_specifier\n                          | TYPEDEF_NAME struct_or_union_specifier : struct_or_union '{' struct_declaration_list '}'\n                                     | struct_or_union IDENTIFIER '{' struct_declaration_list '}'\n                                     | struct_or_union IDENTIFIER struct_or_union : STRUCT\n                           | UNION struct_declaration_list : struct_declaration\n                                   | struct_declaration_list struct_declaration struct_declaration : specifier_qualifier_list struct_declarator_list ';' specifier_qualifier_list : type_specifier\n                                    | type_specifier specifier_qualifier_list\n                                    | type_qualifier \n                                    | type_qualifier specifier_qualifier_liststruct_declarator_list : struct_declarator\n                                  | struct_declarator_list ',' struct_declaratorstruct_declarator : declarator\n                             | ':' constant_expression\n                             | declarator ':' constant_expression enum_specifier : ENUM '{' enumerator_list '}'\n                          | ENUM '{' enumerator_list  ',' '}' enum_specifier : ENUM IDENTIFIER '{' enumerator_list '}'\n                          | ENUM IDENTIFIER '{' enumerator_list  ',' '}' enum_specifier : ENUM IDENTIFIER enumerator_list : enumerator\n                           | enumerator_list ',' enumeratorenumerator : IDENTIFIER\n                      | IDENTIFIER '=' constant_expression function_specifier : INLINE type_qualifier : CONST\n                          | RESTRICT\n                          | VOLATILE declarator : direct_declarator\n                      | pointer direct_declarator direct_declarator : IDENTIFIER direct_declarator : '(' declarator ')' direct_declarator : direct_declarator '[' ']'\n                             | direct_declarator '[' type_qualifier_list ']' direct_declarator : direct_declarator '[' assignment_expression ']'\n                             | direct_declarator '[' type_qualifier_list assignment_expression ']' direct_declarator : direct_declarator '[' STATIC assignment_expression ']'\n                             | direct_declarator '[' STATIC type_qualifier_list assignment_expression ']'\n                             | direct_declarator '[' type_qualifier_list STATIC assignment_expression ']' direct_declarator : direct_declarator '[' '*' ']'\n                             | direct_declarator '[' type_qualifier_list '*' ']' direct_declarator : direct_declarator '(' ')'\n                             | direct_declarator '(' parameter_type_list ')'\n                             | direct_declarator '(' identifier_list ')'\n                             pointer : '*'\n                   | '*' pointer pointer : '*' type_qualifier_list\n                   | '*' type_qualifier_list pointer type_qualifier_list : type_qualifier\n                               | type_qualifier_list type_qualifier parameter_type_list : parameter_list\n                               | parameter_list ',' ELLIPSISparameter_list : parameter_declaration\n                          | parameter_list ',' parameter_declaration parameter_declaration : declaration_specifiers\n                                 | declaration_specifiers declarator\n                                 | declaration_specifiers abstract_declarator identifier_list : IDENTIFIER\n                           | identifier_list ',' IDENTIFIER type_name : specifier_qualifier_list\n                     | specifier_qualifier_list abstract_declarator abstract_declarator : pointer\n                               | direct_abstract_declarator\n                               | pointer direct_abstract_declarator direct_abstract_declarator : '(' abstract_declarator ')' direct_abstract_declarator : direct_abstract_declarator '[' ']'\n                                      | direct_abstract_declarator '[' assignment_expression ']' direct_abstract_declarator : '[' ']'\n                                      | '[' assignment_expression ']' \n                                      | '[' type_qualifier_list ']' \n                                      | '[' type_qualifier_list assignment_expression ']' \n                                      direct_abstract_declarator : direct_abstract_declarator '[' '*' ']'\n                                      direct_abstract_declarator : '[' '*' ']'\n                                      direct_abstract_declarator : direct_abstract_declarator '(' ')'\n                                      | direct_abstract_declarator '(' parameter_type_list ')'\n                                      direct_abstract_declarator : '(' ')'\n                                      | '(' parameter_type_list ')'\n                                      initializer : assignment_expressioninitializer : '{' initializer_list '}'\n                       | '{' initializer_list ',' '}' initializer_list : initializer\n                            | designation initializer\n                            | initializer_list ',' initializer \n                            | initializer_list ',' designation initializer designation : designator_list '=' designator_list : designator\n                           | designator_list designator designator : '[' constant_expression  ']'\n                      | '.' IDENTIFIER statement : labeled_statement\n                     | compound_statement\n                     | expression_statement\n                     | selection_statement\n                     | iteration_statement\n                     | jump_statement labeled_statement : IDENTIFIER ':' statement\n                             | CASE constant_expression ':' statement\n                             | DEFAULT ':' statement compound_statement : '{' '}'\n                              | '{' block_item_list '}' block_item_list : block_item\n                           | block_item_list block_item block_item : declaration\n                      | statement declaration_list : declaration\n                            | declaration_list declaration expression_statement : ';'\n                                | expression ';' selection_statement : IF '(' expression ')' statement\n                               | IF '(' expression ')' statement ELSE statement\n                               | SWITCH '(' expression ')' statement iteration_statement : WHILE '(' expression ')' statement\n                               | DO statement WHILE '(' expression ')' ';'\n                               | FOR '(' expression_statement expression_statement ')' statement\n                               | FOR '(' declaration expression_statement expression_statement ')' statement jump_statement : GOTO IDENTIFIER ';'\n                          | CONTINUE ';'\n                          | BREAK ';'\n                          | RETURN ';'\n                          | RETURN expression ';' "
+    
+_lr_action_items = {'#':([0,1,2,3,4,5,40,42,65,69,78,96,130,172,173,247,283,],[7,7,-1,-3,-4,-11,-2,-167,-6,-168,-23,-5,-301,-24,-12,-302,-25,]),'TYPEDEF':([0,1,2,3,4,5,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,40,41,42,44,47,57,58,62,64,65,67,68,69,72,73,78,80,81,90,96,97,130,131,132,133,134,135,136,137,138,139,140,141,157,162,169,172,173,176,188,247,248,253,259,261,262,263,265,269,272,273,274,276,281,283,284,286,291,340,343,344,347,372,390,392,400,401,402,404,405,412,420,423,427,428,430,431,432,446,453,454,466,471,472,477,478,479,493,497,498,499,],[12,12,-1,-3,-4,-11,12,12,12,12,-181,-182,-183,-184,-185,-186,-187,-188,-189,-190,-191,-192,-193,-194,-195,-196,-197,-198,-199,-200,-228,-229,-230,-227,-2,12,-167,-231,-233,-203,-71,-222,12,-6,-307,12,-168,12,-232,-23,-59,-72,-38,-5,-308,-301,12,-303,-305,-306,-309,-292,-293,-294,-295,-296,-297,-235,-244,-234,-24,-12,-201,-218,-302,-304,-310,12,-319,-320,-321,-236,-237,-242,-245,-246,12,12,-25,-58,-64,-202,-28,-45,-219,-220,12,-298,-300,-318,-322,-238,-243,-239,12,-60,-65,-29,-36,-48,-53,-221,-299,-241,-240,-76,-37,-54,-311,-313,-314,-316,-312,-315,-317,]),'EXTERN':([0,1,2,3,4,5,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,40,41,42,44,47,57,58,62,64,65,67,68,69,72,73,78,80,81,90,96,97,130,131,132,133,134,135,136,137,138,139,140,141,157,162,169,172,173,176,188,247,248,253,259,261,262,263,265,269,272,273,274,276,281,283,284,286,291,340,343,344,347,372,390,392,400,401,402,404,405,412,420,423,427,428,430,431,432,446,453,454,466,471,472,477,478,479,493,497,498,499,],[13,13,-1,-3,-4,-11,13,13,13,13,-181,-182,-183,-184,-185,-186,-187,-188,-189,-190,-191,-192,-193,-194,-195,-196,-197,-198,-199,-200,-228,-229,-230,-227,-2,13,-167,-231,-233,-203,-71,-222,13,-6,-307,13,-168,13,-232,-23,-59,-72,-38,-5,-308,-301,13,-303,-305,-306,-309,-292,-293,-294,-295,-296,-297,-235,-244,-234,-24,-12,-201,-218,-302,-304,-310,13,-319,-320,-321,-236,-237,-242,-245,-246,13,13,-25,-58,-64,-202,-28,-45,-219,-220,13,-298,-300,-318,-322,-238,-243,-239,13,-60,-65,-29,-36,-48,-53,-221,-299,-241,-240,-76,-37,-54,-311,-313,-314,-316,-312,-315,-317,]),'STATIC':([0,1,2,3,4,5,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,40,41,42,44,47,57,58,62,64,65,67,68,69,71,72,73,77,78,80,81,90,96,97,130,131,132,133,134,135,136,137,138,139,140,141,157,158,162,169,171,172,173,176,188,247,248,253,259,261,262,263,265,269,272,273,274,276,281,283,284,286,291,340,343,344,347,372,390,392,400,401,402,404,405,412,420,423,427,428,430,431,432,446,453,454,466,471,472,477,478,479,493,497,498,499,],[14,14,-1,-3,-4,-11,14,14,14,14,-181,-182,-183,-184,-185,-186,-187,-188,-189,-190,-191,-192,-193,-194,-195,-196,-197,-198,-199,-200,-228,-229,-230,-227,-2,14,-167,-231,-233,-203,-71,-222,14,-6,-307,14,-168,160,14,-232,-251,-23,-59,-72,-38,-5,-308,-301,14,-303,-305,-306,-309,-292,-293,-294,-295,-296,-297,-235,267,-244,-234,-252,-24,-12,-201,-218,-302,-304,-310,14,-319,-320,-321,-236,-237,-242,-245,-246,14,14,-25,-58,-64,-202,-28,-45,-219,-220,14,-298,-300,-318,-322,-238,-243,-239,14,-60,-65,-29,-36,-48,-53,-221,-299,-241,-240,-76,-37,-54,-311,-313,-314,-316,-312,-315,-317,]),'AUTO':([0,1,2,3,4,5,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,40,41,42,44,47,57,58,62,64,65,67,68,69,72,73,78,80,81,90,96,97,130,131,132,133,134,135,136,137,138,139,140,141,157,162,169,172,173,176,188,247,248,253,259,261,262,263,265,269,272,273,274,276,281,283,284,286,291,340,343,344,347,372,390,392,400,401,402,404,405,412,420,423,427,428,430,431,432,446,453,454,466,471,472,477,478,479,493,497,498,499,],[15,15,-1,-3,-4,-11,15,15,15,15,-181,-182,-183,-184,-185,-186,-187,-188,-189,-190,-191,-192,-193,-194,-195,-196,-197,-198,-199,-200,-228,-229,-230,-227,-2,15,-167,-231,-233,-203,-71,-222,15,-6,-307,15,-168,15,-232,-23,-59,-72,-38,-5,-308,-301,15,-303,-305,-306,-309,-292,-293,-294,-295,-296,-297,-235,-244,-234,-24,-12,-201,-218,-302,-304,-310,15,-319,-320,-321,-236,-237,-242,-245,-246,15,15,-25,-58,-64,-202,-28,-45,-219,-220,15,-298,-300,-318,-322,-238,-243,-239,15,-60,-65,-29,-36,-48,-53,-221,-299,-241,-240,-76,-37,-54,-311,-313,-314,-316,-312,-315,-317,]),'REGISTER':([0,1,2,3,4,5,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,40,41,42,44,47,57,58,62,64,65,67,68,69,72,73,78,80,81,90,96,97,130,131,132,133,134,135,136,137,138,139,140,141,157,162,169,172,173,176,188,247,248,253,259,261,262,263,265,269,272,273,274,276,281,283,284,286,291,340,343,344,347,372,390,392,400,401,402,404,405,412,420,423,427,428,430,431,432,446,453,454,466,471,472,477,478,479,493,497,498,499,],[16,16,-1,-3,-4,-11,16,16,16,16,-181,-182,-183,-184,-185,-186,-187,-188,-189,-190,-191,-192,-193,-194,-195,-196,-197,-198,-199,-200,-228,-229,-230,-227,-2,16,-167,-231,-233,-203,-71,-222,16,-6,-307,16,-168,16,-232,-23,-59,-72,-38,-5,-308,-301,16,-303,-305,-306,-309,-292,-293,-294,-295,-296,-297,-235,-244,-234,-24,-12,-201,-218,-302,-304,-310,16,-319,-320,-321,-236,-237,-242,-245,-246,16,16,-25,-58,-64,-202,-28,-45,-219,-220,16,-298,-300,-318,-322,-238,-243,-239,16,-60,-65,-29,-36,-48,-53,-221,-299,-241,-240,-76,-37,-54,-311,-313,-314,-316,-312,-315,-317,]),'VOID':([0,1,2,3,4,5,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,40,41,42,44,47,56,57,58,62,64,65,67,68,69,72,73,78,79,80,81,82,83,85,86,87,90,96,97,110,130,131,132,133,134,135,136,137,138,139,140,141,157,162,169,172,173,174,175,176,177,184,188,220,224,226,247,248,253,259,261,262,263,265,269,272,273,274,276,281,283,284,285,286,287,291,340,343,344,347,372,390,392,400,401,402,404,405,412,420,423,427,428,430,431,432,446,453,454,466,471,472,477,478,479,493,497,498,499,],[17,17,-1,-3,-4,-11,17,17,17,17,-181,-182,-183,-184,-185,-186,-187,-188,-189,-190,-191,-192,-193,-194,-195,-196,-197,-198,-199,-200,-228,-229,-230,-227,-2,17,-167,-231,-233,17,-203,-71,-222,17,-6,-307,17,-168,17,-232,-23,17,-59,-72,17,-206,17,17,17,-38,-5,-308,17,-301,17,-303,-305,-306,-309,-292,-293,-294,-295,-296,-297,-235,-244,-234,-24,-12,17,17,-201,-207,17,-218,17,17,17,-302,-304,-310,17,-319,-320,-321,-236,-237,-242,-245,-246,17,17,-25,-58,17,-64,-208,-202,-28,-45,-219,-220,17,-298,-300,-318,-322,-238,-243,-239,17,-60,-65,-29,-36,-48,-53,-221,-299,-241,-240,-76,-37,-54,-311,-313,-314,-316,-312,-315,-317,]),'CHAR':([0,1,2,3,4,5,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,40,41,42,44,47,56,57,58,62,64,65,67,68,69,72,73,78,79,80,81,82,83,85,86,87,90,96,97,110,130,131,132,133,134,135,136,137,138,139,140,141,157,162,169,172,173,174,175,176,177,184,188,220,224,226,247,248,253,259,261,262,263,265,269,272,273,274,276,281,283,284,285,286,287,291,340,343,344,347,372,390,392,400,401,402,404,405,412,420,423,427,428,430,431,432,446,453,454,466,471,472,477,478,479,493,497,498,499,],[18,18,-1,-3,-4,-11,18,18,18,18,-181,-182,-183,-184,-185,-186,-187,-188,-189,-190,-191,-192,-193,-194,-195,-196,-197,-198,-199,-200,-228,-229,-230,-227,-2,18,-167,-231,-233,18,-203,-71,-222,18,-6,-307,18,-168,18,-232,-23,18,-59,-72,18,-206,18,18,18,-38,-5,-308,18,-301,18,-303,-305,-306,-309,-292,-293,-294,-295,-296,-297,-235,-244,-234,-24,-12,18,18,-201,-207,18,-218,18,18,18,-302,-304,-310,18,-319,-320,-321,-236,-237,-242,-245,-246,18,18,-25,-58,18,-64,-208,-202,-28,-45,-219,-220,18,-298,-300,-318,-322,-238,-243,-239,18,-60,-65,-29,-36,-48,-53,-221,-299,-241,-240,-76,-37,-54,-311,-313,-314,-316,-312,-315,-317,]),'SHORT':([0,1,2,3,4,5,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,40,41,42,44,47,56,57,58,62,64,65,67,68,69,72,73,78,79,80,81,82,83,85,86,87,90,96,97,110,130,131,132,133,134,135,136,137,138,139,140,141,157,162,169,172,173,174,175,176,177,184,188,220,224,226,247,248,253,259,261,262,263,265,269,272,273,274,276,281,283,284,285,286,287,291,340,343,344,347,372,390,392,400,401,402,404,405,412,420,423,427,428,430,431,432,446,453,454,466,471,472,477,478,479,493,497,498,499,],[19,19,-1,-3,-4,-11,19,19,19,19,-181,-182,-183,-184,-185,-186,-187,-188,-189,-190,-191,-192,-193,-194,-195,-196,-197,-198,-199,-200,-228,-229,-230,-227,-2,19,-167,-231,-233,19,-203,-71,-222,19,-6,-307,19,-168,19,-232,-23,19,-59,-72,19,-206,19,19,19,-38,-5,-308,19,-301,19,-303,-305,-306,-309,-292,-293,-294,-295,-296,-297,-235,-244,-234,-24,-12,19,19,-201,-207,19,-218,19,19,19,-302,-304,-310,19,-319,-320,-321,-236,-237,-242,-245,-246,19,19,-25,-58,19,-64,-208,-202,-28,-45,-219,-220,19,-298,-300,-318,-322,-238,-243,-239,19,-60,-65,-29,-36,-48,-53,-221,-299,-241,-240,-76,-37,-54,-311,-313,-314,-316,-312,-315,-317,]),'INT':([0,1,2,3,4,5,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,40,41,42,44,47,56,57,58,62,64,65,67,68,69,72,73,78,79,80,81,82,83,85,86,87,90,96,97,110,130,131,132,133,134,135,136,137,138,139,140,141,157,162,169,172,173,174,175,176,177,184,188,220,224,226,247,248,253,259,261,262,263,265,269,272,273,274,276,281,283,284,285,286,287,291,340,343,344,347,372,390,392,400,401,402,404,405,412,420,423,427,428,430,431,432,446,453,454,466,471,472,477,478,479,493,497,498,499,],[20,20,-1,-3,-4,-11,20,20,20,20,-181,-182,-183,-184,-185,-186,-187,-188,-189,-190,-191,-192,-193,-194,-195,-196,-197,-198,-199,-200,-228,-229,-230,-227,-2,20,-167,-231,-233,20,-203,-71,-222,20,-6,-307,20,-168,20,-232,-23,20,-59,-72,20,-206,20,20,20,-38,-5,-308,20,-301,20,-303,-305,-306,-309,-292,-293,-294,-295,-296,-297,-235,-244,-234,-24,-12,20,20,-201,-207,20,-218,20,20,20,-302,-304,-310,20,-319,-320,-321,-236,-237,-242,-245,-246,20,20,-25,-58,20,-64,-208,-202,-28,-45,-219,-220,20,-298,-300,-318,-322,-238,-243,-239,20,-60,-65,-29,-36,-48,-53,-221,-299,-241,-240,-76,-37,-54,-311,-313,-314,-316,-312,-315,-317,]),'LONG':([0,1,2,3,4,5,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,40,41,42,44,47,56,57,58,62,64,65,67,68,69,72,73,78,79,80,81,82,83,85,86,87,90,96,97,110,130,131,132,133,134,135,136,137,138,139,140,141,157,162,169,172,173,174,175,176,177,184,188,220,224,226,247,248,253,259,261,262,263,265,269,272,273,274,276,281,283,284,285,286,287,291,340,343,344,347,372,390,392,400,401,402,404,405,412,420,423,427,428,430,431,432,446,453,454,466,471,472,477,478,479,493,497,498,499,],[21,21,-1,-3,-4,-11,21,21,21,21,-181,-182,-183,-184,-185,-186,-187,-188,-189,-190,-191,-192,-193,-194,-195,-196,-197,-198,-199,-200,-228,-229,-230,-227,-2,21,-167,-231,-233,21,-203,-71,-222,21,-6,-307,21,-168,21,-232,-23,21,-59,-72,21,-206,21,21,21,-38,-5,-308,21,-301,21,-303,-305,-306,-309,-292,-293,-294,-295,-296,-297,-235,-244,-234,-24,-12,21,21,-201,-207,21,-218,21,21,21,-302,-304,-310,21,-319,-320,-321,-236,-237,-242,-245,-246,21,21,-25,-58,21,-64,-208,-202,-28,-45,-219,-220,21,-298,-300,-318,-322,-238,-243,-239,21,-60,-65,-29,-36,-48,-53,-221,-299,-241,-240,-76,-37,-54,-311,-313,-314,-316,-312,-315,-317,]),'FLOAT':([0,1,2,3,4,5,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,40,41,42,44,47,56,57,58,62,64,65,67,68,69,72,73,78,79,80,81,82,83,85,86,87,90,96,97,110,130,131,132,133,134,135,136,137,138,139,140,141,157,162,169,172,173,174,175,176,177,184,188,220,224,226,247,248,253,259,261,262,263,265,269,272,273,274,276,281,283,284,285,286,287,291,340,343,344,347,372,390,392,400,401,402,404,405,412,420,423,427,428,430,431,432,446,453,454,466,471,472,477,478,479,493,497,498,499,],[22,22,-1,-3,-4,-11,22,22,22,22,-181,-182,-183,-184,-185,-186,-187,-188,-189,-190,-191,-192,-193,-194,-195,-196,-197,-198,-199,-200,-228,-229,-230,-227,-2,22,-167,-231,-233,22,-203,-71,-222,22,-6,-307,22,-168,22,-232,-23,22,-59,-72,22,-206,22,22,22,-38,-5,-308,22,-301,22,-303,-305,-306,-309,-292,-293,-294,-295,-296,-297,-235,-244,-234,-24,-12,22,22,-201,-207,22,-218,22,22,22,-302,-304,-310,22,-319,-320,-321,-236,-237,-242,-245,-246,22,22,-25,-58,22,-64,-208,-202,-28,-45,-219,-220,22,-298,-300,-318,-322,-238,-243,-239,22,-60,-65,-29,-36,-48,-53,-221,-299,-241,-240,-76,-37,-54,-311,-313,-314,-316,-312,-315,-317,]),'DOUBLE':([0,1,2,3,4,5,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,40,41,42,44,47,56,57,58,62,64,65,67,68,69,72,73,78,79,80,81,82,83,85,86,87,90,96,97,110,130,131,132,133,134,135,136,137,138,139,140,141,157,162,169,172,173,174,175,176,177,184,188,220,224,226,247,248,253,259,261,262,263,265,269,272,273,274,276,281,283,284,285,286,287,291,340,343,344,347,372,390,392,400,401,402,404,405,412,420,423,427,428,430,431,432,446,453,454,466,471,472,477,478,479,493,497,498,499,],[23,23,-1,-3,-4,-11,23,23,23,23,-181,-182,-183,-184,-185,-186,-187,-188,-189,-190,-191,-192,-193,-194,-195,-196,-197,-198,-199,-200,-228,-229,-230,-227,-2,23,-167,-231,-233,23,-203,-71,-222,23,-6,-307,23,-168,23,-232,-23,23,-59,-72,23,-206,23,23,23,-38,-5,-308,23,-301,23,-303,-305,-306,-309,-292,-293,-294,-295,-296,-297,-235,-244,-234,-24,-12,23,23,-201,-207,23,-218,23,23,23,-302,-304,-310,23,-319,-320,-321,-236,-237,-242,-245,-246,23,23,-25,-58,23,-64,-208,-202,-28,-45,-219,-220,23,-298,-300,-318,-322,-238,-243,-239,23,-60,-65,-29,-36,-48,-53,-221,-299,-241,-240,-76,-37,-54,-311,-313,-314,-316,-312,-315,-317,]),'SIGNED':([0,1,2,3,4,5,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,40,41,42,44,47,56,57,58,62,64,65,67,68,69,72,73,78,79,80,81,82,83,85,86,87,90,96,97,110,130,131,132,133,134,135,136,137,138,139,140,141,157,162,169,172,173,174,175,176,177,184,188,220,224,226,247,248,253,259,261,262,263,265,269,272,273,274,276,281,283,284,285,286,287,291,340,343,344,347,372,390,392,400,401,402,404,405,412,420,423,427,428,430,431,432,446,453,454,466,471,472,477,478,479,493,497,498,499,],[24,24,-1,-3,-4,-11,24,24,24,24,-181,-182,-183,-184,-185,-186,-187,-188,-189,-190,-191,-192,-193,-194,-195,-196,-197,-198,-199,-200,-228,-229,-230,-227,-2,24,-167,-231,-233,24,-203,-71,-222,24,-6,-307,24,-168,24,-232,-23,24,-59,-72,24,-206,24,24,24,-38,-5,-308,24,-301,24,-303,-305,-306,-309,-292,-293,-294,-295,-296,-297,-235,-244,-234,-24,-12,24,24,-201,-207,24,-218,24,24,24,-302,-304,-310,24,-319,-320,-321,-236,-237,-242,-245,-246,24,24,-25,-58,24,-64,-208,-202,-28,-45,-219,-220,24,-298,-300,-318,-322,-238,-243,-239,24,-60,-65,-29,-36,-48,-53,-221,-299,-241,-240,-76,-37,-54,-311,-313,-314,-316,-312,-315,-317,]),'UNSIGNED':([0,1,2,3,4,5,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,40,41,42,44,47,56,57,58,62,64,65,67,68,69,72,73,78,79,80,81,82,83,85,86,87,90,96,97,110,130,131,132,133,134,135,136,137,138,139,140,141,157,162,169,172,173,174,175,176,177,184,188,220,224,226,247,248,253,259,261,262,263,265,269,272,273,274,276,281,283,284,285,286,287,291,340,343,344,347,372,390,392,400,401,402,404,405,412,420,423,427,428,430,431,432,446,453,454,466,471,472,477,478,479,493,497,498,499,],[25,25,-1,-3,-4,-11,25,25,25,25,-181,-182,-183,-184,-185,-186,-187,-188,-189,-190,-191,-192,-193,-194,-195,-196,-197,-198,-199,-200,-228,-229,-230,-227,-2,25,-167,-231,-233,25,-203,-71,-222,25,-6,-307,25,-168,25,-232,-23,25,-59,-72,25,-206,25,25,25,-38,-5,-308,25,-301,25,-303,-305,-306,-309,-292,-293,-294,-295,-296,-297,-235,-244,-234,-24,-12,25,25,-201,-207,25,-218,25,25,25,-302,-304,-310,25,-319,-320,-321,-236,-237,-242,-245,-246,25,25,-25,-58,25,-64,-208,-202,-28,-45,-219,-220,25,-298,-300,-318,-322,-238,-243,-239,25,-60,-65,-29,-36,-48,-53,-221,-299,-241,-240,-76,-37,-54,-311,-313,-314,-316,-312,-315,-317,]),'BOOLEAN':([0,1,2,3,4,5,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,40,41,42,44,47,56,57,58,62,64,65,67,68,69,72,73,78,79,80,81,82,83,85,86,87,90,96,97,110,130,131,132,133,134,135,136,137,138,139,140,141,157,162,169,172,173,174,175,176,177,184,188,220,224,226,247,248,253,259,261,262,263,265,269,272,273,274,276,281,283,284,285,286,287,291,340,343,344,347,372,390,392,400,401,402,404,405,412,420,423,427,428,430,431,432,446,453,454,466,471,472,477,478,479,493,497,498,499,],[26,26,-1,-3,-4,-11,26,26,26,26,-181,-182,-183,-184,-185,-186,-187,-188,-189,-190,-191,-192,-193,-194,-195,-196,-197,-198,-199,-200,-228,-229,-230,-227,-2,26,-167,-231,-233,26,-203,-71,-222,26,-6,-307,26,-168,26,-232,-23,26,-59,-72,26,-206,26,26,26,-38,-5,-308,26,-301,26,-303,-305,-306,-309,-292,-293,-294,-295,-296,-297,-235,-244,-234,-24,-12,26,26,-201,-207,26,-218,26,26,26,-302,-304,-310,26,-319,-320,-321,-236,-237,-242,-245,-246,26,26,-25,-58,26,-64,-208,-202,-28,-45,-219,-220,26,-298,-300,-318,-322,-238,-243,-239,26,-60,-65,-29,-36,-48,-53,-221,-299,-241,-240,-76,-37,-54,-311,-313,-314,-316,-312,-315,-317,]),'COMPLEX':([0,1,2,3,4,5,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,40,41,42,44,47,56,57,58,62,64,65,67,68,69,72,73,78,79,80,81,82,83,85,86,87,90,96,97,110,130,131,132,133,134,135,136,137,138,139,140,141,157,162,169,172,173,174,175,176,177,184,188,220,224,226,247,248,253,259,261,262,263,265,269,272,273,274,276,281,283,284,285,286,287,291,340,343,344,347,372,390,392,400,401,402,404,405,412,420,423,427,428,430,431,432,446,453,454,466,471,472,477,478,479,493,497,498,499,],[27,27,-1,-3,-4,-11,27,27,27,27,-181,-182,-183,-184,-185,-186,-187,-188,-189,-190,-191,-192,-193,-194,-195,-196,-197,-198,-199,-200,-228,-229,-230,-227,-2,27,-167,-231,-233,27,-203,-71,-222,27,-6,-307,27,-168,27,-232,-23,27,-59,-72,27,-206,27,27,27,-38,-5,-308,27,-301,27,-303,-305,-306,-309,-292,-293,-294,-295,-296,-297,-235,-244,-234,-24,-12,27,27,-201,-207,27,-218,27,27,27,-302,-304,-310,27,-319,-320,-321,-236,-237,-242,-245,-246,27,27,-25,-58,27,-64,-208,-202,-28,-45,-219,-220,27,-298,-300,-318,-322,-238,-243,-239,27,-60,-65,-29,-36,-48,-53,-221,-299,-241,-240,-76,-37,-54,-311,-313,-314,-316,-312,-315,-317,]),'IMAGINARY':([0,1,2,3,4,5,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,40,41,42,44,47,56,57,58,62,64,65,67,68,69,72,73,78,79,80,81,82,83,85,86,87,90,96,97,110,130,131,132,133,134,135,136,137,138,139,140,141,157,162,169,172,173,174,175,176,177,184,188,220,224,226,247,248,253,259,261,262,263,265,269,272,273,274,276,281,283,284,285,286,287,291,340,343,344,347,372,390,392,400,401,402,404,405,412,420,423,427,428,430,431,432,446,453,454,466,471,472,477,478,479,493,497,498,499,],[28,28,-1,-3,-4,-11,28,28,28,28,-181,-182,-183,-184,-185,-186,-187,-188,-189,-190,-191,-192,-193,-194,-195,-196,-197,-198,-199,-200,-228,-229,-230,-227,-2,28,-167,-231,-233,28,-203,-71,-222,28,-6,-307,28,-168,28,-232,-23,28,-59,-72,28,-206,28,28,28,-38,-5,-308,28,-301,28,-303,-305,-306,-309,-292,-293,-294,-295,-296,-297,-235,-244,-234,-24,-12,28,28,-201,-207,28,-218,28,28,28,-302,-304,-310,28,-319,-320,-321,-236,-237,-242,-245,-246,28,28,-25,-58,28,-64,-208,-202,-28,-45,-219,-220,28,-298,-300,-318,-322,-238,-243,-239,28,-60,-65,-29,-36,-48,-53,-221,-299,-241,-240,-76,-37,-54,-311,-313,-314,-316,-312,-315,-317,]),'TYPEDEF_NAME':([0,1,2,3,4,5,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,40,41,42,44,47,56,57,58,62,64,65,67,68,69,72,73,78,79,80,81,82,83,85,86,87,90,96,97,110,130,131,132,133,134,135,136,137,138,139,140,141,157,162,169,172,173,174,175,176,177,184,188,220,224,226,247,248,253,259,261,262,263,265,269,272,273,274,276,281,283,284,285,286,287,291,340,343,344,347,372,390,392,400,401,402,404,405,412,420,423,427,428,430,431,432,446,453,454,466,471,472,477,478,479,493,497,498,499,],[31,31,-1,-3,-4,-11,31,31,31,31,-181,-182,-183,-184,-185,-186,-187,-188,-189,-190,-191,-192,-193,-194,-195,-196,-197,-198,-199,-200,-228,-229,-230,-227,-2,31,-167,-231,-233,31,-203,-71,-222,31,-6,-307,31,-168,31,-232,-23,31,-59,-72,31,-206,31,31,31,-38,-5,-308,31,-301,31,-303,-305,-306,-309,-292,-293,-294,-295,-296,-297,-235,-244,-234,-24,-12,31,31,-201,-207,31,-218,31,31,31,-302,-304,-310,31,-319,-320,-321,-236,-237,-242,-245,-246,31,31,-25,-58,31,-64,-208,-202,-28,-45,-219,-220,31,-298,-300,-318,-322,-238,-243,-239,31,-60,-65,-29,-36,-48,-53,-221,-299,-241,-240,-76,-37,-54,-311,-313,-314,-316,-312,-315,-317,]),'CONST':([0,1,2,3,4,5,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,40,41,42,44,47,49,56,57,58,62,64,65,67,68,69,71,72,73,76,77,78,79,80,81,82,83,85,86,87,90,96,97,110,130,131,132,133,134,135,136,137,138,139,140,141,157,158,160,162,169,171,172,173,174,175,176,177,184,188,220,224,226,247,248,253,259,261,262,263,265,269,271,272,273,274,276,281,282,283,284,285,286,287,291,340,343,344,347,372,390,392,400,401,402,404,405,412,418,420,423,427,428,430,431,432,446,453,454,466,471,472,477,478,479,493,497,498,499,],[32,32,-1,-3,-4,-11,32,32,32,32,-181,-182,-183,-184,-185,-186,-187,-188,-189,-190,-191,-192,-193,-194,-195,-196,-197,-198,-199,-200,-228,-229,-230,-227,-2,32,-167,-231,-233,32,32,-203,-71,-222,32,-6,-307,32,-168,32,32,-232,32,-251,-23,32,-59,-72,32,-206,32,32,32,-38,-5,-308,32,-301,32,-303,-305,-306,-309,-292,-293,-294,-295,-296,-297,-235,32,32,-244,-234,-252,-24,-12,32,32,-201,-207,32,-218,32,32,32,-302,-304,-310,32,-319,-320,-321,-236,-237,32,-242,-245,-246,32,32,32,-25,-58,32,-64,-208,-202,-28,-45,-219,-220,32,-298,-300,-318,-322,-238,-243,-239,32,32,-60,-65,-29,-36,-48,-53,-221,-299,-241,-240,-76,-37,-54,-311,-313,-314,-316,-312,-315,-317,]),'RESTRICT':([0,1,2,3,4,5,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,40,41,42,44,47,49,56,57,58,62,64,65,67,68,69,71,72,73,76,77,78,79,80,81,82,83,85,86,87,90,96,97,110,130,131,132,133,134,135,136,137,138,139,140,141,157,158,160,162,169,171,172,173,174,175,176,177,184,188,220,224,226,247,248,253,259,261,262,263,265,269,271,272,273,274,276,281,282,283,284,285,286,287,291,340,343,344,347,372,390,392,400,401,402,404,405,412,418,420,423,427,428,430,431,432,446,453,454,466,471,472,477,478,479,493,497,498,499,],[33,33,-1,-3,-4,-11,33,33,33,33,-181,-182,-183,-184,-185,-186,-187,-188,-189,-190,-191,-192,-193,-194,-195,-196,-197,-198,-199,-200,-228,-229,-230,-227,-2,33,-167,-231,-233,33,33,-203,-71,-222,33,-6,-307,33,-168,33,33,-232,33,-251,-23,33,-59,-72,33,-206,33,33,33,-38,-5,-308,33,-301,33,-303,-305,-306,-309,-292,-293,-294,-295,-296,-297,-235,33,33,-244,-234,-252,-24,-12,33,33,-201,-207,33,-218,33,33,33,-302,-304,-310,33,-319,-320,-321,-236,-237,33,-242,-245,-246,33,33,33,-25,-58,33,-64,-208,-202,-28,-45,-219,-220,33,-298,-300,-318,-322,-238,-243,-239,33,33,-60,-65,-29,-36,-48,-53,-221,-299,-241,-240,-76,-37,-54,-311,-313,-314,-316,-312,-315,-317,]),'VOLATILE':([0,1,2,3,4,5,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,40,41,42,44,47,49,56,57,58,62,64,65,67,68,69,71,72,73,76,77,78,79,80,81,82,83,85,86,87,90,96,97,110,130,131,132,133,134,135,136,137,138,139,140,141,157,158,160,162,169,171,172,173,174,175,176,177,184,188,220,224,226,247,248,253,259,261,262,263,265,269,271,272,273,274,276,281,282,283,284,285,286,287,291,340,343,344,347,372,390,392,400,401,402,404,405,412,418,420,423,427,428,430,431,432,446,453,454,466,471,472,477,478,479,493,497,498,499,],[34,34,-1,-3,-4,-11,34,34,34,34,-181,-182,-183,-184,-185,-186,-187,-188,-189,-190,-191,-192,-193,-194,-195,-196,-197,-198,-199,-200,-228,-229,-230,-227,-2,34,-167,-231,-233,34,34,-203,-71,-222,34,-6,-307,34,-168,34,34,-232,34,-251,-23,34,-59,-72,34,-206,34,34,34,-38,-5,-308,34,-301,34,-303,-305,-306,-309,-292,-293,-294,-295,-296,-297,-235,34,34,-244,-234,-252,-24,-12,34,34,-201,-207,34,-218,34,34,34,-302,-304,-310,34,-319,-320,-321,-236,-237,34,-242,-245,-246,34,34,34,-25,-58,34,-64,-208,-202,-28,-45,-219,-220,34,-298,-300,-318,-322,-238,-243,-239,34,34,-60,-65,-29,-36,-48,-53,-221,-299,-241,-240,-76,-37,-54,-311,-313,-314,-316,-312,-315,-317,]),'INLINE':([0,1,2,3,4,5,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,40,41,42,44,47,57,58,62,64,65,67,68,69,72,73,78,80,81,90,96,97,130,131,132,133,134,135,136,137,138,139,140,141,157,162,169,172,173,176,188,247,248,253,259,261,262,263,265,269,272,273,274,276,281,283,284,286,291,340,343,344,347,372,390,392,400,401,402,404,405,412,420,423,427,428,430,431,432,446,453,454,466,471,472,477,478,479,493,497,498,499,],[35,35,-1,-3,-4,-11,35,35,35,35,-181,-182,-183,-184,-185,-186,-187,-188,-189,-190,-191,-192,-193,-194,-195,-196,-197,-198,-199,-200,-228,-229,-230,-227,-2,35,-167,-231,-233,-203,-71,-222,35,-6,-307,35,-168,35,-232,-23,-59,-72,-38,-5,-308,-301,35,-303,-305,-306,-309,-292,-293,-294,-295,-296,-297,-235,-244,-234,-24,-12,-201,-218,-302,-304,-310,35,-319,-320,-321,-236,-237,-242,-245,-246,35,35,-25,-58,-64,-202,-28,-45,-219,-220,35,-298,-300,-318,-322,-238,-243,-239,35,-60,-65,-29,-36,-48,-53,-221,-299,-241,-240,-76,-37,-54,-311,-313,-314,-316,-312,-315,-317,]),'ENUM':([0,1,2,3,4,5,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,40,41,42,44,47,56,57,58,62,64,65,67,68,69,72,73,78,79,80,81,82,83,85,86,87,90,96,97,110,130,131,132,133,134,135,136,137,138,139,140,141,157,162,169,172,173,174,175,176,177,184,188,220,224,226,247,248,253,259,261,262,263,265,269,272,273,274,276,281,283,284,285,286,287,291,340,343,344,347,372,390,392,400,401,402,404,405,412,420,423,427,428,430,431,432,446,453,454,466,471,472,477,478,479,493,497,498,499,],[37,37,-1,-3,-4,-11,37,37,37,37,-181,-182,-183,-184,-185,-186,-187,-188,-189,-190,-191,-192,-193,-194,-195,-196,-197,-198,-199,-200,-228,-229,-230,-227,-2,37,-167,-231,-233,37,-203,-71,-222,37,-6,-307,37,-168,37,-232,-23,37,-59,-72,37,-206,37,37,37,-38,-5,-308,37,-301,37,-303,-305,-306,-309,-292,-293,-294,-295,-296,-297,-235,-244,-234,-24,-12,37,37,-201,-207,37,-218,37,37,37,-302,-304,-310,37,-319,-320,-321,-236,-237,-242,-245,-246,37,37,-25,-58,37,-64,-208,-202,-28,-45,-219,-220,37,-298,-300,-318,-322,-238,-243,-239,37,-60,-65,-29,-36,-48,-53,-221,-299,-241,-240,-76,-37,-54,-311,-313,-314,-316,-312,-315,-317,]),'STRUCT':([0,1,2,3,4,5,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,40,41,42,44,47,56,57,58,62,64,65,67,68,69,72,73,78,79,80,81,82,83,85,86,87,90,96,97,110,130,131,132,133,134,135,136,137,138,139,140,141,157,162,169,172,173,174,175,176,177,184,188,220,224,226,247,248,253,259,261,262,263,265,269,272,273,274,276,281,283,284,285,286,287,291,340,343,344,347,372,390,392,400,401,402,404,405,412,420,423,427,428,430,431,432,446,453,454,466,471,472,477,478,479,493,497,498,499,],[38,38,-1,-3,-4,-11,38,38,38,38,-181,-182,-183,-184,-185,-186,-187,-188,-189,-190,-191,-192,-193,-194,-195,-196,-197,-198,-199,-200,-228,-229,-230,-227,-2,38,-167,-231,-233,38,-203,-71,-222,38,-6,-307,38,-168,38,-232,-23,38,-59,-72,38,-206,38,38,38,-38,-5,-308,38,-301,38,-303,-305,-306,-309,-292,-293,-294,-295,-296,-297,-235,-244,-234,-24,-12,38,38,-201,-207,38,-218,38,38,38,-302,-304,-310,38,-319,-320,-321,-236,-237,-242,-245,-246,38,38,-25,-58,38,-64,-208,-202,-28,-45,-219,-220,38,-298,-300,-318,-322,-238,-243,-239,38,-60,-65,-29,-36,-48,-53,-221,-299,-241,-240,-76,-37,-54,-311,-313,-314,-316,-312,-315,-317,]),'UNION':([0,1,2,3,4,5,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,40,41,42,44,47,56,57,58,62,64,65,67,68,69,72,73,78,79,80,81,82,83,85,86,87,90,96,97,110,130,131,132,133,134,135,136,137,138,139,140,141,157,162,169,172,173,174,175,176,177,184,188,220,224,226,247,248,253,259,261,262,263,265,269,272,273,274,276,281,283,284,285,286,287,291,340,343,344,347,372,390,392,400,401,402,404,405,412,420,423,427,428,430,431,432,446,453,454,466,471,472,477,478,479,493,497,498,499,],[39,39,-1,-3,-4,-11,39,39,39,39,-181,-182,-183,-184,-185,-186,-187,-188,-189,-190,-191,-192,-193,-194,-195,-196,-197,-198,-199,-200,-228,-229,-230,-227,-2,39,-167,-231,-233,39,-203,-71,-222,39,-6,-307,39,-168,39,-232,-23,39,-59,-72,39,-206,39,39,39,-38,-5,-308,39,-301,39,-303,-305,-306,-309,-292,-293,-294,-295,-296,-297,-235,-244,-234,-24,-12,39,39,-201,-207,39,-218,39,39,39,-302,-304,-310,39,-319,-320,-321,-236,-237,-242,-245,-246,39,39,-25,-58,39,-64,-208,-202,-28,-45,-219,-220,39,-298,-300,-318,-322,-238,-243,-239,39,-60,-65,-29,-36,-48,-53,-221,-299,-241,-240,-76,-37,-54,-311,-313,-314,-316,-312,-315,-317,]),'$end':([1,2,3,4,5,40,42,65,69,78,96,130,172,173,247,283,],[0,-1,-3,-4,-11,-2,-167,-6,-168,-23,-5,-301,-24,-12,-302,-25,]),';':([6,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,41,42,43,44,46,47,51,52,53,54,57,58,62,63,68,69,73,80,81,90,95,98,99,101,102,103,104,108,111,112,113,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,145,149,152,153,154,155,156,157,162,169,176,178,179,180,188,217,218,219,221,222,223,225,247,248,249,251,252,253,259,260,261,262,263,264,265,269,272,273,274,284,286,290,291,340,343,344,347,349,356,358,360,363,364,369,373,374,375,376,377,378,379,380,381,382,383,384,385,386,387,388,389,390,391,392,393,398,399,400,401,402,404,405,420,421,422,423,427,428,430,431,432,433,438,439,443,445,446,447,448,449,452,453,454,466,471,472,474,477,478,479,481,489,491,492,493,494,496,497,498,499,],[42,-169,-171,-173,-175,-181,-182,-183,-184,-185,-186,-187,-188,-189,-190,-191,-192,-193,-194,-195,-196,-197,-198,-199,-200,-228,-229,-230,-227,-179,-167,69,-231,-177,-233,-170,-172,-174,-176,-203,-71,-222,42,135,-168,-232,-59,-72,-38,-179,-180,-280,-107,-46,-101,-30,-49,-94,-13,-7,-91,-8,-9,-87,-83,-81,-73,-66,-61,-55,-301,135,-303,-305,-306,-309,-292,-293,-294,-295,-296,-297,-7,253,135,261,262,263,-130,-178,-235,-244,-234,-201,287,-213,-215,-218,-19,-20,-31,-32,-33,-46,-34,-302,-304,135,-166,135,-310,135,400,-319,-320,-321,401,-236,-237,-242,-245,-246,-58,-64,-216,-202,-28,-45,-219,-220,-281,-108,-95,-15,-17,-18,-10,-92,-88,-84,-82,-74,-75,-67,-68,-69,-70,-62,-63,-56,-57,-50,-51,-52,-298,135,-300,-131,135,135,-318,-322,-238,-243,-239,-60,-214,-217,-65,-29,-36,-48,-53,-221,-282,-14,-16,-35,-47,-299,135,135,135,135,-241,-240,-76,-37,-54,-102,-311,-313,-314,135,-21,135,498,-316,135,-22,-312,-315,-317,]),'IDENTIFIER':([6,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,42,45,48,49,51,52,53,54,55,57,58,60,61,62,63,66,68,69,70,71,72,75,76,77,80,81,84,85,86,89,90,94,100,105,106,107,109,110,114,115,116,117,118,119,130,131,132,133,134,135,136,137,138,139,140,141,143,149,151,154,158,160,161,168,170,171,176,181,182,183,187,188,189,190,194,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,220,224,226,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,252,253,254,255,256,257,259,261,262,263,267,268,271,275,279,281,282,284,286,288,289,291,340,341,343,344,347,348,350,352,368,390,391,392,398,399,400,401,411,418,419,420,423,426,427,428,429,430,431,432,435,437,440,442,444,446,447,448,449,450,452,457,466,471,472,477,478,479,481,488,490,491,493,494,497,498,499,],[47,-169,-171,-173,-175,-181,-182,-183,-184,-185,-186,-187,-188,-189,-190,-191,-192,-193,-194,-195,-196,-197,-198,-199,-200,-228,-229,-230,-227,57,62,-204,-205,-167,47,47,-247,-170,-172,-174,-176,80,-203,-71,90,93,-222,47,113,142,-168,47,113,166,-248,-249,-251,-59,-72,47,-209,-211,93,-38,93,113,113,113,113,113,113,-39,-40,-41,-42,-43,-44,-301,142,-303,-305,-306,-309,-292,-293,-294,-295,-296,-297,113,142,260,113,113,113,-40,47,-250,-252,-201,113,-210,-212,93,-218,93,113,113,113,355,113,-113,-114,-115,-116,-117,-118,-119,-120,-121,-122,-123,113,113,113,113,363,364,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,-302,-304,142,142,-310,113,113,113,113,113,-319,-320,-321,113,-40,113,407,47,47,113,-58,-64,47,113,-202,-28,93,-45,-219,-220,93,113,-287,113,-298,142,-300,113,113,-318,-322,113,113,-40,-60,-65,113,-29,-36,93,-48,-53,-221,113,113,113,113,113,-299,142,142,142,113,113,-40,-76,-37,-54,-311,-313,-314,142,113,113,142,-316,142,-312,-315,-317,]),'(':([6,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,42,44,45,47,48,49,51,52,53,54,57,58,59,62,63,66,68,69,70,71,73,75,76,77,80,81,84,85,86,88,90,100,104,105,106,107,109,110,112,113,114,115,116,117,118,119,121,122,130,131,132,133,134,135,136,137,138,139,140,141,142,143,146,147,148,149,150,154,157,158,160,161,162,168,169,170,171,176,181,182,183,188,190,194,197,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,217,218,220,224,226,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,252,253,254,255,256,257,259,261,262,263,265,267,268,269,271,272,273,274,279,280,281,282,284,286,288,289,291,294,295,296,297,298,299,300,301,302,303,304,305,306,307,308,309,310,311,312,313,314,315,316,317,318,319,320,321,322,323,324,325,326,327,328,329,330,331,332,333,334,335,336,337,338,339,340,343,344,347,350,352,360,363,364,368,369,371,372,390,391,392,397,398,399,400,401,402,404,405,410,411,413,416,418,419,420,423,426,427,428,430,431,432,435,437,438,439,440,442,444,446,447,448,449,450,452,453,454,455,457,458,460,461,462,463,465,466,471,472,477,478,479,481,483,484,485,486,488,489,490,491,493,494,496,497,498,499,],[48,-169,-171,-173,-175,-181,-182,-183,-184,-185,-186,-187,-188,-189,-190,-191,-192,-193,-194,-195,-196,-197,-198,-199,-200,-228,-229,-230,-227,-167,72,48,-233,48,-247,-170,-172,-174,-176,-203,-71,88,-222,48,110,110,-168,48,110,72,-248,-249,-251,-59,-72,48,-209,-211,185,-38,110,214,220,220,224,226,110,-13,-7,-39,-40,-41,-42,-43,-44,-8,-9,-301,110,-303,-305,-306,-309,-292,-293,-294,-295,-296,-297,-7,224,255,256,257,110,259,110,-235,110,110,-40,-244,281,-234,-250,-252,-201,224,-210,-212,-218,224,110,224,110,-113,-114,-115,-116,-117,-118,-119,-120,-121,-122,-123,110,224,110,110,-19,-20,110,110,110,372,224,224,224,224,224,224,224,224,224,224,224,224,224,224,224,224,224,-302,-304,110,110,-310,110,110,110,110,110,-319,-320,-321,-236,110,-40,-237,110,-242,-245,-246,281,412,281,110,-58,-64,48,224,-202,426,-96,-97,-98,-99,-100,-103,-104,-105,-106,-109,-110,-124,-125,-126,-127,-128,-129,-134,-135,-136,-137,-138,-139,-142,-143,-144,-145,-146,-147,-148,-149,-150,-151,-152,-153,-154,-155,-160,-161,-162,-163,-164,-165,-132,-133,-28,-45,-219,-220,110,-287,-15,-17,-18,224,-10,372,372,-298,110,-300,450,110,110,-318,-322,-238,-243,-239,412,110,-278,-270,110,-40,-60,-65,110,-29,-36,-48,-53,-221,110,224,-14,-16,110,224,110,-299,110,110,110,110,110,-241,-240,-268,-40,-276,-267,-279,-271,-272,-275,-76,-37,-54,-311,-313,-314,110,-269,-274,-277,-273,110,-21,110,110,-316,110,-22,-312,-315,-317,]),'*':([6,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,42,48,49,51,52,53,54,57,58,62,63,66,68,69,70,71,76,77,80,81,84,85,86,90,100,102,104,105,106,107,108,109,110,112,113,114,115,116,117,118,119,121,122,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,149,154,158,160,161,168,171,176,181,182,183,188,190,194,197,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,217,218,219,220,221,222,223,224,225,226,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,252,253,254,255,256,257,259,261,262,263,267,268,271,281,282,284,286,288,289,291,340,343,344,347,350,352,360,363,364,368,369,372,385,386,387,388,389,390,391,392,398,399,400,401,411,418,419,420,423,426,427,428,430,431,432,435,437,438,439,440,442,443,444,445,446,447,448,449,450,452,457,466,471,472,477,478,479,481,488,489,490,491,493,494,496,497,498,499,],[49,-169,-171,-173,-175,-181,-182,-183,-184,-185,-186,-187,-188,-189,-190,-191,-192,-193,-194,-195,-196,-197,-198,-199,-200,-228,-229,-230,-227,-167,49,49,-170,-172,-174,-176,-203,-71,-222,49,115,115,-168,49,161,49,-251,-59,-72,49,-209,-211,-38,115,-46,-30,115,115,115,-49,115,115,-13,-7,-39,-40,-41,-42,-43,-44,-8,-9,244,-301,115,-303,-305,-306,-309,-292,-293,-294,-295,-296,-297,-7,115,115,115,268,115,-40,49,-252,-201,115,-210,-212,-218,115,115,115,115,-113,-114,-115,-116,-117,-118,-119,-120,-121,-122,-123,115,115,115,115,-19,-20,-31,115,-32,-33,-46,115,-34,115,49,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,-302,-304,115,115,-310,115,115,115,115,115,-319,-320,-321,115,-40,115,49,419,-58,-64,49,115,-202,-28,-45,-219,-220,115,-287,-15,-17,-18,115,-10,49,244,244,-50,-51,-52,-298,115,-300,115,115,-318,-322,457,115,-40,-60,-65,115,-29,-36,-48,-53,-221,115,115,-14,-16,115,115,-35,115,-47,-299,115,115,115,115,115,-40,-76,-37,-54,-311,-313,-314,115,115,-21,115,115,-316,115,-22,-312,-315,-317,]),'CONSTANT':([7,32,33,34,42,66,68,69,71,77,78,100,105,106,107,109,110,114,115,116,117,118,119,130,131,132,133,134,135,136,137,138,139,140,141,143,149,154,158,160,161,171,172,173,181,190,194,197,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,220,224,226,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,252,253,254,255,256,257,259,261,262,263,267,268,271,282,283,289,350,352,368,390,391,392,398,399,400,401,411,418,419,426,435,437,440,442,444,446,447,448,449,450,452,457,477,478,479,481,488,490,491,493,494,497,498,499,],[50,-228,-229,-230,-167,121,121,-168,121,-251,172,121,121,121,121,121,121,-39,-40,-41,-42,-43,-44,-301,121,-303,-305,-306,-309,-292,-293,-294,-295,-296,-297,121,121,121,121,121,-40,-252,-24,283,121,121,121,121,121,-113,-114,-115,-116,-117,-118,-119,-120,-121,-122,-123,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,-302,-304,121,121,-310,121,121,121,121,121,-319,-320,-321,121,-40,121,121,-25,121,121,-287,121,-298,121,-300,121,121,-318,-322,121,121,-40,121,121,121,121,121,121,-299,121,121,121,121,121,-40,-311,-313,-314,121,121,121,121,-316,121,-312,-315,-317,]),'[':([8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,44,47,49,51,52,53,54,57,58,62,73,75,76,77,80,81,85,86,90,100,104,112,113,121,122,142,157,162,168,169,170,171,176,182,183,188,195,196,217,218,229,265,269,272,273,274,279,280,281,284,286,291,340,343,344,347,350,353,355,360,363,364,369,371,372,402,404,405,410,413,416,420,423,427,428,430,431,432,436,438,439,444,453,454,455,458,460,461,462,463,465,466,471,472,483,484,485,486,489,490,496,],[-169,-171,-173,-175,-181,-182,-183,-184,-185,-186,-187,-188,-189,-190,-191,-192,-193,-194,-195,-196,-197,-198,-199,-200,-228,-229,-230,-227,71,-233,-247,-170,-172,-174,-176,-203,-71,-222,71,-248,-249,-251,-59,-72,-209,-211,-38,197,213,-13,-7,-8,-9,-7,-235,-244,282,-234,-250,-252,-201,-210,-212,-218,197,-288,-19,-20,282,-236,-237,-242,-245,-246,282,411,282,-58,-64,-202,-28,-45,-219,-220,197,-289,-291,-15,-17,-18,-10,282,282,-238,-243,-239,411,-278,-270,-60,-65,-29,-36,-48,-53,-221,-290,-14,-16,197,-241,-240,-268,-276,-267,-279,-271,-272,-275,-76,-37,-54,-269,-274,-277,-273,-21,197,-22,]),',':([8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,41,43,44,46,47,49,51,52,53,54,57,58,62,73,75,76,77,80,81,90,91,92,93,95,98,99,101,102,103,104,108,111,112,113,120,121,122,123,124,125,126,127,128,129,142,145,155,156,157,162,164,165,166,167,168,169,170,171,176,178,179,180,185,186,188,191,192,193,217,218,219,221,222,223,225,228,251,264,265,269,272,273,274,277,278,279,280,284,286,290,291,292,293,294,295,296,297,298,299,300,301,302,303,304,305,306,307,308,309,310,311,312,313,314,315,316,317,318,319,320,321,322,323,324,325,326,327,328,329,330,331,332,333,334,335,336,337,338,339,340,342,343,344,345,346,347,349,351,356,357,358,359,360,361,362,363,364,369,373,374,375,376,377,378,379,380,381,382,383,384,385,386,387,388,389,393,394,395,396,402,404,405,407,409,410,413,416,420,421,422,423,425,427,428,430,431,432,433,434,438,439,443,445,453,454,455,458,460,461,462,463,465,466,467,468,469,470,471,472,473,474,475,476,480,483,484,485,486,487,489,495,496,],[-169,-171,-173,-175,-181,-182,-183,-184,-185,-186,-187,-188,-189,-190,-191,-192,-193,-194,-195,-196,-197,-198,-199,-200,-228,-229,-230,-227,-179,70,-231,-177,-233,-247,-170,-172,-174,-176,-203,-71,-222,-232,-248,-249,-251,-59,-72,-38,189,-223,-225,-179,-180,-280,-107,-46,-101,-30,-49,-94,-13,-7,-91,-8,-9,-87,-83,-81,-73,-66,-61,-55,-7,254,-130,-178,-235,-244,275,276,-260,-255,-257,-234,-250,-252,-201,288,-213,-215,-77,341,-218,348,350,-283,-19,-20,-31,-32,-33,-46,-34,254,-166,254,-236,-237,-242,-245,-246,-258,-259,-264,-265,-58,-64,-216,-202,425,-78,-85,-96,-97,-98,-99,-100,-103,-104,-105,-106,-109,-110,-124,-125,-126,-127,-128,-129,-134,-135,-136,-137,-138,-139,-142,-143,-144,-145,-146,-147,-148,-149,-150,-151,-152,-153,-154,-155,-160,-161,-162,-163,-164,-165,-132,-133,-28,429,-45,-219,-224,-226,-220,-281,-284,-108,254,-95,254,-15,440,-26,-17,-18,-10,-92,-88,-84,-82,-74,-75,-67,-68,-69,-70,-62,-63,-56,-57,-50,-51,-52,-131,254,254,254,-238,-243,-239,-261,-256,-266,-278,-270,-60,-214,-217,-65,-79,-29,-36,-48,-53,-221,-282,-285,-14,-16,-35,-47,-241,-240,-268,-276,-267,-279,-271,-272,-275,-76,-80,488,-89,-93,-37,-54,-286,-102,-27,490,254,-269,-274,-277,-273,-86,-21,-90,-22,]),')':([8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,44,47,49,51,52,53,54,57,58,62,72,73,74,75,76,77,80,81,85,86,90,101,102,103,104,108,111,112,113,120,121,122,123,124,125,126,127,128,129,135,155,157,162,163,164,165,166,167,168,169,170,171,176,182,183,185,188,214,217,218,219,221,222,223,225,227,228,229,253,265,269,272,273,274,277,278,279,280,281,284,286,291,292,293,294,295,296,297,298,299,300,301,302,303,304,305,306,307,308,309,310,311,312,313,314,315,316,317,318,319,320,321,322,323,324,325,326,327,328,329,330,331,332,333,334,335,336,337,338,339,340,343,344,347,356,358,360,361,362,363,364,365,366,367,369,370,371,372,373,374,375,376,377,378,379,380,381,382,383,384,385,386,387,388,389,393,394,395,396,402,404,405,407,408,409,410,412,413,414,415,416,420,423,424,425,427,428,430,431,432,438,439,443,445,451,453,454,455,458,459,460,461,462,463,465,466,467,468,469,470,471,472,474,475,480,482,483,484,485,486,487,489,495,496,],[-169,-171,-173,-175,-181,-182,-183,-184,-185,-186,-187,-188,-189,-190,-191,-192,-193,-194,-195,-196,-197,-198,-199,-200,-228,-229,-230,-227,-231,-233,-247,-170,-172,-174,-176,-203,-71,-222,162,-232,169,-248,-249,-251,-59,-72,-209,-211,-38,-107,-46,-101,-30,-49,-94,-13,-7,-91,-8,-9,-87,-83,-81,-73,-66,-61,-55,-309,-130,-235,-244,273,274,-253,-260,-255,-257,-234,-250,-252,-201,-210,-212,-77,-218,360,-19,-20,-31,-32,-33,-46,-34,368,369,-262,-310,-236,-237,-242,-245,-246,-258,-259,-264,-265,413,-58,-64,-202,424,-78,-85,-96,-97,-98,-99,-100,-103,-104,-105,-106,-109,-110,-124,-125,-126,-127,-128,-129,-134,-135,-136,-137,-138,-139,-142,-143,-144,-145,-146,-147,-148,-149,-150,-151,-152,-153,-154,-155,-160,-161,-162,-163,-164,-165,-132,-133,-28,-45,-219,-220,-108,-95,-15,439,-26,-17,-18,441,442,443,-10,-263,-264,413,-92,-88,-84,-82,-74,-75,-67,-68,-69,-70,-62,-63,-56,-57,-50,-51,-52,-131,447,448,449,-238,-243,-239,-261,-254,-256,-266,458,-278,460,461,-270,-60,-65,466,-79,-29,-36,-48,-53,-221,-14,-16,-35,-47,481,-241,-240,-268,-276,485,-267,-279,-271,-272,-275,-76,-80,487,-89,-93,-37,-54,-102,-27,492,494,-269,-274,-277,-273,-86,-21,-90,-22,]),':':([17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,44,47,57,58,62,73,80,81,84,85,86,90,101,102,103,104,108,111,112,113,120,121,122,123,124,125,126,127,128,129,142,144,155,157,162,169,176,180,182,183,188,217,218,219,221,222,223,225,250,251,265,269,272,273,274,284,286,288,291,340,343,344,347,356,357,358,360,363,364,369,373,374,375,376,377,378,379,380,381,382,383,384,385,386,387,388,389,393,402,404,405,420,423,427,428,430,431,432,438,439,443,445,453,454,466,471,472,474,489,496,],[-186,-187,-188,-189,-190,-191,-192,-193,-194,-195,-196,-197,-198,-199,-200,-228,-229,-230,-231,-233,-203,-71,-222,-232,-59,-72,181,-209,-211,-38,-107,-46,-101,-30,-49,-94,-13,-7,-91,-8,-9,-87,-83,-81,-73,-66,-61,-55,249,252,-130,-235,-244,-234,-201,289,-210,-212,-218,-19,-20,-31,-32,-33,-46,-34,391,-166,-236,-237,-242,-245,-246,-58,-64,181,-202,-28,-45,-219,-220,-108,437,-95,-15,-17,-18,-10,-92,-88,-84,-82,-74,-75,-67,-68,-69,-70,-62,-63,-56,-57,-50,-51,-52,-131,-238,-243,-239,-60,-65,-29,-36,-48,-53,-221,-14,-16,-35,-47,-241,-240,-76,-37,-54,-102,-21,-22,]),']':([32,33,34,71,77,101,102,103,104,108,111,112,113,120,121,122,123,124,125,126,127,128,129,155,158,159,161,171,217,218,219,221,222,223,225,251,266,268,270,282,354,356,358,359,360,363,364,369,373,374,375,376,377,378,379,380,381,382,383,384,385,386,387,388,389,393,403,406,411,417,418,419,438,439,443,445,456,457,464,474,489,496,],[-228,-229,-230,157,-251,-107,-46,-101,-30,-49,-94,-13,-7,-91,-8,-9,-87,-83,-81,-73,-66,-61,-55,-130,265,269,272,-252,-19,-20,-31,-32,-33,-46,-34,-166,402,404,405,416,436,-108,-95,438,-15,-17,-18,-10,-92,-88,-84,-82,-74,-75,-67,-68,-69,-70,-62,-63,-56,-57,-50,-51,-52,-131,453,454,455,462,463,465,-14,-16,-35,-47,483,484,486,-102,-21,-22,]),'INC_OP':([32,33,34,42,66,68,69,71,77,100,104,105,106,107,109,110,112,113,114,115,116,117,118,119,121,122,130,131,132,133,134,135,136,137,138,139,140,141,142,143,149,154,158,160,161,171,181,190,194,197,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,217,218,220,224,226,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,252,253,254,255,256,257,259,261,262,263,267,268,271,282,289,350,352,360,363,364,368,369,390,391,392,398,399,400,401,411,418,419,426,435,437,438,439,440,442,444,446,447,448,449,450,452,457,477,478,479,481,488,489,490,491,493,494,496,497,498,499,],[-228,-229,-230,-167,105,105,-168,105,-251,105,217,105,105,105,105,105,-13,-7,-39,-40,-41,-42,-43,-44,-8,-9,-301,105,-303,-305,-306,-309,-292,-293,-294,-295,-296,-297,-7,105,105,105,105,105,-40,-252,105,105,105,105,105,-113,-114,-115,-116,-117,-118,-119,-120,-121,-122,-123,105,105,105,105,-19,-20,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,-302,-304,105,105,-310,105,105,105,105,105,-319,-320,-321,105,-40,105,105,105,105,-287,-15,-17,-18,105,-10,-298,105,-300,105,105,-318,-322,105,105,-40,105,105,105,-14,-16,105,105,105,-299,105,105,105,105,105,-40,-311,-313,-314,105,105,-21,105,105,-316,105,-22,-312,-315,-317,]),'DEC_OP':([32,33,34,42,66,68,69,71,77,100,104,105,106,107,109,110,112,113,114,115,116,117,118,119,121,122,130,131,132,133,134,135,136,137,138,139,140,141,142,143,149,154,158,160,161,171,181,190,194,197,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,217,218,220,224,226,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,252,253,254,255,256,257,259,261,262,263,267,268,271,282,289,350,352,360,363,364,368,369,390,391,392,398,399,400,401,411,418,419,426,435,437,438,439,440,442,444,446,447,448,449,450,452,457,477,478,479,481,488,489,490,491,493,494,496,497,498,499,],[-228,-229,-230,-167,106,106,-168,106,-251,106,218,106,106,106,106,106,-13,-7,-39,-40,-41,-42,-43,-44,-8,-9,-301,106,-303,-305,-306,-309,-292,-293,-294,-295,-296,-297,-7,106,106,106,106,106,-40,-252,106,106,106,106,106,-113,-114,-115,-116,-117,-118,-119,-120,-121,-122,-123,106,106,106,106,-19,-20,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,-302,-304,106,106,-310,106,106,106,106,106,-319,-320,-321,106,-40,106,106,106,106,-287,-15,-17,-18,106,-10,-298,106,-300,106,106,-318,-322,106,106,-40,106,106,106,-14,-16,106,106,106,-299,106,106,106,106,106,-40,-311,-313,-314,106,106,-21,106,106,-316,106,-22,-312,-315,-317,]),'SIZEOF':([32,33,34,42,66,68,69,71,77,100,105,106,107,109,110,114,115,116,117,118,119,130,131,132,133,134,135,136,137,138,139,140,141,143,149,154,158,160,161,171,181,190,194,197,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,220,224,226,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,252,253,254,255,256,257,259,261,262,263,267,268,271,282,289,350,352,368,390,391,392,398,399,400,401,411,418,419,426,435,437,440,442,444,446,447,448,449,450,452,457,477,478,479,481,488,490,491,493,494,497,498,499,],[-228,-229,-230,-167,109,109,-168,109,-251,109,109,109,109,109,109,-39,-40,-41,-42,-43,-44,-301,109,-303,-305,-306,-309,-292,-293,-294,-295,-296,-297,109,109,109,109,109,-40,-252,109,109,109,109,109,-113,-114,-115,-116,-117,-118,-119,-120,-121,-122,-123,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,-302,-304,109,109,-310,109,109,109,109,109,-319,-320,-321,109,-40,109,109,109,109,-287,109,-298,109,-300,109,109,-318,-322,109,109,-40,109,109,109,109,109,109,-299,109,109,109,109,109,-40,-311,-313,-314,109,109,109,109,-316,109,-312,-315,-317,]),'&':([32,33,34,42,66,68,69,71,77,100,102,104,105,106,107,108,109,110,112,113,114,115,116,117,118,119,121,122,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,149,154,158,160,161,171,181,190,194,197,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,217,218,219,220,221,222,223,224,225,226,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,252,253,254,255,256,257,259,261,262,263,267,268,271,282,289,350,352,360,363,364,368,369,375,376,377,378,379,380,381,382,383,384,385,386,387,388,389,390,391,392,398,399,400,401,411,418,419,426,435,437,438,439,440,442,443,444,445,446,447,448,449,450,452,457,477,478,479,481,488,489,490,491,493,494,496,497,498,499,],[-228,-229,-230,-167,114,114,-168,114,-251,114,-46,-30,114,114,114,-49,114,114,-13,-7,-39,-40,-41,-42,-43,-44,-8,-9,233,-81,-73,-66,-61,-55,-301,114,-303,-305,-306,-309,-292,-293,-294,-295,-296,-297,-7,114,114,114,114,114,-40,-252,114,114,114,114,114,-113,-114,-115,-116,-117,-118,-119,-120,-121,-122,-123,114,114,114,114,-19,-20,-31,114,-32,-33,-46,114,-34,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,-302,-304,114,114,-310,114,114,114,114,114,-319,-320,-321,114,-40,114,114,114,114,-287,-15,-17,-18,114,-10,233,-82,-74,-75,-67,-68,-69,-70,-62,-63,-56,-57,-50,-51,-52,-298,114,-300,114,114,-318,-322,114,114,-40,114,114,114,-14,-16,114,114,-35,114,-47,-299,114,114,114,114,114,-40,-311,-313,-314,114,114,-21,114,114,-316,114,-22,-312,-315,-317,]),'+':([32,33,34,42,66,68,69,71,77,100,102,104,105,106,107,108,109,110,112,113,114,115,116,117,118,119,121,122,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,149,154,158,160,161,171,181,190,194,197,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,217,218,219,220,221,222,223,224,225,226,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,252,253,254,255,256,257,259,261,262,263,267,268,271,282,289,350,352,360,363,364,368,369,383,384,385,386,387,388,389,390,391,392,398,399,400,401,411,418,419,426,435,437,438,439,440,442,443,444,445,446,447,448,449,450,452,457,477,478,479,481,488,489,490,491,493,494,496,497,498,499,],[-228,-229,-230,-167,116,116,-168,116,-251,116,-46,-30,116,116,116,-49,116,116,-13,-7,-39,-40,-41,-42,-43,-44,-8,-9,242,-55,-301,116,-303,-305,-306,-309,-292,-293,-294,-295,-296,-297,-7,116,116,116,116,116,-40,-252,116,116,116,116,116,-113,-114,-115,-116,-117,-118,-119,-120,-121,-122,-123,116,116,116,116,-19,-20,-31,116,-32,-33,-46,116,-34,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,-302,-304,116,116,-310,116,116,116,116,116,-319,-320,-321,116,-40,116,116,116,116,-287,-15,-17,-18,116,-10,242,242,-56,-57,-50,-51,-52,-298,116,-300,116,116,-318,-322,116,116,-40,116,116,116,-14,-16,116,116,-35,116,-47,-299,116,116,116,116,116,-40,-311,-313,-314,116,116,-21,116,116,-316,116,-22,-312,-315,-317,]),'-':([32,33,34,42,66,68,69,71,77,100,102,104,105,106,107,108,109,110,112,113,114,115,116,117,118,119,121,122,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,149,154,158,160,161,171,181,190,194,197,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,217,218,219,220,221,222,223,224,225,226,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,252,253,254,255,256,257,259,261,262,263,267,268,271,282,289,350,352,360,363,364,368,369,383,384,385,386,387,388,389,390,391,392,398,399,400,401,411,418,419,426,435,437,438,439,440,442,443,444,445,446,447,448,449,450,452,457,477,478,479,481,488,489,490,491,493,494,496,497,498,499,],[-228,-229,-230,-167,117,117,-168,117,-251,117,-46,-30,117,117,117,-49,117,117,-13,-7,-39,-40,-41,-42,-43,-44,-8,-9,243,-55,-301,117,-303,-305,-306,-309,-292,-293,-294,-295,-296,-297,-7,117,117,117,117,117,-40,-252,117,117,117,117,117,-113,-114,-115,-116,-117,-118,-119,-120,-121,-122,-123,117,117,117,117,-19,-20,-31,117,-32,-33,-46,117,-34,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,-302,-304,117,117,-310,117,117,117,117,117,-319,-320,-321,117,-40,117,117,117,117,-287,-15,-17,-18,117,-10,243,243,-56,-57,-50,-51,-52,-298,117,-300,117,117,-318,-322,117,117,-40,117,117,117,-14,-16,117,117,-35,117,-47,-299,117,117,117,117,117,-40,-311,-313,-314,117,117,-21,117,117,-316,117,-22,-312,-315,-317,]),'~':([32,33,34,42,66,68,69,71,77,100,105,106,107,109,110,114,115,116,117,118,119,130,131,132,133,134,135,136,137,138,139,140,141,143,149,154,158,160,161,171,181,190,194,197,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,220,224,226,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,252,253,254,255,256,257,259,261,262,263,267,268,271,282,289,350,352,368,390,391,392,398,399,400,401,411,418,419,426,435,437,440,442,444,446,447,448,449,450,452,457,477,478,479,481,488,490,491,493,494,497,498,499,],[-228,-229,-230,-167,118,118,-168,118,-251,118,118,118,118,118,118,-39,-40,-41,-42,-43,-44,-301,118,-303,-305,-306,-309,-292,-293,-294,-295,-296,-297,118,118,118,118,118,-40,-252,118,118,118,118,118,-113,-114,-115,-116,-117,-118,-119,-120,-121,-122,-123,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,-302,-304,118,118,-310,118,118,118,118,118,-319,-320,-321,118,-40,118,118,118,118,-287,118,-298,118,-300,118,118,-318,-322,118,118,-40,118,118,118,118,118,118,-299,118,118,118,118,118,-40,-311,-313,-314,118,118,118,118,-316,118,-312,-315,-317,]),'!':([32,33,34,42,66,68,69,71,77,100,105,106,107,109,110,114,115,116,117,118,119,130,131,132,133,134,135,136,137,138,139,140,141,143,149,154,158,160,161,171,181,190,194,197,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,220,224,226,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,252,253,254,255,256,257,259,261,262,263,267,268,271,282,289,350,352,368,390,391,392,398,399,400,401,411,418,419,426,435,437,440,442,444,446,447,448,449,450,452,457,477,478,479,481,488,490,491,493,494,497,498,499,],[-228,-229,-230,-167,119,119,-168,119,-251,119,119,119,119,119,119,-39,-40,-41,-42,-43,-44,-301,119,-303,-305,-306,-309,-292,-293,-294,-295,-296,-297,119,119,119,119,119,-40,-252,119,119,119,119,119,-113,-114,-115,-116,-117,-118,-119,-120,-121,-122,-123,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,-302,-304,119,119,-310,119,119,119,119,119,-319,-320,-321,119,-40,119,119,119,119,-287,119,-298,119,-300,119,119,-318,-322,119,119,-40,119,119,119,119,119,119,-299,119,119,119,119,119,-40,-311,-313,-314,119,119,119,119,-316,119,-312,-315,-317,]),'STRING_LITERAL':([32,33,34,42,50,66,68,69,71,77,100,105,106,107,109,110,114,115,116,117,118,119,130,131,132,133,134,135,136,137,138,139,140,141,143,149,154,158,160,161,171,181,190,194,197,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,220,224,226,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,252,253,254,255,256,257,259,261,262,263,267,268,271,282,289,350,352,368,390,391,392,398,399,400,401,411,418,419,426,435,437,440,442,444,446,447,448,449,450,452,457,477,478,479,481,488,490,491,493,494,497,498,499,],[-228,-229,-230,-167,78,122,122,-168,122,-251,122,122,122,122,122,122,-39,-40,-41,-42,-43,-44,-301,122,-303,-305,-306,-309,-292,-293,-294,-295,-296,-297,122,122,122,122,122,-40,-252,122,122,122,122,122,-113,-114,-115,-116,-117,-118,-119,-120,-121,-122,-123,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,-302,-304,122,122,-310,122,122,122,122,122,-319,-320,-321,122,-40,122,122,122,122,-287,122,-298,122,-300,122,122,-318,-322,122,122,-40,122,122,122,122,122,122,-299,122,122,122,122,122,-40,-311,-313,-314,122,122,122,122,-316,122,-312,-315,-317,]),'{':([36,37,38,39,41,42,44,47,55,57,58,60,62,64,66,67,68,69,73,80,81,90,97,100,130,131,132,133,134,135,136,137,138,139,140,141,149,157,162,169,194,247,248,249,252,253,261,262,263,265,269,272,273,274,350,352,368,390,391,392,400,401,402,404,405,435,441,442,443,444,446,447,448,449,453,454,466,477,478,479,481,490,491,493,494,497,498,499,],[56,61,-204,-205,68,-167,-231,-233,79,87,-71,89,94,68,100,-307,68,-168,-232,175,-72,187,-308,100,-301,68,-303,-305,-306,-309,-292,-293,-294,-295,-296,-297,68,-235,-244,-234,100,-302,-304,68,68,-310,-319,-320,-321,-236,-237,-242,-245,-246,100,-287,444,-298,68,-300,-318,-322,-238,-243,-239,100,444,444,444,100,-299,68,68,68,-241,-240,-76,-311,-313,-314,68,100,68,-316,68,-312,-315,-317,]),'__ATTRIBUTE__':([36,37,38,39,55,58,60,81,176,188,286,291,343,344,347,423,430,431,432,466,472,],[59,59,-204,-205,59,-71,59,-72,59,59,59,59,59,59,59,59,59,59,59,-76,59,]),'=':([41,44,47,73,93,95,102,104,112,113,121,122,142,157,162,169,195,196,217,218,219,221,222,223,225,265,269,272,273,274,353,355,360,363,364,369,402,404,405,436,438,439,443,445,453,454,489,496,],[66,-231,-233,-232,190,66,200,-30,-13,-7,-8,-9,-7,-235,-244,-234,352,-288,-19,-20,-31,-32,-33,-46,-34,-236,-237,-242,-245,-246,-289,-291,-15,-17,-18,-10,-238,-243,-239,-290,-14,-16,-35,-47,-241,-240,-21,-22,]),'}':([42,68,69,82,83,91,92,93,99,101,102,103,104,108,111,112,113,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,174,177,184,186,189,191,192,193,217,218,219,221,222,223,225,247,248,251,253,261,262,263,285,287,341,342,345,346,348,349,350,351,356,358,360,363,364,369,373,374,375,376,377,378,379,380,381,382,383,384,385,386,387,388,389,390,392,400,401,429,433,434,438,439,443,445,446,473,474,476,477,478,479,489,490,493,496,497,498,499,],[-167,130,-168,176,-206,188,-223,-225,-280,-107,-46,-101,-30,-49,-94,-13,-7,-91,-8,-9,-87,-83,-81,-73,-66,-61,-55,-301,247,-303,-305,-306,-309,-292,-293,-294,-295,-296,-297,284,-207,291,340,344,347,349,-283,-19,-20,-31,-32,-33,-46,-34,-302,-304,-166,-310,-319,-320,-321,420,-208,427,428,-224,-226,432,-281,433,-284,-108,-95,-15,-17,-18,-10,-92,-88,-84,-82,-74,-75,-67,-68,-69,-70,-62,-63,-56,-57,-50,-51,-52,-298,-300,-318,-322,471,-282,-285,-14,-16,-35,-47,-299,-286,-102,489,-311,-313,-314,-21,496,-316,-22,-312,-315,-317,]),'CASE':([42,68,69,130,131,132,133,134,135,136,137,138,139,140,141,149,247,248,249,252,253,261,262,263,390,391,392,400,401,446,447,448,449,477,478,479,481,491,493,494,497,498,499,],[-167,143,-168,-301,143,-303,-305,-306,-309,-292,-293,-294,-295,-296,-297,143,-302,-304,143,143,-310,-319,-320,-321,-298,143,-300,-318,-322,-299,143,143,143,-311,-313,-314,143,143,-316,143,-312,-315,-317,]),'DEFAULT':([42,68,69,130,131,132,133,134,135,136,137,138,139,140,141,149,247,248,249,252,253,261,262,263,390,391,392,400,401,446,447,448,449,477,478,479,481,491,493,494,497,498,499,],[-167,144,-168,-301,144,-303,-305,-306,-309,-292,-293,-294,-295,-296,-297,144,-302,-304,144,144,-310,-319,-320,-321,-298,144,-300,-318,-322,-299,144,144,144,-311,-313,-314,144,144,-316,144,-312,-315,-317,]),'IF':([42,68,69,130,131,132,133,134,135,136,137,138,139,140,141,149,247,248,249,252,253,261,262,263,390,391,392,400,401,446,447,448,449,477,478,479,481,491,493,494,497,498,499,],[-167,146,-168,-301,146,-303,-305,-306,-309,-292,-293,-294,-295,-296,-297,146,-302,-304,146,146,-310,-319,-320,-321,-298,146,-300,-318,-322,-299,146,146,146,-311,-313,-314,146,146,-316,146,-312,-315,-317,]),'SWITCH':([42,68,69,130,131,132,133,134,135,136,137,138,139,140,141,149,247,248,249,252,253,261,262,263,390,391,392,400,401,446,447,448,449,477,478,479,481,491,493,494,497,498,499,],[-167,147,-168,-301,147,-303,-305,-306,-309,-292,-293,-294,-295,-296,-297,147,-302,-304,147,147,-310,-319,-320,-321,-298,147,-300,-318,-322,-299,147,147,147,-311,-313,-314,147,147,-316,147,-312,-315,-317,]),'WHILE':([42,68,69,130,131,132,133,134,135,136,137,138,139,140,141,149,247,248,249,252,253,258,261,262,263,390,391,392,400,401,446,447,448,449,477,478,479,481,491,493,494,497,498,499,],[-167,148,-168,-301,148,-303,-305,-306,-309,-292,-293,-294,-295,-296,-297,148,-302,-304,148,148,-310,397,-319,-320,-321,-298,148,-300,-318,-322,-299,148,148,148,-311,-313,-314,148,148,-316,148,-312,-315,-317,]),'DO':([42,68,69,130,131,132,133,134,135,136,137,138,139,140,141,149,247,248,249,252,253,261,262,263,390,391,392,400,401,446,447,448,449,477,478,479,481,491,493,494,497,498,499,],[-167,149,-168,-301,149,-303,-305,-306,-309,-292,-293,-294,-295,-296,-297,149,-302,-304,149,149,-310,-319,-320,-321,-298,149,-300,-318,-322,-299,149,149,149,-311,-313,-314,149,149,-316,149,-312,-315,-317,]),'FOR':([42,68,69,130,131,132,133,134,135,136,137,138,139,140,141,149,247,248,249,252,253,261,262,263,390,391,392,400,401,446,447,448,449,477,478,479,481,491,493,494,497,498,499,],[-167,150,-168,-301,150,-303,-305,-306,-309,-292,-293,-294,-295,-296,-297,150,-302,-304,150,150,-310,-319,-320,-321,-298,150,-300,-318,-322,-299,150,150,150,-311,-313,-314,150,150,-316,150,-312,-315,-317,]),'GOTO':([42,68,69,130,131,132,133,134,135,136,137,138,139,140,141,149,247,248,249,252,253,261,262,263,390,391,392,400,401,446,447,448,449,477,478,479,481,491,493,494,497,498,499,],[-167,151,-168,-301,151,-303,-305,-306,-309,-292,-293,-294,-295,-296,-297,151,-302,-304,151,151,-310,-319,-320,-321,-298,151,-300,-318,-322,-299,151,151,151,-311,-313,-314,151,151,-316,151,-312,-315,-317,]),'CONTINUE':([42,68,69,130,131,132,133,134,135,136,137,138,139,140,141,149,247,248,249,252,253,261,262,263,390,391,392,400,401,446,447,448,449,477,478,479,481,491,493,494,497,498,499,],[-167,152,-168,-301,152,-303,-305,-306,-309,-292,-293,-294,-295,-296,-297,152,-302,-304,152,152,-310,-319,-320,-321,-298,152,-300,-318,-322,-299,152,152,152,-311,-313,-314,152,152,-316,152,-312,-315,-317,]),'BREAK':([42,68,69,130,131,132,133,134,135,136,137,138,139,140,141,149,247,248,249,252,253,261,262,263,390,391,392,400,401,446,447,448,449,477,478,479,481,491,493,494,497,498,499,],[-167,153,-168,-301,153,-303,-305,-306,-309,-292,-293,-294,-295,-296,-297,153,-302,-304,153,153,-310,-319,-320,-321,-298,153,-300,-318,-322,-299,153,153,153,-311,-313,-314,153,153,-316,153,-312,-315,-317,]),'RETURN':([42,68,69,130,131,132,133,134,135,136,137,138,139,140,141,149,247,248,249,252,253,261,262,263,390,391,392,400,401,446,447,448,449,477,478,479,481,491,493,494,497,498,499,],[-167,154,-168,-301,154,-303,-305,-306,-309,-292,-293,-294,-295,-296,-297,154,-302,-304,154,154,-310,-319,-320,-321,-298,154,-300,-318,-322,-299,154,154,154,-311,-313,-314,154,154,-316,154,-312,-315,-317,]),'.':([100,104,112,113,121,122,142,195,196,217,218,350,353,355,360,363,364,369,436,438,439,444,489,490,496,],[198,215,-13,-7,-8,-9,-7,198,-288,-19,-20,198,-289,-291,-15,-17,-18,-10,-290,-14,-16,198,-21,198,-22,]),'/':([102,104,108,112,113,121,122,129,142,217,218,219,221,222,223,225,360,363,364,369,385,386,387,388,389,438,439,443,445,489,496,],[-46,-30,-49,-13,-7,-8,-9,245,-7,-19,-20,-31,-32,-33,-46,-34,-15,-17,-18,-10,245,245,-50,-51,-52,-14,-16,-35,-47,-21,-22,]),'%':([102,104,108,112,113,121,122,129,142,217,218,219,221,222,223,225,360,363,364,369,385,386,387,388,389,438,439,443,445,489,496,],[-46,-30,-49,-13,-7,-8,-9,246,-7,-19,-20,-31,-32,-33,-46,-34,-15,-17,-18,-10,246,246,-50,-51,-52,-14,-16,-35,-47,-21,-22,]),'LEFT_OP':([102,104,108,112,113,121,122,127,128,129,142,217,218,219,221,222,223,225,360,363,364,369,379,380,381,382,383,384,385,386,387,388,389,438,439,443,445,489,496,],[-46,-30,-49,-13,-7,-8,-9,240,-61,-55,-7,-19,-20,-31,-32,-33,-46,-34,-15,-17,-18,-10,240,240,240,240,-62,-63,-56,-57,-50,-51,-52,-14,-16,-35,-47,-21,-22,]),'RIGHT_OP':([102,104,108,112,113,121,122,127,128,129,142,217,218,219,221,222,223,225,360,363,364,369,379,380,381,382,383,384,385,386,387,388,389,438,439,443,445,489,496,],[-46,-30,-49,-13,-7,-8,-9,241,-61,-55,-7,-19,-20,-31,-32,-33,-46,-34,-15,-17,-18,-10,241,241,241,241,-62,-63,-56,-57,-50,-51,-52,-14,-16,-35,-47,-21,-22,]),'<':([102,104,108,112,113,121,122,126,127,128,129,142,217,218,219,221,222,223,225,360,363,364,369,377,378,379,380,381,382,383,384,385,386,387,388,389,438,439,443,445,489,496,],[-46,-30,-49,-13,-7,-8,-9,236,-66,-61,-55,-7,-19,-20,-31,-32,-33,-46,-34,-15,-17,-18,-10,236,236,-67,-68,-69,-70,-62,-63,-56,-57,-50,-51,-52,-14,-16,-35,-47,-21,-22,]),'>':([102,104,108,112,113,121,122,126,127,128,129,142,217,218,219,221,222,223,225,360,363,364,369,377,378,379,380,381,382,383,384,385,386,387,388,389,438,439,443,445,489,496,],[-46,-30,-49,-13,-7,-8,-9,237,-66,-61,-55,-7,-19,-20,-31,-32,-33,-46,-34,-15,-17,-18,-10,237,237,-67,-68,-69,-70,-62,-63,-56,-57,-50,-51,-52,-14,-16,-35,-47,-21,-22,]),'LE_OP':([102,104,108,112,113,121,122,126,127,128,129,142,217,218,219,221,222,223,225,360,363,364,369,377,378,379,380,381,382,383,384,385,386,387,388,389,438,439,443,445,489,496,],[-46,-30,-49,-13,-7,-8,-9,238,-66,-61,-55,-7,-19,-20,-31,-32,-33,-46,-34,-15,-17,-18,-10,238,238,-67,-68,-69,-70,-62,-63,-56,-57,-50,-51,-52,-14,-16,-35,-47,-21,-22,]),'GE_OP':([102,104,108,112,113,121,122,126,127,128,129,142,217,218,219,221,222,223,225,360,363,364,369,377,378,379,380,381,382,383,384,385,386,387,388,389,438,439,443,445,489,496,],[-46,-30,-49,-13,-7,-8,-9,239,-66,-61,-55,-7,-19,-20,-31,-32,-33,-46,-34,-15,-17,-18,-10,239,239,-67,-68,-69,-70,-62,-63,-56,-57,-50,-51,-52,-14,-16,-35,-47,-21,-22,]),'EQ_OP':([102,104,108,112,113,121,122,125,126,127,128,129,142,217,218,219,221,222,223,225,360,363,364,369,376,377,378,379,380,381,382,383,384,385,386,387,388,389,438,439,443,445,489,496,],[-46,-30,-49,-13,-7,-8,-9,234,-73,-66,-61,-55,-7,-19,-20,-31,-32,-33,-46,-34,-15,-17,-18,-10,234,-74,-75,-67,-68,-69,-70,-62,-63,-56,-57,-50,-51,-52,-14,-16,-35,-47,-21,-22,]),'NE_OP':([102,104,108,112,113,121,122,125,126,127,128,129,142,217,218,219,221,222,223,225,360,363,364,369,376,377,378,379,380,381,382,383,384,385,386,387,388,389,438,439,443,445,489,496,],[-46,-30,-49,-13,-7,-8,-9,235,-73,-66,-61,-55,-7,-19,-20,-31,-32,-33,-46,-34,-15,-17,-18,-10,235,-74,-75,-67,-68,-69,-70,-62,-63,-56,-57,-50,-51,-52,-14,-16,-35,-47,-21,-22,]),'^':([102,104,108,112,113,121,122,123,124,125,126,127,128,129,142,217,218,219,221,222,223,225,360,363,364,369,374,375,376,377,378,379,380,381,382,383,384,385,386,387,388,389,438,439,443,445,489,496,],[-46,-30,-49,-13,-7,-8,-9,232,-83,-81,-73,-66,-61,-55,-7,-19,-20,-31,-32,-33,-46,-34,-15,-17,-18,-10,232,-84,-82,-74,-75,-67,-68,-69,-70,-62,-63,-56,-57,-50,-51,-52,-14,-16,-35,-47,-21,-22,]),'|':([102,104,108,112,113,120,121,122,123,124,125,126,127,128,129,142,217,218,219,221,222,223,225,360,363,364,369,373,374,375,376,377,378,379,380,381,382,383,384,385,386,387,388,389,438,439,443,445,489,496,],[-46,-30,-49,-13,-7,231,-8,-9,-87,-83,-81,-73,-66,-61,-55,-7,-19,-20,-31,-32,-33,-46,-34,-15,-17,-18,-10,231,-88,-84,-82,-74,-75,-67,-68,-69,-70,-62,-63,-56,-57,-50,-51,-52,-14,-16,-35,-47,-21,-22,]),'AND_OP':([102,104,108,111,112,113,120,121,122,123,124,125,126,127,128,129,142,217,218,219,221,222,223,225,358,360,363,364,369,373,374,375,376,377,378,379,380,381,382,383,384,385,386,387,388,389,438,439,443,445,489,496,],[-46,-30,-49,230,-13,-7,-91,-8,-9,-87,-83,-81,-73,-66,-61,-55,-7,-19,-20,-31,-32,-33,-46,-34,230,-15,-17,-18,-10,-92,-88,-84,-82,-74,-75,-67,-68,-69,-70,-62,-63,-56,-57,-50,-51,-52,-14,-16,-35,-47,-21,-22,]),'?':([102,103,104,108,111,112,113,120,121,122,123,124,125,126,127,128,129,142,217,218,219,221,222,223,225,358,360,363,364,369,373,374,375,376,377,378,379,380,381,382,383,384,385,386,387,388,389,438,439,443,445,489,496,],[-46,211,-30,-49,-94,-13,-7,-91,-8,-9,-87,-83,-81,-73,-66,-61,-55,-7,-19,-20,-31,-32,-33,-46,-34,-95,-15,-17,-18,-10,-92,-88,-84,-82,-74,-75,-67,-68,-69,-70,-62,-63,-56,-57,-50,-51,-52,-14,-16,-35,-47,-21,-22,]),'OR_OP':([102,103,104,108,111,112,113,120,121,122,123,124,125,126,127,128,129,142,217,218,219,221,222,223,225,358,360,363,364,369,373,374,375,376,377,378,379,380,381,382,383,384,385,386,387,388,389,438,439,443,445,489,496,],[-46,212,-30,-49,-94,-13,-7,-91,-8,-9,-87,-83,-81,-73,-66,-61,-55,-7,-19,-20,-31,-32,-33,-46,-34,-95,-15,-17,-18,-10,-92,-88,-84,-82,-74,-75,-67,-68,-69,-70,-62,-63,-56,-57,-50,-51,-52,-14,-16,-35,-47,-21,-22,]),'MUL_ASSIGN':([102,104,112,113,121,122,142,217,218,219,221,222,223,225,360,363,364,369,438,439,443,445,489,496,],[201,-30,-13,-7,-8,-9,-7,-19,-20,-31,-32,-33,-46,-34,-15,-17,-18,-10,-14,-16,-35,-47,-21,-22,]),'DIV_ASSIGN':([102,104,112,113,121,122,142,217,218,219,221,222,223,225,360,363,364,369,438,439,443,445,489,496,],[202,-30,-13,-7,-8,-9,-7,-19,-20,-31,-32,-33,-46,-34,-15,-17,-18,-10,-14,-16,-35,-47,-21,-22,]),'MOD_ASSIGN':([102,104,112,113,121,122,142,217,218,219,221,222,223,225,360,363,364,369,438,439,443,445,489,496,],[203,-30,-13,-7,-8,-9,-7,-19,-20,-31,-32,-33,-46,-34,-15,-17,-18,-10,-14,-16,-35,-47,-21,-22,]),'ADD_ASSIGN':([102,104,112,113,121,122,142,217,218,219,221,222,223,225,360,363,364,369,438,439,443,445,489,496,],[204,-30,-13,-7,-8,-9,-7,-19,-20,-31,-32,-33,-46,-34,-15,-17,-18,-10,-14,-16,-35,-47,-21,-22,]),'SUB_ASSIGN':([102,104,112,113,121,122,142,217,218,219,221,222,223,225,360,363,364,369,438,439,443,445,489,496,],[205,-30,-13,-7,-8,-9,-7,-19,-20,-31,-32,-33,-46,-34,-15,-17,-18,-10,-14,-16,-35,-47,-21,-22,]),'LEFT_ASSIGN':([102,104,112,113,121,122,142,217,218,219,221,222,223,225,360,363,364,369,438,439,443,445,489,496,],[206,-30,-13,-7,-8,-9,-7,-19,-20,-31,-32,-33,-46,-34,-15,-17,-18,-10,-14,-16,-35,-47,-21,-22,]),'RIGHT_ASSIGN':([102,104,112,113,121,122,142,217,218,219,221,222,223,225,360,363,364,369,438,439,443,445,489,496,],[207,-30,-13,-7,-8,-9,-7,-19,-20,-31,-32,-33,-46,-34,-15,-17,-18,-10,-14,-16,-35,-47,-21,-22,]),'AND_ASSIGN':([102,104,112,113,121,122,142,217,218,219,221,222,223,225,360,363,364,369,438,439,443,445,489,496,],[208,-30,-13,-7,-8,-9,-7,-19,-20,-31,-32,-33,-46,-34,-15,-17,-18,-10,-14,-16,-35,-47,-21,-22,]),'XOR_ASSIGN':([102,104,112,113,121,122,142,217,218,219,221,222,223,225,360,363,364,369,438,439,443,445,489,496,],[209,-30,-13,-7,-8,-9,-7,-19,-20,-31,-32,-33,-46,-34,-15,-17,-18,-10,-14,-16,-35,-47,-21,-22,]),'OR_ASSIGN':([102,104,112,113,121,122,142,217,218,219,221,222,223,225,360,363,364,369,438,439,443,445,489,496,],[210,-30,-13,-7,-8,-9,-7,-19,-20,-31,-32,-33,-46,-34,-15,-17,-18,-10,-14,-16,-35,-47,-21,-22,]),'PTR_OP':([104,112,113,121,122,142,217,218,360,363,364,369,438,439,489,496,],[216,-13,-7,-8,-9,-7,-19,-20,-15,-17,-18,-10,-14,-16,-21,-22,]),'ELSE':([130,135,136,137,138,139,140,141,247,253,261,262,263,390,392,400,401,446,477,478,479,493,497,498,499,],[-301,-309,-292,-293,-294,-295,-296,-297,-302,-310,-319,-320,-321,-298,-300,-318,-322,-299,491,-313,-314,-316,-312,-315,-317,]),'DEPRECATED':([185,425,],[300,300,]),'__DEPRECATED__':([185,425,],[301,301,]),'UNAVAILABLE':([185,425,],[302,302,]),'__UNAVAILABLE__':([185,425,],[303,303,]),'ACCESS':([185,425,],[304,304,]),'__ACCESS__':([185,425,],[305,305,]),'COLD':([185,425,],[306,306,]),'__COLD__':([185,425,],[307,307,]),'HOT':([185,425,],[308,308,]),'__HOT__':([185,425,],[309,309,]),'UNUSED':([185,425,],[310,310,]),'__UNUSED__':([185,425,],[311,311,]),'ALIGNED':([185,425,],[312,312,]),'__ALIGNED__':([185,425,],[313,313,]),'ALLOC_SIZE':([185,425,],[314,314,]),'__ALLOC_SIZE__':([185,425,],[315,315,]),'COPY':([185,425,],[316,316,]),'__COPY__':([185,425,],[317,317,]),'DESIGNATED_INIT':([185,425,],[318,318,]),'__DESIGNATED_INIT__':([185,425,],[319,319,]),'MAY_ALIAS':([185,425,],[320,320,]),'__MAY_ALIAS__':([185,425,],[321,321,]),'MODE':([185,425,],[322,322,]),'__MODE__':([185,425,],[323,323,]),'OBJC_ROOT_CLASS':([185,425,],[324,324,]),'__OBJC_ROOT_CLASS__':([185,425,],[325,325,]),'PACKED':([185,425,],[326,326,]),'__PACKED__':([185,425,],[327,327,]),'SCALAR_STORAGE_ORDER':([185,425,],[328,328,]),'__SCALAR_STORAGE_ORDER__':([185,425,],[329,329,]),'TRANSPARENT_UNION':([185,425,],[330,330,]),'__TRANSPARENT_UNION__':([185,425,],[331,331,]),'VECTOR_SIZE':([185,425,],[332,332,]),'__VECTOR_SIZE__':([185,425,],[333,333,]),'VISIBILITY':([185,425,],[334,334,]),'__VISIBILITY__':([185,425,],[335,335,]),'WARN_IF_NOT_ALIGNED':([185,425,],[336,336,]),'__WARN_IF_NOT_ALIGNED__':([185,425,],[337,337,]),'FALLTHROUGH':([185,425,],[338,338,]),'__FALLTHROUGH__':([185,425,],[339,339,]),'ELLIPSIS':([276,],[408,]),}
+
+_lr_action = {}
+for _k, _v in _lr_action_items.items():
+   for _x,_y in zip(_v[0],_v[1]):
+      if not _x in _lr_action:  _lr_action[_x] = {}
+      _lr_action[_x][_k] = _y
+del _lr_action_items
+
+_lr_goto_items = {'translation_unit':([0,],[1,]),'external_declaration':([0,1,],[2,40,]),'function_definition':([0,1,],[3,3,]),'declaration':([0,1,41,64,68,131,259,],[4,4,67,97,133,133,399,]),'linemarker':([0,1,],[5,5,]),'declaration_specifiers':([0,1,8,9,10,11,41,64,68,72,131,259,276,281,372,412,],[6,6,51,52,53,54,63,63,63,168,63,63,168,168,168,168,]),'storage_class_specifier':([0,1,8,9,10,11,41,64,68,72,131,259,276,281,372,412,],[8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,]),'type_specifier':([0,1,8,9,10,11,41,56,64,68,72,79,82,85,86,87,110,131,174,175,184,220,224,226,259,276,281,285,372,412,],[9,9,9,9,9,9,9,85,9,9,9,85,85,85,85,85,85,9,85,85,85,85,85,85,9,9,9,85,9,9,]),'type_qualifier':([0,1,8,9,10,11,41,49,56,64,68,71,72,76,79,82,85,86,87,110,131,158,160,174,175,184,220,224,226,259,271,276,281,282,285,372,412,418,],[10,10,10,10,10,10,10,77,86,10,10,77,10,171,86,86,86,86,86,86,10,171,77,86,86,86,86,86,86,10,171,10,10,77,86,10,10,171,]),'function_specifier':([0,1,8,9,10,11,41,64,68,72,131,259,276,281,372,412,],[11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,]),'struct_or_union_specifier':([0,1,8,9,10,11,41,56,64,68,72,79,82,85,86,87,110,131,174,175,184,220,224,226,259,276,281,285,372,412,],[29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,]),'enum_specifier':([0,1,8,9,10,11,41,56,64,68,72,79,82,85,86,87,110,131,174,175,184,220,224,226,259,276,281,285,372,412,],[30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,]),'struct_or_union':([0,1,8,9,10,11,41,56,64,68,72,79,82,85,86,87,110,131,174,175,184,220,224,226,259,276,281,285,372,412,],[36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,]),'declarator':([6,48,63,70,84,168,281,288,],[41,74,95,95,180,277,74,180,]),'init_declarator_list':([6,63,],[43,43,]),'direct_declarator':([6,45,48,63,70,84,168,279,281,288,],[44,73,44,44,44,44,44,73,44,44,]),'pointer':([6,48,49,63,70,76,84,168,229,281,288,372,],[45,45,75,45,45,170,45,279,371,279,45,371,]),'init_declarator':([6,63,70,],[46,46,156,]),'attribute_specifier_list':([36,37,176,188,291,344,347,432,],[55,60,286,343,423,430,431,472,]),'attribute_specifier':([36,37,55,60,176,188,286,291,343,344,347,423,430,431,432,472,],[58,58,81,81,58,58,81,58,81,58,58,81,81,81,58,81,]),'declaration_list':([41,],[64,]),'compound_statement':([41,64,68,131,149,249,252,391,447,448,449,481,491,494,],[65,96,137,137,137,137,137,137,137,137,137,137,137,137,]),'type_qualifier_list':([49,71,160,282,],[76,158,271,418,]),'struct_declaration_list':([56,79,87,175,],[82,174,184,285,]),'struct_declaration':([56,79,82,87,174,175,184,285,],[83,83,177,83,177,83,177,177,]),'specifier_qualifier_list':([56,79,82,85,86,87,110,174,175,184,220,224,226,285,],[84,84,84,182,183,84,229,84,84,84,229,229,229,84,]),'enumerator_list':([61,89,94,187,],[91,186,191,342,]),'enumerator':([61,89,94,187,189,341,348,429,],[92,92,92,92,345,345,345,345,]),'initializer':([66,100,194,350,435,444,490,],[98,193,351,434,473,193,434,]),'assignment_expression':([66,68,71,100,110,131,149,154,158,160,194,199,211,213,214,220,224,226,249,252,254,255,256,257,259,267,271,282,350,391,398,399,411,418,426,435,440,444,447,448,449,450,452,481,488,490,491,494,],[99,155,159,99,155,155,155,155,266,270,99,356,155,155,362,155,155,155,155,155,393,155,155,155,155,403,406,417,99,155,155,155,456,464,470,99,475,99,155,155,155,155,155,155,470,99,155,155,]),'conditional_expression':([66,68,71,100,110,131,143,149,154,158,160,181,190,194,197,199,211,213,214,220,224,226,249,252,254,255,256,257,259,267,271,282,289,350,391,398,399,411,418,426,435,437,440,444,447,448,449,450,452,481,488,490,491,494,],[101,101,101,101,101,101,251,101,101,101,101,251,251,101,251,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,251,101,101,101,101,101,101,101,101,474,101,101,101,101,101,101,101,101,101,101,101,101,]),'unary_expression':([66,68,71,100,105,106,107,109,110,131,143,149,154,158,160,181,190,194,197,199,211,212,213,214,220,224,226,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,249,252,254,255,256,257,259,267,271,282,289,350,368,391,398,399,411,418,426,435,437,440,442,444,447,448,449,450,452,481,488,490,491,494,],[102,102,102,102,219,221,223,225,102,102,223,102,102,102,102,223,223,102,223,102,102,223,102,102,102,102,102,223,223,223,223,223,223,223,223,223,223,223,223,223,223,223,223,223,102,102,102,102,102,102,102,102,102,102,223,102,223,102,102,102,102,102,102,102,223,102,223,102,102,102,102,102,102,102,102,102,102,102,]),'logical_or_expression':([66,68,71,100,110,131,143,149,154,158,160,181,190,194,197,199,211,213,214,220,224,226,249,252,254,255,256,257,259,267,271,282,289,350,391,398,399,411,418,426,435,437,440,444,447,448,449,450,452,481,488,490,491,494,],[103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,]),'postfix_expression':([66,68,71,100,105,106,107,109,110,131,143,149,154,158,160,181,190,194,197,199,211,212,213,214,220,224,226,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,249,252,254,255,256,257,259,267,271,282,289,350,368,391,398,399,411,418,426,435,437,440,442,444,447,448,449,450,452,481,488,490,491,494,],[104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,]),'unary_operator':([66,68,71,100,105,106,107,109,110,131,143,149,154,158,160,181,190,194,197,199,211,212,213,214,220,224,226,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,249,252,254,255,256,257,259,267,271,282,289,350,368,391,398,399,411,418,426,435,437,440,442,444,447,448,449,450,452,481,488,490,491,494,],[107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,]),'cast_expression':([66,68,71,100,107,110,131,143,149,154,158,160,181,190,194,197,199,211,212,213,214,220,224,226,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,249,252,254,255,256,257,259,267,271,282,289,350,368,391,398,399,411,418,426,435,437,440,442,444,447,448,449,450,452,481,488,490,491,494,],[108,108,108,108,222,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,387,388,389,108,108,108,108,108,108,108,108,108,108,108,108,445,108,108,108,108,108,108,108,108,108,445,108,108,108,108,108,108,108,108,108,108,108,]),'logical_and_expression':([66,68,71,100,110,131,143,149,154,158,160,181,190,194,197,199,211,212,213,214,220,224,226,249,252,254,255,256,257,259,267,271,282,289,350,391,398,399,411,418,426,435,437,440,444,447,448,449,450,452,481,488,490,491,494,],[111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,358,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,]),'primary_expression':([66,68,71,100,105,106,107,109,110,131,143,149,154,158,160,181,190,194,197,199,211,212,213,214,220,224,226,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,249,252,254,255,256,257,259,267,271,282,289,350,368,391,398,399,411,418,426,435,437,440,442,444,447,448,449,450,452,481,488,490,491,494,],[112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,]),'inclusive_or_expression':([66,68,71,100,110,131,143,149,154,158,160,181,190,194,197,199,211,212,213,214,220,224,226,230,249,252,254,255,256,257,259,267,271,282,289,350,391,398,399,411,418,426,435,437,440,444,447,448,449,450,452,481,488,490,491,494,],[120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,373,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,]),'exclusive_or_expression':([66,68,71,100,110,131,143,149,154,158,160,181,190,194,197,199,211,212,213,214,220,224,226,230,231,249,252,254,255,256,257,259,267,271,282,289,350,391,398,399,411,418,426,435,437,440,444,447,448,449,450,452,481,488,490,491,494,],[123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,374,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,]),'and_expression':([66,68,71,100,110,131,143,149,154,158,160,181,190,194,197,199,211,212,213,214,220,224,226,230,231,232,249,252,254,255,256,257,259,267,271,282,289,350,391,398,399,411,418,426,435,437,440,444,447,448,449,450,452,481,488,490,491,494,],[124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,375,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,]),'equality_expression':([66,68,71,100,110,131,143,149,154,158,160,181,190,194,197,199,211,212,213,214,220,224,226,230,231,232,233,249,252,254,255,256,257,259,267,271,282,289,350,391,398,399,411,418,426,435,437,440,444,447,448,449,450,452,481,488,490,491,494,],[125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,376,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,]),'relational_expression':([66,68,71,100,110,131,143,149,154,158,160,181,190,194,197,199,211,212,213,214,220,224,226,230,231,232,233,234,235,249,252,254,255,256,257,259,267,271,282,289,350,391,398,399,411,418,426,435,437,440,444,447,448,449,450,452,481,488,490,491,494,],[126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,377,378,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,]),'shift_expression':([66,68,71,100,110,131,143,149,154,158,160,181,190,194,197,199,211,212,213,214,220,224,226,230,231,232,233,234,235,236,237,238,239,249,252,254,255,256,257,259,267,271,282,289,350,391,398,399,411,418,426,435,437,440,444,447,448,449,450,452,481,488,490,491,494,],[127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,379,380,381,382,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,]),'additive_expression':([66,68,71,100,110,131,143,149,154,158,160,181,190,194,197,199,211,212,213,214,220,224,226,230,231,232,233,234,235,236,237,238,239,240,241,249,252,254,255,256,257,259,267,271,282,289,350,391,398,399,411,418,426,435,437,440,444,447,448,449,450,452,481,488,490,491,494,],[128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,383,384,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,]),'multiplicative_expression':([66,68,71,100,110,131,143,149,154,158,160,181,190,194,197,199,211,212,213,214,220,224,226,230,231,232,233,234,235,236,237,238,239,240,241,242,243,249,252,254,255,256,257,259,267,271,282,289,350,391,398,399,411,418,426,435,437,440,444,447,448,449,450,452,481,488,490,491,494,],[129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,385,386,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,]),'block_item_list':([68,],[131,]),'block_item':([68,131,],[132,248,]),'statement':([68,131,149,249,252,391,447,448,449,481,491,494,],[134,134,258,390,392,446,477,478,479,493,497,499,]),'labeled_statement':([68,131,149,249,252,391,447,448,449,481,491,494,],[136,136,136,136,136,136,136,136,136,136,136,136,]),'expression_statement':([68,131,149,249,252,259,391,398,399,447,448,449,452,481,491,494,],[138,138,138,138,138,398,138,451,452,138,138,138,482,138,138,138,]),'selection_statement':([68,131,149,249,252,391,447,448,449,481,491,494,],[139,139,139,139,139,139,139,139,139,139,139,139,]),'iteration_statement':([68,131,149,249,252,391,447,448,449,481,491,494,],[140,140,140,140,140,140,140,140,140,140,140,140,]),'jump_statement':([68,131,149,249,252,391,447,448,449,481,491,494,],[141,141,141,141,141,141,141,141,141,141,141,141,]),'expression':([68,110,131,149,154,211,213,220,224,226,249,252,255,256,257,259,391,398,399,447,448,449,450,452,481,491,494,],[145,228,145,145,264,357,359,228,228,228,145,145,394,395,396,145,145,145,145,145,145,145,480,145,145,145,145,]),'parameter_type_list':([72,281,372,412,],[163,415,415,459,]),'identifier_list':([72,],[164,]),'parameter_list':([72,281,372,412,],[165,165,165,165,]),'parameter_declaration':([72,276,281,372,412,],[167,409,167,167,167,]),'flag_list':([78,],[173,]),'struct_declarator_list':([84,],[178,]),'struct_declarator':([84,288,],[179,421,]),'initializer_list':([100,444,],[192,476,]),'designation':([100,350,444,490,],[194,435,194,435,]),'designator_list':([100,350,444,490,],[195,195,195,195,]),'designator':([100,195,350,444,490,],[196,353,196,196,196,]),'assignment_operator':([102,],[199,]),'type_name':([110,220,224,226,],[227,365,366,367,]),'constant_expression':([143,181,190,197,289,],[250,290,346,354,422,]),'abstract_declarator':([168,229,281,372,],[278,370,414,414,]),'direct_abstract_declarator':([168,229,279,281,371,372,],[280,280,410,280,410,280,]),'attribute_list':([185,],[292,]),'attribute':([185,425,],[293,467,]),'attribute_token':([185,425,],[294,294,]),'enumerator_attribute':([185,425,],[295,295,]),'function_attribute':([185,425,],[296,296,]),'label_attribute':([185,425,],[297,297,]),'type_attribute':([185,425,],[298,298,]),'statement_attribute':([185,425,],[299,299,]),'argument_expression_list':([214,],[361,]),'attribute_argument_list':([426,],[468,]),'attribute_argument':([426,488,],[469,495,]),}
+
+_lr_goto = {}
+for _k, _v in _lr_goto_items.items():
+   for _x, _y in zip(_v[0], _v[1]):
+       if not _x in _lr_goto: _lr_goto[_x] = {}
+       _lr_goto[_x][_k] = _y
+del _lr_goto_items
+_lr_productions = [
+  ("S' -> translation_unit","S'",1,None,None,None),
+  ('translation_unit -> external_declaration','translation_unit',1,'p_translation_unit','parser_99.py',38),
+  ('translation_unit -> translation_unit external_declaration','translation_unit',2,'p_translation_unit','parser_99.py',39),
+  ('external_declaration -> function_definition','external_declaration',1,'p_external_declaration','parser_99.py',49),
+  ('external_declaration -> declaration','external_declaration',1,'p_external_declaration','parser_99.py',50),
+  ('function_definition -> declaration_specifiers declarator declaration_list compound_statement','function_definition',4,'p_function_definition','parser_99.py',55),
+  ('function_definition -> declaration_specifiers declarator compound_statement','function_definition',3,'p_function_definition','parser_99.py',56),
+  ('primary_expression -> IDENTIFIER','primary_expression',1,'p_primary_expression','parser_99.py',61),
+  ('primary_expression -> CONSTANT','primary_expression',1,'p_primary_expression','parser_99.py',62),
+  ('primary_expression -> STRING_LITERAL','primary_expression',1,'p_primary_expression','parser_99.py',63),
+  ('primary_expression -> ( expression )','primary_expression',3,'p_primary_expression','parser_99.py',64),
+  ('external_declaration -> linemarker','external_declaration',1,'p_external_declaration_linemarker','parser_gnu99.py',63),
+  ('linemarker -> # CONSTANT STRING_LITERAL flag_list','linemarker',4,'p_linemarker','parser_gnu99.py',68),
+  ('postfix_expression -> primary_expression','postfix_expression',1,'p_postfix_expression','parser_99.py',72),
+  ('postfix_expression -> postfix_expression [ expression ]','postfix_expression',4,'p_postfix_expression','parser_99.py',73),
+  ('postfix_expression -> postfix_expression ( )','postfix_expression',3,'p_postfix_expression','parser_99.py',74),
+  ('postfix_expression -> postfix_expression ( argument_expression_list )','postfix_expression',4,'p_postfix_expression','parser_99.py',75),
+  ('postfix_expression -> postfix_expression . IDENTIFIER','postfix_expression',3,'p_postfix_expression','parser_99.py',76),
+  ('postfix_expression -> postfix_expression PTR_OP IDENTIFIER','postfix_expression',3,'p_postfix_expression','parser_99.py',77),
+  ('postfix_expression -> postfix_expression INC_OP','postfix_expression',2,'p_postfix_expression','parser_99.py',78),
+  ('postfix_expression -> postfix_expression DEC_OP','postfix_expression',2,'p_postfix_expression','parser_99.py',79),
+  ('postfix_expression -> ( type_name ) { initializer_list }','postfix_expression',6,'p_postfix_expression','parser_99.py',80),
+  ('postfix_expression -> ( type_name ) { initializer_list , }','postfix_expression',7,'p_postfix_expression','parser_99.py',81),
+  ('flag_list -> <empty>','flag_list',0,'p_flag_list','parser_gnu99.py',79),
+  ('flag_list -> CONSTANT','flag_list',1,'p_flag_list','parser_gnu99.py',80),
+  ('flag_list -> flag_list CONSTANT','flag_list',2,'p_flag_list','parser_gnu99.py',81),
+  ('argument_expression_list -> assignment_expression','argument_expression_list',1,'p_argument_expression_list','parser_99.py',90),
+  ('argument_expression_list -> argument_expression_list , assignment_expression','argument_expression_list',3,'p_argument_expression_list','parser_99.py',91),
+  ('enum_specifier -> ENUM attribute_specifier_list { enumerator_list }','enum_specifier',5,'p_enum_specifier_former_attribute','parser_gnu99.py',91),
+  ('enum_specifier -> ENUM attribute_specifier_list { enumerator_list , }','enum_specifier',6,'p_enum_specifier_former_attribute','parser_gnu99.py',92),
+  ('unary_expression -> postfix_expression','unary_expression',1,'p_unary_expression','parser_99.py',100),
+  ('unary_expression -> INC_OP unary_expression','unary_expression',2,'p_unary_expression','parser_99.py',101),
+  ('unary_expression -> DEC_OP unary_expression','unary_expression',2,'p_unary_expression','parser_99.py',102),
+  ('unary_expression -> unary_operator cast_expression','unary_expression',2,'p_unary_expression','parser_99.py',103),
+  ('unary_expression -> SIZEOF unary_expression','unary_expression',2,'p_unary_expression','parser_99.py',104),
+  ('unary_expression -> SIZEOF ( type_name )','unary_expression',4,'p_unary_expression','parser_99.py',105),
+  ('enum_specifier -> ENUM attribute_specifier_list IDENTIFIER { enumerator_list }','enum_specifier',6,'p_enum_specifier2_former_attribute','parser_gnu99.py',100),
+  ('enum_specifier -> ENUM attribute_specifier_list IDENTIFIER { enumerator_list , }','enum_specifier',7,'p_enum_specifier2_former_attribute','parser_gnu99.py',101),
+  ('enum_specifier -> ENUM attribute_specifier_list IDENTIFIER','enum_specifier',3,'p_enum_specifier3_former_attribute','parser_gnu99.py',110),
+  ('unary_operator -> &','unary_operator',1,'p_unary_operator','parser_99.py',114),
+  ('unary_operator -> *','unary_operator',1,'p_unary_operator','parser_99.py',115),
+  ('unary_operator -> +','unary_operator',1,'p_unary_operator','parser_99.py',116),
+  ('unary_operator -> -','unary_operator',1,'p_unary_operator','parser_99.py',117),
+  ('unary_operator -> ~','unary_operator',1,'p_unary_operator','parser_99.py',118),
+  ('unary_operator -> !','unary_operator',1,'p_unary_operator','parser_99.py',119),
+  ('enum_specifier -> ENUM { enumerator_list } attribute_specifier_list','enum_specifier',5,'p_enum_specifier_later_attribute','parser_gnu99.py',119),
+  ('cast_expression -> unary_expression','cast_expression',1,'p_cast_expression','parser_99.py',124),
+  ('cast_expression -> ( type_name ) cast_expression','cast_expression',4,'p_cast_expression','parser_99.py',125),
+  ('enum_specifier -> ENUM { enumerator_list , } attribute_specifier_list','enum_specifier',6,'p_enum_specifier_later_attribute2','parser_gnu99.py',127),
+  ('multiplicative_expression -> cast_expression','multiplicative_expression',1,'p_multiplicative_expression','parser_99.py',134),
+  ('multiplicative_expression -> multiplicative_expression * cast_expression','multiplicative_expression',3,'p_multiplicative_expression','parser_99.py',135),
+  ('multiplicative_expression -> multiplicative_expression / cast_expression','multiplicative_expression',3,'p_multiplicative_expression','parser_99.py',136),
+  ('multiplicative_expression -> multiplicative_expression % cast_expression','multiplicative_expression',3,'p_multiplicative_expression','parser_99.py',137),
+  ('enum_specifier -> ENUM IDENTIFIER { enumerator_list } attribute_specifier_list','enum_specifier',6,'p_enum_specifier2_later_attribute','parser_gnu99.py',135),
+  ('enum_specifier -> ENUM IDENTIFIER { enumerator_list , } attribute_specifier_list','enum_specifier',7,'p_enum_specifier2_later_attribute2','parser_gnu99.py',144),
+  ('additive_expression -> multiplicative_expression','additive_expression',1,'p_additive_expression','parser_99.py',150),
+  ('additive_expression -> additive_expression + multiplicative_expression','additive_expression',3,'p_additive_expression','parser_99.py',151),
+  ('additive_expression -> additive_expression - multiplicative_expression','additive_expression',3,'p_additive_expression','parser_99.py',152),
+  ('struct_or_union_specifier -> struct_or_union attribute_specifier_list { struct_declaration_list }','struct_or_union_specifier',5,'p_struct_or_union_specifier_former_attribute','parser_gnu99.py',153),
+  ('struct_or_union_specifier -> struct_or_union attribute_specifier_list IDENTIFIER','struct_or_union_specifier',3,'p_struct_or_union_specifier_former_attribute','parser_gnu99.py',154),
+  ('struct_or_union_specifier -> struct_or_union attribute_specifier_list IDENTIFIER { struct_declaration_list }','struct_or_union_specifier',6,'p_struct_or_union_specifier_former_attribute','parser_gnu99.py',155),
+  ('shift_expression -> additive_expression','shift_expression',1,'p_shift_expression','parser_99.py',163),
+  ('shift_expression -> shift_expression LEFT_OP additive_expression','shift_expression',3,'p_shift_expression','parser_99.py',164),
+  ('shift_expression -> shift_expression RIGHT_OP additive_expression','shift_expression',3,'p_shift_expression','parser_99.py',165),
+  ('struct_or_union_specifier -> struct_or_union { struct_declaration_list } attribute_specifier_list','struct_or_union_specifier',5,'p_struct_or_union_specifier_later_attribute','parser_gnu99.py',165),
+  ('struct_or_union_specifier -> struct_or_union IDENTIFIER { struct_declaration_list } attribute_specifier_list','struct_or_union_specifier',6,'p_struct_or_union_specifier_later_attribute2','parser_gnu99.py',175),
+  ('relational_expression -> shift_expression','relational_expression',1,'p_relational_expression','parser_99.py',176),
+  ('relational_expression -> relational_expression < shift_expression','relational_expression',3,'p_relational_expression','parser_99.py',177),
+  ('relational_expression -> relational_expression > shift_expression','relational_expression',3,'p_relational_expression','parser_99.py',178),
+  ('relational_expression -> relational_expression LE_OP shift_expression','relational_expression',3,'p_relational_expression','parser_99.py',179),
+  ('relational_expression -> relational_expression GE_OP shift_expression','relational_expression',3,'p_relational_expression','parser_99.py',180),
+  ('attribute_specifier_list -> attribute_specifier','attribute_specifier_list',1,'p_attribute_specifier_list','parser_gnu99.py',186),
+  ('attribute_specifier_list -> attribute_specifier_list attribute_specifier','attribute_specifier_list',2,'p_attribute_specifier_list','parser_gnu99.py',187),
+  ('equality_expression -> relational_expression','equality_expression',1,'p_equality_expression','parser_99.py',195),
+  ('equality_expression -> equality_expression EQ_OP relational_expression','equality_expression',3,'p_equality_expression','parser_99.py',196),
+  ('equality_expression -> equality_expression NE_OP relational_expression','equality_expression',3,'p_equality_expression','parser_99.py',197),
+  ('attribute_specifier -> __ATTRIBUTE__ ( ( attribute_list ) )','attribute_specifier',6,'p_attribute_specifier','parser_gnu99.py',197),
+  ('attribute_list -> <empty>','attribute_list',0,'p_attribute_list','parser_gnu99.py',203),
+  ('attribute_list -> attribute','attribute_list',1,'p_attribute_list','parser_gnu99.py',204),
+  ('attribute_list -> attribute_list ,','attribute_list',2,'p_attribute_list','parser_gnu99.py',205),
+  ('attribute_list -> attribute_list , attribute','attribute_list',3,'p_attribute_list','parser_gnu99.py',206),
+  ('and_expression -> equality_expression','and_expression',1,'p_and_expression','parser_99.py',208),
+  ('and_expression -> and_expression & equality_expression','and_expression',3,'p_and_expression','parser_99.py',209),
+  ('exclusive_or_expression -> and_expression','exclusive_or_expression',1,'p_exclusive_or_expression','parser_99.py',217),
+  ('exclusive_or_expression -> exclusive_or_expression ^ and_expression','exclusive_or_expression',3,'p_exclusive_or_expression','parser_99.py',218),
+  ('attribute -> attribute_token','attribute',1,'p_attribute','parser_gnu99.py',220),
+  ('attribute -> attribute_token ( attribute_argument_list )','attribute',4,'p_attribute','parser_gnu99.py',221),
+  ('inclusive_or_expression -> exclusive_or_expression','inclusive_or_expression',1,'p_inclusive_or_expression','parser_99.py',226),
+  ('inclusive_or_expression -> inclusive_or_expression | exclusive_or_expression','inclusive_or_expression',3,'p_inclusive_or_expression','parser_99.py',227),
+  ('attribute_argument_list -> attribute_argument','attribute_argument_list',1,'p_attribute_argument_list','parser_gnu99.py',232),
+  ('attribute_argument_list -> attribute_argument_list , attribute_argument','attribute_argument_list',3,'p_attribute_argument_list','parser_gnu99.py',233),
+  ('logical_and_expression -> inclusive_or_expression','logical_and_expression',1,'p_logical_and_expression','parser_99.py',235),
+  ('logical_and_expression -> logical_and_expression AND_OP inclusive_or_expression','logical_and_expression',3,'p_logical_and_expression','parser_99.py',236),
+  ('attribute_argument -> assignment_expression','attribute_argument',1,'p_attribute_argument','parser_gnu99.py',243),
+  ('logical_or_expression -> logical_and_expression','logical_or_expression',1,'p_logical_or_expression','parser_99.py',244),
+  ('logical_or_expression -> logical_or_expression OR_OP logical_and_expression','logical_or_expression',3,'p_logical_or_expression','parser_99.py',245),
+  ('attribute_token -> enumerator_attribute','attribute_token',1,'p_attribute_token','parser_gnu99.py',249),
+  ('attribute_token -> function_attribute','attribute_token',1,'p_attribute_token','parser_gnu99.py',250),
+  ('attribute_token -> label_attribute','attribute_token',1,'p_attribute_token','parser_gnu99.py',251),
+  ('attribute_token -> type_attribute','attribute_token',1,'p_attribute_token','parser_gnu99.py',252),
+  ('attribute_token -> statement_attribute','attribute_token',1,'p_attribute_token','parser_gnu99.py',253),
+  ('conditional_expression -> logical_or_expression','conditional_expression',1,'p_conditional_expression','parser_99.py',253),
+  ('conditional_expression -> logical_or_expression ? expression : conditional_expression','conditional_expression',5,'p_conditional_expression','parser_99.py',254),
+  ('enumerator_attribute -> DEPRECATED','enumerator_attribute',1,'p_enumerator_attribute','parser_gnu99.py',259),
+  ('enumerator_attribute -> __DEPRECATED__','enumerator_attribute',1,'p_enumerator_attribute','parser_gnu99.py',260),
+  ('enumerator_attribute -> UNAVAILABLE','enumerator_attribute',1,'p_enumerator_attribute','parser_gnu99.py',261),
+  ('enumerator_attribute -> __UNAVAILABLE__','enumerator_attribute',1,'p_enumerator_attribute','parser_gnu99.py',262),
+  ('assignment_expression -> conditional_expression','assignment_expression',1,'p_assignment_expression','parser_99.py',262),
+  ('assignment_expression -> unary_expression assignment_operator assignment_expression','assignment_expression',3,'p_assignment_expression','parser_99.py',263),
+  ('function_attribute -> ACCESS','function_attribute',1,'p_function_attribute','parser_gnu99.py',268),
+  ('function_attribute -> __ACCESS__','function_attribute',1,'p_function_attribute','parser_gnu99.py',269),
+  ('function_attribute -> UNAVAILABLE','function_attribute',1,'p_function_attribute','parser_gnu99.py',270),
+  ('function_attribute -> __UNAVAILABLE__','function_attribute',1,'p_function_attribute','parser_gnu99.py',271),
+  ('assignment_operator -> =','assignment_operator',1,'p_assignment_operator','parser_99.py',272),
+  ('assignment_operator -> MUL_ASSIGN','assignment_operator',1,'p_assignment_operator','parser_99.py',273),
+  ('assignment_operator -> DIV_ASSIGN','assignment_operator',1,'p_assignment_operator','parser_99.py',274),
+  ('assignment_operator -> MOD_ASSIGN','assignment_operator',1,'p_assignment_operator','parser_99.py',275),
+  ('assignment_operator -> ADD_ASSIGN','assignment_operator',1,'p_assignment_operator','parser_99.py',276),
+  ('assignment_operator -> SUB_ASSIGN','assignment_operator',1,'p_assignment_operator','parser_99.py',277),
+  ('assignment_operator -> LEFT_ASSIGN','assignment_operator',1,'p_assignment_operator','parser_99.py',278),
+  ('assignment_operator -> RIGHT_ASSIGN','assignment_operator',1,'p_assignment_operator','parser_99.py',279),
+  ('assignment_operator -> AND_ASSIGN','assignment_operator',1,'p_assignment_operator','parser_99.py',280),
+  ('assignment_operator -> XOR_ASSIGN','assignment_operator',1,'p_assignment_operator','parser_99.py',281),
+  ('assignment_operator -> OR_ASSIGN','assignment_operator',1,'p_assignment_operator','parser_99.py',282),
+  ('label_attribute -> COLD','label_attribute',1,'p_label_attribute','parser_gnu99.py',277),
+  ('label_attribute -> __COLD__','label_attribute',1,'p_label_attribute','parser_gnu99.py',278),
+  ('label_attribute -> HOT','label_attribute',1,'p_label_attribute','parser_gnu99.py',279),
+  ('label_attribute -> __HOT__','label_attribute',1,'p_label_attribute','parser_gnu99.py',280),
+  ('label_attribute -> UNUSED','label_attribute',1,'p_label_attribute','parser_gnu99.py',281),
+  ('label_attribute -> __UNUSED__','label_attribute',1,'p_label_attribute','parser_gnu99.py',282),
+  ('expression -> assignment_expression','expression',1,'p_expression','parser_99.py',287),
+  ('expression -> expression , assignment_expression','expression',3,'p_expression','parser_99.py',288),
+  ('statement_attribute -> FALLTHROUGH','statement_attribute',1,'p_statement_attribute','parser_gnu99.py',288),
+  ('statement_attribute -> __FALLTHROUGH__','statement_attribute',1,'p_statement_attribute','parser_gnu99.py',289),
+  ('type_attribute -> ALIGNED','type_attribute',1,'p_type_attribute','parser_gnu99.py',295),
+  ('type_attribute -> __ALIGNED__','type_attribute',1,'p_type_attribute','parser_gnu99.py',296),
+  ('type_attribute -> ALLOC_SIZE','type_attribute',1,'p_type_attribute','parser_gnu99.py',297),
+  ('type_attribute -> __ALLOC_SIZE__','type_attribute',1,'p_type_attribute','parser_gnu99.py',298),
+  ('type_attribute -> COPY','type_attribute',1,'p_type_attribute','parser_gnu99.py',299),
+  ('type_attribute -> __COPY__','type_attribute',1,'p_type_attribute','parser_gnu99.py',300),
+  ('type_attribute -> DEPRECATED','type_attribute',1,'p_type_attribute','parser_gnu99.py',301),
+  ('type_attribute -> __DEPRECATED__','type_attribute',1,'p_type_attribute','parser_gnu99.py',302),
+  ('type_attribute -> DESIGNATED_INIT','type_attribute',1,'p_type_attribute','parser_gnu99.py',303),
+  ('type_attribute -> __DESIGNATED_INIT__','type_attribute',1,'p_type_attribute','parser_gnu99.py',304),
+  ('type_attribute -> MAY_ALIAS','type_attribute',1,'p_type_attribute','parser_gnu99.py',305),
+  ('type_attribute -> __MAY_ALIAS__','type_attribute',1,'p_type_attribute','parser_gnu99.py',306),
+  ('type_attribute -> MODE','type_attribute',1,'p_type_attribute','parser_gnu99.py',307),
+  ('type_attribute -> __MODE__','type_attribute',1,'p_type_attribute','parser_gnu99.py',308),
+  ('type_attribute -> OBJC_ROOT_CLASS','type_attribute',1,'p_type_attribute','parser_gnu99.py',309),
+  ('type_attribute -> __OBJC_ROOT_CLASS__','type_attribute',1,'p_type_attribute','parser_gnu99.py',310),
+  ('type_attribute -> PACKED','type_attribute',1,'p_type_attribute','parser_gnu99.py',311),
+  ('type_attribute -> __PACKED__','type_attribute',1,'p_type_attribute','parser_gnu99.py',312),
+  ('type_attribute -> SCALAR_STORAGE_ORDER','type_attribute',1,'p_type_attribute','parser_gnu99.py',313),
+  ('type_attribute -> __SCALAR_STORAGE_ORDER__','type_attribute',1,'p_type_attribute','parser_gnu99.py',314),
+  ('type_attribute -> TRANSPARENT_UNION','type_attribute',1,'p_type_attribute','parser_gnu99.py',315),
+  ('type_attribute -> __TRANSPARENT_UNION__','type_attribute',1,'p_type_attribute','parser_gnu99.py',316),
+  ('type_attribute -> UNAVAILABLE','type_attribute',1,'p_type_attribute','parser_gnu99.py',317),
+  ('type_attribute -> __UNAVAILABLE__','type_attribute',1,'p_type_attribute','parser_gnu99.py',318),
+  ('type_attribute -> UNUSED','type_attribute',1,'p_type_attribute','parser_gnu99.py',319),
+  ('type_attribute -> __UNUSED__','type_attribute',1,'p_type_attribute','parser_gnu99.py',320),
+  ('type_attribute -> VECTOR_SIZE','type_attribute',1,'p_type_attribute','parser_gnu99.py',321),
+  ('type_attribute -> __VECTOR_SIZE__','type_attribute',1,'p_type_attribute','parser_gnu99.py',322),
+  ('type_attribute -> VISIBILITY','type_attribute',1,'p_type_attribute','parser_gnu99.py',323),
+  ('type_attribute -> __VISIBILITY__','type_attribute',1,'p_type_attribute','parser_gnu99.py',324),
+  ('type_attribute -> WARN_IF_NOT_ALIGNED','type_attribute',1,'p_type_attribute','parser_gnu99.py',325),
+  ('type_attribute -> __WARN_IF_NOT_ALIGNED__','type_attribute',1,'p_type_attribute','parser_gnu99.py',326),
+  ('constant_expression -> conditional_expression','constant_expression',1,'p_constant_expression','parser_99.py',297),
+  ('declaration -> declaration_specifiers ;','declaration',2,'p_declaration','parser_99.py',302),
+  ('declaration -> declaration_specifiers init_declarator_list ;','declaration',3,'p_declaration','parser_99.py',303),
+  ('declaration_specifiers -> storage_class_specifier','declaration_specifiers',1,'p_declaration_specifiers','parser_99.py',324),
+  ('declaration_specifiers -> storage_class_specifier declaration_specifiers','declaration_specifiers',2,'p_declaration_specifiers','parser_99.py',325),
+  ('declaration_specifiers -> type_specifier','declaration_specifiers',1,'p_declaration_specifiers','parser_99.py',326),
+  ('declaration_specifiers -> type_specifier declaration_specifiers','declaration_specifiers',2,'p_declaration_specifiers','parser_99.py',327),
+  ('declaration_specifiers -> type_qualifier','declaration_specifiers',1,'p_declaration_specifiers','parser_99.py',328),
+  ('declaration_specifiers -> type_qualifier declaration_specifiers','declaration_specifiers',2,'p_declaration_specifiers','parser_99.py',329),
+  ('declaration_specifiers -> function_specifier','declaration_specifiers',1,'p_declaration_specifiers','parser_99.py',330),
+  ('declaration_specifiers -> function_specifier declaration_specifiers','declaration_specifiers',2,'p_declaration_specifiers','parser_99.py',331),
+  ('init_declarator_list -> init_declarator','init_declarator_list',1,'p_init_declarator_list','parser_99.py',342),
+  ('init_declarator_list -> init_declarator_list , init_declarator','init_declarator_list',3,'p_init_declarator_list','parser_99.py',343),
+  ('init_declarator -> declarator','init_declarator',1,'p_init_declarator','parser_99.py',352),
+  ('init_declarator -> declarator = initializer','init_declarator',3,'p_init_declarator','parser_99.py',353),
+  ('storage_class_specifier -> TYPEDEF','storage_class_specifier',1,'p_storage_class_specifier','parser_99.py',361),
+  ('storage_class_specifier -> EXTERN','storage_class_specifier',1,'p_storage_class_specifier','parser_99.py',362),
+  ('storage_class_specifier -> STATIC','storage_class_specifier',1,'p_storage_class_specifier','parser_99.py',363),
+  ('storage_class_specifier -> AUTO','storage_class_specifier',1,'p_storage_class_specifier','parser_99.py',364),
+  ('storage_class_specifier -> REGISTER','storage_class_specifier',1,'p_storage_class_specifier','parser_99.py',365),
+  ('type_specifier -> VOID','type_specifier',1,'p_type_specifier','parser_99.py',370),
+  ('type_specifier -> CHAR','type_specifier',1,'p_type_specifier','parser_99.py',371),
+  ('type_specifier -> SHORT','type_specifier',1,'p_type_specifier','parser_99.py',372),
+  ('type_specifier -> INT','type_specifier',1,'p_type_specifier','parser_99.py',373),
+  ('type_specifier -> LONG','type_specifier',1,'p_type_specifier','parser_99.py',374),
+  ('type_specifier -> FLOAT','type_specifier',1,'p_type_specifier','parser_99.py',375),
+  ('type_specifier -> DOUBLE','type_specifier',1,'p_type_specifier','parser_99.py',376),
+  ('type_specifier -> SIGNED','type_specifier',1,'p_type_specifier','parser_99.py',377),
+  ('type_specifier -> UNSIGNED','type_specifier',1,'p_type_specifier','parser_99.py',378),
+  ('type_specifier -> BOOLEAN','type_specifier',1,'p_type_specifier','parser_99.py',379),
+  ('type_specifier -> COMPLEX','type_specifier',1,'p_type_specifier','parser_99.py',380),
+  ('type_specifier -> IMAGINARY','type_specifier',1,'p_type_specifier','parser_99.py',381),
+  ('type_specifier -> struct_or_union_specifier','type_specifier',1,'p_type_specifier','parser_99.py',382),
+  ('type_specifier -> enum_specifier','type_specifier',1,'p_type_specifier','parser_99.py',383),
+  ('type_specifier -> TYPEDEF_NAME','type_specifier',1,'p_type_specifier','parser_99.py',384),
+  ('struct_or_union_specifier -> struct_or_union { struct_declaration_list }','struct_or_union_specifier',4,'p_struct_or_union_specifier','parser_99.py',389),
+  ('struct_or_union_specifier -> struct_or_union IDENTIFIER { struct_declaration_list }','struct_or_union_specifier',5,'p_struct_or_union_specifier','parser_99.py',390),
+  ('struct_or_union_specifier -> struct_or_union IDENTIFIER','struct_or_union_specifier',2,'p_struct_or_union_specifier','parser_99.py',391),
+  ('struct_or_union -> STRUCT','struct_or_union',1,'p_struct_or_union','parser_99.py',418),
+  ('struct_or_union -> UNION','struct_or_union',1,'p_struct_or_union','parser_99.py',419),
+  ('struct_declaration_list -> struct_declaration','struct_declaration_list',1,'p_struct_declaration_list','parser_99.py',424),
+  ('struct_declaration_list -> struct_declaration_list struct_declaration','struct_declaration_list',2,'p_struct_declaration_list','parser_99.py',425),
+  ('struct_declaration -> specifier_qualifier_list struct_declarator_list ;','struct_declaration',3,'p_struct_declaration','parser_99.py',434),
+  ('specifier_qualifier_list -> type_specifier','specifier_qualifier_list',1,'p_specifier_qualifier_list','parser_99.py',442),
+  ('specifier_qualifier_list -> type_specifier specifier_qualifier_list','specifier_qualifier_list',2,'p_specifier_qualifier_list','parser_99.py',443),
+  ('specifier_qualifier_list -> type_qualifier','specifier_qualifier_list',1,'p_specifier_qualifier_list','parser_99.py',444),
+  ('specifier_qualifier_list -> type_qualifier specifier_qualifier_list','specifier_qualifier_list',2,'p_specifier_qualifier_list','parser_99.py',445),
+  ('struct_declarator_list -> struct_declarator','struct_declarator_list',1,'p_struct_declarator_list','parser_99.py',454),
+  ('struct_declarator_list -> struct_declarator_list , struct_declarator','struct_declarator_list',3,'p_struct_declarator_list','parser_99.py',455),
+  ('struct_declarator -> declarator','struct_declarator',1,'p_struct_declarator','parser_99.py',464),
+  ('struct_declarator -> : constant_expression','struct_declarator',2,'p_struct_declarator','parser_99.py',465),
+  ('struct_declarator -> declarator : constant_expression','struct_declarator',3,'p_struct_declarator','parser_99.py',466),
+  ('enum_specifier -> ENUM { enumerator_list }','enum_specifier',4,'p_enum_specifier','parser_99.py',476),
+  ('enum_specifier -> ENUM { enumerator_list , }','enum_specifier',5,'p_enum_specifier','parser_99.py',477),
+  ('enum_specifier -> ENUM IDENTIFIER { enumerator_list }','enum_specifier',5,'p_enum_specifier2','parser_99.py',483),
+  ('enum_specifier -> ENUM IDENTIFIER { enumerator_list , }','enum_specifier',6,'p_enum_specifier2','parser_99.py',484),
+  ('enum_specifier -> ENUM IDENTIFIER','enum_specifier',2,'p_enum_specifier3','parser_99.py',500),
+  ('enumerator_list -> enumerator','enumerator_list',1,'p_enumerator_list','parser_99.py',508),
+  ('enumerator_list -> enumerator_list , enumerator','enumerator_list',3,'p_enumerator_list','parser_99.py',509),
+  ('enumerator -> IDENTIFIER','enumerator',1,'p_enumerator','parser_99.py',518),
+  ('enumerator -> IDENTIFIER = constant_expression','enumerator',3,'p_enumerator','parser_99.py',519),
+  ('function_specifier -> INLINE','function_specifier',1,'p_function_specifier','parser_99.py',532),
+  ('type_qualifier -> CONST','type_qualifier',1,'p_type_qualifier','parser_99.py',537),
+  ('type_qualifier -> RESTRICT','type_qualifier',1,'p_type_qualifier','parser_99.py',538),
+  ('type_qualifier -> VOLATILE','type_qualifier',1,'p_type_qualifier','parser_99.py',539),
+  ('declarator -> direct_declarator','declarator',1,'p_declarator','parser_99.py',544),
+  ('declarator -> pointer direct_declarator','declarator',2,'p_declarator','parser_99.py',545),
+  ('direct_declarator -> IDENTIFIER','direct_declarator',1,'p_direct_declarator1','parser_99.py',554),
+  ('direct_declarator -> ( declarator )','direct_declarator',3,'p_direct_declarator2','parser_99.py',559),
+  ('direct_declarator -> direct_declarator [ ]','direct_declarator',3,'p_direct_declarator3','parser_99.py',564),
+  ('direct_declarator -> direct_declarator [ type_qualifier_list ]','direct_declarator',4,'p_direct_declarator3','parser_99.py',565),
+  ('direct_declarator -> direct_declarator [ assignment_expression ]','direct_declarator',4,'p_direct_declarator4','parser_99.py',571),
+  ('direct_declarator -> direct_declarator [ type_qualifier_list assignment_expression ]','direct_declarator',5,'p_direct_declarator4','parser_99.py',572),
+  ('direct_declarator -> direct_declarator [ STATIC assignment_expression ]','direct_declarator',5,'p_direct_declarator5','parser_99.py',579),
+  ('direct_declarator -> direct_declarator [ STATIC type_qualifier_list assignment_expression ]','direct_declarator',6,'p_direct_declarator5','parser_99.py',580),
+  ('direct_declarator -> direct_declarator [ type_qualifier_list STATIC assignment_expression ]','direct_declarator',6,'p_direct_declarator5','parser_99.py',581),
+  ('direct_declarator -> direct_declarator [ * ]','direct_declarator',4,'p_direct_declarator6','parser_99.py',598),
+  ('direct_declarator -> direct_declarator [ type_qualifier_list * ]','direct_declarator',5,'p_direct_declarator6','parser_99.py',599),
+  ('direct_declarator -> direct_declarator ( )','direct_declarator',3,'p_direct_declarator7','parser_99.py',605),
+  ('direct_declarator -> direct_declarator ( parameter_type_list )','direct_declarator',4,'p_direct_declarator7','parser_99.py',606),
+  ('direct_declarator -> direct_declarator ( identifier_list )','direct_declarator',4,'p_direct_declarator7','parser_99.py',607),
+  ('pointer -> *','pointer',1,'p_pointer1','parser_99.py',613),
+  ('pointer -> * pointer','pointer',2,'p_pointer1','parser_99.py',614),
+  ('pointer -> * type_qualifier_list','pointer',2,'p_pointer2','parser_99.py',619),
+  ('pointer -> * type_qualifier_list pointer','pointer',3,'p_pointer2','parser_99.py',620),
+  ('type_qualifier_list -> type_qualifier','type_qualifier_list',1,'p_type_qualifier_list','parser_99.py',625),
+  ('type_qualifier_list -> type_qualifier_list type_qualifier','type_qualifier_list',2,'p_type_qualifier_list','parser_99.py',626),
+  ('parameter_type_list -> parameter_list','parameter_type_list',1,'p_parameter_type_list','parser_99.py',635),
+  ('parameter_type_list -> parameter_list , ELLIPSIS','parameter_type_list',3,'p_parameter_type_list','parser_99.py',636),
+  ('parameter_list -> parameter_declaration','parameter_list',1,'p_parameter_list','parser_99.py',645),
+  ('parameter_list -> parameter_list , parameter_declaration','parameter_list',3,'p_parameter_list','parser_99.py',646),
+  ('parameter_declaration -> declaration_specifiers','parameter_declaration',1,'p_parameter_declaration','parser_99.py',655),
+  ('parameter_declaration -> declaration_specifiers declarator','parameter_declaration',2,'p_parameter_declaration','parser_99.py',656),
+  ('parameter_declaration -> declaration_specifiers abstract_declarator','parameter_declaration',2,'p_parameter_declaration','parser_99.py',657),
+  ('identifier_list -> IDENTIFIER','identifier_list',1,'p_identifier_list','parser_99.py',662),
+  ('identifier_list -> identifier_list , IDENTIFIER','identifier_list',3,'p_identifier_list','parser_99.py',663),
+  ('type_name -> specifier_qualifier_list','type_name',1,'p_type_name','parser_99.py',672),
+  ('type_name -> specifier_qualifier_list abstract_declarator','type_name',2,'p_type_name','parser_99.py',673),
+  ('abstract_declarator -> pointer','abstract_declarator',1,'p_abstract_declarator','parser_99.py',681),
+  ('abstract_declarator -> direct_abstract_declarator','abstract_declarator',1,'p_abstract_declarator','parser_99.py',682),
+  ('abstract_declarator -> pointer direct_abstract_declarator','abstract_declarator',2,'p_abstract_declarator','parser_99.py',683),
+  ('direct_abstract_declarator -> ( abstract_declarator )','direct_abstract_declarator',3,'p_direct_abstract_declarator1','parser_99.py',688),
+  ('direct_abstract_declarator -> direct_abstract_declarator [ ]','direct_abstract_declarator',3,'p_direct_abstract_declarator2','parser_99.py',693),
+  ('direct_abstract_declarator -> direct_abstract_declarator [ assignment_expression ]','direct_abstract_declarator',4,'p_direct_abstract_declarator2','parser_99.py',694),
+  ('direct_abstract_declarator -> [ ]','direct_abstract_declarator',2,'p_direct_abstract_declarator3','parser_99.py',699),
+  ('direct_abstract_declarator -> [ assignment_expression ]','direct_abstract_declarator',3,'p_direct_abstract_declarator3','parser_99.py',700),
+  ('direct_abstract_declarator -> [ type_qualifier_list ]','direct_abstract_declarator',3,'p_direct_abstract_declarator3','parser_99.py',701),
+  ('direct_abstract_declarator -> [ type_qualifier_list assignment_expression ]','direct_abstract_declarator',4,'p_direct_abstract_declarator3','parser_99.py',702),
+  ('direct_abstract_declarator -> direct_abstract_declarator [ * ]','direct_abstract_declarator',4,'p_direct_abstract_declarator4','parser_99.py',708),
+  ('direct_abstract_declarator -> [ * ]','direct_abstract_declarator',3,'p_direct_abstract_declarator5','parser_99.py',714),
+  ('direct_abstract_declarator -> direct_abstract_declarator ( )','direct_abstract_declarator',3,'p_direct_abstract_declarator6','parser_99.py',720),
+  ('direct_abstract_declarator -> direct_abstract_declarator ( parameter_type_list )','direct_abstract_declarator',4,'p_direct_abstract_declarator6','parser_99.py',721),
+  ('direct_abstract_declarator -> ( )','direct_abstract_declarator',2,'p_direct_abstract_declarator7','parser_99.py',727),
+  ('direct_abstract_declarator -> ( parameter_type_list )','direct_abstract_declarator',3,'p_direct_abstract_declarator7','parser_99.py',728),
+  ('initializer -> assignment_expression','initializer',1,'p_initializer','parser_99.py',734),
+  ('initializer -> { initializer_list }','initializer',3,'p_initializer2','parser_99.py',739),
+  ('initializer -> { initializer_list , }','initializer',4,'p_initializer2','parser_99.py',740),
+  ('initializer_list -> initializer','initializer_list',1,'p_initializer_list','parser_99.py',745),
+  ('initializer_list -> designation initializer','initializer_list',2,'p_initializer_list','parser_99.py',746),
+  ('initializer_list -> initializer_list , initializer','initializer_list',3,'p_initializer_list','parser_99.py',747),
+  ('initializer_list -> initializer_list , designation initializer','initializer_list',4,'p_initializer_list','parser_99.py',748),
+  ('designation -> designator_list =','designation',2,'p_designation','parser_99.py',757),
+  ('designator_list -> designator','designator_list',1,'p_designator_list','parser_99.py',762),
+  ('designator_list -> designator_list designator','designator_list',2,'p_designator_list','parser_99.py',763),
+  ('designator -> [ constant_expression ]','designator',3,'p_designator','parser_99.py',772),
+  ('designator -> . IDENTIFIER','designator',2,'p_designator','parser_99.py',773),
+  ('statement -> labeled_statement','statement',1,'p_statement','parser_99.py',778),
+  ('statement -> compound_statement','statement',1,'p_statement','parser_99.py',779),
+  ('statement -> expression_statement','statement',1,'p_statement','parser_99.py',780),
+  ('statement -> selection_statement','statement',1,'p_statement','parser_99.py',781),
+  ('statement -> iteration_statement','statement',1,'p_statement','parser_99.py',782),
+  ('statement -> jump_statement','statement',1,'p_statement','parser_99.py',783),
+  ('labeled_statement -> IDENTIFIER : statement','labeled_statement',3,'p_labeled_statement','parser_99.py',788),
+  ('labeled_statement -> CASE constant_expression : statement','labeled_statement',4,'p_labeled_statement','parser_99.py',789),
+  ('labeled_statement -> DEFAULT : statement','labeled_statement',3,'p_labeled_statement','parser_99.py',790),
+  ('compound_statement -> { }','compound_statement',2,'p_compound_statement','parser_99.py',795),
+  ('compound_statement -> { block_item_list }','compound_statement',3,'p_compound_statement','parser_99.py',796),
+  ('block_item_list -> block_item','block_item_list',1,'p_block_item_list','parser_99.py',801),
+  ('block_item_list -> block_item_list block_item','block_item_list',2,'p_block_item_list','parser_99.py',802),
+  ('block_item -> declaration','block_item',1,'p_block_item','parser_99.py',811),
+  ('block_item -> statement','block_item',1,'p_block_item','parser_99.py',812),
+  ('declaration_list -> declaration','declaration_list',1,'p_declaration_list','parser_99.py',817),
+  ('declaration_list -> declaration_list declaration','declaration_list',2,'p_declaration_list','parser_99.py',818),
+  ('expression_statement -> ;','expression_statement',1,'p_expression_statement','parser_99.py',827),
+  ('expression_statement -> expression ;','expression_statement',2,'p_expression_statement','parser_99.py',828),
+  ('selection_statement -> IF ( expression ) statement','selection_statement',5,'p_selection_statement','parser_99.py',833),
+  ('selection_statement -> IF ( expression ) statement ELSE statement','selection_statement',7,'p_selection_statement','parser_99.py',834),
+  ('selection_statement -> SWITCH ( expression ) statement','selection_statement',5,'p_selection_statement','parser_99.py',835),
+  ('iteration_statement -> WHILE ( expression ) statement','iteration_statement',5,'p_iteration_statement','parser_99.py',840),
+  ('iteration_statement -> DO statement WHILE ( expression ) ;','iteration_statement',7,'p_iteration_statement','parser_99.py',841),
+  ('iteration_statement -> FOR ( expression_statement expression_statement ) statement','iteration_statement',6,'p_iteration_statement','parser_99.py',842),
+  ('iteration_statement -> FOR ( declaration expression_statement expression_statement ) statement','iteration_statement',7,'p_iteration_statement','parser_99.py',843),
+  ('jump_statement -> GOTO IDENTIFIER ;','jump_statement',3,'p_jump_statement','parser_99.py',848),
+  ('jump_statement -> CONTINUE ;','jump_statement',2,'p_jump_statement','parser_99.py',849),
+  ('jump_statement -> BREAK ;','jump_statement',2,'p_jump_statement','parser_99.py',850),
+  ('jump_statement -> RETURN ;','jump_statement',2,'p_jump_statement','parser_99.py',851),
+  ('jump_statement -> RETURN expression ;','jump_statement',3,'p_jump_statement','parser_99.py',852),
+]
@@ -1,16 +1,37 @@
 import sys
 sys.path.append("../")
 
+from io import StringIO
 from pathlib import Path
 
-from core.utils import debug_production
+from core.source_file import map_source, read_source
+from core.utils import debug_production, table_options
 from front_end.lexer.cregex import *
+from front_end.lexer.token import compact_lexer
+from preprocessor.condition_evaluator import ConditionEvaluator
+from preprocessor.include_resolver import IncludeResolver
+from preprocessor.header_cache import CacheEntry, HeaderCache, MacroTable, file_digest
+from preprocessor.macro_expander import MacroExpander, tokens_to_str
+from preprocessor.profile import compile_profile, load_profile
+from preprocessor.snapshot import PreProcessorSnapshot
+from preprocessor.source_scanner import LineMap, SourceScanner, scan_conditional_section
+from preprocessor.token_output import TokenOutput
 import core.intermediate_representation as ir
 import ply.lex as lex
 import ply.yacc as yacc
 import re
 import time
 
+# Opening of an include guard: #ifndef X or #if !defined(X) followed by #define X
+INCLUDE_GUARD_RE = re.compile(r'\s*#[ \t]*(?:ifndef[ \t]+(\w+)|if[ \t]*![ \t]*defined[ \t]*(?:\([ \t]*(\w+)[ \t]*\)|[ \t]+(\w+)))[ \t]*\n\s*#[ \t]*define[ \t]+(\w+)\b')
+DIRECTIVE_RE     = re.compile(r'^[ \t]*#[ \t]*(\w+)', re.MULTILINE)
+# Text line following blank lines, a directive or the end of data ends a macro invocation
+TEXT_LINE_RE     = re.compile(r'\s*[^\s#]')
+
+# Name under which #pragma once headers are recorded inside the macro table, it can't
+# collide with a macro since it isn't an identifier.
+PRAGMA_ONCE_NAME = '#pragma once {}'
+
 
 class C99PreProcessorLexer(object):
     """
@@ -81,19 +102,41 @@ class C99PreProcessorLexer(object):
              )
 
     def __init__(self, **kwargs):
-        self._lexer    = lex.lex(module = self, reflags=re.UNICODE, **kwargs)
+        self._lexer    = compact_lexer(lex.lex(module = self, reflags=re.UNICODE, **kwargs), space = True)
         self.nested_if = 0
+        # Called with the lexer and the line start of an outermost #if so dead groups can be skipped
+        self.conditional_callback = None
+
+        # Position of the left parenthesis opening a macro parameter list
+        self._lparen_lexpos = -1
 
     # Define a rule so we can track line numbers
     def t_NEWLINE(self, t):
         r'\n+'
         t.lexer.lineno += len(t.value)
+        t.lexer.begin("INITIAL")
+
+        # Dead groups of an if section are found once its #if line is lexed.
+        if_line_start = getattr(t.lexer, 'if_line_start', None)
+
+        if if_line_start is not None:
+            t.lexer.if_line_start = None
+            self.conditional_callback(t.lexer, if_line_start)
+
+        # Body of a dead group is skipped without being tokenized.
+        skip_table = getattr(t.lexer, 'skip_table', None)
+
+        if skip_table and t.lexpos in skip_table:
+            group_end = skip_table.pop(t.lexpos)
+
+            t.lexer.lineno += t.lexer.lexdata.count('\n', t.lexer.lexpos, group_end)
+            t.lexer.lexpos  = group_end
         
         return t
 
     HEADER_NAME_RE = "|".join([
-                                f"""<[^<>]+>""",
-                                f"""\"[^\"]+\" """,
+                                f"""<[^<>\n]+>""",
+                                f"""\"[^\"\n]+\" """,
                             ])
     
     @lex.TOKEN(HEADER_NAME_RE)
@@ -103,13 +146,30 @@ class C99PreProcessorLexer(object):
     def t_DIRECTIVE(self, t):
         r'\#[a-zA-Z_][a-zA-Z_0-9]*'
 
-        t.lexer.begin("directive")
+        # A directive only starts a line, otherwise it's the # operator (stringification) followed by an identifier.
+        line_start = t.lexer.lexdata.rfind('\n', 0, t.lexpos) + 1
+
+        if t.lexer.lexdata[line_start:t.lexpos].strip(' \t'):
+            t.type  = '#'
+            t.value = '#'
+            t.lexer.lexpos = t.lexpos + 1
+            return t
 
         # Check first if it's a standard C directive
         if t.value in self.reserved:
             t.type = self.reserved[t.value]
+
+            # Macro name is lexed separately to detect function-like macro definition.
+            if t.type == "DEFINE":
+                t.lexer.begin("directive")
             
             if t.type == "IF" or t.type == 'IFDEF' or t.type == 'IFNDEF':
+                # Macro state is only known outside of any if section, and once the previous
+                # if section is reduced (#if may be its lookahead), so when the parser asks
+                # for the end of the #if line.
+                if not self.nested_if and self.conditional_callback and hasattr(t.lexer, 'skip_table'):
+                    t.lexer.if_line_start = line_start
+
                 self.nested_if += 1
             elif t.type == "ENDIF":
                 self.nested_if -= 1
@@ -203,24 +263,19 @@ class C99PreProcessorLexer(object):
     def t_directive_error(self, t):
         t.lexer.skip(1)
 
-    # Defining LPAREN in operator_punc and define_directive will lead to ambiguities due to replacement_list
-    # to avoid this we only define LPAREN inside directive, this will avoid any further issues with text_line
-    # reporting lexer error for LPAREN.
-    def t_directive_LPAREN(self, t):
-        r'(?<!\s)\('
-        # Match a left parenthesis only if not preceded by white space character
-        return t
-
-    def t_directive_RPAREN(self, t):
-        r'\)'
+    def t_directive_IDENTIFIER(self, t):
+        r'[a-zA-Z_][a-zA-Z_0-9]*'
+        # Defining LPAREN in operator_punc and define_directive will lead to ambiguities due to replacement_list.
+        # To avoid this, only a left parenthesis directly following the defined macro name is an LPAREN,
+        # any other parenthesis is a literal so text_line and replacement_list never see LPAREN.
+        self._lparen_lexpos = t.lexer.lexpos
         t.lexer.begin("INITIAL")
-        t.type = ')'
         return t
 
     # Match any parenthesis and return it as a literal to avoid ambiguity between lparen and '(' in production rule.
     def t_LPAREN(self, t):
         r'\('
-        t.type = '('      # Set token type to the expected literal
+        t.type = 'LPAREN' if t.lexpos == self._lparen_lexpos else '('
         return t
 
     # Error handling when an incorrect character is
@@ -249,38 +304,57 @@ class C99PreProcessorLexer(object):
 
 class C99PreProcessor(object):
 
-    def __init__(self, stdlib_path = [], keep_comment = False, debug = False, **kwargs):
+    # Precomputed parse tables generated by build_tables.py
+    TABLE_MODULE = 'preprocessor.parsetab_c99_preprocessor'
+
+    def __init__(self, stdlib_path = [], keep_comment = False, debug = False, cache_dir = None, include_dirs = [], prescan_include = False, include_resolver = None, profile = None, **kwargs):
         self._current_file = Path()
         
         self._lexer = C99PreProcessorLexer()
         self.tokens = self._lexer.tokens
 
-        self.headers_table = {}
-        self.macro         = {} 
+        # Every resolved include, used to build the dependency graph.
+        self.dependencies  = {}
+        # Files preprocessed by process/process_to
+        self._source_list  = []
+        # Include guard macro of each guarded file
+        self._include_guard_table = {}
+        self.macro         = MacroTable()
+        # Stream receiving top level output as soon as it's preprocessed
+        self._output       = None
+        self._header_cache = HeaderCache(cache_dir) if cache_dir else None
+        self._expander     = MacroExpander(self.macro, self._lexer._lexer)
+        self._evaluator    = ConditionEvaluator(self.macro, self._expander)
+
+        self._lexer.conditional_callback = self._skip_dead_groups
 
         self.define_macro("__DATE__", callback = time.strftime, arg_list = ["%b %d %Y"])
         self.define_macro("__FILE__", callback = self.get_current_filename)
         self.define_macro("__LINE__", callback = self.get_lineno)
         self.define_macro("__TIME__", callback = time.strftime, arg_list = ["%H:%M:%S"])
 
-        self._parser = yacc.yacc(module = self, debug = debug, start = "preprocessing_file", **kwargs)
-        self._di_tri_graph_replace_table =  {
-                                                # Digraph
-                                                '<:' : '[', '>:' : ']', '<%' : '{', '>%' : '}', '%:' : '#',  
-                                                # Trigraph
-                                                '??=' : '#', '??/' : '\\', '??\'' : '^', '??(' : '[',
-                                                '??)' : ']', '??!' : '|', '??<' : '{', '??>' : '}',
-                                                '??-' : '~',
-                                            }
+        # Predefined macros of a target (gcc_x86_64, arm_none_eabi...)
+        if profile:
+            self._load_profile(profile)
+
+        self._parser = yacc.yacc(module = self, debug = debug, start = "preprocessing_file", **table_options(self.TABLE_MODULE, **kwargs))
+        self._scanner = SourceScanner(keep_comment)
+        self._line_map = LineMap()
 
         if not stdlib_path:
             self._stdlib_path = ["stdlib/",]
         else:
             self._stdlib_path = stdlib_path
 
+        # Include directories (-I) are searched before stdlib path, a resolver can be shared
+        # between preprocessors using the same directories to share its lookups.
+        if include_resolver is None:
+            include_resolver = IncludeResolver(list(include_dirs) + list(self._stdlib_path), prescan_include)
+
+        self.include_resolver = include_resolver
+
         self._keep_comment       = keep_comment
         self._debug              = debug
-        self._discard_next_paren = False
 
     """
     Preprocessor production rules + semantics actions
@@ -316,7 +390,12 @@ class C99PreProcessor(object):
                    | text_line
                    | conditionally_supported_directive
         '''
-        p[0] = p[1]
+        # Top level output is written right away instead of being joined up to the whole file.
+        if self._output is not None and self._is_top_level(p):
+            self._output.write(p[1])
+            p[0] = ''
+        else:
+            p[0] = p[1]
 
     @debug_production
     def p_control_line(self, p):
@@ -328,103 +407,50 @@ class C99PreProcessor(object):
                      | pragma_directive NEWLINE
                      | undef_directive NEWLINE
         '''
-        p[0] = f'{p[1]}\n'
+        p[0] = f'{p[1]}{p[2]}'
 
     @debug_production
     def p_if_section(self, p):
         '''
         if_section  : if_group endif_line
         '''
-        if_block = '\n'
-
-        if p[1][0]:
-            if_block = p[1][1]
-        
-        # Only rescan if we aren't in another if block which might evaluate to False, otherwise useless processing could happens.
-        if not self._lexer.nested_if:
-            if_block = self.parse(if_block, lexer = self._lexer._lexer.clone())
-
-        p[0] = if_block
+        p[0] = self._select_group(p, [p[1]], p[2])
 
     @debug_production
     def p_if_section2(self, p):
         '''
         if_section  : if_group elif_groups endif_line
         '''
-        if_block = '\n'
-
-        if p[1][0]:
-            if_block = p[1][1]
-        else:
-            for elif_group in p[2]:
-                if elif_group[0]:
-                    if_block = elif_group[1]
-                    break
-
-        # Only rescan if we aren't in another if block which might evaluate to False, otherwise useless processing could happens.
-        if not self._lexer.nested_if:
-            if_block = self.parse(if_block, lexer = self._lexer._lexer.clone())
-
-        p[0] = if_block
+        p[0] = self._select_group(p, [p[1]] + p[2], p[3])
 
     @debug_production
     def p_if_section3(self, p):
         '''
         if_section  : if_group else_group endif_line
         '''
-        if_block = '\n'
-
-        if p[1][0]:
-            if_block = p[1][1]
-        else:
-            if_block = p[2]
-
-        # Only rescan if we aren't in another if block which might evaluate to False, otherwise useless processing could happens.
-        if not self._lexer.nested_if:            
-            if_block = self.parse(if_block, lexer = self._lexer._lexer.clone())
-
-        p[0] = if_block
+        p[0] = self._select_group(p, [p[1], p[2]], p[3])
 
     @debug_production
     def p_if_section4(self, p):
         '''
         if_section  : if_group elif_groups else_group endif_line
         '''
-
-        block_evaluated = False
-
-        if p[1][0]:
-            if_block = p[1][1]
-            block_evaluated = True
-        else:
-            for elif_group in p[2]:
-                if elif_group[0]:
-                    if_block = elif_group[1]
-                    block_evaluated = True
-                    break
-
-        if not block_evaluated:
-            if_block = p[3]
-
-        # Only rescan if we aren't in another if block which might evaluate to False, otherwise useless processing could happens.
-        if not self._lexer.nested_if:
-            if_block = self.parse(if_block, lexer = self._lexer._lexer.clone())
-
-        p[0] = if_block
+        p[0] = self._select_group(p, [p[1]] + p[2] + [p[3]], p[4])
 
     @debug_production
     def p_if_group(self, p):
         '''
-        if_group : IF constant_expression NEWLINE
-                 | IF constant_expression NEWLINE group
+        if_group : IF token_list NEWLINE
+                 | IF token_list NEWLINE group
         '''
-        group = ''
+        group        = ''
+        is_evaluated = bool(self._evaluator.evaluate(p[2]))
 
-        if p[2]:
+        if is_evaluated:
             if len(p) == 5:
                 group = p[4]
 
-        p[0] = (p[2], group)
+        p[0] = (is_evaluated, group, p.lineno(1), p.lineno(1) + len(p[3]))
 
     @debug_production
     def p_if_group2(self, p):
@@ -440,7 +466,7 @@ class C99PreProcessor(object):
             if len(p) == 5:
                 group = p[4]
 
-        p[0] = (is_defined, group)
+        p[0] = (is_defined, group, p.lineno(1), p.lineno(1) + len(p[3]))
 
     @debug_production
     def p_if_group3(self, p):
@@ -456,7 +482,7 @@ class C99PreProcessor(object):
             if len(p) == 5:
                 group = p[4]
 
-        p[0] = (not is_defined, group)
+        p[0] = (not is_defined, group, p.lineno(1), p.lineno(1) + len(p[3]))
 
     @debug_production
     def p_elif_groups(self, p):
@@ -473,16 +499,17 @@ class C99PreProcessor(object):
     @debug_production
     def p_elif_group(self, p):
         '''
-        elif_group : ELIF constant_expression NEWLINE
-                   | ELIF constant_expression NEWLINE group
+        elif_group : ELIF token_list NEWLINE
+                   | ELIF token_list NEWLINE group
         '''
-        group = ''
+        group        = ''
+        is_evaluated = bool(self._evaluator.evaluate(p[2]))
 
-        if p[2]:
+        if is_evaluated:
             if len(p) == 5:
                 group = p[4]
 
-        p[0] = (p[2], group)
+        p[0] = (is_evaluated, group, p.lineno(1), p.lineno(1) + len(p[3]))
 
     @debug_production
     def p_else_group(self, p):
@@ -495,69 +522,70 @@ class C99PreProcessor(object):
         if len(p) == 4:
             group = p[3]
 
-        p[0] = group
+        p[0] = (True, group, p.lineno(1), p.lineno(1) + len(p[2]))
 
     @debug_production
     def p_endif_line(self, p):
         '''
         endif_line : ENDIF NEWLINE
         '''
-        p[0] = '\n'
+        # Line of the directive and line following the if section.
+        p[0] = (p.lineno(1), p.lineno(1) + len(p[2]))
 
     @debug_production
     def p_define_directive(self, p):
         '''
         define_directive : DEFINE IDENTIFIER replacement_list
         '''
-        if not self._lexer.nested_if:
-            self.define_macro(p[2], replacement = p[3])
+        if self._is_top_level(p):
+            self.define_macro(p[2], replacement = tokens_to_str(p[3]), token_list = p[3])
             p[0] = '\n'
         else:
-            p[0] = f'{p[1]} {p[2]} {p[3]}'
+            p[0] = f'{p[1]} {p[2]} {tokens_to_str(p[3])}'
 
     @debug_production
     def p_define_directive_2(self, p):
         '''
         define_directive : DEFINE IDENTIFIER LPAREN ')' replacement_list
         '''
-        if not self._lexer.nested_if:
-            self.define_macro(p[2], replacement = p[5])
+        if self._is_top_level(p):
+            self.define_macro(p[2], replacement = tokens_to_str(p[5]), token_list = p[5], function_like = True)
             p[0] = '\n'
         else:
-            p[0] = f'{p[1]} {p[2]}() {p[5]}'
+            p[0] = f'{p[1]} {p[2]}() {tokens_to_str(p[5])}'
 
     @debug_production
     def p_define_directive_3(self, p):
         '''
         define_directive : DEFINE IDENTIFIER LPAREN identifier_list ')' replacement_list
         '''
-        if not self._lexer.nested_if:
-            self.define_macro(p[2], replacement = p[6], arg_list = p[4].split(','))
+        if self._is_top_level(p):
+            self.define_macro(p[2], replacement = tokens_to_str(p[6]), token_list = p[6], arg_list = p[4].split(','), function_like = True)
             p[0] = '\n'
         else:
-            p[0] = f'{p[1]} {p[2]}({p[4]}) {p[6]}'
+            p[0] = f'{p[1]} {p[2]}({p[4]}) {tokens_to_str(p[6])}'
 
     @debug_production
     def p_define_directive_4(self, p):
         '''
         define_directive : DEFINE IDENTIFIER LPAREN ELLIPSIS ')' replacement_list
         '''
-        if not self._lexer.nested_if:
-            self.define_macro(p[2], replacement = p[6], variadic = True)
+        if self._is_top_level(p):
+            self.define_macro(p[2], replacement = tokens_to_str(p[6]), token_list = p[6], variadic = True, function_like = True)
             p[0] = '\n'
         else:
-            p[0] = f'{p[1]} {p[2]}(...) {p[6]}'
+            p[0] = f'{p[1]} {p[2]}(...) {tokens_to_str(p[6])}'
 
     @debug_production
     def p_define_directive_5(self, p):
         '''
         define_directive : DEFINE IDENTIFIER LPAREN identifier_list ',' ELLIPSIS ')' replacement_list
         '''
-        if not self._lexer.nested_if:
-            self.define_macro(p[2], replacement = p[8], arg_list = p[4].split(','), variadic = True)
+        if self._is_top_level(p):
+            self.define_macro(p[2], replacement = tokens_to_str(p[8]), token_list = p[8], arg_list = p[4].split(','), variadic = True, function_like = True)
             p[0] = '\n'
         else:
-            p[0] = f'{p[1]} {p[2]}({p[4]},...) {p[8]}'
+            p[0] = f'{p[1]} {p[2]}({p[4]},...) {tokens_to_str(p[8])}'
 
     @debug_production
     def p_error_directive(self, p):
@@ -565,35 +593,34 @@ class C99PreProcessor(object):
         error_directive : ERROR
                         | ERROR token_list
         '''
-        if not self._lexer.nested_if:
+        if self._is_top_level(p):
             if len(p) == 2:
                 raise Exception()
             elif len(p) == 3:
-                raise Exception(p[2])
+                raise Exception(tokens_to_str(p[2]))
         else:
-            p[0] = f'{p[1]} {p[2] if len(p) == 2 else ""}'
+            p[0] = f'{p[1]} {tokens_to_str(p[2]) if len(p) == 3 else ""}'
 
     @debug_production
     def p_include_directive(self, p):
         '''
         include_directive : INCLUDE token_list
         '''
-        if not self._lexer.nested_if:
-            p[0] = self.include(p[2])
+        if self._is_top_level(p):
+            p[0] = self.include(tokens_to_str(self._expander.expand(p[2])))
         else:
-            p[0] = f'{p[1]} {p[2]}'
+            p[0] = f'{p[1]} {tokens_to_str(p[2])}'
 
     @debug_production
     def p_line_directive(self, p):
         '''
         line_directive : LINE token_list
         '''
-        if not self._lexer.nested_if:
-            p[2] = str(p[2])
-            token_list = p[2].split(' ')
+        if self._is_top_level(p):
+            token_list = [str(token.value) for token in self._expander.expand(p[2])]
             p[0] = self.lineno_update(token_list)
         else:
-            p[0] = f'{p[1]} {p[2]}'
+            p[0] = f'{p[1]} {tokens_to_str(p[2])}'
 
     @debug_production
     def p_pragma_directive(self, p):
@@ -602,214 +629,53 @@ class C99PreProcessor(object):
                          | PRAGMA token_list
                          | _PRAGMA '(' STRING_LITERAL ')'
         '''
-        if not self._lexer.nested_if:
-            p[0] = self.pragma(p[1:])
+        directive = [tokens_to_str(symbol) if isinstance(symbol, list) else symbol for symbol in p[1:]]
+
+        if self._is_top_level(p):
+            p[0] = self.pragma(directive)
         else:
-            p[0] = ' '.join(p[1:])
+            p[0] = ' '.join(directive)
 
     @debug_production
     def p_undef_directive(self, p):
         '''
         undef_directive : UNDEF IDENTIFIER
         '''
-        if not self._lexer.nested_if:
+        if self._is_top_level(p):
             self.undef_macro(p[2])
             p[0] = '\n'
         else:
             p[0] = f'{p[1]} {p[2]}'
     
-    @debug_production
-    def p_primary_expression(self, p):
-        '''primary_expression : IDENTIFIER
-        '''
-        if p[1] in self.macro:
-            replacement = self.expand_macro(p[1])
-            p[0] = replacement if replacement != None else p[1]
-        else:
-            p[0] = p[1]
-
-    @debug_production
-    def p_primary_expression2(self, p):
-        '''primary_expression : CONSTANT'''
-        p[0] = p[1]
-
-    @debug_production
-    def p_primary_expression3(self, p):
-        '''primary_expression : '(' constant_expression ')' '''
-        p[0] = p[2]
-
-    @debug_production
-    def p_unary_expression(self, p):
-        '''unary_expression : primary_expression
-                            | unary_operator unary_expression
-                            | DEFINED '(' IDENTIFIER ')' '''
-        if len(p) == 2:
-            p[0] = p[1]
-        elif len(p) == 3:
-            p[0] = p[1], p[2]
-        else:
-            p[0] = True if p[3] in self.macro else False
-
-    @debug_production
-    def p_unary_operator(self, p):
-        '''unary_operator : '&'
-                          | '*'  
-                          | '+'  
-                          | '-'  
-                          | '~'  
-                          | '!' '''
-        p[0] = p[1]
-
-    @debug_production
-    def p_multiplicative_expression(self, p):
-        '''multiplicative_expression : unary_expression
-                                     | multiplicative_expression '*' unary_expression
-                                     | multiplicative_expression '/' unary_expression
-                                     | multiplicative_expression '%' unary_expression '''
-        if len(p) == 2:
-            p[0] = p[1]
-        else:
-            if p[2] == '*':
-                p[0] = p[1] * p[3]
-            elif p[2] == '/':
-                p[0] = p[1] / p[3]
-            elif p[2] == '%':
-                p[0] = p[1] % p[3]
-
-    @debug_production
-    def p_additive_expression(self, p):
-        '''additive_expression : multiplicative_expression
-                               | additive_expression '+' multiplicative_expression
-                               | additive_expression '-' multiplicative_expression '''
-        if len(p) == 2:
-            p[0] = p[1]
-        else:
-            if p[2] == '+':
-                p[0] = p[1] + p[3]
-            elif p[2] == '-':
-                p[0] = p[1] - p[3]
-
-    @debug_production
-    def p_shift_expression(self, p):
-        '''shift_expression : additive_expression
-                            | shift_expression LEFT_OP additive_expression
-                            | shift_expression RIGHT_OP additive_expression '''
-        if len(p) == 2:
-            p[0] = p[1]
-        else:
-            if p[2] == '<<':
-                p[0] = p[1] << p[3]
-            elif p[2] == '>>':
-                p[0] = p[1] >> p[3]
-
-    @debug_production
-    def p_relational_expression(self, p):
-        '''relational_expression : shift_expression
-                                 | relational_expression '<' shift_expression
-                                 | relational_expression '>' shift_expression
-                                 | relational_expression LE_OP shift_expression
-                                 | relational_expression GE_OP shift_expression '''
-        if len(p) == 2:
-            p[0] = p[1]
-        else:
-            if p[2] == '<':
-                p[0] = p[1] < p[3]
-            elif p[2] == '>':
-                p[0] = p[1] > p[3]
-            elif p[2] == '<=':
-                p[0] = p[1] <= p[3]
-            elif p[2] == '>=':
-                p[0] = p[1] >= p[3]
-
-    @debug_production
-    def p_equality_expression(self, p):
-        '''equality_expression : relational_expression
-                               | equality_expression EQ_OP relational_expression
-                               | equality_expression NE_OP relational_expression '''
-        if len(p) == 2:
-            p[0] = p[1]
-        else:
-            if p[2] == '==':
-                p[0] = p[1] == p[3]
-            elif p[2] == '!=':
-                p[0] = p[1] != p[3]
-
-    @debug_production
-    def p_and_expression(self, p):
-        '''and_expression : equality_expression
-                          | and_expression '&' equality_expression '''
-        if len(p) == 2:
-            p[0] = p[1]
-        else:
-            p[0] = p[1] & p[3]
-
-    @debug_production
-    def p_exclusive_or_expression(self, p):
-        '''exclusive_or_expression : and_expression
-                                   | exclusive_or_expression '^' and_expression '''
-        if len(p) == 2:
-            p[0] = p[1]
-        else:
-            p[0] = p[1] ^ p[3]
-
-    @debug_production
-    def p_inclusive_or_expression(self, p):
-        '''inclusive_or_expression : exclusive_or_expression
-                                   | inclusive_or_expression '|' exclusive_or_expression '''
-        if len(p) == 2:
-            p[0] = p[1]
-        else:
-            p[0] = p[1] | p[3]
-
-    @debug_production
-    def p_logical_and_expression(self, p):
-        '''logical_and_expression : inclusive_or_expression
-                                  | logical_and_expression AND_OP inclusive_or_expression '''
-        if len(p) == 2:
-            p[0] = p[1]
-        else:
-            p[0] = p[1] and p[3]
-
-    @debug_production
-    def p_logical_or_expression(self, p):
-        '''
-        logical_or_expression : logical_and_expression
-                              | logical_or_expression OR_OP logical_and_expression '''
-        if len(p) == 2:
-            p[0] = p[1]
-        else:
-            p[0] = p[1] or p[2]
-
-    @debug_production
-    def p_conditional_expression(self, p ):
-        '''
-        conditional_expression : logical_or_expression
-                               | logical_or_expression '?' conditional_expression ':' conditional_expression '''
-        if len(p) == 2:
-            p[0] = p[1]
-        else:
-            p[0] = p[1] if p[2] else p[3] 
-
-    @debug_production
-    def p_constant_expression(self, p):
-        '''
-        constant_expression : conditional_expression
-        '''
-        p[0] = p[1]
-
     @debug_production
     def p_text_line(self, p):
         '''
         text_line : NEWLINE
                   | token_list NEWLINE
         '''
-        p[0] = ' '.join([str(t) for t in p[1:]])
+        if len(p) == 2:
+            p[0] = p[1]
+        # Lexer may already be inside the next if section since a text line is reduced on lookahead.
+        elif self._is_top_level(p):
+            is_continued = TEXT_LINE_RE.match(p.lexer.lexdata, p.lexpos(2) + len(p[2])) is not None
+            token_list   = self._expander.expand_line(p[1], is_continued)
+            write_tokens = getattr(self._output, 'write_tokens', None)
+
+            # Tokens are handed to the output as is when it collects tokens.
+            if write_tokens is not None:
+                write_tokens(token_list)
+                p[0] = p[2]
+            else:
+                p[0] = f'{tokens_to_str(token_list)} {p[2]}'
+        else:
+            # Text will be expanded once the enclosing if section is rescanned.
+            p[0] = f'{tokens_to_str(p[1])} {p[2]}'
 
     def p_conditionally_supported_directive(self, p):
         '''
         conditionally_supported_directive : DIRECTIVE token_list NEWLINE
         '''
-        p[0] = '\n'
+        p[0] = p[3]
     
     @debug_production
     def p_identifier_list(self, p):
@@ -830,6 +696,8 @@ class C99PreProcessor(object):
         '''
         if len(p) == 2:
             p[0] = p[1]
+        else:
+            p[0] = []
 
     @debug_production
     def p_token_list(self, p):
@@ -837,55 +705,18 @@ class C99PreProcessor(object):
         token_list : token
                    | token_list token
         '''
+        # Tokens are kept so macros are expanded on the whole list once it's complete.
         if len(p) == 2:
-            p[0] = p[1]
+            p[0] = [p[1]]
         else:
-            tokens = p[1:]
-            
-            # TODO: Check if there's a better way to skip open parenthesis once function-like macro
-            # has been expanded.
-            # 
-            # HACK: Because we are looking ahead for function-like macro expansion and PLY internally
-            # return matched '(' which is done before identifier is being expanded.
-            # So to know we need to skip it a boolean is set when function-like macro is
-            # expanded.
-            if self._discard_next_paren and tokens[1] == '(':
-                tokens.pop()
-                self._discard_next_paren = False
-
-            p[0] = ' '.join([str(t) for t in tokens])
+            p[1].append(p[2])
+            p[0] = p[1]
 
     def p_token(self, p):
         '''
         token :     IDENTIFIER
         '''
-        if p[1] in self.macro:
-            arg_list = []
-            replacement = None
-
-            # Lookahead so function like macro will be expanded correctly.
-            lexer = p.lexer.clone()
-
-            # We lookahead with a cloned lexer so we are able to backtrack if we see
-            # that macro should not be expanded because it's being recursive.
-            if lexer.lexmatch.group() == '(':
-                next_token = lexer.next().value
-                while next_token != ')':
-                    if next_token != ',':
-                        arg_list.append(str(next_token))
-                    next_token = lexer.next().value
-            
-                replacement = self.expand_macro(p[1], arg_list)
-                
-                if replacement != None:
-                    p.lexer.lexpos = lexer.lexpos
-                    self._discard_next_paren = True
-            else:
-                replacement = self.expand_macro(p[1], arg_list)
-
-            p[0] = replacement if replacement != None else p[1]
-        else:
-            p[0] = p[1]
+        p[0] = p.slice[1]
 
     def p_token2(self, p):
         '''
@@ -894,7 +725,8 @@ class C99PreProcessor(object):
                 |   STRING_LITERAL
                 |   operator_punc
         '''
-        p[0] = p[1]
+        # Operator or punctuator token is already produced by its own production rule.
+        p[0] = p[1] if p.slice[1].type == 'operator_punc' else p.slice[1]
 
     def p_operator_punc(self, p):
         '''operator_punc :     '='
@@ -948,11 +780,11 @@ class C99PreProcessor(object):
                                | '@'
                                | '#'
                                '''
-        p[0] = p[1]
+        p[0] = p.slice[1]
 
     def p_error(self, p):
         if p:
-            print(f'Syntax error: {p}')
+            print(f'Syntax error: {p} ({self._current_file}:{self._line_map.physical_line(p.lineno)})')
         else:
             print("Reach EOF")
 
@@ -970,21 +802,187 @@ class C99PreProcessor(object):
 
     def get_lineno(self, *args):
         """
-        Gets the lineno.
+        Gets the physical line of the macro being expanded.
         
         :param      args:  The arguments
         :type       args:  list
         """
-        return self._lexer._lexer.lineno
+        return self._line_map.physical_line(self._expander.lineno)
+
+    def _is_group_live(self, directive, argument):
+        """
+        Evaluate the condition of a group as the grammar does.
+
+        :param      directive:  The directive (if, ifdef, ifndef, elif or else)
+        :type       directive:  str
+        :param      argument:   The directive argument
+        :type       argument:   str
+        """
+        if directive == 'else':
+            return True
+        elif directive == 'ifdef' or directive == 'ifndef':
+            return (argument.split()[0] in self.macro) == (directive == 'ifdef')
+
+        return bool(self._evaluator.evaluate(self._expander.tokenize(argument)))
+
+    def _skip_dead_groups(self, lexer, line_start):
+        """
+        Find dead groups of an if section about to be lexed so the lexer skips them.
+
+        Only directive lines are scanned, conditions are evaluated in order with the
+        current macro state until a live group is found, like C does. Grammar still
+        evaluates conditions (memoized) and gets an empty group for skipped ones.
+        
+        :param      lexer:       The lexer
+        :type       lexer:       ply.lex.Lexer
+        :param      line_start:  The position of the #if line
+        :type       line_start:  int
+        """
+        group_list = scan_conditional_section(lexer.lexdata, line_start)
+
+        if group_list is None:
+            return
+
+        is_live_found = False
+
+        for (directive, argument, _, line_end), next_group in zip(group_list, group_list[1:]):
+            if not is_live_found:
+                try:
+                    is_live_found = self._is_group_live(directive, argument)
+                except Exception:
+                    # Grammar reports invalid conditions.
+                    return
+
+                if is_live_found:
+                    continue
+
+            if line_end < next_group[2]:
+                lexer.skip_table[line_end] = next_group[2]
+
+    def _select_group(self, p, group_list, endif_line):
+        """
+        Select the first live group of an if section.
+
+        At top level, the group is rescanned from its first line. Otherwise it's
+        rescanned along the enclosing if section, so lines of the section around
+        it are kept as empty lines and each text line of the group is still at
+        its own line (__LINE__).
+        
+        :param      p:           The if section production
+        :type       p:           ply.yacc.YaccProduction
+        :param      group_list:  The groups (is live, text, directive line, first line)
+        :type       group_list:  list
+        :param      endif_line:  The #endif line and the line following the if section
+        :type       endif_line:  tuple
+        """
+        is_top_level = self._is_top_level(p)
+        section_line = group_list[0][2]
+        end_line     = endif_line[1]
+
+        for index, (is_live, group, _, group_line) in enumerate(group_list):
+            if not is_live:
+                continue
+
+            if is_top_level:
+                lexer        = self._lexer._lexer.clone()
+                lexer.lineno = group_line
+
+                return self.parse(group, lexer = lexer)
+
+            next_line = group_list[index + 1][2] if index + 1 < len(group_list) else endif_line[0]
+
+            return '\n' * (group_line - section_line) + group + '\n' * (end_line - next_line)
+
+        return '\n' if is_top_level else '\n' * (end_line - section_line)
+
+    def _is_top_level(self, p):
+        """
+        Determine whether a production is reduced outside of any if section.
+        
+        :param      p:    The production
+        :type       p:    ply.yacc.YaccProduction
+        """
+        return all(symbol.type in ('$end', 'group') for symbol in p.stack)
 
     def parse(self, data, lexer = None):
         """
         Parse the file content using C 99 standard.
+
+        Output is written to the current output stream, or returned when no stream is set.
         
         :param      data:  The header/source file content
         :type       data:  str
         """
-        return self._parser.parse(data, lexer = lexer)
+        if lexer is None:
+            lexer = self._lexer._lexer
+
+        # Dead groups found while lexing data, line feed position ending their directive line -> group end
+        lexer.skip_table    = {}
+        # Start of an outermost #if line whose dead groups aren't found yet
+        lexer.if_line_start = None
+
+        if self._output is not None:
+            return self._parser.parse(data, lexer = lexer) or ''
+
+        self._output = StringIO()
+
+        try:
+            remaining_output = self._parser.parse(data, lexer = lexer) or ''
+            return self._output.getvalue() + remaining_output
+        finally:
+            self._output = None
+
+    def _load_profile(self, name):
+        """
+        Define predefined macros of a target profile.
+
+        Profiles are precompiled so no definition is parsed, if the precompiled
+        profile is missing or outdated then definitions are parsed instead.
+
+        :param      name:  The profile name
+        :type       name:  str
+        """
+        macro_table = load_profile(name)
+
+        if macro_table is None:
+            macro_table = compile_profile(name, C99PreProcessor())
+
+        dict.update(self.macro, macro_table)
+
+    def snapshot(self, output = ''):
+        """
+        Capture macros, include guards and dependencies, for instance once a
+        prelude shared by many sources has been preprocessed.
+
+        Callback macros (__FILE__, __LINE__...) belong to the preprocessor so they
+        aren't part of the snapshot.
+
+        :param      output:  The output the state comes with (prelude output)
+        :type       output:  str
+        """
+        macro_table     = {name: macro for name, macro in dict.items(self.macro) if not macro.callback}
+        dependency_list = list(dict.fromkeys(self._source_list + list(self.dependencies)))
+
+        return PreProcessorSnapshot(macro_table, dict(self._include_guard_table), dependency_list, output)
+
+    def restore(self, snapshot):
+        """
+        Restore a state captured by snapshot, macros defined since are dropped.
+
+        :param      snapshot:  The snapshot
+        :type       snapshot:  PreProcessorSnapshot
+        """
+        callback_table = {name: macro for name, macro in dict.items(self.macro) if macro.callback}
+
+        # Table is rebuilt without notifying recorders, a restore isn't part of any header output.
+        dict.clear(self.macro)
+        dict.update(self.macro, callback_table)
+        dict.update(self.macro, snapshot.macro_table)
+
+        self._include_guard_table = dict(snapshot.include_guard_table)
+        # Sources state comes from are dependencies of every output preprocessed from now.
+        self.dependencies         = {Path(path): None for path, _ in snapshot.dependency_list}
+        self._source_list         = []
 
     def define_macro(self, name, **kwargs):
         """
@@ -995,7 +993,11 @@ class C99PreProcessor(object):
         :param      kwargs:     The keyword arguments
         :type       kwargs:     dict
         """
-        self.macro[name] = ir.Macro(name, **kwargs) 
+        # Replacement list is compiled from its tokens, so tokenize it when only its text is given.
+        if 'token_list' not in kwargs and not kwargs.get('callback'):
+            kwargs['token_list'] = self._expander.tokenize(str(kwargs.get('replacement', '')))
+
+        self.macro[name] = ir.Macro(name, **kwargs)
         return self.macro[name]
 
     def expand_macro(self, name, arg_list = []):
@@ -1008,25 +1010,9 @@ class C99PreProcessor(object):
         :type       arg_list:  list
         """
         if name in self.macro:
-            replacement = None
-            if not self.macro[name].has_been_expanded:
-                replacement = self.macro[name].expand(arg_list)
-                
-                # Rescanning  yield "Reach EOF" because parser expects the input to be compliant as a source file.
-                # So we are appending a newline to the replacement to follow C standard.
-                # NB: replacement needs to be casted to str due to return of int/float from lexer (see if it can be handled better).
-                lexer = self._lexer._lexer.clone()
-                lexer_input = str(replacement) + '\n'
-                
-                # We remove last char which is the extra newline added previously to allow parsing of the replacement as a source file.
-                replacement = self.parse(lexer_input, lexer = lexer)[:-1]
-            else:
-                print(f'Warning: Macro {name} is recursive')
-
-            # Reset expansion flag to False to allow macro expansion in detection of a further token in current parsed text.
-            self.macro[name].has_been_expanded = False
+            invocation = f'{name}({",".join(arg_list)})' if self.macro[name].function_like else name
 
-            return replacement
+            return tokens_to_str(self._expander.expand(self._expander.tokenize(invocation)))
         else:
             raise NameError(f'Macro {name} not defined.')
 
@@ -1046,38 +1032,140 @@ class C99PreProcessor(object):
         :param      header_name:  The header name
         :type       header_name:  str
         """
-        include_content  = ''
-        is_include_found = False
-        header_path      = header_name[1:-1]
-
-        if header_path in self.headers_table:
-            return self.headers_table[header_path]
-
-        if header_name[0] == '"' and header_name[-1] == '"':
-            include_path = self._current_file.parent.joinpath(header_path)
-            is_include_found = include_path.is_file()
-
-        # If include hasn't been found in relative path or header name is enclosed by <> then looks inside
-        # stdlib path.
-        if not is_include_found:
-            for std_dir in self._stdlib_path:
-                include_path = Path(std_dir).joinpath(header_path)
-                is_include_found = include_path.is_file()
-                if is_include_found:
-                    break
+        include_path = self._resolve_include(header_name)
+
+        if not self._is_include_skipped(include_path):
+            # Included output is written to the current output stream instead of being returned.
+            self._process_include(include_path)
+
+        return '\n'
+
+    def _resolve_include(self, header_name):
+        """
+        Resolve a header name and record it as a dependency.
+        
+        :param      header_name:  The header name
+        :type       header_name:  str
+        """
+        include_path = self.include_resolver.resolve(header_name, self._current_file.parent)
+
+        if include_path is None:
+            # Neither relative path nor include directories yield an existing file so we have to raise an error.
+            raise FileNotFoundError(f'{header_name[1:-1]} doesn\'t resolve to an existing file.')
+
+        self.dependencies[include_path.resolve()] = None
+
+        return include_path
+
+    def _is_include_skipped(self, include_path):
+        """
+        Determine whether an include can be skipped without reading the file,
+        because it has #pragma once or its include guard macro is defined.
+
+        Both are looked up inside the macro table so header cache records them.
         
-        if not is_include_found:
-            # Neither stdlib/relative path yield an existing file so we have to raise an error.
-            raise FileNotFoundError(f'{header_path} doesn\'t resolve to an existing file.')
-        else:
-            include_content = f'{self.process(include_path, self._lexer._lexer.clone())}\n'
+        :param      include_path:  The include path
+        :type       include_path:  Path
+        """
+        resolved_path = include_path.resolve()
+
+        if PRAGMA_ONCE_NAME.format(resolved_path) in self.macro:
+            return True
 
-        # Add the preprocessed include inside the headers table so we can later output
-        # contents inside intermediate files *.i or avoid reprocessing an already preprocessed
-        # header.
-        self.headers_table[header_path] = include_content
+        include_guard = self._include_guard_table.get(resolved_path)
 
-        return include_content
+        return include_guard is not None and include_guard in self.macro
+
+    def _detect_include_guard(self, file_content):
+        """
+        Detect the include guard of a file (like GCC multiple include optimization).
+
+        File is guarded when it starts with #ifndef X (or #if !defined(X)) directly
+        followed by #define X and nothing but whitespaces follows the matching #endif.
+        
+        :param      file_content:  The file content once comments are stripped
+        :type       file_content:  str
+        """
+        match = INCLUDE_GUARD_RE.match(file_content)
+
+        if not match:
+            return None
+
+        include_guard = match.group(1) or match.group(2) or match.group(3)
+
+        if include_guard != match.group(4):
+            return None
+
+        depth = 0
+
+        for directive in DIRECTIVE_RE.finditer(file_content, match.start()):
+            name = directive.group(1)
+
+            if name in ('if', 'ifdef', 'ifndef'):
+                depth += 1
+            elif name in ('elif', 'else') and depth == 1:
+                return None
+            elif name == 'endif':
+                depth -= 1
+
+                if not depth:
+                    line_end = file_content.find('\n', directive.end())
+
+                    if line_end < 0 or not file_content[line_end:].strip():
+                        return include_guard
+
+                    return None
+
+        return None
+
+    def _process_include(self, include_path):
+        """
+        Preprocess an included file and write its output to the current output stream.
+
+        When a cache directory is set, the preprocessed header is fetched from the
+        header cache if its content, included files and macros it reads are unchanged.
+        
+        :param      include_path:  The resolved include path
+        :type       include_path:  Path
+        """
+        if not self._header_cache:
+            self._process_file(include_path, self._lexer._lexer.clone())
+            return
+
+        # The digest identifies the header content for both its cache key and includers' records.
+        with map_source(include_path) as content:
+            digest = file_digest(content)
+
+        key   = self._header_cache.key(include_path, digest, f'{type(self).__name__}{self._keep_comment}')
+        entry = self._header_cache.lookup(key, self.macro)
+
+        if entry:
+            self.macro.replay(entry)
+
+            if entry.include_guard:
+                self._include_guard_table[include_path.resolve()] = entry.include_guard
+
+            self.dependencies.update((Path(path).resolve(), None) for path, _ in entry.dependency_list[1:])
+            self._output.write(entry.output)
+            return
+
+        recorder   = self.macro.record([(str(include_path), digest)])
+        output_tmp = self._output
+
+        # Output is captured since it has to be stored inside the cache.
+        self._output = StringIO()
+
+        try:
+            self._process_file(include_path, self._lexer._lexer.clone())
+            output = self._output.getvalue()
+        finally:
+            self._output = output_tmp
+            self.macro.stop(recorder)
+
+        if recorder.cacheable:
+            self._header_cache.store(key, CacheEntry(output, recorder, self._include_guard_table.get(include_path.resolve())))
+
+        self._output.write(output)
 
     def pragma(self, directive):
         """
@@ -1086,6 +1174,10 @@ class C99PreProcessor(object):
         :param      directive:  The directive
         :type       directive:  list
         """
+        if [argument.strip() for argument in directive[1:]] == ['once']:
+            name = PRAGMA_ONCE_NAME.format(self._current_file.resolve())
+            self.macro[name] = ir.Macro(name)
+
         return '\n'
 
     def lineno_update(self, directive):
@@ -1103,36 +1195,6 @@ class C99PreProcessor(object):
         
         return '\n'
 
-    def _replace_di_trigraph(self, file_content):
-        """
-        Replace all digraphs and trigraphs to their corresponding single character.
-        
-        :param      file_content:    The header/source file content
-        :type       file_content:    str
-        """
-        for di_trigraph, replacing_char in self._di_tri_graph_replace_table.items():
-            file_content = file_content.replace(di_trigraph, replacing_char)
-
-        return file_content
-
-    def _join_backslash(self, file_content):
-        """
-        Replace all digraphs and trigraphs to their corresponding single character.
-        
-        :param      file_content:    The header/source file content
-        :type       file_content:    str
-        """
-        return file_content.replace('\\\n', '')
-
-    def _strip_comment(self, file_content):
-        """
-        Strip all comments from the file content.
-        
-        :param      file_content:  The header/source file content
-        :type       file_content:  str
-        """
-        return re.sub(COMMENT_RE, ' ', file_content)
-
     def _is_source_file(self, file_content):
         """
         Determines whether the specified file content is source file.
@@ -1149,6 +1211,56 @@ class C99PreProcessor(object):
         The pre processing is responsible of directive execution which
         starts with '#'.
 
+        :param      file_path:  The file path
+        :type       file_path:  str
+        """
+        output = StringIO()
+        self.process_to(file_path, output, lexer)
+
+        return output.getvalue()
+
+    def process_to(self, file_path, output_file, lexer = None):
+        """
+        Preprocess a source file and write its output to a stream.
+
+        Output (included headers too) is written in order as soon as each top level
+        line is preprocessed, so memory usage doesn't depend on output size.
+
+        :param      file_path:    The file path
+        :type       file_path:    str
+        :param      output_file:  The output stream
+        :type       output_file:  io.TextIOBase
+        """
+        output_tmp   = self._output
+        self._output = output_file
+
+        self._source_list.append(Path(file_path).resolve())
+
+        try:
+            self._process_file(file_path, lexer)
+        finally:
+            self._output = output_tmp
+
+    def process_tokens(self, file_path, text_output = None, lexer = None):
+        """
+        Preprocess a source file into a token list a parser can consume directly.
+
+        Preprocessed text is only produced when a text stream is given.
+
+        :param      file_path:    The file path
+        :type       file_path:    str
+        :param      text_output:  The stream receiving preprocessed text
+        :type       text_output:  io.TextIOBase|None
+        """
+        output = TokenOutput(self._expander.tokenize, text_output)
+        self.process_to(file_path, output, lexer)
+
+        return output.token_list
+
+    def _process_file(self, file_path, lexer = None):
+        """
+        Preprocess a file and write its output to the current output stream.
+
         :param      file_path:  The file path
         :type       file_path:  str
         """
@@ -1156,36 +1268,35 @@ class C99PreProcessor(object):
 
         # Store temporarily current file in case of include
         current_file_tmp = self._current_file 
+        line_map_tmp     = self._line_map
         self._current_file = file
 
-        file_content = file.read_text()
+        file_content = read_source(file)
         
         if not self._is_source_file(file_content):
             file_content += '\n'
 
-        # Translation phase 1
-        file_content = self._replace_di_trigraph(file_content)
-        
-        # Translation phase 2
-        file_content = self._join_backslash(file_content)
-        
-        # Translation phase 3 and 4 are done in parallel
-        if not self._keep_comment:
-            file_content = self._strip_comment(file_content)
+        # Translation phases 1 to 3 are done in a single pass, phase 4 is done while parsing.
+        file_content, self._line_map = self._scanner.scan(file_content)
+
+        include_guard = self._detect_include_guard(file_content)
+
+        if include_guard:
+            self._include_guard_table[file.resolve()] = include_guard
         
         if not lexer:
             lexer = self._lexer._lexer
 
+        # Line numbers are relative to the file so they can be mapped to physical lines.
+        lexer.lineno = 1
+
         # Clone the lexer to allow recursion without interfering with current tokenization.
-        preprocessed_output = self.parse(file_content, lexer = lexer)
+        self._output.write(self.parse(file_content, lexer = lexer))
         self._current_file = current_file_tmp
-
-        return preprocessed_output
+        self._line_map     = line_map_tmp
 
 if __name__ == "__main__":
     pre_processor = C99PreProcessor(debug = False, keep_comment = False)
 
-    preprocessed_code = pre_processor.process("../examples/digraph_trigraph/directive.c")
-
     with open("../output/directive.i" , "wt") as preprocessed_file:
-        preprocessed_file.write(preprocessed_code)
\ No newline at end of file
+        pre_processor.process_to("../examples/digraph_trigraph/directive.c", preprocessed_file)
\ No newline at end of file
@@ -0,0 +1,278 @@
+from preprocessor.header_cache import macro_signature
+from preprocessor.macro_expander import tokens_to_str
+
+import copy
+
+# Binary operators precedence (C99 6.5.5 to 6.5.14)
+BINARY_PRECEDENCE_TABLE = {
+                                '||' : 1, '&&' : 2, '|' : 3, '^' : 4, '&' : 5,
+                                '==' : 6, '!=' : 6,
+                                '<'  : 7, '>'  : 7, '<=' : 7, '>=' : 7,
+                                '<<' : 8, '>>' : 8,
+                                '+'  : 9, '-'  : 9,
+                                '*'  : 10, '/' : 10, '%' : 10,
+                          }
+
+def c_division(left, right):
+    """
+    Divide as C does, integer division truncates toward zero.
+
+    :param      left:   The left operand
+    :type       left:   int|float
+    :param      right:  The right operand
+    :type       right:  int|float
+    """
+    if not right:
+        raise Exception("Division by zero in #if/#elif condition.")
+
+    if isinstance(left, int) and isinstance(right, int):
+        quotient = abs(left) // abs(right)
+        return quotient if (left < 0) == (right < 0) else -quotient
+
+    return left / right
+
+def c_modulo(left, right):
+    return left - right * c_division(left, right)
+
+BINARY_OPERATOR_TABLE = {
+                            '|'  : lambda left, right: left | right,
+                            '^'  : lambda left, right: left ^ right,
+                            '&'  : lambda left, right: left & right,
+                            '==' : lambda left, right: int(left == right),
+                            '!=' : lambda left, right: int(left != right),
+                            '<'  : lambda left, right: int(left < right),
+                            '>'  : lambda left, right: int(left > right),
+                            '<=' : lambda left, right: int(left <= right),
+                            '>=' : lambda left, right: int(left >= right),
+                            '<<' : lambda left, right: left << right,
+                            '>>' : lambda left, right: left >> right,
+                            '+'  : lambda left, right: left + right,
+                            '-'  : lambda left, right: left - right,
+                            '*'  : lambda left, right: left * right,
+                            '/'  : c_division,
+                            '%'  : c_modulo,
+                        }
+
+UNARY_OPERATOR_TABLE = {
+                            '+' : lambda operand: +operand,
+                            '-' : lambda operand: -operand,
+                            '~' : lambda operand: ~operand,
+                            '!' : lambda operand: int(not operand),
+                       }
+
+class ConditionCompiler(object):
+    """
+    Compile a fully expanded #if condition into a closure (C99 6.10.1).
+
+    Closures evaluate their operands lazily, so a division by zero inside
+    a short-circuited operand of &&, || or ?: isn't evaluated, as in C.
+    """
+
+    def __init__(self, token_list):
+        self._token_list = token_list
+        self._index      = 0
+
+    def _peek(self):
+        if self._index < len(self._token_list):
+            return self._token_list[self._index].value
+
+        return None
+
+    def _next(self):
+        token = self._token_list[self._index] if self._index < len(self._token_list) else None
+
+        if token is None:
+            raise Exception("Unexpected end of #if/#elif condition.")
+
+        self._index += 1
+
+        return token
+
+    def _expect(self, value):
+        token = self._next()
+
+        if token.value != value:
+            raise Exception(f"Expected '{value}' instead of '{token.value}' in #if/#elif condition.")
+
+    def compile(self):
+        """
+        Compile the condition.
+        """
+        condition = self._conditional()
+
+        if self._index != len(self._token_list):
+            raise Exception(f"Unexpected '{self._peek()}' in #if/#elif condition.")
+
+        return condition
+
+    def _conditional(self):
+        condition = self._binary(1)
+
+        if self._peek() != '?':
+            return condition
+
+        self._next()
+        when_true = self._conditional()
+        self._expect(':')
+        when_false = self._conditional()
+
+        return lambda: when_true() if condition() else when_false()
+
+    def _binary(self, min_precedence):
+        left = self._unary()
+
+        while self._peek() in BINARY_PRECEDENCE_TABLE and BINARY_PRECEDENCE_TABLE[self._peek()] >= min_precedence:
+            operator = self._next().value
+            right    = self._binary(BINARY_PRECEDENCE_TABLE[operator] + 1)
+
+            if operator == '&&':
+                left = (lambda left, right: lambda: int(bool(left()) and bool(right())))(left, right)
+            elif operator == '||':
+                left = (lambda left, right: lambda: int(bool(left()) or bool(right())))(left, right)
+            else:
+                left = (lambda function, left, right: lambda: function(left(), right()))(BINARY_OPERATOR_TABLE[operator], left, right)
+
+        return left
+
+    def _unary(self):
+        if self._peek() in UNARY_OPERATOR_TABLE:
+            function = UNARY_OPERATOR_TABLE[self._next().value]
+            operand  = self._unary()
+
+            return lambda: function(operand())
+
+        return self._primary()
+
+    def _primary(self):
+        token = self._next()
+
+        if token.value == '(':
+            condition = self._conditional()
+            self._expect(')')
+
+            return condition
+        elif token.type == 'CONSTANT':
+            value = token.value
+            return lambda: value
+        elif token.type == 'IDENTIFIER':
+            # Identifiers remaining after macro expansion are replaced by 0.
+            return lambda: 0
+
+        raise Exception(f"Unexpected '{token.value}' in #if/#elif condition.")
+
+class ConditionEvaluator(object):
+    """
+    Evaluate #if/#elif conditions.
+
+    Conditions are compiled once per expanded token sequence and results are
+    memoized per condition on the macros read while evaluating it (macros
+    expanded indirectly included), so an unchanged condition under unchanged
+    macros costs a dict lookup and a signature check per macro it reads.
+    """
+
+    def __init__(self, macro_table, expander, max_entries = 8):
+        self._macro_table    = macro_table
+        self._expander       = expander
+        self._max_entries    = max_entries
+
+        # Expanded condition -> closure
+        self._compiled_table = {}
+        # Condition -> [(macro reads, result)]
+        self._memo_table     = {}
+
+    def _match(self, macro_reads):
+        """
+        Determine whether macros read by a memoized evaluation are unchanged.
+
+        Lookups go through the macro table so header cache records them as well.
+
+        :param      macro_reads:  The macro signatures
+        :type       macro_reads:  dict
+        """
+        for name, signature in macro_reads.items():
+            macro = self._macro_table[name] if name in self._macro_table else None
+
+            if macro_signature(macro) != signature:
+                return False
+
+        return True
+
+    def _replace_defined(self, token_list):
+        """
+        Replace defined X and defined(X) by 1 or 0 before macro expansion.
+
+        :param      token_list:  The condition token list
+        :type       token_list:  list
+        """
+        output = []
+        index  = 0
+
+        while index < len(token_list):
+            token = token_list[index]
+
+            if token.value != 'defined':
+                # A condition like A < B && C > D is lexed as a bracketed header name.
+                if token.type == 'HEADER_NAME' and token.value[0] == '<':
+                    for text in ('<', token.value[1:-1], '>'):
+                        output.extend(self._expander.tokenize(text, token.lineno))
+                else:
+                    output.append(token)
+
+                index += 1
+                continue
+
+            if index + 1 < len(token_list) and token_list[index + 1].value == '(':
+                name   = token_list[index + 2] if index + 2 < len(token_list) else None
+                index += 4
+
+                if name is None or index > len(token_list) or token_list[index - 1].value != ')':
+                    raise Exception("Missing ')' after defined in #if/#elif condition.")
+            elif index + 1 < len(token_list):
+                name   = token_list[index + 1]
+                index += 2
+            else:
+                raise Exception("Missing macro name after defined in #if/#elif condition.")
+
+            constant       = copy.copy(token)
+            constant.type  = 'CONSTANT'
+            constant.value = int(name.value in self._macro_table)
+            output.append(constant)
+
+        return output
+
+    def _evaluate(self, token_list):
+        expanded_token_list = self._expander.expand(self._replace_defined(token_list))
+        expanded_condition  = tokens_to_str(expanded_token_list)
+
+        if expanded_condition not in self._compiled_table:
+            self._compiled_table[expanded_condition] = ConditionCompiler(expanded_token_list).compile()
+
+        return self._compiled_table[expanded_condition]()
+
+    def evaluate(self, token_list):
+        """
+        Evaluate a condition.
+
+        :param      token_list:  The condition token list
+        :type       token_list:  list
+        """
+        condition  = tokens_to_str(token_list)
+        entry_list = self._memo_table.setdefault(condition, [])
+
+        for macro_reads, result in entry_list:
+            if self._match(macro_reads):
+                return result
+
+        recorder = self._macro_table.record()
+
+        try:
+            result = self._evaluate(token_list)
+        finally:
+            self._macro_table.stop(recorder)
+
+        # Conditions using __LINE__ or another callback macro are never memoized.
+        if recorder.cacheable:
+            entry_list.insert(0, (recorder.macro_reads, result))
+            del entry_list[self._max_entries:]
+
+        return result
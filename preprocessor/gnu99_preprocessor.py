@@ -14,6 +14,9 @@ class PreProcessorFlags(IntEnum):
 class GNU99PreProcessor(C99PreProcessor):
     
     def _create_line_control(self, filename, flag_list = []):
+        # Line control depends on the includer line number so it can't be cached.
+        self.macro.taint()
+
         return f'#{self._lexer._lexer.lineno} "{filename}" {" ".join([str(flag.value) for flag in flag_list])}\n'
 
     def include(self, header_name):
@@ -24,16 +27,22 @@ class GNU99PreProcessor(C99PreProcessor):
         :type       header_name:  str
         """
 
+        include_path = self._resolve_include(header_name)
+
+        # Skipped headers produce no output, line controls included.
+        if self._is_include_skipped(include_path):
+            return '\n'
+
         line_control_start_flag = [PreProcessorFlags.START_FILE]
 
         if header_name[0] == '<' and header_name[-1] == '>':
             line_control_start_flag.append(PreProcessorFlags.SYSTEM_HEADER)
 
-        include_content = self._create_line_control(header_name[1:-1], line_control_start_flag)
-        include_content += super(GNU99PreProcessor, self).include(header_name)
-        include_content += self._create_line_control(os.path.basename(self._current_file), [PreProcessorFlags.RETURN_TO_FILE])
+        # Included output is written to the output stream so start line control has to be written first.
+        self._output.write(self._create_line_control(header_name[1:-1], line_control_start_flag))
+        self._process_include(include_path)
 
-        return include_content
+        return '\n' + self._create_line_control(os.path.basename(self._current_file), [PreProcessorFlags.RETURN_TO_FILE])
     
     # TODO: Add missing line control. GNU preprocessor adds a line control when returning/starting to preprocess of the current file.
     # TODO: Add missing line control when extern "C" is encountered.
@@ -41,7 +50,5 @@ class GNU99PreProcessor(C99PreProcessor):
 if __name__ == "__main__":
     pre_processor = GNU99PreProcessor(debug = False, keep_comment = False)
 
-    preprocessed_code = pre_processor.process("../examples/digraph_trigraph/directive.c")
-
     with open("../output/directive.i" , "wt") as preprocessed_file:
-        preprocessed_file.write(preprocessed_code)
\ No newline at end of file
+        pre_processor.process_to("../examples/digraph_trigraph/directive.c", preprocessed_file)
\ No newline at end of file
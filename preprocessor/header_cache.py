@@ -0,0 +1,264 @@
+import hashlib
+import os
+import pickle
+from pathlib import Path
+
+# Bump this value whenever the layout of a cache entry changes so stale
+# entries written by an older CoPY are never reused.
+CACHE_VERSION = 6
+
+def macro_signature(macro):
+    """
+    Compute a comparable signature of a macro definition.
+
+    Callback macros (__FILE__, __LINE__...) are only identified by their name
+    because their replacement depends on the preprocessor state.
+
+    :param      macro:  The macro
+    :type       macro:  ir.Macro|None
+    """
+    if macro is None:
+        return None
+    elif macro.callback:
+        return ('callback', macro.name)
+    else:
+        return (macro.replacement, tuple(macro.arg_list), macro.variadic, macro.function_like)
+
+def file_digest(content):
+    """
+    Compute the digest of a file content.
+
+    :param      content:  The file content
+    :type       content:  bytes
+    """
+    return hashlib.sha256(content).hexdigest()
+
+class MacroRecorder(object):
+    """
+    Record macros read and written while a header is being preprocessed.
+
+    Only macros read before being written by the header itself are part of
+    the macro state the header output depends on.
+    """
+
+    def __init__(self, dependency_list = []):
+        self.macro_reads     = {}
+        self.macro_writes    = {}
+        self.dependency_list = list(dependency_list)
+        self.cacheable       = True
+
+    def read(self, name, macro):
+        if name not in self.macro_writes and name not in self.macro_reads:
+            self.macro_reads[name] = macro_signature(macro)
+
+    def write(self, name, macro):
+        self.macro_writes[name] = macro
+
+    def merge(self, recorder):
+        """
+        Merge a nested recorder (included header) into this one.
+
+        :param      recorder:  The nested recorder
+        :type       recorder:  MacroRecorder
+        """
+        for name, signature in recorder.macro_reads.items():
+            if name not in self.macro_writes and name not in self.macro_reads:
+                self.macro_reads[name] = signature
+
+        self.macro_writes.update(recorder.macro_writes)
+        self.dependency_list.extend(recorder.dependency_list)
+        self.cacheable = self.cacheable and recorder.cacheable
+
+class MacroTable(dict):
+    """
+    Macro table which notifies active recorders of every macro lookup
+    and (re)definition.
+
+    Lookups of undefined macros are recorded as well because a header
+    output also depends on macros being absent (include guards for instance).
+    """
+
+    def __init__(self, *args, **kwargs):
+        super(MacroTable, self).__init__(*args, **kwargs)
+        self._recorder_list = []
+
+    def record(self, dependency_list = []):
+        """
+        Start recording macro accesses.
+
+        :param      dependency_list:  The files the recorded output depends on
+        :type       dependency_list:  list
+        """
+        recorder = MacroRecorder(dependency_list)
+        self._recorder_list.append(recorder)
+        return recorder
+
+    def stop(self, recorder):
+        """
+        Stop recording macro accesses and merge them into the enclosing recorder.
+
+        :param      recorder:  The recorder
+        :type       recorder:  MacroRecorder
+        """
+        self._recorder_list.remove(recorder)
+
+        if self._recorder_list:
+            self._recorder_list[-1].merge(recorder)
+
+    def taint(self):
+        """
+        Mark output of every recorded header as not cacheable.
+        """
+        for recorder in self._recorder_list:
+            recorder.cacheable = False
+
+    def replay(self, recorder):
+        """
+        Apply a recorded header effect on the macro table.
+
+        :param      recorder:  The recorder
+        :type       recorder:  MacroRecorder
+        """
+        # Macros the header reads are read by its includer too.
+        for name in recorder.macro_reads:
+            self._record_read(name)
+
+        if self._recorder_list:
+            self._recorder_list[-1].dependency_list.extend(recorder.dependency_list)
+
+        for name, macro in recorder.macro_writes.items():
+            if macro is None:
+                self.pop(name, None)
+            else:
+                self[name] = macro
+
+    def match(self, recorder):
+        """
+        Determine whether current macro state matches the recorded one.
+
+        :param      recorder:  The recorder
+        :type       recorder:  MacroRecorder
+        """
+        for name, signature in recorder.macro_reads.items():
+            if macro_signature(dict.get(self, name)) != signature:
+                return False
+
+        return True
+
+    def _record_read(self, name):
+        if self._recorder_list:
+            self._recorder_list[-1].read(name, dict.get(self, name))
+
+    def __contains__(self, name):
+        self._record_read(name)
+
+        return super(MacroTable, self).__contains__(name)
+
+    def __getitem__(self, name):
+        self._record_read(name)
+
+        return super(MacroTable, self).__getitem__(name)
+
+    def __setitem__(self, name, macro):
+        if self._recorder_list:
+            self._recorder_list[-1].write(name, macro)
+
+        super(MacroTable, self).__setitem__(name, macro)
+
+    def pop(self, name, *args):
+        if self._recorder_list:
+            self._recorder_list[-1].write(name, None)
+
+        return super(MacroTable, self).pop(name, *args)
+
+class CacheEntry(object):
+    """
+    Preprocessed header stored inside the header cache.
+    """
+
+    def __init__(self, output, recorder, include_guard = None):
+        self.output          = output
+        self.include_guard   = include_guard
+        self.macro_reads     = recorder.macro_reads
+        self.macro_writes    = recorder.macro_writes
+        self.dependency_list = recorder.dependency_list
+
+class HeaderCache(object):
+    """
+    Persistent cache of preprocessed headers.
+
+    Each cache file is named after the header content, its resolved path and
+    the preprocessor configuration. Since the same header can be preprocessed
+    differently depending on macros defined by its includer, a cache file
+    stores one entry per macro state the header has been seen with.
+    """
+
+    def __init__(self, cache_dir, max_entries = 8):
+        self._cache_dir   = Path(cache_dir)
+        self._max_entries = max_entries
+
+        self._cache_dir.mkdir(parents = True, exist_ok = True)
+
+    def key(self, include_path, digest, salt = ''):
+        """
+        Compute the cache key of a header.
+
+        :param      include_path:  The resolved include path
+        :type       include_path:  Path
+        :param      digest:        The header content digest (file_digest)
+        :type       digest:        str
+        :param      salt:          The preprocessor configuration
+        :type       salt:          str
+        """
+        return hashlib.sha256(f'{CACHE_VERSION}\0{salt}\0{Path(include_path).resolve()}\0{digest}'.encode()).hexdigest()
+
+    def _load(self, key):
+        try:
+            with open(self._cache_dir.joinpath(f'{key}.pickle'), 'rb') as cache_file:
+                return pickle.load(cache_file)
+        except (OSError, EOFError, pickle.UnpicklingError):
+            return []
+
+    def lookup(self, key, macro_table):
+        """
+        Find a cache entry matching current macro state.
+
+        :param      key:          The cache key
+        :type       key:          str
+        :param      macro_table:  The macro table
+        :type       macro_table:  MacroTable
+        """
+        for entry in self._load(key):
+            if not macro_table.match(entry):
+                continue
+
+            # Included headers are part of the output so they must not have changed.
+            if all(self._is_unchanged(path, digest) for path, digest in entry.dependency_list[1:]):
+                return entry
+
+        return None
+
+    def store(self, key, entry):
+        """
+        Store a preprocessed header.
+
+        :param      key:    The cache key
+        :type       key:    str
+        :param      entry:  The entry
+        :type       entry:  CacheEntry
+        """
+        entry_list = [entry] + self._load(key)[:self._max_entries - 1]
+        cache_path = self._cache_dir.joinpath(f'{key}.pickle')
+        tmp_path   = self._cache_dir.joinpath(f'{key}.{os.getpid()}.tmp')
+
+        # Write to a temporary file first so concurrent processes never read a partial entry.
+        with open(tmp_path, 'wb') as cache_file:
+            pickle.dump(entry_list, cache_file, protocol = pickle.HIGHEST_PROTOCOL)
+
+        os.replace(tmp_path, cache_path)
+
+    def _is_unchanged(self, path, digest):
+        try:
+            return file_digest(Path(path).read_bytes()) == digest
+        except OSError:
+            return False
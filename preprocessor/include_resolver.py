@@ -0,0 +1,117 @@
+import os
+from pathlib import Path
+
+class IncludeResolver(object):
+    """
+    Resolve header names to files with a cache of positive and negative lookups.
+
+    Quoted header names are searched inside the including file directory first
+    then inside include directories, bracketed ones only inside include directories.
+    Each (directory, header name) is checked at most once on the filesystem and
+    each (including directory, header name) is resolved at most once.
+
+    When pre-scan is enabled, include directories are listed once so resolving
+    a header inside them doesn't touch the filesystem at all.
+    """
+
+    def __init__(self, include_dir_list = [], prescan = False):
+        self._include_dir_list = [Path(include_dir) for include_dir in include_dir_list]
+        self._prescan          = prescan
+
+        # (directory, header path) -> bool
+        self._file_cache       = {}
+        # (including directory, header name) -> Path|None
+        self._resolution_cache = {}
+        # header path -> Path of first include directory containing it
+        self._prescan_table    = None
+
+    def _scan_include_dir_list(self):
+        """
+        List every file of include directories once.
+        """
+        self._prescan_table = {}
+
+        for include_dir in self._include_dir_list:
+            for root, _, filename_list in os.walk(include_dir):
+                for filename in filename_list:
+                    path        = Path(root).joinpath(filename)
+                    header_path = path.relative_to(include_dir).as_posix()
+
+                    # First directory wins like during a regular search.
+                    self._prescan_table.setdefault(header_path, path)
+
+    def _is_file(self, directory, header_path):
+        """
+        Determine whether a header exists inside a directory.
+
+        :param      directory:    The directory
+        :type       directory:    Path
+        :param      header_path:  The header path
+        :type       header_path:  str
+        """
+        key = (directory, header_path)
+
+        if key not in self._file_cache:
+            self._file_cache[key] = directory.joinpath(header_path).is_file()
+
+        return self._file_cache[key]
+
+    def _search_include_dir_list(self, header_path):
+        """
+        Search a header inside include directories.
+
+        :param      header_path:  The header path
+        :type       header_path:  str
+        """
+        if self._prescan:
+            if self._prescan_table is None:
+                self._scan_include_dir_list()
+
+            return self._prescan_table.get(Path(header_path).as_posix())
+
+        for include_dir in self._include_dir_list:
+            if self._is_file(include_dir, header_path):
+                return include_dir.joinpath(header_path)
+
+        return None
+
+    def resolve(self, header_name, including_dir):
+        """
+        Resolve a header name to a file path.
+
+        Returns None when header doesn't resolve to an existing file.
+
+        :param      header_name:    The header name including its delimiters ("" or <>)
+        :type       header_name:    str
+        :param      including_dir:  The directory of the including file
+        :type       including_dir:  Path
+        """
+        is_quoted   = header_name[0] == '"' and header_name[-1] == '"'
+        header_path = header_name[1:-1]
+        # Bracketed header names don't depend on the including file.
+        key         = (Path(including_dir) if is_quoted else None, header_name)
+
+        if key in self._resolution_cache:
+            return self._resolution_cache[key]
+
+        include_path = None
+
+        if is_quoted and self._is_file(key[0], header_path):
+            include_path = key[0].joinpath(header_path)
+
+        # If include hasn't been found in relative path or header name is enclosed by <> then looks inside
+        # include directories.
+        if include_path is None:
+            include_path = self._search_include_dir_list(header_path)
+
+        self._resolution_cache[key] = include_path
+
+        return include_path
+
+    def clear(self):
+        """
+        Forget every lookup, for instance when files are added or removed.
+        """
+        self._file_cache.clear()
+        self._resolution_cache.clear()
+        self._prescan_table = None
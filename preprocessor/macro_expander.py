@@ -0,0 +1,210 @@
+EMPTY_HIDE_SET = frozenset()
+
+def tokens_to_str(token_list):
+    """
+    Convert a token list to its text representation.
+
+    :param      token_list:  The token list
+    :type       token_list:  list
+    """
+    return ' '.join([str(token.value) for token in token_list])
+
+class MacroExpander(object):
+    """
+    Expand macros of a token list following C99 rescanning rules (6.10.3.4).
+
+    Every token produced by an expansion carries a hide set, which is the set
+    of macro names it results from. A macro name found inside its own hide set
+    is never expanded again, so recursive macros always terminate without
+    tracking any global expansion state.
+    """
+
+    def __init__(self, macro_table, lexer):
+        self._macro_table = macro_table
+
+        # Dedicated lexer so replacement lists are tokenized without disturbing the
+        # lexer currently reading the source file.
+        self._lexer       = lexer.clone()
+
+        # Line of the macro being expanded, used by __LINE__.
+        self.lineno       = 0
+
+        # Invocation left incomplete by a text line, completed by the next one.
+        self._incomplete_list = []
+
+    def tokenize(self, text, lineno = 0):
+        """
+        Tokenize a replacement list.
+
+        :param      text:    The replacement text
+        :type       text:    str
+        :param      lineno:  The line number set to all produced tokens
+        :type       lineno:  int
+        """
+        token_list = []
+
+        self._lexer.begin('INITIAL')
+        self._lexer.input(text)
+
+        for token in iter(self._lexer.token, None):
+            token.lineno = lineno
+            token_list.append(token)
+
+        return token_list
+
+    def _collect_argument_list(self, pending):
+        """
+        Collect arguments of a function-like macro invocation.
+
+        Pending tokens are stored in reversed order and the left parenthesis is the last one.
+        Arguments are only consumed when the invocation is complete.
+
+        :param      pending:  The pending tokens
+        :type       pending:  list
+        """
+        argument_list = [[]]
+        depth         = 0
+
+        for index in range(len(pending) - 2, -1, -1):
+            token = pending[index]
+
+            if token.value == ')' and not depth:
+                del pending[index:]
+                return argument_list, token
+            elif token.value == ',' and not depth:
+                argument_list.append([])
+                continue
+            elif token.value == '(':
+                depth += 1
+            elif token.value == ')':
+                depth -= 1
+
+            argument_list[-1].append(token)
+
+        return None, None
+
+    def _substitute(self, macro, argument_list, hide_set, lineno):
+        """
+        Substitute the macro by its replacement list.
+
+        :param      macro:          The macro
+        :type       macro:          ir.Macro
+        :param      argument_list:  The argument token lists
+        :type       argument_list:  list
+        :param      hide_set:       The hide set added to every substituted token
+        :type       hide_set:       frozenset
+        :param      lineno:         The invocation line number
+        :type       lineno:         int
+        """
+        if macro.callback:
+            # Callback macros depend on preprocessor state so the header can't be cached.
+            self._macro_table.taint()
+            self.lineno = lineno
+
+        replacement = macro.expand(argument_list, self.expand, self.tokenize)
+
+        for token in replacement:
+            token.lineno   = lineno
+            token.hide_set = getattr(token, 'hide_set', EMPTY_HIDE_SET) | hide_set
+
+        return replacement
+
+    def expand(self, token_list):
+        """
+        Expand all macros of a token list.
+
+        :param      token_list:  The token list
+        :type       token_list:  list
+        """
+        return self._expand(token_list, False)[0]
+
+    def expand_line(self, token_list, is_continued):
+        """
+        Expand all macros of a text line.
+
+        Arguments of a function-like macro invocation may span several lines, so an
+        invocation left incomplete by the line is held back until the next text line.
+
+        :param      token_list:    The token list of the line
+        :type       token_list:    list
+        :param      is_continued:  Whether the next line is a text line
+        :type       is_continued:  bool
+        """
+        output, incomplete_list = self._expand(self._incomplete_list + token_list, True)
+        self._incomplete_list   = []
+
+        if not incomplete_list:
+            return output
+
+        if is_continued:
+            self._incomplete_list = incomplete_list
+            return output
+
+        # A function-like macro name ending the text isn't an invocation.
+        if len(incomplete_list) == 1:
+            return output + incomplete_list
+
+        raise Exception(f"Unterminated argument list invoking macro {incomplete_list[0].value}.")
+
+    def _expand(self, token_list, is_incomplete_kept):
+        """
+        Expand all macros of a token list.
+
+        :param      token_list:          The token list
+        :type       token_list:          list
+        :param      is_incomplete_kept:  Whether expansion stops at an incomplete invocation and returns
+                                         its tokens instead of keeping its name as is
+        :type       is_incomplete_kept:  bool
+        """
+        pending = token_list[::-1]
+        output  = []
+
+        while pending:
+            token = pending.pop()
+
+            if token.type != 'IDENTIFIER' or token.value not in self._macro_table:
+                output.append(token)
+                continue
+
+            hide_set = getattr(token, 'hide_set', EMPTY_HIDE_SET)
+
+            if token.value in hide_set:
+                output.append(token)
+                continue
+
+            macro = self._macro_table[token.value]
+
+            if macro.function_like:
+                # Parenthesis may come with the next tokens.
+                if not pending and is_incomplete_kept:
+                    return output, [token]
+
+                # A function-like macro name not followed by a parenthesis isn't an invocation.
+                if not pending or pending[-1].value != '(':
+                    output.append(token)
+                    continue
+
+                argument_list, rparen = self._collect_argument_list(pending)
+
+                if argument_list is None:
+                    if is_incomplete_kept:
+                        return output, [token] + pending[::-1]
+
+                    output.append(token)
+                    continue
+
+                hide_set = (hide_set & getattr(rparen, 'hide_set', EMPTY_HIDE_SET)) | {token.value}
+            else:
+                argument_list = None
+                hide_set      = hide_set | {token.value}
+
+            replacement = self._substitute(macro, argument_list, hide_set, token.lineno)
+
+            # Replacement takes the white space preceding the invocation, which # operator keeps.
+            if replacement:
+                replacement[0].space = getattr(token, 'space', False)
+
+            # Replacement is rescanned with the rest of the token list.
+            pending.extend(reversed(replacement))
+
+        return output, []
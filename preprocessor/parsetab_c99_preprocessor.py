@@ -0,0 +1,138 @@
+
+# parsetab_c99_preprocessor.py
+# This file is automatically generated. Do not edit.
+# pylint: disable=W,C,R
+_tabversion = '3.10'
+
+_lr_method = 'LALR'
+
+_lr_signature = 'preprocessing_fileADD_ASSIGN AND_ASSIGN AND_OP CONSTANT DEC_OP DEFINE DEFINED DIRECTIVE DIV_ASSIGN ELIF ELLIPSIS ELSE ENDIF EQ_OP ERROR GE_OP HASH_HASH HEADER_NAME IDENTIFIER IF IFDEF IFNDEF INCLUDE INC_OP LEFT_ASSIGN LEFT_OP LE_OP LINE LPAREN MOD_ASSIGN MUL_ASSIGN NEWLINE NE_OP OR_ASSIGN OR_OP PRAGMA PTR_OP RIGHT_ASSIGN RIGHT_OP STRING_LITERAL SUB_ASSIGN UNDEF XOR_ASSIGN _PRAGMA\n        preprocessing_file : \n                           | group\n        \n        group : group_part\n              | group group_part\n        \n        group_part : control_line\n                   | if_section\n                   | text_line\n                   | conditionally_supported_directive\n        \n        control_line : define_directive NEWLINE\n                     | error_directive NEWLINE\n                     | include_directive NEWLINE\n                     | line_directive NEWLINE\n                     | pragma_directive NEWLINE\n                     | undef_directive NEWLINE\n        \n        if_section  : if_group endif_line\n        \n        if_section  : if_group elif_groups endif_line\n        \n        if_section  : if_group else_group endif_line\n        \n        if_section  : if_group elif_groups else_group endif_line\n        \n        if_group : IF token_list NEWLINE\n                 | IF token_list NEWLINE group\n        \n        if_group : IFDEF IDENTIFIER NEWLINE\n                 | IFDEF IDENTIFIER NEWLINE group\n        \n        if_group : IFNDEF IDENTIFIER NEWLINE\n                 | IFNDEF IDENTIFIER NEWLINE group\n        \n        elif_groups : elif_group\n                    | elif_groups elif_group\n        \n        elif_group : ELIF token_list NEWLINE\n                   | ELIF token_list NEWLINE group\n        \n        else_group : ELSE NEWLINE\n                   | ELSE NEWLINE group\n        \n        endif_line : ENDIF NEWLINE\n        \n        define_directive : DEFINE IDENTIFIER replacement_list\n        \n        define_directive : DEFINE IDENTIFIER LPAREN \')\' replacement_list\n        \n        define_directive : DEFINE IDENTIFIER LPAREN identifier_list \')\' replacement_list\n        \n        define_directive : DEFINE IDENTIFIER LPAREN ELLIPSIS \')\' replacement_list\n        \n        define_directive : DEFINE IDENTIFIER LPAREN identifier_list \',\' ELLIPSIS \')\' replacement_list\n        \n        error_directive : ERROR\n                        | ERROR token_list\n        \n        include_directive : INCLUDE token_list\n        \n        line_directive : LINE token_list\n        \n        pragma_directive : PRAGMA\n                         | PRAGMA token_list\n                         | _PRAGMA \'(\' STRING_LITERAL \')\'\n        \n        undef_directive : UNDEF IDENTIFIER\n        \n        text_line : NEWLINE\n                  | token_list NEWLINE\n        \n        conditionally_supported_directive : DIRECTIVE token_list NEWLINE\n        \n        identifier_list : IDENTIFIER\n                        | identifier_list \',\' IDENTIFIER\n        \n        replacement_list : \n                         | token_list\n        \n        token_list : token\n                   | token_list token\n        \n        token :     IDENTIFIER\n        \n        token :     HEADER_NAME\n                |   CONSTANT\n                |   STRING_LITERAL\n                |   operator_punc\n        operator_punc :     \'=\'\n                               | AND_OP\n                               | MUL_ASSIGN \n                               | DIV_ASSIGN\n                               | MOD_ASSIGN \n                               | ADD_ASSIGN \n                               | SUB_ASSIGN \n                               | LEFT_ASSIGN \n                               | RIGHT_ASSIGN \n                               | AND_ASSIGN \n                               | XOR_ASSIGN \n                               | OR_ASSIGN \n                               | DEC_OP\n                               | ELLIPSIS\n                               | EQ_OP\n                               | GE_OP\n                               | INC_OP\n                               | LEFT_OP\n                               | LE_OP\n                               | NE_OP\n                               | HASH_HASH\n                               | PTR_OP\n                               | OR_OP\n                               | RIGHT_OP\n                               | \';\'\n                               | \'{\'\n                               | \'}\'\n                               | \',\' \n                               | \':\'\n                               | \'(\'\n                               | \')\'\n                               | \'[\'\n                               | \']\'\n                               | \'.\'\n                               | \'&\'\n                               | \'!\'\n                               | \'~\'\n                               | \'-\'\n                               | \'+\'\n                               | \'*\'\n                               | \'/\'\n                               | \'%\'\n                               | \'<\'\n                               | \'>\'\n                               | \'^\'\n                               | \'|\'\n                               | \'?\'\n                               | \'"\'\n                               | \'@\'\n                               | \'#\'\n                               '
+    
+_lr_action_items = {'$end':([0,1,2,3,4,5,6,7,9,84,85,86,87,88,89,90,91,98,111,114,115,118,126,],[-1,0,-2,-3,-5,-6,-7,-8,-45,-4,-9,-10,-11,-12,-13,-14,-15,-46,-16,-17,-31,-47,-18,]),'NEWLINE':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,16,19,20,21,22,23,26,28,29,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,94,96,98,99,100,101,102,103,104,105,107,108,109,110,111,114,115,116,117,118,119,121,123,124,125,126,127,128,130,133,134,135,136,137,138,139,141,142,145,146,147,],[9,9,-3,-5,-6,-7,-8,85,-45,86,87,88,89,90,98,-54,-89,-72,-86,-37,-41,-88,-57,-52,-55,-56,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-87,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,-101,-102,-103,-104,-105,-106,-107,-108,-4,-9,-10,-11,-12,-13,-14,-15,115,116,-46,-53,118,-50,-38,-39,-40,-42,-44,123,124,125,-16,-17,-31,9,128,-47,-32,-51,9,9,9,-18,9,9,-50,-43,9,9,9,9,-33,-50,-50,-34,-35,-50,-36,]),'DIRECTIVE':([0,2,3,4,5,6,7,9,84,85,86,87,88,89,90,91,98,111,114,115,116,118,123,124,125,126,127,128,134,135,136,137,],[17,17,-3,-5,-6,-7,-8,-45,-4,-9,-10,-11,-12,-13,-14,-15,-46,-16,-17,-31,17,-47,17,17,17,-18,17,17,17,17,17,17,]),'DEFINE':([0,2,3,4,5,6,7,9,84,85,86,87,88,89,90,91,98,111,114,115,116,118,123,124,125,126,127,128,134,135,136,137,],[18,18,-3,-5,-6,-7,-8,-45,-4,-9,-10,-11,-12,-13,-14,-15,-46,-16,-17,-31,18,-47,18,18,18,-18,18,18,18,18,18,18,]),'ERROR':([0,2,3,4,5,6,7,9,84,85,86,87,88,89,90,91,98,111,114,115,116,118,123,124,125,126,127,128,134,135,136,137,],[23,23,-3,-5,-6,-7,-8,-45,-4,-9,-10,-11,-12,-13,-14,-15,-46,-16,-17,-31,23,-47,23,23,23,-18,23,23,23,23,23,23,]),'INCLUDE':([0,2,3,4,5,6,7,9,84,85,86,87,88,89,90,91,98,111,114,115,116,118,123,124,125,126,127,128,134,135,136,137,],[24,24,-3,-5,-6,-7,-8,-45,-4,-9,-10,-11,-12,-13,-14,-15,-46,-16,-17,-31,24,-47,24,24,24,-18,24,24,24,24,24,24,]),'LINE':([0,2,3,4,5,6,7,9,84,85,86,87,88,89,90,91,98,111,114,115,116,118,123,124,125,126,127,128,134,135,136,137,],[25,25,-3,-5,-6,-7,-8,-45,-4,-9,-10,-11,-12,-13,-14,-15,-46,-16,-17,-31,25,-47,25,25,25,-18,25,25,25,25,25,25,]),'PRAGMA':([0,2,3,4,5,6,7,9,84,85,86,87,88,89,90,91,98,111,114,115,116,118,123,124,125,126,127,128,134,135,136,137,],[26,26,-3,-5,-6,-7,-8,-45,-4,-9,-10,-11,-12,-13,-14,-15,-46,-16,-17,-31,26,-47,26,26,26,-18,26,26,26,26,26,26,]),'_PRAGMA':([0,2,3,4,5,6,7,9,84,85,86,87,88,89,90,91,98,111,114,115,116,118,123,124,125,126,127,128,134,135,136,137,],[27,27,-3,-5,-6,-7,-8,-45,-4,-9,-10,-11,-12,-13,-14,-15,-46,-16,-17,-31,27,-47,27,27,27,-18,27,27,27,27,27,27,]),'UNDEF':([0,2,3,4,5,6,7,9,84,85,86,87,88,89,90,91,98,111,114,115,116,118,123,124,125,126,127,128,134,135,136,137,],[30,30,-3,-5,-6,-7,-8,-45,-4,-9,-10,-11,-12,-13,-14,-15,-46,-16,-17,-31,30,-47,30,30,30,-18,30,30,30,30,30,30,]),'IF':([0,2,3,4,5,6,7,9,84,85,86,87,88,89,90,91,98,111,114,115,116,118,123,124,125,126,127,128,134,135,136,137,],[31,31,-3,-5,-6,-7,-8,-45,-4,-9,-10,-11,-12,-13,-14,-15,-46,-16,-17,-31,31,-47,31,31,31,-18,31,31,31,31,31,31,]),'IFDEF':([0,2,3,4,5,6,7,9,84,85,86,87,88,89,90,91,98,111,114,115,116,118,123,124,125,126,127,128,134,135,136,137,],[32,32,-3,-5,-6,-7,-8,-45,-4,-9,-10,-11,-12,-13,-14,-15,-46,-16,-17,-31,32,-47,32,32,32,-18,32,32,32,32,32,32,]),'IFNDEF':([0,2,3,4,5,6,7,9,84,85,86,87,88,89,90,91,98,111,114,115,116,118,123,124,125,126,127,128,134,135,136,137,],[33,33,-3,-5,-6,-7,-8,-45,-4,-9,-10,-11,-12,-13,-14,-15,-46,-16,-17,-31,33,-47,33,33,33,-18,33,33,33,33,33,33,]),'IDENTIFIER':([0,2,3,4,5,6,7,9,16,17,18,19,20,21,22,23,24,25,26,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,97,98,99,100,101,102,103,104,105,108,111,114,115,116,117,118,120,121,123,124,125,126,127,128,130,134,135,136,137,139,140,141,146,],[19,19,-3,-5,-6,-7,-8,-45,19,19,101,-54,-89,-72,-86,19,19,19,19,-88,-57,107,19,109,110,-52,-55,-56,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-87,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,-101,-102,-103,-104,-105,-106,-107,-108,-4,-9,-10,-11,-12,-13,-14,-15,19,-46,-53,19,19,19,19,19,19,19,-16,-17,-31,19,19,-47,129,19,19,19,19,-18,19,19,19,19,19,19,19,19,143,19,19,]),'HEADER_NAME':([0,2,3,4,5,6,7,9,16,17,19,20,21,22,23,24,25,26,28,29,31,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,97,98,99,100,101,102,103,104,105,108,111,114,115,116,117,118,121,123,124,125,126,127,128,130,134,135,136,137,139,141,146,],[35,35,-3,-5,-6,-7,-8,-45,35,35,-54,-89,-72,-86,35,35,35,35,-88,-57,35,-52,-55,-56,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-87,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,-101,-102,-103,-104,-105,-106,-107,-108,-4,-9,-10,-11,-12,-13,-14,-15,35,-46,-53,35,35,35,35,35,35,35,-16,-17,-31,35,35,-47,35,35,35,35,-18,35,35,35,35,35,35,35,35,35,35,]),'CONSTANT':([0,2,3,4,5,6,7,9,16,17,19,20,21,22,23,24,25,26,28,29,31,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,97,98,99,100,101,102,103,104,105,108,111,114,115,116,117,118,121,123,124,125,126,127,128,130,134,135,136,137,139,141,146,],[36,36,-3,-5,-6,-7,-8,-45,36,36,-54,-89,-72,-86,36,36,36,36,-88,-57,36,-52,-55,-56,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-87,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,-101,-102,-103,-104,-105,-106,-107,-108,-4,-9,-10,-11,-12,-13,-14,-15,36,-46,-53,36,36,36,36,36,36,36,-16,-17,-31,36,36,-47,36,36,36,36,-18,36,36,36,36,36,36,36,36,36,36,]),'STRING_LITERAL':([0,2,3,4,5,6,7,9,16,17,19,20,21,22,23,24,25,26,28,29,31,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,97,98,99,100,101,102,103,104,105,106,108,111,114,115,116,117,118,121,123,124,125,126,127,128,130,134,135,136,137,139,141,146,],[29,29,-3,-5,-6,-7,-8,-45,29,29,-54,-89,-72,-86,29,29,29,29,-88,-57,29,-52,-55,-56,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-87,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,-101,-102,-103,-104,-105,-106,-107,-108,-4,-9,-10,-11,-12,-13,-14,-15,29,-46,-53,29,29,29,29,29,29,122,29,-16,-17,-31,29,29,-47,29,29,29,29,-18,29,29,29,29,29,29,29,29,29,29,]),'=':([0,2,3,4,5,6,7,9,16,17,19,20,21,22,23,24,25,26,28,29,31,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,97,98,99,100,101,102,103,104,105,108,111,114,115,116,117,118,121,123,124,125,126,127,128,130,134,135,136,137,139,141,146,],[38,38,-3,-5,-6,-7,-8,-45,38,38,-54,-89,-72,-86,38,38,38,38,-88,-57,38,-52,-55,-56,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-87,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,-101,-102,-103,-104,-105,-106,-107,-108,-4,-9,-10,-11,-12,-13,-14,-15,38,-46,-53,38,38,38,38,38,38,38,-16,-17,-31,38,38,-47,38,38,38,38,-18,38,38,38,38,38,38,38,38,38,38,]),'AND_OP':([0,2,3,4,5,6,7,9,16,17,19,20,21,22,23,24,25,26,28,29,31,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,97,98,99,100,101,102,103,104,105,108,111,114,115,116,117,118,121,123,124,125,126,127,128,130,134,135,136,137,139,141,146,],[39,39,-3,-5,-6,-7,-8,-45,39,39,-54,-89,-72,-86,39,39,39,39,-88,-57,39,-52,-55,-56,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-87,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,-101,-102,-103,-104,-105,-106,-107,-108,-4,-9,-10,-11,-12,-13,-14,-15,39,-46,-53,39,39,39,39,39,39,39,-16,-17,-31,39,39,-47,39,39,39,39,-18,39,39,39,39,39,39,39,39,39,39,]),'MUL_ASSIGN':([0,2,3,4,5,6,7,9,16,17,19,20,21,22,23,24,25,26,28,29,31,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,97,98,99,100,101,102,103,104,105,108,111,114,115,116,117,118,121,123,124,125,126,127,128,130,134,135,136,137,139,141,146,],[40,40,-3,-5,-6,-7,-8,-45,40,40,-54,-89,-72,-86,40,40,40,40,-88,-57,40,-52,-55,-56,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-87,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,-101,-102,-103,-104,-105,-106,-107,-108,-4,-9,-10,-11,-12,-13,-14,-15,40,-46,-53,40,40,40,40,40,40,40,-16,-17,-31,40,40,-47,40,40,40,40,-18,40,40,40,40,40,40,40,40,40,40,]),'DIV_ASSIGN':([0,2,3,4,5,6,7,9,16,17,19,20,21,22,23,24,25,26,28,29,31,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,97,98,99,100,101,102,103,104,105,108,111,114,115,116,117,118,121,123,124,125,126,127,128,130,134,135,136,137,139,141,146,],[41,41,-3,-5,-6,-7,-8,-45,41,41,-54,-89,-72,-86,41,41,41,41,-88,-57,41,-52,-55,-56,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-87,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,-101,-102,-103,-104,-105,-106,-107,-108,-4,-9,-10,-11,-12,-13,-14,-15,41,-46,-53,41,41,41,41,41,41,41,-16,-17,-31,41,41,-47,41,41,41,41,-18,41,41,41,41,41,41,41,41,41,41,]),'MOD_ASSIGN':([0,2,3,4,5,6,7,9,16,17,19,20,21,22,23,24,25,26,28,29,31,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,97,98,99,100,101,102,103,104,105,108,111,114,115,116,117,118,121,123,124,125,126,127,128,130,134,135,136,137,139,141,146,],[42,42,-3,-5,-6,-7,-8,-45,42,42,-54,-89,-72,-86,42,42,42,42,-88,-57,42,-52,-55,-56,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-87,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,-101,-102,-103,-104,-105,-106,-107,-108,-4,-9,-10,-11,-12,-13,-14,-15,42,-46,-53,42,42,42,42,42,42,42,-16,-17,-31,42,42,-47,42,42,42,42,-18,42,42,42,42,42,42,42,42,42,42,]),'ADD_ASSIGN':([0,2,3,4,5,6,7,9,16,17,19,20,21,22,23,24,25,26,28,29,31,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,97,98,99,100,101,102,103,104,105,108,111,114,115,116,117,118,121,123,124,125,126,127,128,130,134,135,136,137,139,141,146,],[43,43,-3,-5,-6,-7,-8,-45,43,43,-54,-89,-72,-86,43,43,43,43,-88,-57,43,-52,-55,-56,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-87,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,-101,-102,-103,-104,-105,-106,-107,-108,-4,-9,-10,-11,-12,-13,-14,-15,43,-46,-53,43,43,43,43,43,43,43,-16,-17,-31,43,43,-47,43,43,43,43,-18,43,43,43,43,43,43,43,43,43,43,]),'SUB_ASSIGN':([0,2,3,4,5,6,7,9,16,17,19,20,21,22,23,24,25,26,28,29,31,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,97,98,99,100,101,102,103,104,105,108,111,114,115,116,117,118,121,123,124,125,126,127,128,130,134,135,136,137,139,141,146,],[44,44,-3,-5,-6,-7,-8,-45,44,44,-54,-89,-72,-86,44,44,44,44,-88,-57,44,-52,-55,-56,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-87,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,-101,-102,-103,-104,-105,-106,-107,-108,-4,-9,-10,-11,-12,-13,-14,-15,44,-46,-53,44,44,44,44,44,44,44,-16,-17,-31,44,44,-47,44,44,44,44,-18,44,44,44,44,44,44,44,44,44,44,]),'LEFT_ASSIGN':([0,2,3,4,5,6,7,9,16,17,19,20,21,22,23,24,25,26,28,29,31,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,97,98,99,100,101,102,103,104,105,108,111,114,115,116,117,118,121,123,124,125,126,127,128,130,134,135,136,137,139,141,146,],[45,45,-3,-5,-6,-7,-8,-45,45,45,-54,-89,-72,-86,45,45,45,45,-88,-57,45,-52,-55,-56,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-87,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,-101,-102,-103,-104,-105,-106,-107,-108,-4,-9,-10,-11,-12,-13,-14,-15,45,-46,-53,45,45,45,45,45,45,45,-16,-17,-31,45,45,-47,45,45,45,45,-18,45,45,45,45,45,45,45,45,45,45,]),'RIGHT_ASSIGN':([0,2,3,4,5,6,7,9,16,17,19,20,21,22,23,24,25,26,28,29,31,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,97,98,99,100,101,102,103,104,105,108,111,114,115,116,117,118,121,123,124,125,126,127,128,130,134,135,136,137,139,141,146,],[46,46,-3,-5,-6,-7,-8,-45,46,46,-54,-89,-72,-86,46,46,46,46,-88,-57,46,-52,-55,-56,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-87,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,-101,-102,-103,-104,-105,-106,-107,-108,-4,-9,-10,-11,-12,-13,-14,-15,46,-46,-53,46,46,46,46,46,46,46,-16,-17,-31,46,46,-47,46,46,46,46,-18,46,46,46,46,46,46,46,46,46,46,]),'AND_ASSIGN':([0,2,3,4,5,6,7,9,16,17,19,20,21,22,23,24,25,26,28,29,31,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,97,98,99,100,101,102,103,104,105,108,111,114,115,116,117,118,121,123,124,125,126,127,128,130,134,135,136,137,139,141,146,],[47,47,-3,-5,-6,-7,-8,-45,47,47,-54,-89,-72,-86,47,47,47,47,-88,-57,47,-52,-55,-56,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-87,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,-101,-102,-103,-104,-105,-106,-107,-108,-4,-9,-10,-11,-12,-13,-14,-15,47,-46,-53,47,47,47,47,47,47,47,-16,-17,-31,47,47,-47,47,47,47,47,-18,47,47,47,47,47,47,47,47,47,47,]),'XOR_ASSIGN':([0,2,3,4,5,6,7,9,16,17,19,20,21,22,23,24,25,26,28,29,31,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,97,98,99,100,101,102,103,104,105,108,111,114,115,116,117,118,121,123,124,125,126,127,128,130,134,135,136,137,139,141,146,],[48,48,-3,-5,-6,-7,-8,-45,48,48,-54,-89,-72,-86,48,48,48,48,-88,-57,48,-52,-55,-56,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-87,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,-101,-102,-103,-104,-105,-106,-107,-108,-4,-9,-10,-11,-12,-13,-14,-15,48,-46,-53,48,48,48,48,48,48,48,-16,-17,-31,48,48,-47,48,48,48,48,-18,48,48,48,48,48,48,48,48,48,48,]),'OR_ASSIGN':([0,2,3,4,5,6,7,9,16,17,19,20,21,22,23,24,25,26,28,29,31,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,97,98,99,100,101,102,103,104,105,108,111,114,115,116,117,118,121,123,124,125,126,127,128,130,134,135,136,137,139,141,146,],[49,49,-3,-5,-6,-7,-8,-45,49,49,-54,-89,-72,-86,49,49,49,49,-88,-57,49,-52,-55,-56,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-87,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,-101,-102,-103,-104,-105,-106,-107,-108,-4,-9,-10,-11,-12,-13,-14,-15,49,-46,-53,49,49,49,49,49,49,49,-16,-17,-31,49,49,-47,49,49,49,49,-18,49,49,49,49,49,49,49,49,49,49,]),'DEC_OP':([0,2,3,4,5,6,7,9,16,17,19,20,21,22,23,24,25,26,28,29,31,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,97,98,99,100,101,102,103,104,105,108,111,114,115,116,117,118,121,123,124,125,126,127,128,130,134,135,136,137,139,141,146,],[50,50,-3,-5,-6,-7,-8,-45,50,50,-54,-89,-72,-86,50,50,50,50,-88,-57,50,-52,-55,-56,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-87,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,-101,-102,-103,-104,-105,-106,-107,-108,-4,-9,-10,-11,-12,-13,-14,-15,50,-46,-53,50,50,50,50,50,50,50,-16,-17,-31,50,50,-47,50,50,50,50,-18,50,50,50,50,50,50,50,50,50,50,]),'ELLIPSIS':([0,2,3,4,5,6,7,9,16,17,19,20,21,22,23,24,25,26,28,29,31,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,97,98,99,100,101,102,103,104,105,108,111,114,115,116,117,118,120,121,123,124,125,126,127,128,130,134,135,136,137,139,140,141,146,],[21,21,-3,-5,-6,-7,-8,-45,21,21,-54,-89,-72,-86,21,21,21,21,-88,-57,21,-52,-55,-56,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-87,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,-101,-102,-103,-104,-105,-106,-107,-108,-4,-9,-10,-11,-12,-13,-14,-15,21,-46,-53,21,21,21,21,21,21,21,-16,-17,-31,21,21,-47,132,21,21,21,21,-18,21,21,21,21,21,21,21,21,144,21,21,]),'EQ_OP':([0,2,3,4,5,6,7,9,16,17,19,20,21,22,23,24,25,26,28,29,31,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,97,98,99,100,101,102,103,104,105,108,111,114,115,116,117,118,121,123,124,125,126,127,128,130,134,135,136,137,139,141,146,],[51,51,-3,-5,-6,-7,-8,-45,51,51,-54,-89,-72,-86,51,51,51,51,-88,-57,51,-52,-55,-56,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-87,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,-101,-102,-103,-104,-105,-106,-107,-108,-4,-9,-10,-11,-12,-13,-14,-15,51,-46,-53,51,51,51,51,51,51,51,-16,-17,-31,51,51,-47,51,51,51,51,-18,51,51,51,51,51,51,51,51,51,51,]),'GE_OP':([0,2,3,4,5,6,7,9,16,17,19,20,21,22,23,24,25,26,28,29,31,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,97,98,99,100,101,102,103,104,105,108,111,114,115,116,117,118,121,123,124,125,126,127,128,130,134,135,136,137,139,141,146,],[52,52,-3,-5,-6,-7,-8,-45,52,52,-54,-89,-72,-86,52,52,52,52,-88,-57,52,-52,-55,-56,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-87,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,-101,-102,-103,-104,-105,-106,-107,-108,-4,-9,-10,-11,-12,-13,-14,-15,52,-46,-53,52,52,52,52,52,52,52,-16,-17,-31,52,52,-47,52,52,52,52,-18,52,52,52,52,52,52,52,52,52,52,]),'INC_OP':([0,2,3,4,5,6,7,9,16,17,19,20,21,22,23,24,25,26,28,29,31,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,97,98,99,100,101,102,103,104,105,108,111,114,115,116,117,118,121,123,124,125,126,127,128,130,134,135,136,137,139,141,146,],[53,53,-3,-5,-6,-7,-8,-45,53,53,-54,-89,-72,-86,53,53,53,53,-88,-57,53,-52,-55,-56,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-87,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,-101,-102,-103,-104,-105,-106,-107,-108,-4,-9,-10,-11,-12,-13,-14,-15,53,-46,-53,53,53,53,53,53,53,53,-16,-17,-31,53,53,-47,53,53,53,53,-18,53,53,53,53,53,53,53,53,53,53,]),'LEFT_OP':([0,2,3,4,5,6,7,9,16,17,19,20,21,22,23,24,25,26,28,29,31,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,97,98,99,100,101,102,103,104,105,108,111,114,115,116,117,118,121,123,124,125,126,127,128,130,134,135,136,137,139,141,146,],[54,54,-3,-5,-6,-7,-8,-45,54,54,-54,-89,-72,-86,54,54,54,54,-88,-57,54,-52,-55,-56,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-87,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,-101,-102,-103,-104,-105,-106,-107,-108,-4,-9,-10,-11,-12,-13,-14,-15,54,-46,-53,54,54,54,54,54,54,54,-16,-17,-31,54,54,-47,54,54,54,54,-18,54,54,54,54,54,54,54,54,54,54,]),'LE_OP':([0,2,3,4,5,6,7,9,16,17,19,20,21,22,23,24,25,26,28,29,31,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,97,98,99,100,101,102,103,104,105,108,111,114,115,116,117,118,121,123,124,125,126,127,128,130,134,135,136,137,139,141,146,],[55,55,-3,-5,-6,-7,-8,-45,55,55,-54,-89,-72,-86,55,55,55,55,-88,-57,55,-52,-55,-56,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-87,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,-101,-102,-103,-104,-105,-106,-107,-108,-4,-9,-10,-11,-12,-13,-14,-15,55,-46,-53,55,55,55,55,55,55,55,-16,-17,-31,55,55,-47,55,55,55,55,-18,55,55,55,55,55,55,55,55,55,55,]),'NE_OP':([0,2,3,4,5,6,7,9,16,17,19,20,21,22,23,24,25,26,28,29,31,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,97,98,99,100,101,102,103,104,105,108,111,114,115,116,117,118,121,123,124,125,126,127,128,130,134,135,136,137,139,141,146,],[56,56,-3,-5,-6,-7,-8,-45,56,56,-54,-89,-72,-86,56,56,56,56,-88,-57,56,-52,-55,-56,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-87,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,-101,-102,-103,-104,-105,-106,-107,-108,-4,-9,-10,-11,-12,-13,-14,-15,56,-46,-53,56,56,56,56,56,56,56,-16,-17,-31,56,56,-47,56,56,56,56,-18,56,56,56,56,56,56,56,56,56,56,]),'HASH_HASH':([0,2,3,4,5,6,7,9,16,17,19,20,21,22,23,24,25,26,28,29,31,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,97,98,99,100,101,102,103,104,105,108,111,114,115,116,117,118,121,123,124,125,126,127,128,130,134,135,136,137,139,141,146,],[57,57,-3,-5,-6,-7,-8,-45,57,57,-54,-89,-72,-86,57,57,57,57,-88,-57,57,-52,-55,-56,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-87,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,-101,-102,-103,-104,-105,-106,-107,-108,-4,-9,-10,-11,-12,-13,-14,-15,57,-46,-53,57,57,57,57,57,57,57,-16,-17,-31,57,57,-47,57,57,57,57,-18,57,57,57,57,57,57,57,57,57,57,]),'PTR_OP':([0,2,3,4,5,6,7,9,16,17,19,20,21,22,23,24,25,26,28,29,31,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,97,98,99,100,101,102,103,104,105,108,111,114,115,116,117,118,121,123,124,125,126,127,128,130,134,135,136,137,139,141,146,],[58,58,-3,-5,-6,-7,-8,-45,58,58,-54,-89,-72,-86,58,58,58,58,-88,-57,58,-52,-55,-56,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-87,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,-101,-102,-103,-104,-105,-106,-107,-108,-4,-9,-10,-11,-12,-13,-14,-15,58,-46,-53,58,58,58,58,58,58,58,-16,-17,-31,58,58,-47,58,58,58,58,-18,58,58,58,58,58,58,58,58,58,58,]),'OR_OP':([0,2,3,4,5,6,7,9,16,17,19,20,21,22,23,24,25,26,28,29,31,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,97,98,99,100,101,102,103,104,105,108,111,114,115,116,117,118,121,123,124,125,126,127,128,130,134,135,136,137,139,141,146,],[59,59,-3,-5,-6,-7,-8,-45,59,59,-54,-89,-72,-86,59,59,59,59,-88,-57,59,-52,-55,-56,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-87,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,-101,-102,-103,-104,-105,-106,-107,-108,-4,-9,-10,-11,-12,-13,-14,-15,59,-46,-53,59,59,59,59,59,59,59,-16,-17,-31,59,59,-47,59,59,59,59,-18,59,59,59,59,59,59,59,59,59,59,]),'RIGHT_OP':([0,2,3,4,5,6,7,9,16,17,19,20,21,22,23,24,25,26,28,29,31,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,97,98,99,100,101,102,103,104,105,108,111,114,115,116,117,118,121,123,124,125,126,127,128,130,134,135,136,137,139,141,146,],[60,60,-3,-5,-6,-7,-8,-45,60,60,-54,-89,-72,-86,60,60,60,60,-88,-57,60,-52,-55,-56,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-87,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,-101,-102,-103,-104,-105,-106,-107,-108,-4,-9,-10,-11,-12,-13,-14,-15,60,-46,-53,60,60,60,60,60,60,60,-16,-17,-31,60,60,-47,60,60,60,60,-18,60,60,60,60,60,60,60,60,60,60,]),';':([0,2,3,4,5,6,7,9,16,17,19,20,21,22,23,24,25,26,28,29,31,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,97,98,99,100,101,102,103,104,105,108,111,114,115,116,117,118,121,123,124,125,126,127,128,130,134,135,136,137,139,141,146,],[61,61,-3,-5,-6,-7,-8,-45,61,61,-54,-89,-72,-86,61,61,61,61,-88,-57,61,-52,-55,-56,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-87,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,-101,-102,-103,-104,-105,-106,-107,-108,-4,-9,-10,-11,-12,-13,-14,-15,61,-46,-53,61,61,61,61,61,61,61,-16,-17,-31,61,61,-47,61,61,61,61,-18,61,61,61,61,61,61,61,61,61,61,]),'{':([0,2,3,4,5,6,7,9,16,17,19,20,21,22,23,24,25,26,28,29,31,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,97,98,99,100,101,102,103,104,105,108,111,114,115,116,117,118,121,123,124,125,126,127,128,130,134,135,136,137,139,141,146,],[62,62,-3,-5,-6,-7,-8,-45,62,62,-54,-89,-72,-86,62,62,62,62,-88,-57,62,-52,-55,-56,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-87,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,-101,-102,-103,-104,-105,-106,-107,-108,-4,-9,-10,-11,-12,-13,-14,-15,62,-46,-53,62,62,62,62,62,62,62,-16,-17,-31,62,62,-47,62,62,62,62,-18,62,62,62,62,62,62,62,62,62,62,]),'}':([0,2,3,4,5,6,7,9,16,17,19,20,21,22,23,24,25,26,28,29,31,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,97,98,99,100,101,102,103,104,105,108,111,114,115,116,117,118,121,123,124,125,126,127,128,130,134,135,136,137,139,141,146,],[63,63,-3,-5,-6,-7,-8,-45,63,63,-54,-89,-72,-86,63,63,63,63,-88,-57,63,-52,-55,-56,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-87,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,-101,-102,-103,-104,-105,-106,-107,-108,-4,-9,-10,-11,-12,-13,-14,-15,63,-46,-53,63,63,63,63,63,63,63,-16,-17,-31,63,63,-47,63,63,63,63,-18,63,63,63,63,63,63,63,63,63,63,]),',':([0,2,3,4,5,6,7,9,16,17,19,20,21,22,23,24,25,26,28,29,31,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,97,98,99,100,101,102,103,104,105,108,111,114,115,116,117,118,121,123,124,125,126,127,128,129,130,131,134,135,136,137,139,141,143,146,],[22,22,-3,-5,-6,-7,-8,-45,22,22,-54,-89,-72,-86,22,22,22,22,-88,-57,22,-52,-55,-56,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-87,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,-101,-102,-103,-104,-105,-106,-107,-108,-4,-9,-10,-11,-12,-13,-14,-15,22,-46,-53,22,22,22,22,22,22,22,-16,-17,-31,22,22,-47,22,22,22,22,-18,22,22,-48,22,140,22,22,22,22,22,22,-49,22,]),':':([0,2,3,4,5,6,7,9,16,17,19,20,21,22,23,24,25,26,28,29,31,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,97,98,99,100,101,102,103,104,105,108,111,114,115,116,117,118,121,123,124,125,126,127,128,130,134,135,136,137,139,141,146,],[64,64,-3,-5,-6,-7,-8,-45,64,64,-54,-89,-72,-86,64,64,64,64,-88,-57,64,-52,-55,-56,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-87,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,-101,-102,-103,-104,-105,-106,-107,-108,-4,-9,-10,-11,-12,-13,-14,-15,64,-46,-53,64,64,64,64,64,64,64,-16,-17,-31,64,64,-47,64,64,64,64,-18,64,64,64,64,64,64,64,64,64,64,]),'(':([0,2,3,4,5,6,7,9,16,17,19,20,21,22,23,24,25,26,27,28,29,31,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,97,98,99,100,101,102,103,104,105,108,111,114,115,116,117,118,121,123,124,125,126,127,128,130,134,135,136,137,139,141,146,],[28,28,-3,-5,-6,-7,-8,-45,28,28,-54,-89,-72,-86,28,28,28,28,106,-88,-57,28,-52,-55,-56,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-87,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,-101,-102,-103,-104,-105,-106,-107,-108,-4,-9,-10,-11,-12,-13,-14,-15,28,-46,-53,28,28,28,28,28,28,28,-16,-17,-31,28,28,-47,28,28,28,28,-18,28,28,28,28,28,28,28,28,28,28,]),')':([0,2,3,4,5,6,7,9,16,17,19,20,21,22,23,24,25,26,28,29,31,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,97,98,99,100,101,102,103,104,105,108,111,114,115,116,117,118,120,121,122,123,124,125,126,127,128,129,130,131,132,134,135,136,137,139,141,143,144,146,],[20,20,-3,-5,-6,-7,-8,-45,20,20,-54,-89,-72,-86,20,20,20,20,-88,-57,20,-52,-55,-56,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-87,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,-101,-102,-103,-104,-105,-106,-107,-108,-4,-9,-10,-11,-12,-13,-14,-15,20,-46,-53,20,20,20,20,20,20,20,-16,-17,-31,20,20,-47,130,20,133,20,20,20,-18,20,20,-48,20,139,141,20,20,20,20,20,20,-49,146,20,]),'[':([0,2,3,4,5,6,7,9,16,17,19,20,21,22,23,24,25,26,28,29,31,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,97,98,99,100,101,102,103,104,105,108,111,114,115,116,117,118,121,123,124,125,126,127,128,130,134,135,136,137,139,141,146,],[65,65,-3,-5,-6,-7,-8,-45,65,65,-54,-89,-72,-86,65,65,65,65,-88,-57,65,-52,-55,-56,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-87,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,-101,-102,-103,-104,-105,-106,-107,-108,-4,-9,-10,-11,-12,-13,-14,-15,65,-46,-53,65,65,65,65,65,65,65,-16,-17,-31,65,65,-47,65,65,65,65,-18,65,65,65,65,65,65,65,65,65,65,]),']':([0,2,3,4,5,6,7,9,16,17,19,20,21,22,23,24,25,26,28,29,31,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,97,98,99,100,101,102,103,104,105,108,111,114,115,116,117,118,121,123,124,125,126,127,128,130,134,135,136,137,139,141,146,],[66,66,-3,-5,-6,-7,-8,-45,66,66,-54,-89,-72,-86,66,66,66,66,-88,-57,66,-52,-55,-56,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-87,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,-101,-102,-103,-104,-105,-106,-107,-108,-4,-9,-10,-11,-12,-13,-14,-15,66,-46,-53,66,66,66,66,66,66,66,-16,-17,-31,66,66,-47,66,66,66,66,-18,66,66,66,66,66,66,66,66,66,66,]),'.':([0,2,3,4,5,6,7,9,16,17,19,20,21,22,23,24,25,26,28,29,31,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,97,98,99,100,101,102,103,104,105,108,111,114,115,116,117,118,121,123,124,125,126,127,128,130,134,135,136,137,139,141,146,],[67,67,-3,-5,-6,-7,-8,-45,67,67,-54,-89,-72,-86,67,67,67,67,-88,-57,67,-52,-55,-56,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-87,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,-101,-102,-103,-104,-105,-106,-107,-108,-4,-9,-10,-11,-12,-13,-14,-15,67,-46,-53,67,67,67,67,67,67,67,-16,-17,-31,67,67,-47,67,67,67,67,-18,67,67,67,67,67,67,67,67,67,67,]),'&':([0,2,3,4,5,6,7,9,16,17,19,20,21,22,23,24,25,26,28,29,31,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,97,98,99,100,101,102,103,104,105,108,111,114,115,116,117,118,121,123,124,125,126,127,128,130,134,135,136,137,139,141,146,],[68,68,-3,-5,-6,-7,-8,-45,68,68,-54,-89,-72,-86,68,68,68,68,-88,-57,68,-52,-55,-56,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-87,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,-101,-102,-103,-104,-105,-106,-107,-108,-4,-9,-10,-11,-12,-13,-14,-15,68,-46,-53,68,68,68,68,68,68,68,-16,-17,-31,68,68,-47,68,68,68,68,-18,68,68,68,68,68,68,68,68,68,68,]),'!':([0,2,3,4,5,6,7,9,16,17,19,20,21,22,23,24,25,26,28,29,31,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,97,98,99,100,101,102,103,104,105,108,111,114,115,116,117,118,121,123,124,125,126,127,128,130,134,135,136,137,139,141,146,],[69,69,-3,-5,-6,-7,-8,-45,69,69,-54,-89,-72,-86,69,69,69,69,-88,-57,69,-52,-55,-56,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-87,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,-101,-102,-103,-104,-105,-106,-107,-108,-4,-9,-10,-11,-12,-13,-14,-15,69,-46,-53,69,69,69,69,69,69,69,-16,-17,-31,69,69,-47,69,69,69,69,-18,69,69,69,69,69,69,69,69,69,69,]),'~':([0,2,3,4,5,6,7,9,16,17,19,20,21,22,23,24,25,26,28,29,31,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,97,98,99,100,101,102,103,104,105,108,111,114,115,116,117,118,121,123,124,125,126,127,128,130,134,135,136,137,139,141,146,],[70,70,-3,-5,-6,-7,-8,-45,70,70,-54,-89,-72,-86,70,70,70,70,-88,-57,70,-52,-55,-56,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-87,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,-101,-102,-103,-104,-105,-106,-107,-108,-4,-9,-10,-11,-12,-13,-14,-15,70,-46,-53,70,70,70,70,70,70,70,-16,-17,-31,70,70,-47,70,70,70,70,-18,70,70,70,70,70,70,70,70,70,70,]),'-':([0,2,3,4,5,6,7,9,16,17,19,20,21,22,23,24,25,26,28,29,31,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,97,98,99,100,101,102,103,104,105,108,111,114,115,116,117,118,121,123,124,125,126,127,128,130,134,135,136,137,139,141,146,],[71,71,-3,-5,-6,-7,-8,-45,71,71,-54,-89,-72,-86,71,71,71,71,-88,-57,71,-52,-55,-56,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-87,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,-101,-102,-103,-104,-105,-106,-107,-108,-4,-9,-10,-11,-12,-13,-14,-15,71,-46,-53,71,71,71,71,71,71,71,-16,-17,-31,71,71,-47,71,71,71,71,-18,71,71,71,71,71,71,71,71,71,71,]),'+':([0,2,3,4,5,6,7,9,16,17,19,20,21,22,23,24,25,26,28,29,31,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,97,98,99,100,101,102,103,104,105,108,111,114,115,116,117,118,121,123,124,125,126,127,128,130,134,135,136,137,139,141,146,],[72,72,-3,-5,-6,-7,-8,-45,72,72,-54,-89,-72,-86,72,72,72,72,-88,-57,72,-52,-55,-56,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-87,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,-101,-102,-103,-104,-105,-106,-107,-108,-4,-9,-10,-11,-12,-13,-14,-15,72,-46,-53,72,72,72,72,72,72,72,-16,-17,-31,72,72,-47,72,72,72,72,-18,72,72,72,72,72,72,72,72,72,72,]),'*':([0,2,3,4,5,6,7,9,16,17,19,20,21,22,23,24,25,26,28,29,31,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,97,98,99,100,101,102,103,104,105,108,111,114,115,116,117,118,121,123,124,125,126,127,128,130,134,135,136,137,139,141,146,],[73,73,-3,-5,-6,-7,-8,-45,73,73,-54,-89,-72,-86,73,73,73,73,-88,-57,73,-52,-55,-56,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-87,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,-101,-102,-103,-104,-105,-106,-107,-108,-4,-9,-10,-11,-12,-13,-14,-15,73,-46,-53,73,73,73,73,73,73,73,-16,-17,-31,73,73,-47,73,73,73,73,-18,73,73,73,73,73,73,73,73,73,73,]),'/':([0,2,3,4,5,6,7,9,16,17,19,20,21,22,23,24,25,26,28,29,31,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,97,98,99,100,101,102,103,104,105,108,111,114,115,116,117,118,121,123,124,125,126,127,128,130,134,135,136,137,139,141,146,],[74,74,-3,-5,-6,-7,-8,-45,74,74,-54,-89,-72,-86,74,74,74,74,-88,-57,74,-52,-55,-56,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-87,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,-101,-102,-103,-104,-105,-106,-107,-108,-4,-9,-10,-11,-12,-13,-14,-15,74,-46,-53,74,74,74,74,74,74,74,-16,-17,-31,74,74,-47,74,74,74,74,-18,74,74,74,74,74,74,74,74,74,74,]),'%':([0,2,3,4,5,6,7,9,16,17,19,20,21,22,23,24,25,26,28,29,31,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,97,98,99,100,101,102,103,104,105,108,111,114,115,116,117,118,121,123,124,125,126,127,128,130,134,135,136,137,139,141,146,],[75,75,-3,-5,-6,-7,-8,-45,75,75,-54,-89,-72,-86,75,75,75,75,-88,-57,75,-52,-55,-56,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-87,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,-101,-102,-103,-104,-105,-106,-107,-108,-4,-9,-10,-11,-12,-13,-14,-15,75,-46,-53,75,75,75,75,75,75,75,-16,-17,-31,75,75,-47,75,75,75,75,-18,75,75,75,75,75,75,75,75,75,75,]),'<':([0,2,3,4,5,6,7,9,16,17,19,20,21,22,23,24,25,26,28,29,31,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,97,98,99,100,101,102,103,104,105,108,111,114,115,116,117,118,121,123,124,125,126,127,128,130,134,135,136,137,139,141,146,],[76,76,-3,-5,-6,-7,-8,-45,76,76,-54,-89,-72,-86,76,76,76,76,-88,-57,76,-52,-55,-56,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-87,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,-101,-102,-103,-104,-105,-106,-107,-108,-4,-9,-10,-11,-12,-13,-14,-15,76,-46,-53,76,76,76,76,76,76,76,-16,-17,-31,76,76,-47,76,76,76,76,-18,76,76,76,76,76,76,76,76,76,76,]),'>':([0,2,3,4,5,6,7,9,16,17,19,20,21,22,23,24,25,26,28,29,31,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,97,98,99,100,101,102,103,104,105,108,111,114,115,116,117,118,121,123,124,125,126,127,128,130,134,135,136,137,139,141,146,],[77,77,-3,-5,-6,-7,-8,-45,77,77,-54,-89,-72,-86,77,77,77,77,-88,-57,77,-52,-55,-56,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-87,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,-101,-102,-103,-104,-105,-106,-107,-108,-4,-9,-10,-11,-12,-13,-14,-15,77,-46,-53,77,77,77,77,77,77,77,-16,-17,-31,77,77,-47,77,77,77,77,-18,77,77,77,77,77,77,77,77,77,77,]),'^':([0,2,3,4,5,6,7,9,16,17,19,20,21,22,23,24,25,26,28,29,31,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,97,98,99,100,101,102,103,104,105,108,111,114,115,116,117,118,121,123,124,125,126,127,128,130,134,135,136,137,139,141,146,],[78,78,-3,-5,-6,-7,-8,-45,78,78,-54,-89,-72,-86,78,78,78,78,-88,-57,78,-52,-55,-56,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-87,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,-101,-102,-103,-104,-105,-106,-107,-108,-4,-9,-10,-11,-12,-13,-14,-15,78,-46,-53,78,78,78,78,78,78,78,-16,-17,-31,78,78,-47,78,78,78,78,-18,78,78,78,78,78,78,78,78,78,78,]),'|':([0,2,3,4,5,6,7,9,16,17,19,20,21,22,23,24,25,26,28,29,31,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,97,98,99,100,101,102,103,104,105,108,111,114,115,116,117,118,121,123,124,125,126,127,128,130,134,135,136,137,139,141,146,],[79,79,-3,-5,-6,-7,-8,-45,79,79,-54,-89,-72,-86,79,79,79,79,-88,-57,79,-52,-55,-56,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-87,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,-101,-102,-103,-104,-105,-106,-107,-108,-4,-9,-10,-11,-12,-13,-14,-15,79,-46,-53,79,79,79,79,79,79,79,-16,-17,-31,79,79,-47,79,79,79,79,-18,79,79,79,79,79,79,79,79,79,79,]),'?':([0,2,3,4,5,6,7,9,16,17,19,20,21,22,23,24,25,26,28,29,31,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,97,98,99,100,101,102,103,104,105,108,111,114,115,116,117,118,121,123,124,125,126,127,128,130,134,135,136,137,139,141,146,],[80,80,-3,-5,-6,-7,-8,-45,80,80,-54,-89,-72,-86,80,80,80,80,-88,-57,80,-52,-55,-56,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-87,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,-101,-102,-103,-104,-105,-106,-107,-108,-4,-9,-10,-11,-12,-13,-14,-15,80,-46,-53,80,80,80,80,80,80,80,-16,-17,-31,80,80,-47,80,80,80,80,-18,80,80,80,80,80,80,80,80,80,80,]),'"':([0,2,3,4,5,6,7,9,16,17,19,20,21,22,23,24,25,26,28,29,31,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,97,98,99,100,101,102,103,104,105,108,111,114,115,116,117,118,121,123,124,125,126,127,128,130,134,135,136,137,139,141,146,],[81,81,-3,-5,-6,-7,-8,-45,81,81,-54,-89,-72,-86,81,81,81,81,-88,-57,81,-52,-55,-56,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-87,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,-101,-102,-103,-104,-105,-106,-107,-108,-4,-9,-10,-11,-12,-13,-14,-15,81,-46,-53,81,81,81,81,81,81,81,-16,-17,-31,81,81,-47,81,81,81,81,-18,81,81,81,81,81,81,81,81,81,81,]),'@':([0,2,3,4,5,6,7,9,16,17,19,20,21,22,23,24,25,26,28,29,31,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,97,98,99,100,101,102,103,104,105,108,111,114,115,116,117,118,121,123,124,125,126,127,128,130,134,135,136,137,139,141,146,],[82,82,-3,-5,-6,-7,-8,-45,82,82,-54,-89,-72,-86,82,82,82,82,-88,-57,82,-52,-55,-56,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-87,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,-101,-102,-103,-104,-105,-106,-107,-108,-4,-9,-10,-11,-12,-13,-14,-15,82,-46,-53,82,82,82,82,82,82,82,-16,-17,-31,82,82,-47,82,82,82,82,-18,82,82,82,82,82,82,82,82,82,82,]),'#':([0,2,3,4,5,6,7,9,16,17,19,20,21,22,23,24,25,26,28,29,31,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,97,98,99,100,101,102,103,104,105,108,111,114,115,116,117,118,121,123,124,125,126,127,128,130,134,135,136,137,139,141,146,],[83,83,-3,-5,-6,-7,-8,-45,83,83,-54,-89,-72,-86,83,83,83,83,-88,-57,83,-52,-55,-56,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-87,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,-101,-102,-103,-104,-105,-106,-107,-108,-4,-9,-10,-11,-12,-13,-14,-15,83,-46,-53,83,83,83,83,83,83,83,-16,-17,-31,83,83,-47,83,83,83,83,-18,83,83,83,83,83,83,83,83,83,83,]),'ENDIF':([3,4,5,6,7,9,15,84,85,86,87,88,89,90,91,92,93,95,98,111,112,113,114,115,116,118,123,124,125,126,127,128,134,135,136,137,],[-3,-5,-6,-7,-8,-45,94,-4,-9,-10,-11,-12,-13,-14,-15,94,94,-25,-46,-16,94,-26,-17,-31,-29,-47,-19,-21,-23,-18,-30,-27,-20,-22,-24,-28,]),'ELSE':([3,4,5,6,7,9,15,84,85,86,87,88,89,90,91,92,95,98,111,113,114,115,118,123,124,125,126,128,134,135,136,137,],[-3,-5,-6,-7,-8,-45,96,-4,-9,-10,-11,-12,-13,-14,-15,96,-25,-46,-16,-26,-17,-31,-47,-19,-21,-23,-18,-27,-20,-22,-24,-28,]),'ELIF':([3,4,5,6,7,9,15,84,85,86,87,88,89,90,91,92,95,98,111,113,114,115,118,123,124,125,126,128,134,135,136,137,],[-3,-5,-6,-7,-8,-45,97,-4,-9,-10,-11,-12,-13,-14,-15,97,-25,-46,-16,-26,-17,-31,-47,-19,-21,-23,-18,-27,-20,-22,-24,-28,]),'LPAREN':([101,],[120,]),}
+
+_lr_action = {}
+for _k, _v in _lr_action_items.items():
+   for _x,_y in zip(_v[0],_v[1]):
+      if not _x in _lr_action:  _lr_action[_x] = {}
+      _lr_action[_x][_k] = _y
+del _lr_action_items
+
+_lr_goto_items = {'preprocessing_file':([0,],[1,]),'group':([0,116,123,124,125,128,],[2,127,134,135,136,137,]),'group_part':([0,2,116,123,124,125,127,128,134,135,136,137,],[3,84,3,3,3,3,84,3,84,84,84,84,]),'control_line':([0,2,116,123,124,125,127,128,134,135,136,137,],[4,4,4,4,4,4,4,4,4,4,4,4,]),'if_section':([0,2,116,123,124,125,127,128,134,135,136,137,],[5,5,5,5,5,5,5,5,5,5,5,5,]),'text_line':([0,2,116,123,124,125,127,128,134,135,136,137,],[6,6,6,6,6,6,6,6,6,6,6,6,]),'conditionally_supported_directive':([0,2,116,123,124,125,127,128,134,135,136,137,],[7,7,7,7,7,7,7,7,7,7,7,7,]),'define_directive':([0,2,116,123,124,125,127,128,134,135,136,137,],[8,8,8,8,8,8,8,8,8,8,8,8,]),'error_directive':([0,2,116,123,124,125,127,128,134,135,136,137,],[10,10,10,10,10,10,10,10,10,10,10,10,]),'include_directive':([0,2,116,123,124,125,127,128,134,135,136,137,],[11,11,11,11,11,11,11,11,11,11,11,11,]),'line_directive':([0,2,116,123,124,125,127,128,134,135,136,137,],[12,12,12,12,12,12,12,12,12,12,12,12,]),'pragma_directive':([0,2,116,123,124,125,127,128,134,135,136,137,],[13,13,13,13,13,13,13,13,13,13,13,13,]),'undef_directive':([0,2,116,123,124,125,127,128,134,135,136,137,],[14,14,14,14,14,14,14,14,14,14,14,14,]),'if_group':([0,2,116,123,124,125,127,128,134,135,136,137,],[15,15,15,15,15,15,15,15,15,15,15,15,]),'token_list':([0,2,17,23,24,25,26,31,97,101,116,123,124,125,127,128,130,134,135,136,137,139,141,146,],[16,16,100,102,103,104,105,108,117,121,16,16,16,16,16,16,121,16,16,16,16,121,121,121,]),'token':([0,2,16,17,23,24,25,26,31,97,100,101,102,103,104,105,108,116,117,121,123,124,125,127,128,130,134,135,136,137,139,141,146,],[34,34,99,34,34,34,34,34,34,34,99,34,99,99,99,99,99,34,99,99,34,34,34,34,34,34,34,34,34,34,34,34,34,]),'operator_punc':([0,2,16,17,23,24,25,26,31,97,100,101,102,103,104,105,108,116,117,121,123,124,125,127,128,130,134,135,136,137,139,141,146,],[37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,]),'endif_line':([15,92,93,112,],[91,111,114,126,]),'elif_groups':([15,],[92,]),'else_group':([15,92,],[93,112,]),'elif_group':([15,92,],[95,113,]),'replacement_list':([101,130,139,141,146,],[119,138,142,145,147,]),'identifier_list':([120,],[131,]),}
+
+_lr_goto = {}
+for _k, _v in _lr_goto_items.items():
+   for _x, _y in zip(_v[0], _v[1]):
+       if not _x in _lr_goto: _lr_goto[_x] = {}
+       _lr_goto[_x][_k] = _y
+del _lr_goto_items
+_lr_productions = [
+  ("S' -> preprocessing_file","S'",1,None,None,None),
+  ('preprocessing_file -> <empty>','preprocessing_file',0,'p_preprocessing_file','c99_preprocessor.py',325),
+  ('preprocessing_file -> group','preprocessing_file',1,'p_preprocessing_file','c99_preprocessor.py',326),
+  ('group -> group_part','group',1,'p_group','c99_preprocessor.py',336),
+  ('group -> group group_part','group',2,'p_group','c99_preprocessor.py',337),
+  ('group_part -> control_line','group_part',1,'p_group_part','c99_preprocessor.py',348),
+  ('group_part -> if_section','group_part',1,'p_group_part','c99_preprocessor.py',349),
+  ('group_part -> text_line','group_part',1,'p_group_part','c99_preprocessor.py',350),
+  ('group_part -> conditionally_supported_directive','group_part',1,'p_group_part','c99_preprocessor.py',351),
+  ('control_line -> define_directive NEWLINE','control_line',2,'p_control_line','c99_preprocessor.py',363),
+  ('control_line -> error_directive NEWLINE','control_line',2,'p_control_line','c99_preprocessor.py',364),
+  ('control_line -> include_directive NEWLINE','control_line',2,'p_control_line','c99_preprocessor.py',365),
+  ('control_line -> line_directive NEWLINE','control_line',2,'p_control_line','c99_preprocessor.py',366),
+  ('control_line -> pragma_directive NEWLINE','control_line',2,'p_control_line','c99_preprocessor.py',367),
+  ('control_line -> undef_directive NEWLINE','control_line',2,'p_control_line','c99_preprocessor.py',368),
+  ('if_section -> if_group endif_line','if_section',2,'p_if_section','c99_preprocessor.py',375),
+  ('if_section -> if_group elif_groups endif_line','if_section',3,'p_if_section2','c99_preprocessor.py',391),
+  ('if_section -> if_group else_group endif_line','if_section',3,'p_if_section3','c99_preprocessor.py',412),
+  ('if_section -> if_group elif_groups else_group endif_line','if_section',4,'p_if_section4','c99_preprocessor.py',430),
+  ('if_group -> IF token_list NEWLINE','if_group',3,'p_if_group','c99_preprocessor.py',457),
+  ('if_group -> IF token_list NEWLINE group','if_group',4,'p_if_group','c99_preprocessor.py',458),
+  ('if_group -> IFDEF IDENTIFIER NEWLINE','if_group',3,'p_if_group2','c99_preprocessor.py',472),
+  ('if_group -> IFDEF IDENTIFIER NEWLINE group','if_group',4,'p_if_group2','c99_preprocessor.py',473),
+  ('if_group -> IFNDEF IDENTIFIER NEWLINE','if_group',3,'p_if_group3','c99_preprocessor.py',488),
+  ('if_group -> IFNDEF IDENTIFIER NEWLINE group','if_group',4,'p_if_group3','c99_preprocessor.py',489),
+  ('elif_groups -> elif_group','elif_groups',1,'p_elif_groups','c99_preprocessor.py',504),
+  ('elif_groups -> elif_groups elif_group','elif_groups',2,'p_elif_groups','c99_preprocessor.py',505),
+  ('elif_group -> ELIF token_list NEWLINE','elif_group',3,'p_elif_group','c99_preprocessor.py',516),
+  ('elif_group -> ELIF token_list NEWLINE group','elif_group',4,'p_elif_group','c99_preprocessor.py',517),
+  ('else_group -> ELSE NEWLINE','else_group',2,'p_else_group','c99_preprocessor.py',531),
+  ('else_group -> ELSE NEWLINE group','else_group',3,'p_else_group','c99_preprocessor.py',532),
+  ('endif_line -> ENDIF NEWLINE','endif_line',2,'p_endif_line','c99_preprocessor.py',544),
+  ('define_directive -> DEFINE IDENTIFIER replacement_list','define_directive',3,'p_define_directive','c99_preprocessor.py',551),
+  ('define_directive -> DEFINE IDENTIFIER LPAREN ) replacement_list','define_directive',5,'p_define_directive_2','c99_preprocessor.py',562),
+  ('define_directive -> DEFINE IDENTIFIER LPAREN identifier_list ) replacement_list','define_directive',6,'p_define_directive_3','c99_preprocessor.py',573),
+  ('define_directive -> DEFINE IDENTIFIER LPAREN ELLIPSIS ) replacement_list','define_directive',6,'p_define_directive_4','c99_preprocessor.py',584),
+  ('define_directive -> DEFINE IDENTIFIER LPAREN identifier_list , ELLIPSIS ) replacement_list','define_directive',8,'p_define_directive_5','c99_preprocessor.py',595),
+  ('error_directive -> ERROR','error_directive',1,'p_error_directive','c99_preprocessor.py',606),
+  ('error_directive -> ERROR token_list','error_directive',2,'p_error_directive','c99_preprocessor.py',607),
+  ('include_directive -> INCLUDE token_list','include_directive',2,'p_include_directive','c99_preprocessor.py',620),
+  ('line_directive -> LINE token_list','line_directive',2,'p_line_directive','c99_preprocessor.py',630),
+  ('pragma_directive -> PRAGMA','pragma_directive',1,'p_pragma_directive','c99_preprocessor.py',641),
+  ('pragma_directive -> PRAGMA token_list','pragma_directive',2,'p_pragma_directive','c99_preprocessor.py',642),
+  ('pragma_directive -> _PRAGMA ( STRING_LITERAL )','pragma_directive',4,'p_pragma_directive','c99_preprocessor.py',643),
+  ('undef_directive -> UNDEF IDENTIFIER','undef_directive',2,'p_undef_directive','c99_preprocessor.py',655),
+  ('text_line -> NEWLINE','text_line',1,'p_text_line','c99_preprocessor.py',666),
+  ('text_line -> token_list NEWLINE','text_line',2,'p_text_line','c99_preprocessor.py',667),
+  ('conditionally_supported_directive -> DIRECTIVE token_list NEWLINE','conditionally_supported_directive',3,'p_conditionally_supported_directive','c99_preprocessor.py',680),
+  ('identifier_list -> IDENTIFIER','identifier_list',1,'p_identifier_list','c99_preprocessor.py',686),
+  ('identifier_list -> identifier_list , IDENTIFIER','identifier_list',3,'p_identifier_list','c99_preprocessor.py',687),
+  ('replacement_list -> <empty>','replacement_list',0,'p_replacement_list','c99_preprocessor.py',697),
+  ('replacement_list -> token_list','replacement_list',1,'p_replacement_list','c99_preprocessor.py',698),
+  ('token_list -> token','token_list',1,'p_token_list','c99_preprocessor.py',708),
+  ('token_list -> token_list token','token_list',2,'p_token_list','c99_preprocessor.py',709),
+  ('token -> IDENTIFIER','token',1,'p_token','c99_preprocessor.py',721),
+  ('token -> HEADER_NAME','token',1,'p_token2','c99_preprocessor.py',727),
+  ('token -> CONSTANT','token',1,'p_token2','c99_preprocessor.py',728),
+  ('token -> STRING_LITERAL','token',1,'p_token2','c99_preprocessor.py',729),
+  ('token -> operator_punc','token',1,'p_token2','c99_preprocessor.py',730),
+  ('operator_punc -> =','operator_punc',1,'p_operator_punc','c99_preprocessor.py',736),
+  ('operator_punc -> AND_OP','operator_punc',1,'p_operator_punc','c99_preprocessor.py',737),
+  ('operator_punc -> MUL_ASSIGN','operator_punc',1,'p_operator_punc','c99_preprocessor.py',738),
+  ('operator_punc -> DIV_ASSIGN','operator_punc',1,'p_operator_punc','c99_preprocessor.py',739),
+  ('operator_punc -> MOD_ASSIGN','operator_punc',1,'p_operator_punc','c99_preprocessor.py',740),
+  ('operator_punc -> ADD_ASSIGN','operator_punc',1,'p_operator_punc','c99_preprocessor.py',741),
+  ('operator_punc -> SUB_ASSIGN','operator_punc',1,'p_operator_punc','c99_preprocessor.py',742),
+  ('operator_punc -> LEFT_ASSIGN','operator_punc',1,'p_operator_punc','c99_preprocessor.py',743),
+  ('operator_punc -> RIGHT_ASSIGN','operator_punc',1,'p_operator_punc','c99_preprocessor.py',744),
+  ('operator_punc -> AND_ASSIGN','operator_punc',1,'p_operator_punc','c99_preprocessor.py',745),
+  ('operator_punc -> XOR_ASSIGN','operator_punc',1,'p_operator_punc','c99_preprocessor.py',746),
+  ('operator_punc -> OR_ASSIGN','operator_punc',1,'p_operator_punc','c99_preprocessor.py',747),
+  ('operator_punc -> DEC_OP','operator_punc',1,'p_operator_punc','c99_preprocessor.py',748),
+  ('operator_punc -> ELLIPSIS','operator_punc',1,'p_operator_punc','c99_preprocessor.py',749),
+  ('operator_punc -> EQ_OP','operator_punc',1,'p_operator_punc','c99_preprocessor.py',750),
+  ('operator_punc -> GE_OP','operator_punc',1,'p_operator_punc','c99_preprocessor.py',751),
+  ('operator_punc -> INC_OP','operator_punc',1,'p_operator_punc','c99_preprocessor.py',752),
+  ('operator_punc -> LEFT_OP','operator_punc',1,'p_operator_punc','c99_preprocessor.py',753),
+  ('operator_punc -> LE_OP','operator_punc',1,'p_operator_punc','c99_preprocessor.py',754),
+  ('operator_punc -> NE_OP','operator_punc',1,'p_operator_punc','c99_preprocessor.py',755),
+  ('operator_punc -> HASH_HASH','operator_punc',1,'p_operator_punc','c99_preprocessor.py',756),
+  ('operator_punc -> PTR_OP','operator_punc',1,'p_operator_punc','c99_preprocessor.py',757),
+  ('operator_punc -> OR_OP','operator_punc',1,'p_operator_punc','c99_preprocessor.py',758),
+  ('operator_punc -> RIGHT_OP','operator_punc',1,'p_operator_punc','c99_preprocessor.py',759),
+  ('operator_punc -> ;','operator_punc',1,'p_operator_punc','c99_preprocessor.py',760),
+  ('operator_punc -> {','operator_punc',1,'p_operator_punc','c99_preprocessor.py',761),
+  ('operator_punc -> }','operator_punc',1,'p_operator_punc','c99_preprocessor.py',762),
+  ('operator_punc -> ,','operator_punc',1,'p_operator_punc','c99_preprocessor.py',763),
+  ('operator_punc -> :','operator_punc',1,'p_operator_punc','c99_preprocessor.py',764),
+  ('operator_punc -> (','operator_punc',1,'p_operator_punc','c99_preprocessor.py',765),
+  ('operator_punc -> )','operator_punc',1,'p_operator_punc','c99_preprocessor.py',766),
+  ('operator_punc -> [','operator_punc',1,'p_operator_punc','c99_preprocessor.py',767),
+  ('operator_punc -> ]','operator_punc',1,'p_operator_punc','c99_preprocessor.py',768),
+  ('operator_punc -> .','operator_punc',1,'p_operator_punc','c99_preprocessor.py',769),
+  ('operator_punc -> &','operator_punc',1,'p_operator_punc','c99_preprocessor.py',770),
+  ('operator_punc -> !','operator_punc',1,'p_operator_punc','c99_preprocessor.py',771),
+  ('operator_punc -> ~','operator_punc',1,'p_operator_punc','c99_preprocessor.py',772),
+  ('operator_punc -> -','operator_punc',1,'p_operator_punc','c99_preprocessor.py',773),
+  ('operator_punc -> +','operator_punc',1,'p_operator_punc','c99_preprocessor.py',774),
+  ('operator_punc -> *','operator_punc',1,'p_operator_punc','c99_preprocessor.py',775),
+  ('operator_punc -> /','operator_punc',1,'p_operator_punc','c99_preprocessor.py',776),
+  ('operator_punc -> %','operator_punc',1,'p_operator_punc','c99_preprocessor.py',777),
+  ('operator_punc -> <','operator_punc',1,'p_operator_punc','c99_preprocessor.py',778),
+  ('operator_punc -> >','operator_punc',1,'p_operator_punc','c99_preprocessor.py',779),
+  ('operator_punc -> ^','operator_punc',1,'p_operator_punc','c99_preprocessor.py',780),
+  ('operator_punc -> |','operator_punc',1,'p_operator_punc','c99_preprocessor.py',781),
+  ('operator_punc -> ?','operator_punc',1,'p_operator_punc','c99_preprocessor.py',782),
+  ('operator_punc -> "','operator_punc',1,'p_operator_punc','c99_preprocessor.py',783),
+  ('operator_punc -> @','operator_punc',1,'p_operator_punc','c99_preprocessor.py',784),
+  ('operator_punc -> #','operator_punc',1,'p_operator_punc','c99_preprocessor.py',785),
+]
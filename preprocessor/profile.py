@@ -0,0 +1,89 @@
+import hashlib
+import os
+import pickle
+from pathlib import Path
+
+# Predefined macros of each target are written as #define lines inside profiles/<name>.h
+# and precompiled to profiles/<name>.pickle by build_tables.py.
+PROFILE_DIR     = Path(__file__).resolve().parent.joinpath('profiles')
+
+# Bump this value whenever the layout of a precompiled profile changes.
+PROFILE_VERSION = 3
+
+def profile_list():
+    """
+    Gets the name of every available profile.
+    """
+    return sorted(path.stem for path in PROFILE_DIR.glob('*.h'))
+
+def profile_source_path(name):
+    """
+    Gets the path of the definitions of a profile.
+
+    :param      name:  The profile name
+    :type       name:  str
+    """
+    source_path = PROFILE_DIR.joinpath(f'{name}.h')
+
+    if not source_path.is_file():
+        raise Exception(f"Unknown profile '{name}', available profiles are {', '.join(profile_list())}.")
+
+    return source_path
+
+def _source_digest(name):
+    return hashlib.sha256(profile_source_path(name).read_bytes()).hexdigest()
+
+def load_profile(name):
+    """
+    Load the precompiled macro table of a profile.
+
+    Returns None when profile isn't precompiled or has been precompiled from
+    other definitions or by another version.
+
+    :param      name:  The profile name
+    :type       name:  str
+    """
+    digest = _source_digest(name)
+
+    try:
+        with open(PROFILE_DIR.joinpath(f'{name}.pickle'), 'rb') as profile_file:
+            version, source_digest, macro_table = pickle.load(profile_file)
+    except (OSError, EOFError, ValueError, TypeError, pickle.UnpicklingError, AttributeError, ImportError):
+        return None
+
+    if version != PROFILE_VERSION or source_digest != digest:
+        return None
+
+    return macro_table
+
+def compile_profile(name, pre_processor):
+    """
+    Parse the definitions of a profile into a macro table.
+
+    :param      name:           The profile name
+    :type       name:           str
+    :param      pre_processor:  A preprocessor without any user defined macro
+    :type       pre_processor:  C99PreProcessor
+    """
+    pre_processor.process(profile_source_path(name))
+
+    # Callback macros are defined by every preprocessor.
+    return {name: macro for name, macro in dict.items(pre_processor.macro) if not macro.callback}
+
+def save_profile(name, macro_table):
+    """
+    Save the precompiled macro table of a profile.
+
+    :param      name:         The profile name
+    :type       name:         str
+    :param      macro_table:  The macro table
+    :type       macro_table:  dict
+    """
+    profile_path = PROFILE_DIR.joinpath(f'{name}.pickle')
+    tmp_path     = PROFILE_DIR.joinpath(f'{name}.{os.getpid()}.tmp')
+
+    # Profiles are shipped so they're written with the highest protocol Python 3.6 reads.
+    with open(tmp_path, 'wb') as profile_file:
+        pickle.dump((PROFILE_VERSION, _source_digest(name), macro_table), profile_file, protocol = 4)
+
+    os.replace(tmp_path, profile_path)
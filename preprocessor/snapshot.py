@@ -0,0 +1,80 @@
+import os
+import pickle
+from pathlib import Path
+
+from preprocessor.header_cache import file_digest
+
+# Bump this value whenever the layout of a snapshot changes.
+SNAPSHOT_VERSION = 2
+
+class PreProcessorSnapshot(object):
+    """
+    Macro state of a preprocessor, usually taken once a prelude shared by many
+    sources has been preprocessed.
+
+    Macros are never modified once defined so a snapshot shares them with the
+    preprocessor it was taken from, only tables are copied.
+
+    Output of the prelude isn't replayed by a restore since headers already seen
+    are skipped, it's kept alongside so it can be prepended to each output.
+    """
+
+    def __init__(self, macro_table, include_guard_table, dependency_list, output = ''):
+        self.macro_table         = macro_table
+        self.include_guard_table = include_guard_table
+        self.output              = output
+        # Files the snapshot depends on with their digest
+        self.dependency_list     = [(str(path), file_digest(Path(path).read_bytes())) for path in dependency_list]
+
+    def is_outdated(self):
+        """
+        Determine whether a file the snapshot depends on has changed.
+        """
+        for path, digest in self.dependency_list:
+            try:
+                if file_digest(Path(path).read_bytes()) != digest:
+                    return True
+            except OSError:
+                return True
+
+        return False
+
+    def save(self, snapshot_path):
+        """
+        Save the snapshot to disk.
+
+        :param      snapshot_path:  The snapshot path
+        :type       snapshot_path:  str
+        """
+        snapshot_path = Path(snapshot_path)
+        tmp_path      = snapshot_path.with_suffix(f'.{os.getpid()}.tmp')
+
+        snapshot_path.parent.mkdir(parents = True, exist_ok = True)
+
+        # Write to a temporary file first so concurrent processes never read a partial snapshot.
+        with open(tmp_path, 'wb') as snapshot_file:
+            pickle.dump((SNAPSHOT_VERSION, self), snapshot_file, protocol = pickle.HIGHEST_PROTOCOL)
+
+        os.replace(tmp_path, snapshot_path)
+
+    @staticmethod
+    def load(snapshot_path):
+        """
+        Load a snapshot from disk.
+
+        Returns None when the snapshot can't be read, has been written by another
+        version or when a file it depends on has changed.
+
+        :param      snapshot_path:  The snapshot path
+        :type       snapshot_path:  str
+        """
+        try:
+            with open(snapshot_path, 'rb') as snapshot_file:
+                version, snapshot = pickle.load(snapshot_file)
+        except (OSError, EOFError, ValueError, TypeError, pickle.UnpicklingError, AttributeError, ImportError):
+            return None
+
+        if version != SNAPSHOT_VERSION or snapshot.is_outdated():
+            return None
+
+        return snapshot
@@ -0,0 +1,177 @@
+from bisect import bisect_left
+
+import re
+
+# Trigraphs are replaced everywhere, including inside literals and comments (C99 5.2.1.1).
+TRIGRAPH_TABLE = {
+                    '??=' : '#', '??/' : '\\', '??\'' : '^', '??(' : '[',
+                    '??)' : ']', '??!' : '|', '??<' : '{', '??>' : '}',
+                    '??-' : '~',
+                 }
+
+# Digraphs are punctuators so they are never replaced inside literals and comments (C99 6.4.6).
+DIGRAPH_TABLE = {
+                    '<:' : '[', ':>' : ']', '<%' : '{', '%>' : '}', '%:' : '#',
+                }
+
+SPLICE_RE   = r'\\\n|\?\?/\n'
+TRIGRAPH_RE = r'\?\?[=/\'()!<>\-]'
+DIGRAPH_RE  = r'<:|:>|<%|%>|%:'
+
+# Literals may contain escaped quotes (also written as trigraph) and spliced lines.
+LITERAL_RE  = r'"[^"\\\n?]*(?:(?:\\[\s\S]|\?\?/[\s\S]|\?)[^"\\\n?]*)*"|\'[^\'\\\n?]*(?:(?:\\[\s\S]|\?\?/[\s\S]|\?)[^\'\\\n?]*)*\''
+
+# Line comments go on after a spliced line.
+COMMENT_RE  = r'/\*[^*]*\*+(?:[^/*][^*]*\*+)*/|//[^\n\\?]*(?:(?:\\\n|\?\?/\n|\\|\?)[^\n\\?]*)*'
+
+# Every alternative starts with a literal character (no group) so the regex engine
+# skips plain text with a character set search. Splices are tried before trigraphs.
+SCANNER_RE  = re.compile(f'{LITERAL_RE}|{COMMENT_RE}|{SPLICE_RE}|{TRIGRAPH_RE}|{DIGRAPH_RE}')
+INNER_RE    = re.compile(f'{SPLICE_RE}|{TRIGRAPH_RE}')
+
+# Conditional directive lines, written like the preprocessor lexer expects them
+CONDITIONAL_RE = re.compile(r'^[ \t]*#(if|ifdef|ifndef|elif|else|endif)\b([^\n]*)', re.MULTILINE)
+
+def scan_conditional_section(file_content, line_start):
+    """
+    Find groups of the if section starting at a line, only directive lines are scanned.
+
+    Each group is described by its directive, the directive argument, the position of
+    the directive line start and the position of the line feed ending it. Last group
+    is the #endif line. Returns None if the section isn't terminated.
+
+    :param      file_content:  The scanned file content
+    :type       file_content:  str
+    :param      line_start:    The position of the #if line
+    :type       line_start:    int
+    """
+    group_list = []
+    depth      = 0
+
+    for match in CONDITIONAL_RE.finditer(file_content, line_start):
+        directive = match.group(1)
+
+        # Only directives of the section itself start a group, nested sections are part of the group body.
+        if directive in ('if', 'ifdef', 'ifndef'):
+            depth   += 1
+            is_group = depth == 1
+        elif directive == 'endif':
+            depth   -= 1
+            is_group = not depth
+        else:
+            is_group = depth == 1
+
+        if is_group:
+            group_list.append((directive, match.group(2), match.start(), match.end()))
+
+        if not depth:
+            return group_list
+
+    return None
+
+class LineMap(object):
+    """
+    Map lines of scanned content to physical lines of the source file.
+
+    Only lines removed by line splicing or comment stripping are recorded,
+    a lookup is then a binary search over those removals.
+    """
+
+    def __init__(self):
+        self._line_list   = []
+        self._offset_list = []
+
+    def add(self, line, removed_count):
+        """
+        Record physical lines removed inside a scanned line.
+
+        :param      line:           The scanned line (1-based)
+        :type       line:           int
+        :param      removed_count:  The number of removed line breaks
+        :type       removed_count:  int
+        """
+        offset = self._offset_list[-1] if self._offset_list else 0
+
+        if self._line_list and self._line_list[-1] == line:
+            self._offset_list[-1] = offset + removed_count
+        else:
+            self._line_list.append(line)
+            self._offset_list.append(offset + removed_count)
+
+    def physical_line(self, line):
+        """
+        Gets the physical line a scanned line starts at.
+
+        :param      line:  The scanned line (1-based)
+        :type       line:  int
+        """
+        index = bisect_left(self._line_list, line) - 1
+
+        return line + (self._offset_list[index] if index >= 0 else 0)
+
+class SourceScanner(object):
+    """
+    Single pass scanner for translation phases 1 to 3.
+
+    Trigraphs are replaced, spliced lines are joined and comments are replaced
+    by a space in a single regex substitution. Plain text between matches is
+    copied as is, so Python code only runs for literals, comments, splices and
+    di/trigraphs.
+    """
+
+    def __init__(self, keep_comment = False):
+        self._keep_comment = keep_comment
+
+    def _replace_inner(self, text):
+        """
+        Apply phase 1 and 2 inside a literal or a comment.
+
+        :param      text:  The text
+        :type       text:  str
+        """
+        if '?' not in text and '\\' not in text:
+            return text
+
+        return INNER_RE.sub(lambda match: TRIGRAPH_TABLE.get(match.group(), ''), text)
+
+    def scan(self, file_content):
+        """
+        Scan the header/source file content.
+
+        :param      file_content:  The header/source file content
+        :type       file_content:  str
+        """
+        line_map = LineMap()
+        # Scanned line and source position after last match
+        state    = [1, 0]
+
+        def replace(match):
+            start, end = match.span()
+            text       = match.group()
+            first_char = text[0]
+
+            state[0] += file_content.count('\n', state[1], start)
+            state[1]  = end
+
+            if first_char == '"' or first_char == '\'':
+                replacement = self._replace_inner(text)
+            elif first_char == '/':
+                replacement = self._replace_inner(text) if self._keep_comment else ' '
+            elif text in TRIGRAPH_TABLE:
+                replacement = TRIGRAPH_TABLE[text]
+            elif text in DIGRAPH_TABLE:
+                replacement = DIGRAPH_TABLE[text]
+            else:
+                # Line splice
+                replacement = ''
+
+            removed_count = text.count('\n') - replacement.count('\n')
+
+            if removed_count:
+                line_map.add(state[0], removed_count)
+
+            state[0] += replacement.count('\n')
+
+            return replacement
+
+        return SCANNER_RE.sub(replace, file_content), line_map
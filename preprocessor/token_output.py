@@ -0,0 +1,39 @@
+from preprocessor.macro_expander import tokens_to_str
+
+class TokenOutput(object):
+    """
+    Output stream collecting preprocessed tokens so a parser can consume them
+    without lexing preprocessed text again.
+
+    Text lines are handed over as token lists. Remaining text (line breaks,
+    line controls, output of headers replayed from the header cache) is
+    written as text and tokenized.
+
+    Preprocessed text is also written to a text stream when one is given,
+    formatted as the text output of the preprocessor.
+    """
+
+    def __init__(self, tokenize, text_output = None):
+        self.token_list   = []
+        self._tokenize    = tokenize
+        self._text_output = text_output
+
+    def write(self, text):
+        if self._text_output is not None:
+            self._text_output.write(text)
+
+        if text and not text.isspace():
+            for line in text.splitlines():
+                self.token_list.extend(self._tokenize(line))
+
+    def write_tokens(self, token_list):
+        """
+        Write tokens of a preprocessed text line, its line break is written separately.
+
+        :param      token_list:  The token list
+        :type       token_list:  list
+        """
+        if self._text_output is not None:
+            self._text_output.write(f'{tokens_to_str(token_list)} ')
+
+        self.token_list.extend(token_list)
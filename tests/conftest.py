@@ -0,0 +1,33 @@
+import os
+import sys
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+
+import types
+
+import pytest
+
+from front_end.parser.parser_gnu99 import GNU99Parser
+from transformer.ctypes_generator import CTypesGenerator
+
+def load_module(source, generator = None):
+    """
+    Execute the module generated from a source.
+
+    Generated code runs inside a module object, so module level __getattr__
+    of lazy modules applies.
+
+    :param      source:     The C source or its AST
+    :type       source:     str|ir.AST
+    :param      generator:  The generator (ctypes one by default)
+    :type       generator:  object
+    """
+    ast    = GNU99Parser().parse(source) if isinstance(source, str) else source
+    module = types.ModuleType('generated')
+
+    exec((generator or CTypesGenerator()).generate(ast), module.__dict__)
+
+    return module
+
+@pytest.fixture
+def load():
+    return load_module
@@ -0,0 +1,131 @@
+import os
+import sys
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+
+import pytest
+
+from preprocessor.c99_preprocessor import C99PreProcessor
+
+def write_source(tmp_path, source):
+    source_path = tmp_path.joinpath('source.c')
+    source_path.write_text(source)
+
+    return source_path
+
+def preprocess(tmp_path, source):
+    return [line.split() for line in C99PreProcessor().process(write_source(tmp_path, source)).splitlines() if line.strip()]
+
+def test_text_line_before_if_section(tmp_path):
+    # Text followed by a directive is expanded once, at top level.
+    assert preprocess(tmp_path, '#define W 2\nW Z end\n#if 1\nx\n#endif\n') == [['2', 'Z', 'end'], ['x']]
+
+def test_stringify_keeps_argument_spacing(tmp_path):
+    source = '''#define S(x) #x
+#define V(...) #__VA_ARGS__
+#define T(x) S(x  + 1)
+S(a+b)
+S(  a  +   b  )
+S(f(x,y))
+V(a,b) V(a, b)
+T(a+b)
+'''
+    output = C99PreProcessor().process(write_source(tmp_path, source))
+
+    assert [line.strip() for line in output.splitlines() if line.strip()] == ['"a+b"', '"a + b"', '"f(x,y)"', '"a,b" "a, b"', '"a+b + 1"']
+
+def test_stringify_string_literals(tmp_path):
+    # A string literal followed by a space is lexed as a header name, it's escaped all the same.
+    source = '#define str(x) #x\nstr("x")\nstr("x" )\nstr("a" "b")\n'
+
+    assert preprocess(tmp_path, source) == [['"\\"x\\""'], ['"\\"x\\""'], ['"\\"a\\"', '\\"b\\""']]
+
+def test_stringify_keeps_invocation_spacing(tmp_path):
+    # C99 6.10.3.3 example, a replacement takes the white space preceding its invocation.
+    source = '''#define hash_hash # ## #
+#define mkstr(a) # a
+#define in_between(a) mkstr(a)
+#define join(c, d) in_between(c hash_hash d)
+#define str(x) #x
+#define xstr(x) str(x)
+#define E a
+join(x, y)
+xstr(-E) xstr(- E)
+'''
+    assert preprocess(tmp_path, source) == [['"x', '##', 'y"'], ['"-a"', '"-', 'a"']]
+
+def test_consecutive_if_sections(tmp_path):
+    # An if section is reduced once the next one is being lexed.
+    source = '#define A 1\n#if 1\nA\n#endif\n#if 1\nA\n#if 1\nA\n#endif\n#if 1\nA\n#endif\n#endif\n#ifdef A\nA\n#endif\n'
+
+    assert preprocess(tmp_path, source) == [['1']] * 5
+
+def test_directives_before_if_section(tmp_path):
+    # Directives of a selected group run even though the next if section is the lookahead.
+    source = '#if 1\n#define INNER 5\n#endif\n#if 1\nINNER\n#endif\n'
+
+    assert preprocess(tmp_path, source) == [['5']]
+
+    source = '#ifndef G\n#define G\n#endif\n#ifndef G\nbad\n#endif\nend\n'
+
+    assert preprocess(tmp_path, source) == [['end']]
+
+def test_condition_after_if_section(tmp_path):
+    # Dead groups are found once the previous if section and its macros are processed.
+    source = '#if 1\n#define INNER 5\n#endif\n#if INNER == 5\ne1\n#endif\n'
+
+    assert preprocess(tmp_path, source) == [['e1']]
+
+    source = '#ifdef INNER\n#else\n#define INNER\n#endif\n#ifndef INNER\nbad\n#elif defined INNER\ne2\n#else\nbad\n#endif\n'
+
+    assert preprocess(tmp_path, source) == [['e2']]
+
+def test_invocation_across_lines(tmp_path):
+    source = '#define F(a, b) a + b\nF(1,\n  2) F\n\n(3, 4) F\n#define X\n'
+
+    assert preprocess(tmp_path, source) == [['1', '+', '2'], ['3', '+', '4', 'F']]
+
+    # C99 6.10.3.5 EXAMPLE 3
+    source = '''#define x 3
+#define f(a) f(x * (a))
+#undef x
+#define x 2
+#define g f
+#define h g(~
+#define m(a) a(w)
+#define w 0,1
+g(x+(3,4)-w) | h 5) & m
+(f)^m(m);
+'''
+    assert ' '.join(sum(preprocess(tmp_path, source), [])) == 'f ( 2 * ( 2 + ( 3 , 4 ) - 0 , 1 ) ) | f ( 2 * ( ~ 5 ) ) & f ( 2 * ( 0 , 1 ) ) ^ m ( 0 , 1 ) ;'
+
+def test_unterminated_invocation(tmp_path):
+    with pytest.raises(Exception, match = 'Unterminated argument list invoking macro F'):
+        preprocess(tmp_path, '#define F(a) a\nF(1,\n#define X\n2)\n')
+
+def test_line_after_block_comment(tmp_path):
+    # Lines joined by a comment are still counted.
+    source = '/* a\nblock\ncomment */\na __LINE__\nb /* c\n */\n\nc __LINE__\n'
+
+    assert preprocess(tmp_path, source) == [['a', '4'], ['b'], ['c', '8']]
+
+def test_line_inside_and_after_if_sections(tmp_path):
+    source = '''#if 0
+skipped
+#endif
+a __LINE__
+#if 1
+
+b __LINE__
+#ifdef __LINE__
+/* c
+*/
+c __LINE__
+#else
+#endif
+
+
+d __LINE__
+#endif
+e __LINE__
+'''
+    assert preprocess(tmp_path, source) == [['a', '4'], ['b', '7'], ['c', '11'], ['d', '16'], ['e', '18']]
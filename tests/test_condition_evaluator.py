@@ -0,0 +1,111 @@
+import os
+import sys
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+
+import pytest
+
+from preprocessor.c99_preprocessor import C99PreProcessor
+from preprocessor.condition_evaluator import ConditionCompiler, ConditionEvaluator
+
+@pytest.fixture
+def preprocessor():
+    preprocessor = C99PreProcessor()
+    preprocessor.define_macro('ONE', replacement = '1')
+    preprocessor.define_macro('ZERO', replacement = '0')
+
+    return preprocessor
+
+@pytest.fixture
+def evaluate(preprocessor):
+    evaluator = ConditionEvaluator(preprocessor.macro, preprocessor._expander)
+
+    return lambda condition: evaluator.evaluate(preprocessor._expander.tokenize(condition))
+
+@pytest.mark.parametrize('condition, result', [
+                                                    ('defined ONE', 1),
+                                                    ('defined(ONE)', 1),
+                                                    ('defined ( ONE ) && !defined UNKNOWN', 1),
+                                                    ('defined(UNKNOWN) || defined UNKNOWN', 0),
+                                                    # Identifiers remaining after expansion are 0.
+                                                    ('UNKNOWN + ONE', 1),
+                                              ])
+def test_defined(evaluate, condition, result):
+    assert evaluate(condition) == result
+
+@pytest.mark.parametrize('condition, result', [
+                                                    ('ONE ? 2 : 3', 2),
+                                                    ('ZERO ? 2 : 3', 3),
+                                                    ('ZERO ? 1 : ONE ? 4 : 5', 4),
+                                                    ('(ONE ? ZERO : 1) ? 6 : 7', 7),
+                                                    ('1 + 2 * 3 - -4 / 2 << 1', 18),
+                                                    # Division truncates toward zero.
+                                                    ('-7 / 2 == -3 && -7 % 2 == -1', 1),
+                                              ])
+def test_operators(evaluate, condition, result):
+    assert evaluate(condition) == result
+
+@pytest.mark.parametrize('condition, result', [
+                                                    ('ZERO && 1 / ZERO', 0),
+                                                    ('ONE || 1 % ZERO', 1),
+                                                    ('ONE ? 2 : 1 / ZERO', 2),
+                                                    ('ZERO ? 1 / ZERO : 3', 3),
+                                              ])
+def test_short_circuited_division_by_zero(evaluate, condition, result):
+    assert evaluate(condition) == result
+
+def test_division_by_zero(evaluate):
+    with pytest.raises(Exception, match = 'Division by zero'):
+        evaluate('ONE && 1 / ZERO')
+
+def test_bracketed_comparison(preprocessor, evaluate):
+    preprocessor.define_macro('A', replacement = '1')
+    preprocessor.define_macro('B', replacement = '2')
+    preprocessor.define_macro('C', replacement = '4')
+    preprocessor.define_macro('D', replacement = '3')
+
+    # A < B && C > D is lexed as a header name, which is split again.
+    assert [token.type for token in preprocessor._expander.tokenize('A < B && C > D')] == ['IDENTIFIER', 'HEADER_NAME', 'IDENTIFIER']
+    assert evaluate('A < B && C > D') == 1
+    assert evaluate('A<B&&C>D') == 1
+    assert evaluate('B < A || D > C') == 0
+
+def test_compiled_condition():
+    preprocessor = C99PreProcessor()
+    condition    = ConditionCompiler(preprocessor._expander.tokenize('(1 ? 2 : 3) + !0 * ~0')).compile()
+
+    assert condition() == 1
+
+    with pytest.raises(Exception, match = "Unexpected '\\)'"):
+        ConditionCompiler(preprocessor._expander.tokenize('1 + 2)')).compile()
+
+def test_memo_invalidation(preprocessor, evaluate, monkeypatch):
+    evaluation_list = []
+    _evaluate       = ConditionEvaluator._evaluate
+
+    def spy(self, token_list):
+        evaluation_list.append(token_list)
+        return _evaluate(self, token_list)
+
+    monkeypatch.setattr(ConditionEvaluator, '_evaluate', spy)
+
+    preprocessor.define_macro('VALUE', replacement = '1')
+    preprocessor.define_macro('ALIAS', replacement = 'VALUE')
+
+    assert evaluate('ALIAS == 1') == 1
+    assert evaluate('ALIAS == 1') == 1
+    assert len(evaluation_list) == 1
+
+    # Macro expanded indirectly is redefined.
+    preprocessor.define_macro('VALUE', replacement = '2')
+    assert evaluate('ALIAS == 1') == 0
+    assert len(evaluation_list) == 2
+
+    # Macro is undefined, then defined back as memoized first.
+    preprocessor.undef_macro('VALUE')
+    assert evaluate('ALIAS == 1') == 0
+    assert evaluate('defined VALUE') == 0
+
+    preprocessor.define_macro('VALUE', replacement = '1')
+    assert evaluate('ALIAS == 1') == 1
+    assert evaluate('defined VALUE') == 1
+    assert len(evaluation_list) == 5
@@ -0,0 +1,79 @@
+import os
+import sys
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+
+import pytest
+
+from copy_compiler import CoPy99Compiler, CoPyGNU99Compiler
+
+def write_sources(source_dir, second_width = 4):
+    source_dir.joinpath('common').mkdir()
+    source_dir.joinpath('common', 'types.h').write_text('typedef struct { int cells[WIDTH]; } cell_t;\n')
+    source_dir.joinpath('first.h').write_text('#define WIDTH 4\n#include "common/types.h"\ntypedef struct { cell_t cells; } first_t;\n')
+    source_dir.joinpath('second.h').write_text(f'#define WIDTH {second_width}\n#include "common/types.h"\ntypedef struct {{ cell_t cells; }} second_t;\n')
+
+def test_shared_module_written_once(tmp_path):
+    write_sources(tmp_path)
+
+    compiler = CoPyGNU99Compiler(tmp_path / 'output')
+    compiler.compile_directory(tmp_path, 'first.h', max_workers = 1)
+
+    shared_path = tmp_path / 'output' / 'common' / 'types.py'
+    inode       = shared_path.stat().st_ino
+
+    compiler.compile_directory(tmp_path, 'second.h', max_workers = 1)
+
+    assert shared_path.stat().st_ino == inode
+    assert not list(tmp_path.joinpath('output').rglob('*.tmp'))
+
+def test_conflicting_shared_module(tmp_path):
+    write_sources(tmp_path, second_width = 8)
+
+    with pytest.raises(Exception, match = 'generated differently'):
+        CoPyGNU99Compiler(tmp_path / 'output').compile_many([tmp_path / 'first.h', tmp_path / 'second.h'], tmp_path, max_workers = 1)
+
+def test_stale_shared_module_replaced(tmp_path):
+    write_sources(tmp_path)
+
+    compiler = CoPyGNU99Compiler(tmp_path / 'output')
+    compiler.compile_directory(tmp_path, 'first.h', max_workers = 1)
+
+    shared_path = tmp_path / 'output' / 'common' / 'types.py'
+    os.utime(shared_path, (0, 0))
+    tmp_path.joinpath('first.h').write_text('#define WIDTH 2\n#include "common/types.h"\ntypedef struct { cell_t cells; } first_t;\n')
+
+    compiler.compile_directory(tmp_path, 'first.h', max_workers = 1)
+
+    assert '2' in shared_path.read_text()
+
+def write_translation_units(source_dir):
+    source_dir.joinpath('nested').mkdir(parents = True)
+    source_dir.joinpath('types.h').write_text('#define WIDTH 4\ntypedef struct { int cells[WIDTH]; } cell_t;\n')
+    source_dir.joinpath('first.h').write_text('#include "types.h"\ntypedef struct { cell_t cells; } first_t;\n')
+    source_dir.joinpath('second.h').write_text('#include "types.h"\ntypedef struct { cell_t cells[2]; } second_t;\n')
+    source_dir.joinpath('nested', 'third.h').write_text('typedef struct { char name[8]; } third_t;\n')
+
+    return [source_dir / 'first.h', source_dir / 'second.h', source_dir / 'nested' / 'third.h']
+
+def test_compile_many_like_compile(tmp_path):
+    input_path_list = write_translation_units(tmp_path / 'input')
+
+    name_list       = ['first.py', 'second.py', os.path.join('nested', 'third.py')]
+
+    output_filepath_list = CoPy99Compiler(tmp_path / 'output').compile_many(input_path_list, tmp_path / 'input', max_workers = 2)
+
+    # Output tree mirrors input tree, every unit compiled in a worker matches a sequential compile.
+    assert sorted(output_filepath_list) == sorted(str(tmp_path / 'output' / name) for name in name_list)
+
+    for input_path, name in zip(input_path_list, name_list):
+        expected_filepath = tmp_path / 'expected' / name
+        CoPy99Compiler(tmp_path / 'expected').compile(input_path, str(expected_filepath))
+
+        assert tmp_path.joinpath('output', name).read_text() == expected_filepath.read_text()
+
+def test_compile_many_failure(tmp_path):
+    input_path_list = write_translation_units(tmp_path / 'input')
+    input_path_list[1].write_text('#error broken\n')
+
+    with pytest.raises(Exception, match = 'Failed to compile .*second.h: broken'):
+        CoPy99Compiler(tmp_path / 'output').compile_many(input_path_list, tmp_path / 'input', max_workers = 2)
@@ -0,0 +1,95 @@
+import os
+import sys
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+
+import ctypes
+import re
+
+import pytest
+
+from front_end.parser.parser_gnu99 import GNU99Parser
+from transformer.common import Endianness
+from transformer.ctypes_generator import CTypesGenerator
+
+RECORD = '''
+typedef struct entry
+{
+    unsigned short identifier;
+    unsigned int size;
+} entry_t;
+'''
+
+def test_buffer_array_shares_memory(load):
+    entry_class = load(RECORD).EntryT
+    buffer      = bytearray(ctypes.sizeof(entry_class) * 3)
+    entry_list  = entry_class.from_buffer_array(buffer, 3)
+
+    entry_class.from_buffer(buffer, ctypes.sizeof(entry_class) * 2).size = 42
+    entry_list[0].identifier = 7
+
+    assert entry_list[2].size == 42
+    assert entry_class.from_buffer(buffer).identifier == 7
+    assert [entry.size for entry in entry_class.iter_from_buffer(buffer)] == [0, 0, 42]
+
+def test_buffer_array_read_only(load):
+    entry_class = load(RECORD).EntryT
+    buffer      = bytes(ctypes.sizeof(entry_class) * 2)
+
+    with pytest.raises(TypeError):
+        entry_class.from_buffer_array(buffer, 2)
+
+    entry_list = entry_class.from_buffer_array(buffer, 2, copy = True)
+    entry_list[1].size = 42
+
+    assert len(list(entry_class.iter_from_buffer(buffer, copy = True))) == 2
+    assert buffer == bytes(len(buffer))
+
+def test_codec_follows_layout(load):
+    source = '''
+typedef enum
+{
+    OFF = 0,
+    ON = 1,
+} state_e;
+
+typedef struct
+{
+    short x;
+    short y;
+} point_t;
+
+typedef struct __attribute__((packed)) packet
+{
+    unsigned char kind;
+    state_e state;
+    point_t position[2];
+    double value;
+} packet_t;
+'''
+    for endianness in Endianness:
+        packet_class = load(source, CTypesGenerator(endianness = endianness)).PacketT
+        packet       = packet_class(kind = 3, value = 1.5)
+
+        packet.state._value  = 1
+        packet.position[1].y = -2
+
+        values = packet_class.unpack_tuple(bytes(packet))
+
+        assert packet_class._struct_.size == ctypes.sizeof(packet_class)
+        assert values == (3, 1, 0, 0, 0, -2, 1.5)
+        assert packet_class.pack_tuple(values) == bytes(packet)
+        assert packet.to_dict() == {'kind': 3, 'state': 1, 'position': [{'x': 0, 'y': 0}, {'x': 0, 'y': -2}], 'value': 1.5}
+
+def test_codec_incomplete_type(load):
+    with pytest.raises(Exception, match = 'Incomplete type'):
+        load('struct missing;\ntypedef struct { struct missing member; int value; } holder_t;\n')
+
+@pytest.mark.parametrize('lazy', [False, True])
+def test_codec_spacing(lazy):
+    source = RECORD + 'typedef struct flags { unsigned int kind : 4; } flags_t;\n' + RECORD.replace('entry', 'other')
+    output = CTypesGenerator(lazy = lazy).generate(GNU99Parser().parse(source))
+
+    # Codec directly follows the fields, classes are separated by a blank line with or without one.
+    assert len(re.findall(r'\]\n +_struct_  = ', output)) == 2
+    assert len(re.findall(r'\n\n(?:class|def _define_)\w*', output)) == 2 + 3
+    assert '\n\n\n' not in output
@@ -0,0 +1,72 @@
+import os
+import sys
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+
+from copy_compiler import CoPy99Compiler, MANIFEST_NAME
+from core.dependency_graph import DependencyGraph
+
+def write_sources(source_dir):
+    source_dir.joinpath('types.h').write_text('typedef struct { int x; } point_t;\n')
+    source_dir.joinpath('main.h').write_text('#include "types.h"\n')
+    source_dir.joinpath('main.py').write_text('')
+
+    return source_dir.joinpath('main.h'), source_dir.joinpath('main.py')
+
+def test_outdated_output(tmp_path):
+    input_path, output_filepath = write_sources(tmp_path)
+    manifest_path               = tmp_path / 'manifest.json'
+    dependency_graph            = DependencyGraph(manifest_path, 'compiler')
+
+    # Outputs not recorded yet are outdated.
+    assert dependency_graph.is_outdated(output_filepath, input_path)
+
+    dependency_graph.add(output_filepath, input_path, [input_path, tmp_path / 'types.h'])
+    dependency_graph.save()
+
+    dependency_graph = DependencyGraph(manifest_path, 'compiler')
+    assert not dependency_graph.is_outdated(output_filepath, input_path)
+
+    # Output of another source, or a missing output.
+    assert dependency_graph.is_outdated(output_filepath, tmp_path / 'types.h')
+    assert dependency_graph.is_outdated(tmp_path / 'other.py', input_path)
+
+    # Manifest of another compiler is ignored.
+    assert DependencyGraph(manifest_path, 'other compiler').is_outdated(output_filepath, input_path)
+
+def test_outdated_dependency(tmp_path):
+    input_path, output_filepath = write_sources(tmp_path)
+    header_path                 = tmp_path / 'types.h'
+    dependency_graph            = DependencyGraph(tmp_path / 'manifest.json')
+
+    dependency_graph.add(output_filepath, input_path, [input_path, header_path])
+
+    # Touching a header doesn't change its content.
+    os.utime(header_path, ns = (0, 0))
+    assert not dependency_graph.is_outdated(output_filepath, input_path)
+
+    header_path.write_text('typedef struct { long x; } point_t;\n')
+    assert dependency_graph.is_outdated(output_filepath, input_path)
+
+    dependency_graph.add(output_filepath, input_path, [input_path, header_path])
+    header_path.unlink()
+    assert dependency_graph.is_outdated(output_filepath, input_path)
+
+def test_incremental_compilation(tmp_path):
+    input_dir = tmp_path / 'input'
+    input_dir.mkdir()
+    input_dir.joinpath('types.h').write_text('typedef struct { int x; } point_t;\n')
+    input_dir.joinpath('first.h').write_text('#include "types.h"\ntypedef struct { point_t point; } first_t;\n')
+    input_dir.joinpath('second.h').write_text('typedef struct { char name[8]; } second_t;\n')
+
+    compiler        = CoPy99Compiler(tmp_path / 'output')
+    input_path_list = [input_dir / 'first.h', input_dir / 'second.h']
+
+    assert len(compiler.compile_many(input_path_list, input_dir, max_workers = 1, incremental = True)) == 2
+    assert tmp_path.joinpath('output', MANIFEST_NAME).is_file()
+    assert compiler.compile_many(input_path_list, input_dir, max_workers = 1, incremental = True) == []
+
+    # Only translation units including the changed header are compiled again.
+    input_dir.joinpath('types.h').write_text('typedef struct { long x; } point_t;\n')
+
+    assert compiler.compile_many(input_path_list, input_dir, max_workers = 1, incremental = True) == [str(tmp_path / 'output' / 'first.py')]
+    assert 'c_int64' in tmp_path.joinpath('output', 'first.py').read_text()
@@ -0,0 +1,89 @@
+import os
+import sys
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+
+from preprocessor.c99_preprocessor import C99PreProcessor
+from preprocessor.header_cache import HeaderCache
+
+def write_sources(source_dir):
+    source_dir.joinpath('types.h').write_text('#define WIDTH 4\ntypedef int cell_t[WIDTH];\n')
+    source_dir.joinpath('main.c').write_text('#include "types.h"\ncell_t grid[WIDTH];\n')
+
+    return source_dir.joinpath('main.c')
+
+def spy_lookup(monkeypatch):
+    """
+    Record whether each header cache lookup was a hit.
+    """
+    hit_list = []
+    lookup   = HeaderCache.lookup
+
+    def spy(self, key, macro_table):
+        entry = lookup(self, key, macro_table)
+        hit_list.append(entry is not None)
+        return entry
+
+    monkeypatch.setattr(HeaderCache, 'lookup', spy)
+
+    return hit_list
+
+def test_cached_include(tmp_path):
+    source_path = write_sources(tmp_path)
+    expected    = C99PreProcessor().process(source_path)
+
+    assert C99PreProcessor(cache_dir = tmp_path / 'cache').process(source_path) == expected
+    assert list(tmp_path.joinpath('cache').glob('*.pickle'))
+
+def test_cached_mapped_include(tmp_path, monkeypatch):
+    monkeypatch.setattr('core.source_file.MAP_THRESHOLD', 0)
+
+    test_cached_include(tmp_path)
+
+def test_cache_hit_and_nested_invalidation(tmp_path, monkeypatch):
+    tmp_path.joinpath('inner.h').write_text('#define SIZE 8\n')
+    tmp_path.joinpath('outer.h').write_text('#include "inner.h"\ntypedef char buffer_t[SIZE];\n')
+    tmp_path.joinpath('main.c').write_text('#include "outer.h"\nbuffer_t buffer[SIZE];\n')
+
+    source_path = tmp_path.joinpath('main.c')
+    cache_dir   = tmp_path.joinpath('cache')
+    hit_list    = spy_lookup(monkeypatch)
+
+    # Headers are preprocessed then stored (outer.h lookup comes first).
+    miss_output = C99PreProcessor(cache_dir = cache_dir).process(source_path)
+    assert hit_list == [False, False]
+
+    # outer.h is replayed from the cache, with the macros inner.h defines.
+    hit_list.clear()
+    assert C99PreProcessor(cache_dir = cache_dir).process(source_path) == miss_output
+    assert hit_list == [True]
+    assert 'buffer[8]' in miss_output.replace(' ', '')
+
+    # A nested header change invalidates the outer header entry.
+    hit_list.clear()
+    tmp_path.joinpath('inner.h').write_text('#define SIZE 16\n')
+
+    output = C99PreProcessor(cache_dir = cache_dir).process(source_path)
+    assert hit_list == [False, False]
+    assert output == C99PreProcessor().process(source_path)
+    assert 'buffer_t[16]' in output.replace(' ', '')
+
+def test_tainted_header_not_cached(tmp_path, monkeypatch):
+    tmp_path.joinpath('line.h').write_text('#define SIZE 2\nint line = __LINE__;\n')
+    tmp_path.joinpath('outer.h').write_text('#include "line.h"\ntypedef char buffer_t[SIZE];\n')
+    tmp_path.joinpath('plain.h').write_text('typedef int plain_t;\n')
+    tmp_path.joinpath('main.c').write_text('#include "plain.h"\n#include "outer.h"\n')
+
+    source_path = tmp_path.joinpath('main.c')
+    cache_dir   = tmp_path.joinpath('cache')
+    hit_list    = spy_lookup(monkeypatch)
+    output      = C99PreProcessor(cache_dir = cache_dir).process(source_path)
+
+    # Output of a header expanding a callback macro (and of its includers) depends on
+    # the preprocessor state, only the other header is stored.
+    assert hit_list == [False, False, False]
+    assert len(list(cache_dir.glob('*.pickle'))) == 1
+
+    hit_list.clear()
+    assert C99PreProcessor(cache_dir = cache_dir).process(source_path) == output
+    assert hit_list == [True, False, False]
+    assert 'line=2' in output.replace(' ', '')
@@ -0,0 +1,85 @@
+import os
+import sys
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+
+from pathlib import Path
+
+import pytest
+
+from preprocessor.c99_preprocessor import C99PreProcessor
+from preprocessor.include_resolver import IncludeResolver
+
+@pytest.fixture
+def source_dir(tmp_path):
+    for path in ['first/common.h', 'first/sys/types.h', 'second/common.h', 'second/only.h', 'source/common.h']:
+        tmp_path.joinpath(path).parent.mkdir(parents = True, exist_ok = True)
+        tmp_path.joinpath(path).write_text('')
+
+    return tmp_path
+
+def spy_is_file(monkeypatch):
+    """
+    Record every file existence check.
+    """
+    checked_list = []
+    is_file      = Path.is_file
+
+    def spy(self):
+        checked_list.append(self)
+        return is_file(self)
+
+    monkeypatch.setattr(Path, 'is_file', spy)
+
+    return checked_list
+
+@pytest.mark.parametrize('prescan', [False, True])
+def test_resolve(source_dir, prescan):
+    resolver = IncludeResolver([source_dir / 'first', source_dir / 'second'], prescan)
+
+    # Quoted header names are searched next to the including file first.
+    assert resolver.resolve('"common.h"', source_dir / 'source') == source_dir / 'source' / 'common.h'
+    # First include directory wins.
+    assert resolver.resolve('<common.h>', source_dir / 'source') == source_dir / 'first' / 'common.h'
+    assert resolver.resolve('"only.h"', source_dir / 'source') == source_dir / 'second' / 'only.h'
+    assert resolver.resolve('<sys/types.h>', source_dir) == source_dir / 'first' / 'sys' / 'types.h'
+    assert resolver.resolve('<missing.h>', source_dir) is None
+
+@pytest.mark.parametrize('prescan', [False, True])
+def test_cached_lookups(source_dir, monkeypatch, prescan):
+    resolver     = IncludeResolver([source_dir / 'first', source_dir / 'second'], prescan)
+    checked_list = spy_is_file(monkeypatch)
+
+    assert resolver.resolve('"only.h"', source_dir / 'source') == source_dir / 'second' / 'only.h'
+    assert resolver.resolve('<missing.h>', source_dir / 'source') is None
+    # Include directories are listed instead of being checked file by file.
+    assert len(checked_list) == (1 if prescan else 5)
+
+    # Positive and negative lookups are cached, so are checks of include directories made for another including directory.
+    checked_list.clear()
+    source_dir.joinpath('first', 'missing.h').write_text('')
+
+    assert resolver.resolve('"only.h"', source_dir / 'source') == source_dir / 'second' / 'only.h'
+    assert resolver.resolve('<missing.h>', source_dir / 'source') is None
+    assert resolver.resolve('<missing.h>', source_dir / 'other') is None
+    assert resolver.resolve('"only.h"', source_dir / 'first') == source_dir / 'second' / 'only.h'
+    assert checked_list == ([source_dir / 'first' / 'only.h'] if prescan else [])
+
+    # Cleared resolver sees new files.
+    resolver.clear()
+
+    assert resolver.resolve('<missing.h>', source_dir / 'source') == source_dir / 'first' / 'missing.h'
+
+def test_shared_resolver(source_dir, monkeypatch):
+    source_dir.joinpath('source', 'main.c').write_text('#include <only.h>\n#include "common.h"\n')
+
+    resolver     = IncludeResolver([source_dir / 'first', source_dir / 'second'])
+    checked_list = spy_is_file(monkeypatch)
+
+    for _ in range(2):
+        preprocessor = C99PreProcessor(include_resolver = resolver)
+        preprocessor.process(source_dir / 'source' / 'main.c')
+
+        assert list(preprocessor.dependencies) == [source_dir / 'second' / 'only.h', source_dir / 'source' / 'common.h']
+
+    # Second preprocessor resolves includes without touching the filesystem.
+    assert len(checked_list) == 3
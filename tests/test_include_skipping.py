@@ -0,0 +1,60 @@
+import os
+import sys
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+
+import pytest
+
+from preprocessor.c99_preprocessor import C99PreProcessor
+import preprocessor.c99_preprocessor
+
+def spy_read_source(monkeypatch):
+    """
+    Record the name of every file read.
+    """
+    read_list   = []
+    read_source = preprocessor.c99_preprocessor.read_source
+
+    def spy(path):
+        read_list.append(path.name)
+        return read_source(path)
+
+    monkeypatch.setattr(preprocessor.c99_preprocessor, 'read_source', spy)
+
+    return read_list
+
+def preprocess(tmp_path, header, main = '#include "header.h"\n#include "header.h"\nend\n'):
+    tmp_path.joinpath('header.h').write_text(header)
+    tmp_path.joinpath('main.c').write_text(main)
+
+    return C99PreProcessor().process(tmp_path / 'main.c').split()
+
+@pytest.mark.parametrize('header', [
+                                        '#pragma once\nonce\n',
+                                        '/* guard */\n#ifndef HEADER_H\n#define HEADER_H\nonce\n#endif\n\n',
+                                        '#if !defined(HEADER_H)\n#define HEADER_H\n#if 1\nonce\n#endif\n#endif\n',
+                                        '#if !defined HEADER_H\n#define HEADER_H\nonce\n#endif\n',
+                                   ])
+def test_skipped_include(tmp_path, monkeypatch, header):
+    read_list = spy_read_source(monkeypatch)
+
+    assert preprocess(tmp_path, header) == ['once', 'end']
+    assert read_list == ['main.c', 'header.h']
+
+@pytest.mark.parametrize('header, output', [
+                                                # Guard doesn't enclose the whole file.
+                                                ('#ifndef HEADER_H\n#define HEADER_H\nonce\n#endif\nalways\n', ['once', 'always', 'always', 'end']),
+                                                ('#ifndef HEADER_H\n#define HEADER_H\nonce\n#else\nagain\n#endif\n', ['once', 'again', 'end']),
+                                                ('#ifndef HEADER_H\n#define OTHER_H\nalways\n#endif\n', ['always', 'always', 'end']),
+                                           ])
+def test_unguarded_include(tmp_path, monkeypatch, header, output):
+    read_list = spy_read_source(monkeypatch)
+
+    assert preprocess(tmp_path, header) == output
+    assert read_list == ['main.c', 'header.h', 'header.h']
+
+def test_undefined_guard(tmp_path, monkeypatch):
+    read_list = spy_read_source(monkeypatch)
+    output    = preprocess(tmp_path, '#ifndef HEADER_H\n#define HEADER_H\nonce\n#endif\n', '#include "header.h"\n#undef HEADER_H\n#include "header.h"\n#include "header.h"\n')
+
+    assert output == ['once', 'once']
+    assert read_list == ['main.c', 'header.h', 'header.h']
@@ -0,0 +1,73 @@
+import os
+import sys
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+
+import ctypes
+
+import pytest
+
+from core.layout import LayoutEngine
+from front_end.parser.parser_gnu99 import GNU99Parser
+
+BITFIELD_RECORD_LIST =  [
+                            # Bit field crossing its storage unit moves to the next one
+                            'int a; int b : 23; int c : 22;',
+                            # Storage unit of a long bit field isn't shared with the next field
+                            'unsigned long f : 30; int x;',
+                            # Plain field doesn't share its bytes with a bit field
+                            'unsigned char c; int b : 20;',
+                            # Unit is expanded to a larger type, it keeps its alignment
+                            'unsigned char a : 4; int b : 20; unsigned char c;',
+                            'short a : 9; short b : 9; long c : 40; char d;',
+                            'int a : 3; long b : 40; int c : 30; int d : 3;',
+                        ]
+
+RECORD_LIST =  [
+                    # Padding before a field and at the end of the record
+                    'typedef struct { char a; double b; short c; } record_t;',
+                    'typedef struct { char a; int b[3]; char c[5]; } record_t;',
+                    'typedef struct { short x; char y; } pair_t; typedef struct { char a; pair_t b[2]; long long c; } record_t;',
+                    'typedef struct __attribute__((aligned(16))) { char a; int b; } record_t;',
+                    'typedef struct __attribute__((packed)) { char a; int b; short c; } record_t;',
+                ]
+
+def layout(source):
+    ast = GNU99Parser().parse(source)
+
+    return ast, LayoutEngine(ast).layout(ast.translation_unit_list[-1].specifier_list[-1])
+
+@pytest.mark.parametrize('declaration_list', BITFIELD_RECORD_LIST)
+def test_bitfield_layout_like_ctypes(load, declaration_list):
+    ast, record_layout = layout(f'typedef struct {{ {declaration_list} }} record_t;')
+    record_class       = load(ast).RecordT
+
+    assert (record_layout.size, record_layout.alignment) == (ctypes.sizeof(record_class), ctypes.alignment(record_class))
+
+    for field in record_layout.field_list:
+        descriptor = getattr(record_class, field.name)
+
+        # Bit field size and offset are packed in ctypes field size.
+        if field.is_bitfield():
+            assert (descriptor.offset, descriptor.size & 0xFFFF, descriptor.size >> 16) == (field.offset, field.bit_offset, field.bit_size)
+        else:
+            assert (descriptor.offset, descriptor.size) == (field.offset, field.size)
+
+@pytest.mark.parametrize('source', RECORD_LIST)
+def test_layout_like_ctypes(load, source):
+    ast, record_layout = layout(source)
+    record_class       = load(ast).RecordT
+
+    assert (record_layout.size, record_layout.alignment) == (ctypes.sizeof(record_class), ctypes.alignment(record_class))
+    assert [(field.name, field.offset, field.size) for field in record_layout.field_list] == [(name, getattr(record_class, name).offset, getattr(record_class, name).size) for name, *_ in record_class._fields_]
+
+def test_packed_bitfield_layout():
+    # Explicit packing lets bit fields cross storage units (gcc 12, x86-64).
+    _, record_layout = layout('typedef struct __attribute__((packed)) { int a; int b : 23; int c : 22; } record_t;')
+    c_layout         = record_layout.field_table['c']
+
+    assert (record_layout.size, record_layout.alignment) == (10, 1)
+    assert (c_layout.offset, c_layout.bit_offset) == (6, 7)
+
+    _, record_layout = layout('typedef struct __attribute__((packed)) { unsigned long f : 30; int x; } record_t;')
+
+    assert (record_layout.size, record_layout.field_table['x'].offset) == (8, 4)
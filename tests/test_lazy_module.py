@@ -0,0 +1,76 @@
+import os
+import sys
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+
+import ctypes
+
+import pytest
+
+from transformer.ctypes_generator import CTypesGenerator
+
+SOURCE = '''
+typedef enum
+{
+    IDLE = 0,
+    BUSY = 1,
+} state_e;
+
+typedef struct point
+{
+    short x;
+    short y;
+} point_t;
+
+typedef struct record
+{
+    state_e state;
+    point_t points[2];
+    struct
+    {
+        unsigned char kind : 4;
+        double value;
+    } sample;
+} record_t;
+
+typedef struct other
+{
+    int value;
+} other_t;
+'''
+
+def test_class_defined_on_first_access(load):
+    module     = load(SOURCE, CTypesGenerator(lazy = True))
+    class_list = ['StateE', 'PointT', 'RecordT', 'OtherT']
+
+    assert not set(class_list) & set(vars(module))
+    assert module.__all__ == class_list
+    assert set(class_list) <= set(dir(module))
+
+    # Classes a class depends on are defined with it, others aren't.
+    record_class = module.RecordT
+
+    assert {'StateE', 'PointT', 'RecordT'} <= set(vars(module)) and 'OtherT' not in vars(module)
+    assert module.RecordT is record_class and module.PointT is dict(record_class._fields_)['points']._type_
+
+    with pytest.raises(AttributeError, match = 'has no attribute'):
+        module.MissingT
+
+def test_lazy_class_like_eager_class(load):
+    lazy_module  = load(SOURCE, CTypesGenerator(lazy = True))
+    eager_module = load(SOURCE)
+
+    for name in eager_module.__dict__.keys() & set(lazy_module.__all__):
+        lazy_class, eager_class = getattr(lazy_module, name), getattr(eager_module, name)
+
+        assert lazy_class.__qualname__ == eager_class.__qualname__
+
+        if issubclass(eager_class, ctypes.Structure):
+            # Records with bit fields have no codec.
+            assert ctypes.sizeof(lazy_class) == ctypes.sizeof(eager_class)
+            assert getattr(getattr(lazy_class, '_struct_', None), 'format', None) == getattr(getattr(eager_class, '_struct_', None), 'format', None)
+            assert [field[0] for field in lazy_class._fields_] == [field[0] for field in eager_class._fields_]
+
+    # Nested classes are named as eager ones.
+    sample_class = type(lazy_module.RecordT().sample)
+
+    assert sample_class.__qualname__ == type(eager_module.RecordT().sample).__qualname__
@@ -0,0 +1,70 @@
+import os
+import sys
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+
+import io
+from contextlib import redirect_stdout
+
+import pytest
+
+from front_end.lexer.lexer_99 import C99Lexer
+from front_end.lexer.lexer_gnu99 import GNU99Lexer
+
+ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir))
+
+# Corner cases of rule ordering, constants, comments and illegal characters.
+# Character constants are left out, t_LITERAL can't convert them yet.
+EDGE_CASE_LIST =    [
+                        # Rule ordering and constants
+                        '''typedef_name identifier sizeof _Bool __attribute__ aligned
+1.5e3f .5 1. 10e-2L 0x1FUL 0XffffffffUL 017 08 10ull 42LU 0
+a>>=b<<=c->d++--e...f.g&&h||i!=j==k<=l>=m+=n-=o*=p/=q%=r&=s^=t|=u<<v>>w
+\ttab\tseparated\t# $ @ ` \\r
+last line without newline   ''',
+                        # Continuation lines are spliced by the preprocessor, backslashes are illegal here
+                        'int a = 1 + \\\n 2;\nb\\\nc\n// comment \\\n continued\nd\n',
+                        # Trigraphs are replaced by the preprocessor
+                        '??=define x ??( ??) ??< ??> ??/ ??\' ??! ??- "??/"" x\n',
+                        # Comments
+                        'a /* comment\n\nspanning lines */ b /**/c/* * / **/ d // trailing comment\ne\n',
+                        # Literal prefixes and suffixes
+                        'L"wide" L "" "escaped \\" quote" u8"utf" 0x1f 0X1Fu 0b1 1e+5 0x.p1 .5e-3L 5.f\n',
+                    ]
+
+def source_table():
+    """
+    Gets the edge cases and every example source by name.
+    """
+    source_table = {f'edge_case_{index}': data for index, data in enumerate(EDGE_CASE_LIST)}
+
+    for directory, _, file_list in os.walk(os.path.join(ROOT_DIR, 'examples')):
+        for file_name in sorted(file_list):
+            if file_name.endswith(('.c', '.h', '.i')):
+                with open(os.path.join(directory, file_name), 'rt') as source_file:
+                    source_table[os.path.relpath(source_file.name, ROOT_DIR)] = source_file.read()
+
+    return source_table
+
+SOURCE_TABLE = source_table()
+
+def tokenize(lexer_class, scanner, data):
+    """
+    Tokenize data with a fresh lexer, line numbers are carried over from one input to the next.
+    What the lexer reports on illegal characters is captured too.
+    """
+    lexer  = lexer_class(scanner = scanner)
+    report = io.StringIO()
+
+    lexer.add_symbol('typedef_name', None, True)
+
+    with redirect_stdout(report):
+        token_list = lexer.tokenize(data)
+
+    return [(token.type, token.value, token.lineno, token.lexpos) for token in token_list], report.getvalue()
+
+@pytest.mark.parametrize('lexer_class', [C99Lexer, GNU99Lexer])
+@pytest.mark.parametrize('name', SOURCE_TABLE)
+def test_scanner_like_ply_lexer(lexer_class, name):
+    data = SOURCE_TABLE[name]
+
+    assert tokenize(lexer_class, True, data) == tokenize(lexer_class, False, data)
@@ -0,0 +1,64 @@
+import os
+import sys
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+
+import ctypes
+import random
+
+import pytest
+
+from front_end.parser.parser_gnu99 import GNU99Parser
+from transformer.common import Endianness
+from transformer.ctypes_generator import CTypesGenerator
+from transformer.numpy_generator import NumpyDtypeGenerator
+
+numpy = pytest.importorskip('numpy')
+
+RECORD = '''
+typedef enum
+{
+    IDLE = 0,
+    BUSY = 1,
+} state_e;
+
+typedef struct point
+{
+    short x;
+    short y;
+} point_t;
+
+typedef struct sample
+{
+    unsigned char kind;
+    state_e state;
+    unsigned short flags : 4;
+    point_t position;
+    unsigned char data[2][3];
+    double value;
+} sample_t;
+'''
+
+def test_dtype_decodes_like_ctypes(load):
+    ast = GNU99Parser().parse(RECORD)
+
+    for endianness in Endianness:
+        sample_class = load(ast, CTypesGenerator(endianness = endianness)).SampleT
+        sample_dtype = load(ast, NumpyDtypeGenerator(endianness = endianness)).SampleT
+        data         = random.Random(0).getrandbits(8 * sample_dtype.itemsize * 10).to_bytes(sample_dtype.itemsize * 10, 'little')
+
+        assert 'flags' not in sample_dtype.names
+
+        for sample, row in zip(sample_class.iter_from_buffer(data, copy = True), numpy.frombuffer(data, dtype = sample_dtype)):
+            assert row['kind'] == sample.kind and row['state'] == sample.state._value
+            assert (row['position']['x'], row['position']['y']) == (sample.position.x, sample.position.y)
+            assert row['data'].tolist() == [list(line) for line in sample.data]
+            assert row['value'].tobytes() == numpy.float64(sample.value).astype(sample_dtype['value']).tobytes()
+
+@pytest.mark.parametrize('declaration_list', ['int a; int b : 23; int c : 22; short d;', 'unsigned long f : 30; int x;', 'unsigned char c; int b : 20; char e;', 'unsigned char a : 4; int b : 20; unsigned char c;'])
+def test_dtype_bitfield_layout_like_ctypes(load, declaration_list):
+    ast          = GNU99Parser().parse(f'typedef struct {{ {declaration_list} }} record_t;')
+    record_class = load(ast).RecordT
+    record_dtype = load(ast, NumpyDtypeGenerator()).RecordT
+
+    assert record_dtype.itemsize == ctypes.sizeof(record_class)
+    assert {name: record_dtype.fields[name][1] for name in record_dtype.names} == {field[0]: getattr(record_class, field[0]).offset for field in record_class._fields_ if len(field) == 2}
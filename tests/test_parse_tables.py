@@ -0,0 +1,33 @@
+import os
+import sys
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+
+import pytest
+import ply.yacc as yacc
+
+from build_tables import GRAMMAR_LIST, is_up_to_date
+from core.utils import ROOT_DIR
+from front_end.parser.parser_99 import C99Parser
+
+def fail_table_generation(*args, **kwargs):
+    raise AssertionError('Parse table is computed instead of being loaded.')
+
+@pytest.mark.parametrize('grammar_class', GRAMMAR_LIST)
+def test_shipped_table_up_to_date(grammar_class):
+    assert is_up_to_date(grammar_class())
+
+@pytest.mark.parametrize('grammar_class', GRAMMAR_LIST)
+def test_shipped_table_loaded(grammar_class, monkeypatch):
+    monkeypatch.setattr(yacc, 'LRGeneratedTable', fail_table_generation)
+
+    grammar_class()
+
+def test_missing_table_computed_in_memory(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+
+    parser = C99Parser(tabmodule = 'front_end.parser.parsetab_missing')
+
+    assert parser.parse('typedef struct { int cells[4]; } grid_t;').translation_unit_list
+    # Tables are never written at runtime.
+    assert not os.path.exists(os.path.join(ROOT_DIR, 'front_end', 'parser', 'parsetab_missing.py'))
+    assert not list(tmp_path.iterdir())
@@ -0,0 +1,55 @@
+import os
+import sys
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+
+import shutil
+
+import pytest
+
+from preprocessor.c99_preprocessor import C99PreProcessor
+from preprocessor.profile import compile_profile, load_profile, profile_list, save_profile
+import preprocessor.profile
+
+SOURCE = '''#if __SIZEOF_LONG__ == 8 && defined __x86_64__
+long_64 __INT32_C(1)
+#elif __SIZEOF_LONG__ == 4 && defined(__ARM_ARCH)
+long_32 __INT32_C(1)
+#endif
+__STDC_VERSION__ __LINE__
+'''
+
+@pytest.mark.parametrize('name', profile_list())
+def test_precompiled_profile(name):
+    macro_table = load_profile(name)
+
+    # Shipped profiles are precompiled from their current definitions.
+    assert macro_table is not None
+    assert {name: str(macro) for name, macro in macro_table.items()} == {name: str(macro) for name, macro in compile_profile(name, C99PreProcessor()).items()}
+
+# Preprocessor constants don't keep their suffix.
+@pytest.mark.parametrize('name, output', [
+                                            ('gcc_x86_64', ['long_64', '1', '199901', '6']),
+                                            ('arm_none_eabi', ['long_32', '1', '199901', '6']),
+                                         ])
+def test_profile_macros(tmp_path, name, output):
+    tmp_path.joinpath('source.c').write_text(SOURCE)
+
+    assert C99PreProcessor(profile = name).process(tmp_path / 'source.c').split() == output
+
+def test_outdated_profile(tmp_path, monkeypatch):
+    shutil.copytree(preprocessor.profile.PROFILE_DIR, tmp_path / 'profiles')
+    monkeypatch.setattr(preprocessor.profile, 'PROFILE_DIR', tmp_path / 'profiles')
+
+    # Definitions changed since the profile was precompiled, they're parsed instead.
+    with open(tmp_path / 'profiles' / 'gcc_x86_64.h', 'at') as profile_file:
+        profile_file.write('#define __PROFILE_CHANGED__ 1\n')
+
+    assert load_profile('gcc_x86_64') is None
+    assert '__PROFILE_CHANGED__' in C99PreProcessor(profile = 'gcc_x86_64').macro
+
+    save_profile('gcc_x86_64', compile_profile('gcc_x86_64', C99PreProcessor()))
+    assert '__PROFILE_CHANGED__' in load_profile('gcc_x86_64')
+
+def test_unknown_profile():
+    with pytest.raises(Exception, match = "Unknown profile 'missing'"):
+        C99PreProcessor(profile = 'missing')
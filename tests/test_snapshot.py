@@ -0,0 +1,54 @@
+import os
+import sys
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+
+from preprocessor.c99_preprocessor import C99PreProcessor
+from preprocessor.snapshot import PreProcessorSnapshot
+
+def write_sources(source_dir):
+    source_dir.joinpath('config.h').write_text('#ifndef CONFIG_H\n#define CONFIG_H\n#define WIDTH 4\n#endif\n')
+    source_dir.joinpath('types.h').write_text('#pragma once\ntypedef int cell_t;\n')
+    source_dir.joinpath('prelude.h').write_text('#include "config.h"\n#include "types.h"\n')
+    source_dir.joinpath('first.c').write_text('#include "config.h"\n#include "types.h"\n#define HEIGHT 2\ncell_t first[WIDTH][HEIGHT] __LINE__;\n')
+    source_dir.joinpath('second.c').write_text('#include "types.h"\ncell_t second[WIDTH][HEIGHT];\n')
+
+def prepare(source_dir):
+    write_sources(source_dir)
+
+    preprocessor = C99PreProcessor()
+    output       = preprocessor.process(source_dir / 'prelude.h')
+
+    return preprocessor, preprocessor.snapshot(output)
+
+def test_restore(tmp_path):
+    preprocessor, snapshot = prepare(tmp_path)
+
+    # Headers of the prelude are skipped, callback macros still work.
+    assert preprocessor.process(tmp_path / 'first.c').split() == ['cell_t', 'first', '[', '4', ']', '[', '2', ']', '4', ';']
+
+    # Macros defined since the snapshot are dropped.
+    preprocessor.restore(snapshot)
+
+    assert 'HEIGHT' not in preprocessor.macro and 'WIDTH' in preprocessor.macro
+    assert preprocessor.process(tmp_path / 'second.c').split() == ['cell_t', 'second', '[', '4', ']', '[', 'HEIGHT', ']', ';']
+    assert 'typedef int cell_t' in snapshot.output
+    assert sorted(preprocessor.dependencies) == sorted(tmp_path.joinpath(name).resolve() for name in ['prelude.h', 'config.h', 'types.h'])
+
+def test_saved_snapshot(tmp_path):
+    _, snapshot   = prepare(tmp_path)
+    snapshot_path = tmp_path / 'snapshot' / 'prelude.pickle'
+
+    snapshot.save(snapshot_path)
+
+    preprocessor = C99PreProcessor()
+    preprocessor.restore(PreProcessorSnapshot.load(snapshot_path))
+
+    assert preprocessor.process(tmp_path / 'second.c').split() == ['cell_t', 'second', '[', '4', ']', '[', 'HEIGHT', ']', ';']
+
+    # Snapshot depends on every file of the prelude.
+    tmp_path.joinpath('config.h').write_text('#define WIDTH 8\n')
+    assert PreProcessorSnapshot.load(snapshot_path) is None
+
+    snapshot_path.write_bytes(b'corrupted')
+    assert PreProcessorSnapshot.load(snapshot_path) is None
+    assert PreProcessorSnapshot.load(tmp_path / 'missing.pickle') is None
@@ -0,0 +1,55 @@
+import os
+import sys
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+
+import ply.lex as lex
+import pytest
+
+from front_end.lexer.lexer_99 import C99Lexer
+from front_end.lexer.lexer_ansi import CANSILexer
+from front_end.lexer.lexer_gnu99 import GNU99Lexer
+from front_end.lexer.token import Token
+from front_end.parser.parser_99 import C99Parser
+from preprocessor.c99_preprocessor import C99PreProcessorLexer
+
+SOURCE = 'typedef struct point { int x; int y; } point_t;\nstruct point origin = { 0x10, 2 };\n/* x */ long y = x + y;\n'
+
+@pytest.mark.parametrize('lexer_class', [C99PreProcessorLexer, CANSILexer, C99Lexer, GNU99Lexer])
+def test_compact_tokens(lexer_class):
+    lexer      = lexer_class()
+    token_list = lexer.tokenize(SOURCE)
+
+    # Tokens are the ones of a PLY lexer built from the same rules.
+    ply_lexer = lex.lex(module = lexer)
+    ply_lexer.input(SOURCE)
+
+    assert [(token.type, token.value, token.lineno, token.lexpos) for token in token_list] == [(token.type, token.value, token.lineno, token.lexpos) for token in iter(ply_lexer.token, None)]
+
+    assert all(type(token) is Token for token in token_list)
+    assert not hasattr(token_list[0], '__dict__')
+
+    # Equal identifiers, keywords and punctuators share their value.
+    value_table = {}
+
+    for token in token_list:
+        if token.type not in ('CONSTANT', 'STRING_LITERAL'):
+            assert value_table.setdefault(token.value, token.value) is token.value
+
+def test_preprocessor_tokens():
+    lexer       = C99PreProcessorLexer()
+    first_list  = lexer.tokenize('point x(y)')
+    second_list = lexer.tokenize('x (point)')
+
+    # Tokens preceded by white space are flagged for stringification.
+    assert [getattr(token, 'space', False) for token in second_list] == [False, True, False, False]
+    # Values are interned by the lexer, its clones included.
+    clone = lexer._lexer.clone()
+    clone.input('point')
+
+    assert first_list[0].value is second_list[2].value is clone.token().value
+
+def test_syntax_error_token(capsys):
+    # Parser attaches the lexer to the token reported on a syntax error.
+    C99Parser().parse('struct point { int x int y; };')
+
+    assert "Error: LexToken(INT,'int'" in capsys.readouterr().out
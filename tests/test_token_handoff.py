@@ -0,0 +1,50 @@
+import os
+import sys
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+
+import io
+
+import pytest
+
+from front_end.parser.parser_99 import C99Parser
+from front_end.parser.parser_gnu99 import GNU99Parser
+from preprocessor.c99_preprocessor import C99PreProcessor
+from preprocessor.gnu99_preprocessor import GNU99PreProcessor
+from transformer.ctypes_generator import CTypesGenerator
+
+HEADER = '''#ifndef TYPES_H
+#define TYPES_H
+#define FIELD(name, width) unsigned int name : width
+#define SIZE 16
+typedef struct point { short x; short y; } point_t;
+#endif
+'''
+
+SOURCE = '''#include "types.h"
+#include "types.h"
+typedef struct header {
+    FIELD(kind, 4);
+    FIELD(flags,
+          12);
+    unsigned char data[SIZE];
+    point_t position[2];
+} header_t;
+'''
+
+@pytest.mark.parametrize('preprocessor_class, parser_class', [(C99PreProcessor, C99Parser), (GNU99PreProcessor, GNU99Parser)])
+@pytest.mark.parametrize('is_cached', [False, True])
+def test_token_handoff(tmp_path, preprocessor_class, parser_class, is_cached):
+    tmp_path.joinpath('types.h').write_text(HEADER)
+    tmp_path.joinpath('source.h').write_text(SOURCE)
+
+    cache_dir = tmp_path / 'cache' if is_cached else None
+    text      = preprocessor_class(cache_dir = cache_dir).process(tmp_path / 'source.h')
+
+    # Cached headers are replayed as text which is tokenized.
+    text_output = io.StringIO()
+    token_list  = preprocessor_class(cache_dir = cache_dir).process_tokens(tmp_path / 'source.h', text_output)
+
+    # Parser gets the tokens it would get lexing preprocessed text.
+    assert text_output.getvalue() == text
+    assert CTypesGenerator().generate(parser_class().parse_tokens(token_list)) == CTypesGenerator().generate(parser_class().parse(text))
+    assert 'HeaderT' in CTypesGenerator().generate(parser_class().parse_tokens(token_list))
@@ -0,0 +1,72 @@
+import os
+import sys
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+
+import random
+
+from front_end.parser.parser_gnu99 import GNU99Parser
+from transformer.common import Endianness
+from transformer.ctypes_generator import CTypesGenerator
+from transformer.view_generator import ViewGenerator
+
+RECORD = '''
+typedef enum
+{
+    IDLE = 0,
+    BUSY = 1,
+} state_e;
+
+typedef struct point
+{
+    short x;
+    short y;
+} point_t;
+
+typedef struct sample
+{
+    unsigned char kind;
+    state_e state;
+    unsigned short flags : 4;
+    short delta : 7;
+    point_t position[2];
+    unsigned char data[2][3];
+    int low : 23;
+    int high : 22;
+    unsigned long wide : 30;
+    int tail;
+} sample_t;
+'''
+
+def test_view_decodes_like_ctypes(load):
+    ast = GNU99Parser().parse(RECORD)
+
+    for endianness in Endianness:
+        sample_class = load(ast, CTypesGenerator(endianness = endianness)).SampleT
+        view_class   = load(ast, ViewGenerator(endianness = endianness)).SampleT
+        size         = view_class._struct_.size
+        data         = random.Random(0).getrandbits(8 * size * 10).to_bytes(size * 10, 'little')
+
+        for sample, view in zip(sample_class.iter_from_buffer(data, copy = True), view_class.iter_from_buffer(data)):
+            assert (view.kind, view.state._value, view.flags, view.delta) == (sample.kind, sample.state._value, sample.flags, sample.delta)
+            assert [(point.x, point.y) for point in view.position] == [(point.x, point.y) for point in sample.position]
+            assert [list(line) for line in view.data] == [list(line) for line in sample.data]
+            assert (view.low, view.high, view.wide, view.tail) == (sample.low, sample.high, sample.wide, sample.tail)
+
+def test_view_enumeration(load):
+    module     = load(RECORD, ViewGenerator())
+    view_class = module.SampleT
+    size       = view_class._struct_.size
+    data       = bytearray(size * 3)
+
+    # States are 1, 1 and an unknown value.
+    data[4], data[size + 4], data[2 * size + 4] = 1, 1, 7
+
+    first, second, third = view_class.iter_from_buffer(data)
+
+    # Records share the view of each enumerator, unknown values aren't cached.
+    assert first.state.value == module.StateE.Value.BUSY
+    assert first.state is second.state
+    assert third.state._value == 7 and 7 not in module.StateE._views_
+
+    # Nested views are decoded on first access, once.
+    assert first.position is first.position
@@ -1,5 +1,268 @@
 import enum
+import struct
+
+import core.intermediate_representation as ir
 
 class Endianness(enum.IntEnum):
     LITTLE_ENDIAN = 0x00
-    BIG_ENDIAN = 0x01
\ No newline at end of file
+    BIG_ENDIAN = 0x01
+
+INTEGER_FORMAT_MAP =    {
+                            1: 'b',
+                            2: 'h',
+                            4: 'i',
+                            8: 'q',
+                        }
+
+def get_byte_order(endianness):
+    return '<' if endianness == Endianness.LITTLE_ENDIAN else '>'
+
+def get_class_name(identifier):
+    return ''.join([name.capitalize() for name in identifier.split('_')])
+
+def struct_format(specifier_qualifier_list, size):
+    """
+    Get the struct format (standard size) of a scalar type named by its
+    specifiers, of its size on the target ABI. None when struct has no
+    equivalent (long double).
+
+    :param      specifier_qualifier_list:  The specifier qualifier list
+    :type       specifier_qualifier_list:  list
+    :param      size:                      The size of the type
+    :type       size:                      int
+    """
+    if 'float' in specifier_qualifier_list or 'double' in specifier_qualifier_list:
+        return {4: 'f', 8: 'd'}.get(size)
+    elif '_Bool' in specifier_qualifier_list:
+        return '?'
+    elif 'unsigned' in specifier_qualifier_list or 'size_t' in specifier_qualifier_list:
+        return INTEGER_FORMAT_MAP[size].upper()
+
+    return INTEGER_FORMAT_MAP[size]
+
+class Field(object):
+    """
+    Named field of a structure or union: its layout, the shape of its array
+    (empty for a single value) and its item, an IR structure, union or
+    enumeration or the struct format of a scalar. Pointers are unsigned
+    integers of pointer size.
+    """
+
+    def __init__(self, layout, shape, item):
+        self.name   = layout.name
+        self.layout = layout
+        self.shape  = shape
+        self.item   = item
+        self.count  = 1
+
+        for length in shape:
+            self.count *= length
+
+def get_field_list(layout_engine, node):
+    """
+    Get the named fields of a structure or union, in declaration order.
+    Unnamed bit fields are left out, their storage is padding.
+
+    :param      layout_engine:  The layout engine
+    :type       layout_engine:  LayoutEngine
+    :param      node:           The node
+    :type       node:           ir.Struct|ir.Union
+    """
+    node       = layout_engine.type_node([node])
+    layout     = layout_engine.layout(node)
+    field_list = []
+
+    for declaration in node.declaration_list:
+        for struct_declarator in declaration.struct_declarator_list:
+            declarator = struct_declarator.declarator
+            shape      = []
+            is_pointer = False
+
+            # Outer array declarator is the last dimension.
+            while not isinstance(declarator, str):
+                if isinstance(declarator, ir.ArrayDeclarator):
+                    shape.insert(0, max(declarator.length, 0))
+                else:
+                    is_pointer = True
+
+                declarator = declarator.direct_declarator
+
+            if declarator not in layout.field_table:
+                continue
+
+            if is_pointer:
+                item = INTEGER_FORMAT_MAP[layout_engine.abi.type_table['pointer'][0]].upper()
+            else:
+                item = layout_engine.type_node(declaration.specifier_qualifier_list)
+
+                if item is None:
+                    item = struct_format(declaration.specifier_qualifier_list, layout_engine.type_layout(declaration.specifier_qualifier_list)[0])
+
+            field_list.append(Field(layout.field_table[declarator], shape, item))
+
+    return field_list
+
+class StructFormat(object):
+    """
+    Build the struct format of a whole record from its scalars, in offset
+    order: padding is explicit and consecutive scalars of the same format are
+    counted. Each scalar is a value of the unpacked tuple, enumerations are
+    their integer value, unions are bytes and bit fields share the value of the
+    bytes holding them.
+    """
+
+    def __init__(self, layout_engine, byte_order):
+        """
+        :param      layout_engine:  The layout engine
+        :type       layout_engine:  LayoutEngine
+        :param      byte_order:     The struct byte order ('<' or '>')
+        :type       byte_order:     str
+        """
+        self.layout_engine = layout_engine
+        self.byte_order    = byte_order
+        self.format_list   = []
+        self._item_list    = []
+        self._position     = 0
+
+    def _append(self, count, format):
+        if self._item_list and self._item_list[-1][1] == format and not format.endswith('s'):
+            self._item_list[-1][0] += count
+        else:
+            self._item_list.append([count, format])
+
+    def add_scalar(self, offset, format):
+        """
+        Add a scalar, returns the index of its value.
+
+        :param      offset:  The offset
+        :type       offset:  int
+        :param      format:  The struct format, without byte order
+        :type       format:  str|None
+        """
+        if format is None:
+            raise Exception(f'No struct format for the scalar at offset {offset}.')
+        elif offset < self._position:
+            raise Exception(f'Scalar at offset {offset} overlaps the previous one.')
+        elif offset > self._position:
+            self._append(offset - self._position, 'x')
+
+        self._append(1, format)
+        self.format_list.append(format)
+        self._position = offset + struct.calcsize(f'{self.byte_order}{format}')
+
+        return len(self.format_list) - 1
+
+    def add_item(self, item, offset):
+        """
+        Add the scalars of a field item, returns the index of its first value.
+
+        :param      item:    The item
+        :type       item:    str|ir.Struct|ir.Union|ir.Enumeration
+        :param      offset:  The offset
+        :type       offset:  int
+        """
+        if isinstance(item, ir.Struct):
+            index = len(self.format_list)
+            self.add_record(item, offset)
+
+            return index
+
+        size = self.layout_engine.layout(item).size if isinstance(item, (ir.Union, ir.Enumeration)) else 0
+
+        if isinstance(item, ir.Union):
+            return self.add_scalar(offset, f'{size}s')
+        elif isinstance(item, ir.Enumeration):
+            return self.add_scalar(offset, INTEGER_FORMAT_MAP[size].upper())
+
+        return self.add_scalar(offset, item)
+
+    def add_field(self, field, offset = 0):
+        """
+        Add the scalars of a field (not a bit field) of a record at offset,
+        returns the index of its first value.
+
+        :param      field:   The field
+        :type       field:   Field
+        :param      offset:  The offset of the record
+        :type       offset:  int
+        """
+        index = len(self.format_list)
+
+        for position in range(field.count):
+            self.add_item(field.item, offset + field.layout.offset + position * field.layout.size // field.count)
+
+        return index
+
+    def add_record(self, node, offset = 0):
+        """
+        Add the scalars of a structure, returns each field with the index of its
+        first value, its number of values and for a bit field its shift inside
+        its value (None otherwise).
+
+        Consecutive bit fields are read from the bytes holding them (sized as an
+        integer when possible). Bits of a storage unit are allocated from its
+        least significant bit in little endian and from its most significant
+        bit in big endian, like ctypes and compilers do.
+
+        :param      node:    The node
+        :type       node:    ir.Struct
+        :param      offset:  The offset
+        :type       offset:  int
+        """
+        value_list = []
+
+        # Bit fields being read: [start, end, field list]
+        region = None
+
+        for field in get_field_list(self.layout_engine, node) + [None]:
+            if field and field.layout.is_bitfield():
+                unit_offset = offset + field.layout.offset
+                start, end  = unit_offset + field.layout.bit_offset // 8, unit_offset + (field.layout.bit_offset + field.layout.bit_size + 7) // 8
+
+                if region and start < region[1] and end > region[0]:
+                    region = [min(start, region[0]), max(end, region[1]), region[2] + [field]]
+                    continue
+
+            if region:
+                region_start, region_end, bitfield_list = region
+                region_size                             = region_end - region_start
+                index                                   = self.add_scalar(region_start, INTEGER_FORMAT_MAP[region_size].upper() if region_size in INTEGER_FORMAT_MAP else f'{region_size}s')
+
+                for bitfield in bitfield_list:
+                    unit_offset = offset + bitfield.layout.offset
+
+                    if self.byte_order == '<':
+                        shift = (unit_offset - region_start) * 8 + bitfield.layout.bit_offset
+                    else:
+                        shift = (region_end - unit_offset) * 8 - bitfield.layout.bit_offset - bitfield.layout.bit_size
+
+                    value_list.append((bitfield, index, 1, shift))
+
+                region = None
+
+            if field is None:
+                break
+            elif field.layout.is_bitfield():
+                region = [start, end, [field]]
+            else:
+                index = self.add_field(field, offset)
+                value_list.append((field, index, len(self.format_list) - index, None))
+
+        return value_list
+
+    def build(self, size):
+        """
+        Get the struct format, trailing padding up to the record size.
+
+        :param      size:  The record size
+        :type       size:  int
+        """
+        item_list = [list(item) for item in self._item_list]
+
+        if size > self._position:
+            if item_list and item_list[-1][1] == 'x':
+                item_list[-1][0] += size - self._position
+            else:
+                item_list.append([size - self._position, 'x'])
+
+        return self.byte_order + ''.join([f'{count}{format}' if count > 1 else format for count, format in item_list])
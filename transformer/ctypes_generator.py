@@ -2,15 +2,18 @@ import os
 import sys
 sys.path.append("../")
 
-import ctypes
+import posixpath
+import re
 import textwrap
 
 from front_end.parser.parser_99 import C99Parser
-from front_end.parser.parser_gnu99 import GNU99Parser
+from front_end.parser.parser_gnu99 import GNU99Parser, LineMarker
+from preprocessor.gnu99_preprocessor import PreProcessorFlags
 from transformer.generator import Generator
 from transformer.python_generator import PythonGenerator
 
-from transformer.common import Endianness
+from core.layout import LayoutEngine
+from transformer.common import Endianness, StructFormat, get_byte_order, get_field_list
 
 import core.intermediate_representation as ir 
 
@@ -25,17 +28,35 @@ class CTypesGenerator(Generator):
     with open(f'{ROOT_DIR}/template/ctypes/union.py', 'rt') as template:
         UNION_TEMPLATE = template.read()
 
-    def __init__(self, tab_size = 4, endianness = Endianness.LITTLE_ENDIAN):
+    with open(f'{ROOT_DIR}/template/ctypes/record.py', 'rt') as template:
+        RECORD_TEMPLATE = template.read()
+
+    with open(f'{ROOT_DIR}/template/ctypes/codec.py', 'rt') as template:
+        CODEC_TEMPLATE = template.read()
+
+    with open(f'{ROOT_DIR}/template/ctypes/factory.py', 'rt') as template:
+        FACTORY_TEMPLATE = template.read()
+
+    with open(f'{ROOT_DIR}/template/ctypes/lazy.py', 'rt') as template:
+        LAZY_TEMPLATE = template.read()
+
+    def __init__(self, tab_size = 4, endianness = Endianness.LITTLE_ENDIAN, lazy = False):
         super(CTypesGenerator, self).__init__()
         self._tab_size   = tab_size
         self.endianness = endianness
+        self.lazy       = lazy
         self._enum_packing_map =    {
                                         1: 'ctypes.c_uint8',
                                         2: 'ctypes.c_uint16',
                                         4: 'ctypes.c_uint32',
                                         8: 'ctypes.c_uint64',
                                     }
-        self._python_generator = PythonGenerator()
+        self._python_generator  = PythonGenerator()
+        self._layout_engine     = LayoutEngine()
+        self._dependency_list   = []
+        self._factory_name_list = []
+        self._module_table      = {}
+        self._mixin_table       = {}
 
     def generate_enumeration(self, typedef):
         """
@@ -86,6 +107,7 @@ class CTypesGenerator(Generator):
             for specifier_qualifier in declaration.specifier_qualifier_list:
                 if specifier_qualifier not in ['signed', 'unsigned', 'const', 'char', 'short', 'int', 'long', 'float', 'double', 'void', 'size_t', 'ssize_t']:
                     type_decl = ''.join([name.capitalize() for name in specifier_qualifier.split('_')])
+                    self._dependency_list.append(type_decl)
                 elif specifier_qualifier == 'char':
                     type_decl = 'ctypes.c_int8' if is_signed else 'ctypes.c_uint8'
                 elif specifier_qualifier == 'short':
@@ -149,7 +171,16 @@ class CTypesGenerator(Generator):
         :type       typedef:  { type_description }
         """
         class_name = ''.join([name.capitalize() for name in typedef.identifier.split('_')])
-        base_class = f'''ctypes.{''.join([name.capitalize() for name in self.endianness.name.split('_')])}Structure'''
+        base_class = f'''_Record, ctypes.{''.join([name.capitalize() for name in self.endianness.name.split('_')])}Structure'''
+        codec      = ''
+
+        # Methods shared by structures are defined once by the module.
+        self._mixin_table['_Record'] = CTypesGenerator.RECORD_TEMPLATE
+
+        if self._has_codec(typedef):
+            self._mixin_table['_Codec'] = CTypesGenerator.CODEC_TEMPLATE
+            base_class                  = f'_Codec, {base_class}'
+            codec                       = self._generate_codec(typedef)
 
         nested_class_list = []
         field_list        = []
@@ -161,7 +192,8 @@ class CTypesGenerator(Generator):
                 nested_class_list.append(nested_class)
 
         return CTypesGenerator.STRUCT_TEMPLATE.format(  nested_class = textwrap.indent('\n'.join(nested_class_list), prefix=' ' * self._tab_size), class_name = class_name, base_class = base_class,
-                                                        packing = typedef.packing, fields = textwrap.indent(',\n'.join(field_list), prefix = ' ' * (5 * self._tab_size) ) + ',')
+                                                        packing = typedef.packing, fields = textwrap.indent(',\n'.join(field_list), prefix = ' ' * (5 * self._tab_size) ) + ',',
+                                                        codec = codec)
 
     def generate_union(self, typedef):
         """
@@ -194,30 +226,284 @@ class CTypesGenerator(Generator):
         elif isinstance(typedef, ir.Union):
             return self.generate_union(typedef)
 
+    def _has_codec(self, item):
+        """
+        Determine if a field item can be packed by a struct format: no bit field,
+        no union (overlapping fields) and only scalars struct knows.
+
+        :param      item:  The item
+        :type       item:  str|ir.Struct|ir.Union|ir.Enumeration|None
+        """
+        if isinstance(item, ir.Union):
+            return False
+        elif isinstance(item, ir.Struct):
+            return all(not field.layout.is_bitfield() and self._has_codec(field.item) for field in get_field_list(self._layout_engine, item))
+
+        return item is not None
+
+    def _get_value_count(self, item):
+        """
+        Get the number of flattened values of a field item.
+
+        :param      item:  The item
+        :type       item:  str|ir.Struct|ir.Enumeration
+        """
+        if isinstance(item, ir.Struct):
+            struct_format = StructFormat(self._layout_engine, get_byte_order(self.endianness))
+            struct_format.add_record(item)
+
+            return len(struct_format.format_list)
+
+        return 1
+
+    def _generate_value(self, item, index, shape = [], depth = 0):
+        """
+        Generate the expression building the Python value of a field item from
+        its flattened values: dictionaries for structures, lists for arrays and
+        integers for enumerations.
+
+        :param      item:   The item
+        :type       item:   str|ir.Struct|ir.Enumeration
+        :param      index:  The index (or index expression) of its first value
+        :type       index:  int|str
+        :param      shape:  The shape of the array of items
+        :type       shape:  list
+        :param      depth:  The array nesting depth, to name indexes
+        :type       depth:  int
+        """
+        if shape:
+            count = self._get_value_count(item)
+
+            for length in shape[1:]:
+                count *= length
+
+            if count == 1:
+                end = f'{index} + {shape[0]}' if isinstance(index, str) else index + shape[0]
+
+                return f'''list(values[{index}:{end}])'''
+
+            index_name = f'index_{depth}'
+            item_index = f'{index} + {count} * {index_name}'
+
+            return f'''[{self._generate_value(item, item_index, shape[1:], depth + 1)} for {index_name} in range({shape[0]})]'''
+        elif isinstance(item, ir.Struct):
+            struct_format = StructFormat(self._layout_engine, get_byte_order(self.endianness))
+            item_list     = []
+
+            for field, field_index, _, _ in struct_format.add_record(item):
+                field_index = f'{index} + {field_index}' if isinstance(index, str) else index + field_index
+                item_list.append(f''''{field.name}': {self._generate_value(field.item, field_index, field.shape, depth)}''')
+
+            return f'''{{{', '.join(item_list)}}}'''
+
+        return f'''values[{index}]'''
+
+    def _generate_codec(self, typedef):
+        """
+        Generate the struct codec of a structure: the struct of its whole layout
+        and the function building its dictionary, methods are inherited.
+
+        Layout is computed on the IR (LayoutEngine) so padding follows packing, a
+        structure whose layout can't be computed raises.
+
+        :param      typedef:  The typedef
+        :type       typedef:  ir.Struct
+        """
+        struct_format = StructFormat(self._layout_engine, get_byte_order(self.endianness))
+        struct_format.add_record(typedef)
+
+        return f'''
+{' ' * self._tab_size}_struct_  = struct.Struct('{struct_format.build(self._layout_engine.layout(typedef).size)}')
+{' ' * self._tab_size}_to_dict_ = staticmethod(lambda values: {self._generate_value(typedef, 0)})'''
+
     def generate(self, ast):
         """
-        Parse an AST and construct a Ctypes representation of its content. 
-        
+        Parse an AST and construct a Ctypes representation of its content.
+
         Currently only works for typedef declaration but could be extend afterwards.
 
+        Structures get a struct codec, its layout is computed on the IR.
+
+        In lazy mode, each class is defined by a factory called on first module
+        attribute access (PEP 562) so importing a large module stays cheap.
+
         :param      ast:  The ast
         :type       ast:  { type_description }
         """
-        output = f'''import ctypes\nimport enum\n\n'''
+        self._layout_engine = LayoutEngine(ast)
+
+        return self._generate(self._get_typedef_list(ast), self.lazy)
+
+    def generate_package(self, ast, source_path):
+        """
+        Generate one module per source file of an AST, each one holding the
+        typedefs declared inside it and importing classes it uses from others.
+
+        Source files are followed through GNU line markers: a header included
+        with quotes is relative to its includer, a system header to the root of
+        the package. Headers outside the package are placed at its root.
+
+        :param      ast:          The ast
+        :type       ast:          SourceFile
+        :param      source_path:  The path of the translation unit inside the package
+        :type       source_path:  str
+
+        :returns:   The code of each module by module name
+        :rtype:     dict
+        """
+        self._layout_engine = LayoutEngine(ast)
+
+        # Source files being included, the translation unit is at the bottom.
+        path_list     = [source_path]
+        typedef_table = {self.get_module_name(source_path): []}
+
         for translation_unit in ast.translation_unit_list:
-            if isinstance(translation_unit, ir.Declaration) and translation_unit.is_typedef:
-                output += f'''{self.generate_typedef(translation_unit.specifier_list[-1])}\n'''
+            if isinstance(translation_unit, LineMarker):
+                if PreProcessorFlags.RETURN_TO_FILE in translation_unit.flag_list and len(path_list) > 1:
+                    path_list.pop()
+
+                if PreProcessorFlags.START_FILE in translation_unit.flag_list:
+                    path_list.append(self._get_header_path(path_list[-1], translation_unit))
+            elif isinstance(translation_unit, ir.Declaration) and translation_unit.is_typedef:
+                typedef_table.setdefault(self.get_module_name(path_list[-1]), []).append(translation_unit.specifier_list[-1])
+
+        self._module_table = {''.join([name.capitalize() for name in typedef.identifier.split('_')]): module_name for module_name, typedef_list in typedef_table.items() for typedef in typedef_list}
+        module_table       = {module_name: self._generate(typedef_list, self.lazy, module_name) for module_name, typedef_list in typedef_table.items()}
+        self._module_table = {}
+
+        return module_table
+
+    def _get_header_path(self, includer_path, line_marker):
+        """
+        Gets the path of a header inside the package from the line marker
+        starting it.
+
+        :param      includer_path:  The path of the including file
+        :type       includer_path:  str
+        :param      line_marker:    The line marker
+        :type       line_marker:    LineMarker
+        """
+        header_name = line_marker.filename.strip('"')
+
+        if PreProcessorFlags.SYSTEM_HEADER in line_marker.flag_list:
+            path = header_name
+        else:
+            path = posixpath.join(posixpath.dirname(includer_path), header_name)
+
+        return '/'.join([part for part in posixpath.normpath(path).split('/') if part != '..'])
+
+    def get_module_name(self, path):
+        """
+        Gets the dotted module name of a source file path, parts are made valid
+        identifiers.
+
+        :param      path:  The path
+        :type       path:  str
+        """
+        return '.'.join([re.sub(r'\W|^(?=\d)', '_', part) for part in posixpath.splitext(path)[0].split('/')])
+
+    def _get_relative_module(self, module_name, imported_module_name):
+        """
+        Gets the relative name of a module imported by another one of the same
+        package.
+
+        :param      module_name:           The importing module name
+        :type       module_name:           str
+        :param      imported_module_name:  The imported module name
+        :type       imported_module_name:  str
+        """
+        package_list = module_name.split('.')[:-1]
+        module_list  = imported_module_name.split('.')
+        common       = 0
+
+        while common < min(len(package_list), len(module_list) - 1) and package_list[common] == module_list[common]:
+            common += 1
+
+        return '.' * (len(package_list) - common + 1) + '.'.join(module_list[common:])
+
+    def _get_typedef_list(self, ast):
+        return [translation_unit.specifier_list[-1] for translation_unit in ast.translation_unit_list if isinstance(translation_unit, ir.Declaration) and translation_unit.is_typedef]
 
-        return output
+    def _generate_factory(self, typedef):
+        """
+        Generate the factory defining the class of a typedef, classes it depends
+        on are materialized first.
+
+        :param      typedef:  The typedef
+        :type       typedef:  { type_description }
+        """
+        class_name            = ''.join([name.capitalize() for name in typedef.identifier.split('_')])
+        self._dependency_list = []
+        class_definition      = self.generate_typedef(typedef)
+
+        # Nested classes and unknown names are left to the class body.
+        dependency_list = [dependency for dependency in dict.fromkeys(self._dependency_list) if dependency in self._factory_name_list and dependency != class_name]
+
+        return class_name, CTypesGenerator.FACTORY_TEMPLATE.format( class_name = class_name, class_definition = textwrap.indent(class_definition, prefix = ' ' * self._tab_size),
+                                                                    dependency_list = ''.join([f"{' ' * self._tab_size}{dependency} = _materialize('{dependency}')\n" for dependency in dependency_list]))
+
+    def _generate(self, typedef_list, lazy = False, module_name = None):
+        """
+        Generate the Ctypes representation of a list of typedefs.
+
+        Lazy representations define each class in a factory called on first
+        module attribute access. Classes of other modules of a package are
+        imported.
+
+        :param      typedef_list:  The typedef list
+        :type       typedef_list:  list
+        :param      lazy:          Generate a lazy representation
+        :type       lazy:          bool
+        :param      module_name:   The module name inside its package
+        :type       module_name:   str|None
+        """
+        output             = ''
+        dependency_list    = []
+        self._mixin_table  = {}
+
+        if lazy:
+            self._factory_name_list = [''.join([name.capitalize() for name in typedef.identifier.split('_')]) for typedef in typedef_list]
+            factory_list            = []
+
+            for typedef in typedef_list:
+                class_name, factory = self._generate_factory(typedef)
+                output             += f'''{factory}\n\n'''
+                dependency_list    += self._dependency_list
+                factory_list.append(f"{' ' * self._tab_size}'{class_name}': _define_{class_name},")
+
+            output += CTypesGenerator.LAZY_TEMPLATE.format(factory_list = '\n'.join(factory_list)) + '\n'
+        else:
+            class_list = []
+
+            for typedef in typedef_list:
+                self._dependency_list = []
+                class_list.append(f'''{self.generate_typedef(typedef)}\n''')
+                dependency_list      += self._dependency_list
+
+            # Classes are separated by a blank line, as lazy factories are.
+            output = '\n'.join(class_list)
+
+        import_table = {}
+
+        for dependency in dict.fromkeys(dependency_list):
+            if self._module_table.get(dependency, module_name) != module_name:
+                import_table.setdefault(self._module_table[dependency], []).append(dependency)
+
+        import_list = [f'''from {self._get_relative_module(module_name, imported_module_name)} import {', '.join(name_list)}''' for imported_module_name, name_list in import_table.items()]
+
+        if self._mixin_table:
+            output = '\n\n'.join(self._mixin_table.values()) + '\n\n' + output
+
+        if import_list:
+            output = '\n'.join(import_list) + '\n\n' + output
+
+        return f'''import ctypes\nimport enum\nimport struct\n\n{output}'''
 
 if __name__ == '__main__':
     generator = CTypesGenerator(endianness = Endianness.LITTLE_ENDIAN) 
     parser = GNU99Parser(debug = False)
 
-    with open("../examples/elf.i", "rt") as include_file:
-        data = include_file.read()
-
-    ast = parser.parse(data)
+    ast = parser.parse_file("../examples/elf.i")
     
     with open("../output/elf.py", "wt") as py_directive_file:
         py_directive_file.write(generator.generate(ast))
\ No newline at end of file
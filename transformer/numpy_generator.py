@@ -0,0 +1,131 @@
+import os
+import sys
+sys.path.append("../")
+
+import struct
+import textwrap
+
+from core.layout import LayoutEngine
+from front_end.parser.parser_gnu99 import GNU99Parser
+from transformer.generator import Generator
+
+from transformer.common import Endianness, get_byte_order, get_class_name, get_field_list
+
+import core.intermediate_representation as ir
+
+class NumpyDtypeGenerator(Generator):
+    """
+    Generate NumPy structured dtypes matching ctypes classes of CTypesGenerator,
+    so records can be decoded with numpy.frombuffer and processed vectorized.
+
+    Layout (offsets, packing aware alignment, item size) is computed on the IR
+    by the layout engine, like codecs of ctypes classes, so both representations
+    decode the same bytes identically. ctypes places bit fields of packed
+    structures differently from C compilers, dtypes follow compilers there.
+    Nested structures are nested dtypes, multi dimensional arrays are sub
+    arrays, enumerations are integers, unions overlap their members and
+    pointers are pointer sized unsigned integers.
+
+    NumPy has no bit field type so bit fields are left out of dtypes, their
+    storage is padding.
+
+    NumPy is only needed by generated code.
+    """
+    ROOT_DIR = os.path.abspath(os.path.join(__file__, os.pardir))
+    with open(f'{ROOT_DIR}/template/numpy/struct.py', 'rt') as template:
+        STRUCT_TEMPLATE = template.read()
+
+    def __init__(self, tab_size = 4, endianness = Endianness.LITTLE_ENDIAN):
+        super(NumpyDtypeGenerator, self).__init__()
+        self._tab_size          = tab_size
+        self.endianness         = endianness
+        self._byte_order        = get_byte_order(endianness)
+        self._layout_engine     = LayoutEngine()
+        self._typedef_list      = []
+
+    def _generate_format(self, item):
+        """
+        Generate the dtype format of a field item.
+
+        :param      item:  The item
+        :type       item:  str|ir.Struct|ir.Union|ir.Enumeration
+        """
+        if isinstance(item, ir.Enumeration):
+            return repr(f'{self._byte_order}u{self._layout_engine.layout(item).size}')
+        elif isinstance(item, (ir.Struct, ir.Union)):
+            # Structures generated at top level are referenced, nested ones are inlined
+            # and indented under their parent field.
+            if item in self._typedef_list:
+                return get_class_name(item.identifier)
+
+            return textwrap.indent(self._generate_dtype(item), ' ' * self._tab_size).lstrip()
+        elif item == '?':
+            return repr('b1')
+        elif item is not None:
+            kind = 'f' if item in 'fd' else 'u' if item.isupper() else 'i'
+
+            return repr(f'{self._byte_order}{kind}{struct.calcsize(item)}')
+
+        raise Exception('No dtype format for a scalar without struct format.')
+
+    def _generate_dtype(self, node):
+        """
+        Generate the structured dtype of a structure or union.
+
+        :param      node:  The node
+        :type       node:  ir.Struct|ir.Union
+        """
+        name_list   = []
+        format_list = []
+        offset_list = []
+
+        for field in get_field_list(self._layout_engine, node):
+            # Bit fields have no dtype representation.
+            if field.layout.is_bitfield():
+                continue
+
+            format = self._generate_format(field.item)
+
+            name_list.append(repr(field.name))
+            format_list.append(f'''({format}, {tuple(field.shape)})''' if field.shape else format)
+            offset_list.append(str(field.layout.offset))
+
+        return NumpyDtypeGenerator.STRUCT_TEMPLATE.format(names = ', '.join(name_list), formats = ', '.join(format_list),
+                                                          offsets = ', '.join(offset_list), itemsize = self._layout_engine.layout(node).size)
+
+    def generate_typedef(self, typedef):
+        """
+        Generate the dtype of a typedef.
+
+        :param      typedef:  The typedef
+        :type       typedef:  { type_description }
+        """
+        if isinstance(typedef, ir.Enumeration):
+            return f'''{get_class_name(typedef.identifier)} = numpy.dtype({self._generate_format(typedef)})'''
+
+        return f'''{get_class_name(typedef.identifier)} = {self._generate_dtype(typedef)}'''
+
+    def generate(self, ast):
+        """
+        Parse an AST and construct a NumPy dtype for each typedef.
+
+        :param      ast:  The ast
+        :type       ast:  { type_description }
+        """
+        self._layout_engine = LayoutEngine(ast)
+        self._typedef_list  = [translation_unit.specifier_list[-1] for translation_unit in ast.translation_unit_list if isinstance(translation_unit, ir.Declaration) and translation_unit.is_typedef]
+
+        output = f'''import numpy\n\n'''
+        for typedef in self._typedef_list:
+            output += f'''{self.generate_typedef(typedef)}\n'''
+
+        return output
+
+if __name__ == '__main__':
+    generator = NumpyDtypeGenerator(endianness = Endianness.LITTLE_ENDIAN)
+    parser = GNU99Parser(debug = False)
+
+    ast = parser.parse_file("../examples/elf.i")
+
+    with open("../output/elf_dtype.py", "wt") as py_directive_file:
+        py_directive_file.write(generator.generate(ast))
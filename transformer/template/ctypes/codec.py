@@ -0,0 +1,20 @@
+class _Codec(object):
+    # Struct codec methods shared by generated structures, each one holds the struct of its whole layout (_struct_)
+    # and builds its dictionary from the values of the struct (_to_dict_).
+
+    @classmethod
+    def unpack_tuple(cls, buffer, offset = 0):
+        # Every field is unpacked by a single call, nested structures and arrays are flattened.
+        return cls._struct_.unpack_from(buffer, offset)
+
+    @classmethod
+    def pack_tuple(cls, values):
+        return cls._struct_.pack(*values)
+
+    @classmethod
+    def iter_unpack(cls, buffer):
+        # Buffer size must be a multiple of the structure size.
+        return cls._struct_.iter_unpack(buffer)
+
+    def to_dict(self):
+        return self._to_dict_(self._struct_.unpack_from(self))
\ No newline at end of file
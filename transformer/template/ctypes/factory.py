@@ -0,0 +1,4 @@
+def _define_{class_name}():
+{dependency_list}{class_definition}
+
+    return {class_name}
\ No newline at end of file
@@ -0,0 +1,34 @@
+# Classes are only defined when first accessed (PEP 562), with the classes they depend on.
+_factory_table = {{
+{factory_list}
+}}
+
+__all__ = list(_factory_table)
+
+def _materialize(name):
+    if name not in globals():
+        cls    = _factory_table[name]()
+        prefix = cls.__qualname__
+
+        # Classes are named as if defined at module level, nested classes included.
+        class_list = [cls]
+
+        while class_list:
+            for nested_class in vars(class_list.pop()).values():
+                if isinstance(nested_class, type) and nested_class.__qualname__.startswith(f'{{prefix}}.'):
+                    nested_class.__qualname__ = name + nested_class.__qualname__[len(prefix):]
+                    class_list.append(nested_class)
+
+        cls.__qualname__ = name
+        globals()[name]  = cls
+
+    return globals()[name]
+
+def __getattr__(name):
+    if name not in _factory_table:
+        raise AttributeError(f'module {{__name__!r}} has no attribute {{name!r}}')
+
+    return _materialize(name)
+
+def __dir__():
+    return sorted(set(globals()) | set(_factory_table))
\ No newline at end of file
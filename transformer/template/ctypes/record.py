@@ -0,0 +1,20 @@
+class _Record(object):
+    # Bulk decoding methods shared by generated structures.
+
+    @classmethod
+    def from_buffer_array(cls, buffer, count, offset = 0, copy = False):
+        # Records share memory with the buffer, which must be writable (ctypes raises TypeError otherwise),
+        # unless they're copied once as a whole.
+        array_type = cls * count
+
+        if copy:
+            return array_type.from_buffer_copy(buffer, offset)
+
+        return array_type.from_buffer(buffer, offset)
+
+    @classmethod
+    def iter_from_buffer(cls, buffer, offset = 0, copy = False):
+        # Each record is only created when it's reached.
+        count = (memoryview(buffer).nbytes - offset) // ctypes.sizeof(cls)
+
+        return iter(cls.from_buffer_array(buffer, count, offset, copy))
\ No newline at end of file
@@ -3,4 +3,4 @@ class {class_name}({base_class}):
     _pack_   = {packing}
     _fields_ = [
 {fields}
-                ]
\ No newline at end of file
+                ]{codec}
\ No newline at end of file
@@ -0,0 +1,6 @@
+numpy.dtype({{
+    'names'    : [{names}],
+    'formats'  : [{formats}],
+    'offsets'  : [{offsets}],
+    'itemsize' : {itemsize},
+}})
\ No newline at end of file
@@ -0,0 +1,28 @@
+class {class_name}(_View):
+    class Value(enum.IntEnum):
+{enumerator_list}
+    __slots__ = ('_value',)
+    _struct_  = struct.Struct('{struct_format}')
+    _members_ = {{member.value: member for member in Value}}
+    _views_   = {{}}
+
+    def __init__(self, values):
+        self._value = values[0]
+
+    @property
+    def value(self):
+        # Members are looked up directly, Value() is only called to raise on unknown values.
+        try:
+            return self._members_[self._value]
+        except KeyError:
+            return self.Value(self._value)
+
+    @classmethod
+    def _view_(cls, value):
+        # Views are immutable, records share the view of each enumerator (_views_).
+        view = cls((value,))
+
+        if value in cls._members_:
+            cls._views_[value] = view
+
+        return view
\ No newline at end of file
@@ -0,0 +1,6 @@
+    @property
+    def {name}(self):
+        if self._{name}_ is None:
+            self._{name}_ = {value}
+
+        return self._{name}_
\ No newline at end of file
@@ -0,0 +1,6 @@
+class {class_name}(_View):
+{nested_class}    __slots__ = ({slots})
+    _struct_  = struct.Struct('{struct_format}')
+
+    def __init__(self, values):
+{assignments}{fields}
\ No newline at end of file
@@ -0,0 +1,15 @@
+class _View(object):
+    # Views decode their record once, every field with a single call to the struct of their whole layout (_struct_).
+    __slots__ = ()
+
+    @classmethod
+    def from_buffer(cls, buffer, offset = 0):
+        return cls(cls._struct_.unpack_from(buffer, offset))
+
+    @classmethod
+    def iter_from_buffer(cls, buffer, offset = 0):
+        # Records are unpacked and decoded when they're reached, trailing bytes are left.
+        buffer = memoryview(buffer).cast('B')
+        end    = offset + (buffer.nbytes - offset) // cls._struct_.size * cls._struct_.size
+
+        return map(cls, cls._struct_.iter_unpack(buffer[offset:end]))
\ No newline at end of file
@@ -0,0 +1,312 @@
+import os
+import sys
+sys.path.append("../")
+
+import textwrap
+
+from core.layout import LayoutEngine
+from front_end.parser.parser_gnu99 import GNU99Parser
+from transformer.generator import Generator
+
+from transformer.common import INTEGER_FORMAT_MAP, Endianness, StructFormat, get_byte_order, get_class_name, get_field_list
+
+import core.intermediate_representation as ir
+
+class ViewGenerator(Generator):
+    """
+    Generate light weight view classes as an alternative to ctypes classes of
+    CTypesGenerator, with the same class names, field names and nesting.
+
+    A view decodes its record once, when it's created: a precomputed struct of
+    the whole layout unpacks every field with a single call and each field is
+    an attribute (__slots__), bit fields are shifted and masked. Nested
+    structures are nested views, arrays are tuples, pointers are addresses,
+    unions are decoded member by member from their bytes and enumerations keep
+    their value property but look members up in a precomputed map, records
+    share the view of each enumerator.
+
+    Nested views and arrays other than a slice of scalars are only decoded on
+    first access then cached, records read in a stream don't pay for fields
+    they don't read.
+
+    Layout is computed on the IR by the layout engine, like codecs of ctypes
+    classes, so both decode the same bytes identically. Views are read only
+    snapshots of their record.
+    """
+    ROOT_DIR = os.path.abspath(os.path.join(__file__, os.pardir))
+    with open(f'{ROOT_DIR}/template/view/view.py', 'rt') as template:
+        VIEW_TEMPLATE = template.read()
+
+    with open(f'{ROOT_DIR}/template/view/enum.py', 'rt') as template:
+        ENUM_TEMPLATE = template.read()
+
+    with open(f'{ROOT_DIR}/template/view/struct.py', 'rt') as template:
+        STRUCT_TEMPLATE = template.read()
+
+    with open(f'{ROOT_DIR}/template/view/field.py', 'rt') as template:
+        FIELD_TEMPLATE = template.read()
+
+    # Arrays up to this length are built by a tuple display rather than a comprehension.
+    UNROLL_LENGTH = 16
+
+    def __init__(self, tab_size = 4, endianness = Endianness.LITTLE_ENDIAN):
+        super(ViewGenerator, self).__init__()
+        self._tab_size          = tab_size
+        self.endianness         = endianness
+        self._byte_order        = get_byte_order(endianness)
+        self._layout_engine     = LayoutEngine()
+        self._typedef_list      = []
+
+    def _get_class_reference(self, node):
+        # Views generated at top level are global, nested ones are class attributes.
+        if node in self._typedef_list:
+            return get_class_name(node.identifier)
+
+        return f'''self.{get_class_name(node.identifier)}'''
+
+    def _get_value_count(self, item):
+        """
+        Get the number of values a field item is unpacked to.
+
+        :param      item:  The item
+        :type       item:  str|ir.Struct|ir.Union|ir.Enumeration
+        """
+        if isinstance(item, ir.Struct):
+            struct_format = StructFormat(self._layout_engine, self._byte_order)
+            struct_format.add_record(item)
+
+            return len(struct_format.format_list)
+
+        return 1
+
+    def _generate_value(self, item, index, shape = [], values = 'values', depth = 0):
+        """
+        Generate the expression decoding a field item from the unpacked values.
+
+        :param      item:    The item
+        :type       item:    str|ir.Struct|ir.Union|ir.Enumeration
+        :param      index:   The index (or index expression) of its first value
+        :type       index:   int|str
+        :param      shape:   The shape of the array of items
+        :type       shape:   list
+        :param      values:  The name of the unpacked values
+        :type       values:  str
+        :param      depth:   The array nesting depth, to name indexes
+        :type       depth:   int
+        """
+        if shape:
+            count = self._get_value_count(item)
+
+            for length in shape[1:]:
+                count *= length
+
+            # Arrays of scalars are sliced
+            if count == 1 and isinstance(item, str):
+                end = f'{index} + {shape[0]}' if isinstance(index, str) else index + shape[0]
+
+                return f'''{values}[{index}:{end}]'''
+            elif shape[0] <= ViewGenerator.UNROLL_LENGTH and isinstance(index, int):
+                item_list = [self._generate_value(item, index + count * position, shape[1:], values, depth) for position in range(shape[0])]
+
+                return f'''({', '.join(item_list)}{',' if len(item_list) == 1 else ''})'''
+
+            index_name = f'index_{depth}'
+            item_index = f'{index} + {count} * {index_name}'
+
+            return f'''tuple([{self._generate_value(item, item_index, shape[1:], values, depth + 1)} for {index_name} in range({shape[0]})])'''
+        elif isinstance(item, ir.Enumeration):
+            class_reference = self._get_class_reference(item)
+
+            return f'''({class_reference}._views_.get({values}[{index}]) or {class_reference}._view_({values}[{index}]))'''
+        elif isinstance(item, (ir.Struct, ir.Union)):
+            count = self._get_value_count(item)
+            end   = f'{index} + {count}' if isinstance(index, str) else index + count
+
+            return f'''{self._get_class_reference(item)}({values}[{index}:{end}])'''
+
+        return f'''{values}[{index}]'''
+
+    def _generate_bitfield_value(self, field, index, shift, format, values = 'values'):
+        """
+        Generate the expression decoding a bit field from the value holding it.
+
+        :param      field:   The field
+        :type       field:   Field
+        :param      index:   The index of the value holding it
+        :type       index:   int
+        :param      shift:   The shift of the bit field inside the value
+        :type       shift:   int
+        :param      format:  The struct format of the value
+        :type       format:  str
+        :param      values:  The name of the unpacked values
+        :type       values:  str
+        """
+        value = f'''{values}[{index}]'''
+
+        # Bytes holding bit fields which aren't an integer size
+        if format.endswith('s'):
+            value = f'''int.from_bytes({value}, '{'little' if self._byte_order == '<' else 'big'}')'''
+
+        if shift:
+            value = f'''({value} >> {shift})'''
+
+        value = f'''{value} & {hex((1 << field.layout.bit_size) - 1)}'''
+
+        # Sign extension
+        if isinstance(field.item, str) and field.item.islower():
+            sign  = hex(1 << (field.layout.bit_size - 1))
+            value = f'''(({value}) ^ {sign}) - {sign}'''
+
+        return value
+
+    def _is_lazy(self, field):
+        # Fields building nested views or tuples of values are decoded on first access.
+        if isinstance(field.item, str):
+            return len(field.shape) > 1
+
+        return bool(field.shape) or isinstance(field.item, (ir.Struct, ir.Union))
+
+    def _generate_slots(self, name_list):
+        return ', '.join([repr(name) for name in name_list]) + (',' if len(name_list) == 1 else '')
+
+    def _generate_nested_class_list(self, field_list):
+        """
+        Generate views of structures, unions and enumerations declared inside a
+        record, once.
+
+        :param      field_list:  The field list
+        :type       field_list:  list
+        """
+        node_list = []
+
+        for field in field_list:
+            if not isinstance(field.item, str) and field.item not in self._typedef_list and field.item not in node_list:
+                node_list.append(field.item)
+
+        return ''.join([f'''{textwrap.indent(self.generate_class(node), ' ' * self._tab_size)}\n\n''' for node in node_list])
+
+    def _generate_struct(self, node):
+        """
+        Generate the view class of a structure.
+
+        :param      node:  The node
+        :type       node:  ir.Struct
+        """
+        struct_format   = StructFormat(self._layout_engine, self._byte_order)
+        value_list      = struct_format.add_record(node)
+        field_list      = [field for field, _, _, _ in value_list]
+        lazy_list       = [field for field in field_list if self._is_lazy(field)]
+        name_list       = [field.name for field in field_list if field not in lazy_list]
+        assignment_list = []
+        property_list   = []
+
+        # Records of single scalars are unpacked to their fields at once.
+        if all(shift is None and not field.shape and isinstance(field.item, str) for field, _, _, shift in value_list) and len(value_list) == len(struct_format.format_list) > 1:
+            assignment_list.append(f'''{', '.join([f'self.{name}' for name in name_list])} = values''')
+        else:
+            for field, index, count, shift in value_list:
+                if field in lazy_list:
+                    property_list.append(ViewGenerator.FIELD_TEMPLATE.format(name = field.name, value = self._generate_value(field.item, index, field.shape, 'self._values_')))
+                elif shift is None:
+                    assignment_list.append(f'''self.{field.name} = {self._generate_value(field.item, index, field.shape)}''')
+                else:
+                    assignment_list.append(f'''self.{field.name} = {self._generate_bitfield_value(field, index, shift, struct_format.format_list[index])}''')
+
+        # Lazy fields are decoded from the unpacked values then cached in a private slot, None until then.
+        if lazy_list:
+            name_list += ['_values_'] + [f'_{field.name}_' for field in lazy_list]
+            assignment_list.append('self._values_ = values')
+            assignment_list.append(f'''{' = '.join([f'self._{field.name}_' for field in lazy_list])} = None''')
+
+        return ViewGenerator.STRUCT_TEMPLATE.format(class_name = get_class_name(node.identifier), nested_class = self._generate_nested_class_list(field_list),
+                                                    slots = self._generate_slots(name_list), struct_format = struct_format.build(self._layout_engine.layout(node).size),
+                                                    assignments = textwrap.indent('\n'.join(assignment_list) or 'pass', ' ' * 2 * self._tab_size),
+                                                    fields = ''.join([f'\n\n{item}' for item in property_list]))
+
+    def _generate_union(self, node):
+        """
+        Generate the view class of a union, unpacked as bytes. Each member is
+        decoded from the bytes by its own struct.
+
+        :param      node:  The node
+        :type       node:  ir.Union
+        """
+        field_list      = get_field_list(self._layout_engine, node)
+        struct_list     = []
+        assignment_list = []
+
+        for field in field_list:
+            struct_format = StructFormat(self._layout_engine, self._byte_order)
+
+            if field.layout.is_bitfield():
+                # Bit fields of a union are read from their whole storage unit, at offset 0.
+                format = INTEGER_FORMAT_MAP[field.layout.size].upper()
+                shift  = field.layout.bit_offset if self._byte_order == '<' else field.layout.size * 8 - field.layout.bit_offset - field.layout.bit_size
+                value  = self._generate_bitfield_value(field, struct_format.add_scalar(0, format), shift, format, f'{field.name}_values')
+            else:
+                struct_format.add_field(field)
+                value = self._generate_value(field.item, 0, field.shape, f'{field.name}_values')
+
+            struct_list.append(f'''_{field.name}_struct_ = struct.Struct('{struct_format.build(0)}')''')
+            assignment_list.append(f'''{field.name}_values = self._{field.name}_struct_.unpack_from(values[0])\nself.{field.name} = {value}''')
+
+        nested_class = self._generate_nested_class_list(field_list) + ''.join([f'''{' ' * self._tab_size}{line}\n''' for line in struct_list])
+
+        return ViewGenerator.STRUCT_TEMPLATE.format(class_name = get_class_name(node.identifier), nested_class = nested_class,
+                                                    slots = self._generate_slots([field.name for field in field_list]), struct_format = f'{self._byte_order}{self._layout_engine.layout(node).size}s',
+                                                    assignments = textwrap.indent('\n'.join(assignment_list) or 'pass', ' ' * 2 * self._tab_size), fields = '')
+
+    def _generate_enumeration(self, node):
+        """
+        Generate the view class of an enumeration.
+
+        :param      node:  The node
+        :type       node:  ir.Enumeration
+        """
+        struct_format = StructFormat(self._layout_engine, self._byte_order)
+        struct_format.add_item(node, 0)
+
+        enumerator_list = [f'{name} = {value}' for name, value in node.enumerator_list]
+
+        return ViewGenerator.ENUM_TEMPLATE.format(class_name = get_class_name(node.identifier), struct_format = struct_format.build(0),
+                                                  enumerator_list = textwrap.indent('\n'.join(enumerator_list), prefix = ' ' * 2 * self._tab_size))
+
+    def generate_class(self, node):
+        """
+        Generate the view class of a structure, union or enumeration.
+
+        :param      node:  The node
+        :type       node:  ir.Struct|ir.Union|ir.Enumeration
+        """
+        if isinstance(node, ir.Enumeration):
+            return self._generate_enumeration(node)
+        elif isinstance(node, ir.Union):
+            return self._generate_union(node)
+
+        return self._generate_struct(node)
+
+    def generate(self, ast):
+        """
+        Parse an AST and construct a view class for each typedef.
+
+        :param      ast:  The ast
+        :type       ast:  { type_description }
+        """
+        self._layout_engine = LayoutEngine(ast)
+        self._typedef_list  = [translation_unit.specifier_list[-1] for translation_unit in ast.translation_unit_list if isinstance(translation_unit, ir.Declaration) and translation_unit.is_typedef]
+
+        output = f'''import enum\nimport struct\n\n{ViewGenerator.VIEW_TEMPLATE}\n'''
+
+        for typedef in self._typedef_list:
+            output += f'''\n{self.generate_class(typedef)}\n'''
+
+        return output
+
+if __name__ == '__main__':
+    generator = ViewGenerator(endianness = Endianness.LITTLE_ENDIAN)
+    parser = GNU99Parser(debug = False)
+
+    ast = parser.parse_file("../examples/elf.i")
+
+    with open("../output/elf_view.py", "wt") as py_directive_file:
+        py_directive_file.write(generator.generate(ast))